@@ -11,6 +11,7 @@ from __future__ import annotations
 
 import json
 import logging
+import sys
 import time
 from datetime import date, datetime
 from pathlib import Path
@@ -18,6 +19,13 @@ from typing import Any, Dict, List
 
 from ib_insync import IB, Option  # type: ignore
 
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from opt_data.util.cache_manager import contract_cache  # noqa: E402
+
 
 class DateTimeEncoder(json.JSONEncoder):
     """Custom JSON encoder for datetime objects."""
@@ -71,13 +79,10 @@ def make_throttle(min_interval_sec: float) -> callable:
 
 
 def load_cache(cache_root: Path, symbol: str, trade_date: date) -> List[Dict[str, Any]]:
-    path = (cache_root / f"{symbol.upper()}_{trade_date.isoformat()}.json").resolve()
-    if not path.exists():
-        return []
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
+        return contract_cache(cache_root).load(symbol.upper(), trade_date) or []
     except Exception as exc:
-        logger.warning("Failed to read cache %s: %s", path, exc)
+        logger.warning("Failed to read contracts cache for %s %s: %s", symbol, trade_date, exc)
         return []
 
 
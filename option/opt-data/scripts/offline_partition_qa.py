@@ -24,6 +24,7 @@ if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
 from opt_data.config import load_config  # noqa: E402
+from opt_data.storage.lake import list_parquet_files, list_partitions  # noqa: E402
 
 INTRADAY_PK = ["trade_date", "sample_time", "conid"]
 CLOSE_PK = ["trade_date", "conid"]
@@ -111,9 +112,9 @@ def list_trade_dates(view_root: Path) -> list[date]:
     if not view_root.exists():
         return []
     dates: list[date] = []
-    for path in view_root.glob("date=*"):
+    for value in list_partitions(view_root, "date"):
         try:
-            d = date.fromisoformat(path.name.split("=", 1)[1])
+            d = date.fromisoformat(value)
         except ValueError:
             continue
         dates.append(d)
@@ -124,7 +125,7 @@ def read_parquet_tree(root: Path) -> pd.DataFrame | None:
     if not root.exists():
         return None
     frames: list[pd.DataFrame] = []
-    for path in sorted(root.rglob("*.parquet")):
+    for path in list_parquet_files(root):
         try:
             df = pd.read_parquet(path)
         except Exception:
@@ -2,11 +2,12 @@ import pandas as pd
 from pathlib import Path
 import sys
 import os
-import pyarrow.dataset as ds
 
 # Add src to path
 sys.path.append(os.path.abspath("src"))
 
+from opt_data.storage.lake import lake_dataset  # noqa: E402
+
 
 def load_parquet_data_debug(path_str):
     try:
@@ -15,9 +16,16 @@ def load_parquet_data_debug(path_str):
             print(f"Path does not exist: {path}")
             return pd.DataFrame()
 
-        print(f"Loading from {path} using pyarrow.dataset...")
+        if path.is_file():
+            print(f"Loading file {path}...")
+            return pd.read_parquet(path)
+
+        print(f"Loading from {path} using the shared lake dataset...")
         # Use pyarrow dataset for robust partitioned loading
-        dataset = ds.dataset(path, partitioning="hive")
+        dataset = lake_dataset(path)
+        if dataset is None:
+            print(f"No parquet files under: {path}")
+            return pd.DataFrame()
 
         # We can try to consolidate schema if needed, but default might work better than pandas
         table = dataset.to_table()
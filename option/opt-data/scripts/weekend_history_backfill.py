@@ -26,6 +26,7 @@ Usage
 Output
 ------
 - Parquet bars: data_test/raw/ib/historical_bars_weekend/{SYMBOL}/{conId}/TRADES/{bar}.parquet
+- Daily bars (--daily-aggregate, hours stage): .../{conId}/TRADES/daily.parquet
 - Summary JSONL: state/run_logs/historical_backfill/summary_*.jsonl
 """
 
@@ -55,7 +56,9 @@ from opt_data.ib.historical_probe_utils import (  # noqa: E402
     sanitize_token,
     stable_batch_slice,
 )
+from opt_data.ib.history import aggregate_daily_frame, bars_to_frame  # noqa: E402
 from opt_data.universe import load_universe  # noqa: E402
+from opt_data.util.cache_manager import contract_cache  # noqa: E402
 from opt_data.util.ratelimit import TokenBucket  # noqa: E402
 
 
@@ -106,33 +109,37 @@ def _bars_to_frame(
     bar_size: str,
     what_to_show: str,
 ) -> pd.DataFrame:
-    rows: list[dict[str, Any]] = []
-    for b in bars:
-        rows.append(
-            {
-                "ts": getattr(b, "date", None),
-                "open": getattr(b, "open", None),
-                "high": getattr(b, "high", None),
-                "low": getattr(b, "low", None),
-                "close": getattr(b, "close", None),
-                "volume": getattr(b, "volume", None),
-                "barCount": getattr(b, "barCount", None),
-                "average": getattr(b, "average", None),
-                "symbol": symbol,
-                "conid": conid,
-                "expiry": expiry,
-                "strike": strike,
-                "right": right,
-                "bar_size": bar_size,
-                "what_to_show": what_to_show,
-            }
-        )
-    df = pd.DataFrame(rows)
-    if not df.empty and "ts" in df.columns:
-        df["ts"] = pd.to_datetime(df["ts"], utc=True, errors="coerce")
+    df = bars_to_frame(bars).rename(columns={"date": "ts"})
+    if df.empty:
+        return df
+    df = _with_contract_columns(
+        df,
+        symbol=symbol,
+        conid=conid,
+        expiry=expiry,
+        strike=strike,
+        right=right,
+        bar_size=bar_size,
+        what_to_show=what_to_show,
+    )
+    df["ts"] = pd.to_datetime(df["ts"], utc=True, errors="coerce")
+    return df
+
+
+def _with_contract_columns(df: pd.DataFrame, **columns: Any) -> pd.DataFrame:  # noqa: ANN401
+    for name, value in columns.items():
+        df[name] = value
     return df
 
 
+def _daily_from_bars(bars_df: pd.DataFrame, **columns: Any) -> pd.DataFrame:  # noqa: ANN401
+    """Vectorized 8-hour -> daily aggregation (same contract as fetch_option_daily_aggregated)."""
+    daily = aggregate_daily_frame(bars_df.rename(columns={"ts": "date"}))
+    if daily.empty:
+        return daily
+    return _with_contract_columns(daily, **columns)
+
+
 @dataclass(frozen=True)
 class FetchSummary:
     symbol: str
@@ -174,25 +181,30 @@ class FetchSummary:
 
 
 def load_latest_contracts_cache(symbol: str, cache_dir: Path) -> tuple[list[dict], str]:
-    """Load contracts from the most recent cache file for a symbol.
+    """Load contracts for the most recent cached trade date of a symbol.
+
+    Days recorded in the contract master have no per-day JSON file, so candidates
+    come from the master's coverage plus any fallback ``{SYMBOL}_{date}.json`` files.
 
     Returns:
         Tuple of (contracts list, cache date string)
     """
-    pattern = f"{symbol}_*.json"
-    files = sorted(cache_dir.glob(pattern), reverse=True)
-    if not files:
-        raise FileNotFoundError(f"No contracts cache found for {symbol} in {cache_dir}")
-
-    # Extract date from filename: {SYMBOL}_{YYYY-MM-DD}.json
-    cache_file = files[0]
-    cache_date = cache_file.stem.split("_", 1)[-1] if "_" in cache_file.stem else "unknown"
-
-    contracts = json.loads(cache_file.read_text(encoding="utf-8"))
-    if not isinstance(contracts, list):
-        raise ValueError(f"Contracts cache {cache_file} is not a list")
+    cache = contract_cache(cache_dir)
+    candidates: set[date] = set()
+    coverage = cache.master.coverage(symbol)
+    if coverage is not None:
+        candidates.add(coverage[1])
+    for path in cache_dir.glob(f"{symbol}_*.json"):
+        try:
+            candidates.add(date.fromisoformat(path.stem.split("_", 1)[-1]))
+        except ValueError:
+            continue
 
-    return contracts, cache_date
+    for cache_date in sorted(candidates, reverse=True):
+        contracts = cache.load(symbol, cache_date)
+        if contracts:
+            return contracts, cache_date.isoformat()
+    raise FileNotFoundError(f"No contracts cache found for {symbol} in {cache_dir}")
 
 
 def get_underlying_close(
@@ -383,6 +395,12 @@ def main() -> None:
         default=None,
         help="Summary JSONL path (default: auto-generated)",
     )
+    parser.add_argument(
+        "--daily-aggregate",
+        action=argparse.BooleanOptionalAction,
+        default=False,
+        help="[hours stage] Also write daily.parquet aggregated from the 8-hour bars",
+    )
     parser.add_argument("--dry-run", action="store_true", help="Print plan only")
     args = parser.parse_args()
 
@@ -714,6 +732,7 @@ def main() -> None:
 
                         # Save bars (incremental append + dedup by ts/conid/bar_size/what_to_show)
                         saved_path: str | None = None
+                        saved_df: pd.DataFrame | None = None
                         bars_written = 0
                         merged_first: str | None = None
                         merged_last: str | None = None
@@ -757,14 +776,33 @@ def main() -> None:
                                 bars_written = max(len(merged) - existing_rows, 0)
                                 merged.to_parquet(out_path, index=False)
                                 saved_path = str(out_path)
+                                saved_df = merged
                         else:
                             if not df_new.empty:
                                 df_new.to_parquet(out_path, index=False)
+                                saved_df = df_new
                                 bars_written = len(df_new)
                                 merged_first = df_new["ts"].min().isoformat()
                                 merged_last = df_new["ts"].max().isoformat()
                                 saved_path = str(out_path)
 
+                        if (
+                            bool(args.daily_aggregate)
+                            and bar_size == "8 hours"
+                            and saved_df is not None
+                        ):
+                            daily_df = _daily_from_bars(
+                                saved_df,
+                                symbol=symbol,
+                                conid=conid,
+                                expiry=expiry,
+                                strike=strike,
+                                right=right,
+                                what_to_show=args.what,
+                            )
+                            if not daily_df.empty:
+                                daily_df.to_parquet(out_path.with_name("daily.parquet"), index=False)
+
                         summary = FetchSummary(
                             symbol=symbol,
                             conid=conid,
@@ -13,30 +13,38 @@ import logging
 
 import typer
 
-try:
-    from apscheduler.schedulers.background import BackgroundScheduler
-except Exception:  # pragma: no cover - optional dependency guard
-    BackgroundScheduler = None  # type: ignore[assignment]
-
 from .config import load_config
-from .pipeline.backfill import BackfillPlanner, BackfillRunner
-from .pipeline.backfill import fetch_underlying_close
-from .pipeline.snapshot import SnapshotRunner
-from .pipeline.rollup import RollupRunner
-from .pipeline.enrichment import EnrichmentRunner
-from .pipeline.history import HistoryRunner
-from .pipeline.scheduler import ScheduleRunner
-from .pipeline.qa import QAMetricsCalculator
-from .streaming.selection import (
-    select_expiries,
-    select_strikes_around_spot,
-    strike_step,
+from .util.lazy import LazyAttr, lazy_import
+
+# Runners, IB helpers and calendar utilities pull in pandas, pyarrow and ib_insync; bind
+# them lazily so ``--help`` and light commands do not pay that import cost at startup.
+BackfillPlanner, BackfillRunner, fetch_underlying_close = lazy_import(
+    "opt_data.pipeline.backfill", "BackfillPlanner", "BackfillRunner", "fetch_underlying_close"
+)
+SnapshotRunner = LazyAttr("opt_data.pipeline.snapshot", "SnapshotRunner")
+ShardedSnapshotRunner = LazyAttr("opt_data.pipeline.snapshot_shards", "ShardedSnapshotRunner")
+RollupRunner = LazyAttr("opt_data.pipeline.rollup", "RollupRunner")
+EnrichmentRunner = LazyAttr("opt_data.pipeline.enrichment", "EnrichmentRunner")
+HistoryRunner = LazyAttr("opt_data.pipeline.history", "HistoryRunner")
+ScheduleRunner = LazyAttr("opt_data.pipeline.scheduler", "ScheduleRunner")
+QAMetricsCalculator = LazyAttr("opt_data.pipeline.qa", "QAMetricsCalculator")
+select_expiries, select_strikes_around_spot, strike_step = lazy_import(
+    "opt_data.streaming.selection", "select_expiries", "select_strikes_around_spot", "strike_step"
+)
+StreamingRunner = LazyAttr("opt_data.streaming.runner", "StreamingRunner")
+SummaryIndex, summary_index_path = lazy_import(
+    "opt_data.observability.summary_index", "SummaryIndex", "summary_index_path"
+)
+list_partitions = LazyAttr("opt_data.storage.lake", "list_partitions")
+partition_manifest = LazyAttr("opt_data.storage.manifest", "partition_manifest")
+contract_cache = LazyAttr("opt_data.util.cache_manager", "contract_cache")
+materialize_clean_view = LazyAttr("opt_data.pipeline.clean_views", "materialize_clean_view")
+to_et_date, is_trading_day = lazy_import("opt_data.util.calendar", "to_et_date", "is_trading_day")
+scan_logs = LazyAttr("opt_data.util.logscanner", "scan_logs")
+Universe, UniverseEntry, load_universe = lazy_import(
+    "opt_data.universe", "Universe", "UniverseEntry", "load_universe"
 )
-from .streaming.runner import StreamingRunner
-from .util.calendar import to_et_date, is_trading_day
-from .util.logscanner import scan_logs
-from .universe import UniverseEntry, load_universe
-from .ib import (
+(
     IBSession,
     sec_def_params,
     enumerate_options,
@@ -45,10 +53,22 @@ from .ib import (
     fetch_daily,
     bars_to_dicts,
     OptionSpec,
+) = lazy_import(
+    "opt_data.ib",
+    "IBSession",
+    "sec_def_params",
+    "enumerate_options",
+    "resolve_conids",
+    "make_throttle",
+    "fetch_daily",
+    "bars_to_dicts",
+    "OptionSpec",
 )
-from .ib.discovery import cache_path, discover_contracts_for_symbol
-from .ib.oi_probe import OIProbeConfig, probe_oi
-
+cache_path, discover_contracts_for_symbol = lazy_import(
+    "opt_data.ib.discovery", "cache_path", "discover_contracts_for_symbol"
+)
+OIProbeConfig, probe_oi = lazy_import("opt_data.ib.oi_probe", "OIProbeConfig", "probe_oi")
+run_stdio_server = LazyAttr("opt_data.mcp.server", "run_stdio_server")
 
 app = typer.Typer(add_completion=False, help="opt-data CLI entrypoint")
 
@@ -164,17 +184,16 @@ def _precheck_contract_caches(
         if resolved_conids:
             _update_universe_file(effective_universe_path, resolved_conids)
 
+    contracts = contract_cache(cache_root)
+
     def check_cache(sym: str) -> tuple[str | None, str | None]:
         cache_file = cache_path(cache_root, sym, trade_date.isoformat())
+        # Served from the warmed LRU; only symbols missing from memory touch disk here
+        if contracts.load(sym, trade_date):
+            return None, None
         if not cache_file.exists() or cache_file.stat().st_size == 0:
             return sym, f"{sym} ({cache_file})"
-        try:
-            data = json.loads(cache_file.read_text(encoding="utf-8"))
-        except Exception:
-            return None, f"{sym} ({cache_file})"
-        if not data:
-            return None, f"{sym} ({cache_file})"
-        return None, None
+        return None, f"{sym} ({cache_file})"
 
     def rebuild_caches(symbols_to_build: list[str]) -> list[str]:
         failures: list[str] = []
@@ -230,6 +249,8 @@ def _precheck_contract_caches(
                     failures.append(f"{sym} ({exc})")
         return failures
 
+    # Warm the process-wide contract cache so scheduled slots never read contracts from disk
+    contracts.preload(symbols_for_run, trade_date)
     for sym in symbols_for_run:
         miss, bad = check_cache(sym)
         if miss:
@@ -744,7 +765,7 @@ def history(
     config: Optional[str] = typer.Option(None, help="Path to config TOML"),
     days: int = typer.Option(30, help="Number of days of history to fetch"),
     output: Optional[str] = typer.Option(
-        None, help="Output directory (default: data/clean/ib/history)"
+        None, help="History store root (default: <paths.clean>/view=history)"
     ),
     what: str = typer.Option("MIDPOINT", help="Data type (MIDPOINT, TRADES, etc.)"),
     use_rth: bool = typer.Option(True, help="Use Regular Trading Hours"),
@@ -881,6 +902,12 @@ def snapshot(
         "--snapshot-mode",
         help="Override snapshot fetch mode (streaming/snapshot/reqtickers)",
     ),
+    shards: int = typer.Option(
+        1, "--shards", help="Split the slot across N processes, each with its own IB client id"
+    ),
+    shard_strategy: str = typer.Option(
+        "hash", "--shard-strategy", help="Shard split: 'hash' (symbol) or 'contracts' (balanced)"
+    ),
 ) -> None:
     cfg = load_config(Path(config) if config else None)
     snapshot_cfg = getattr(cfg, "snapshot", None)
@@ -959,15 +986,32 @@ def snapshot(
         typer.echo(" ".join(parts))
 
     try:
-        result = runner.run(
-            trade_date,
-            slot_obj,
-            symbol_list,
-            universe_path=effective_universe,
-            ingest_run_type="intraday",
-            force_refresh=force_refresh,
-            progress=progress_cb,
-        )
+        if shards > 1:
+            sharded = ShardedSnapshotRunner(
+                cfg,
+                shards,
+                strategy=shard_strategy,
+                snapshot_grace_seconds=cfg.cli.snapshot_grace_seconds,
+            )
+            typer.echo(f"[snapshot] shards={shards} strategy={shard_strategy}")
+            result = sharded.run(
+                trade_date,
+                slot_obj,
+                symbol_list,
+                universe_path=effective_universe,
+                ingest_run_type="intraday",
+                force_refresh=force_refresh,
+            )
+        else:
+            result = runner.run(
+                trade_date,
+                slot_obj,
+                symbol_list,
+                universe_path=effective_universe,
+                ingest_run_type="intraday",
+                force_refresh=force_refresh,
+                progress=progress_cb,
+            )
     except Exception as exc:  # pragma: no cover - network/runtime specific
         typer.echo(f"[snapshot:error] {exc}", err=True)
         raise typer.Exit(code=1)
@@ -978,6 +1022,16 @@ def snapshot(
         f"raw_files={len(result.raw_paths)} clean_files={len(result.clean_paths)} "
         f"errors={len(result.errors)}"
     )
+    if result.deferred_symbols:
+        typer.echo(
+            f"[snapshot] deferred={','.join(result.deferred_symbols)} "
+            f"shed={','.join(result.shed_symbols) or '-'}"
+        )
+    if result.partial_slot:
+        typer.echo(
+            "[snapshot] partial slot (deadline reached) "
+            f"skipped={','.join(result.skipped_symbols) or '-'}"
+        )
     if result.errors:
         for err in result.errors[:5]:
             typer.echo(
@@ -1264,8 +1318,7 @@ def streaming_plan(
         if rights
         else streaming_cfg.rights
     )
-    universe_entries = load_universe(Path(cfg.universe.file))
-    conid_map = {entry.symbol: entry.conid for entry in universe_entries}
+    conid_map = Universe.load(Path(cfg.universe.file)).conid_map()
 
     def _select_chain(params, symbol: str, exchange: str):
         if not params:
@@ -1802,7 +1855,9 @@ def schedule(
                 typer.echo(f"[schedule] ... {len(summary.errors) - 5} more errors recorded")
         return
 
-    if BackgroundScheduler is None:
+    try:
+        from apscheduler.schedulers.background import BackgroundScheduler
+    except Exception:  # pragma: no cover - optional dependency guard
         typer.echo(
             "[schedule] APScheduler is not installed; install apscheduler>=3.10 to use --live",
             err=True,
@@ -2072,6 +2127,9 @@ def selfcheck(
         report_dir.mkdir(parents=True, exist_ok=True)
         report_path = report_dir / f"selfcheck_{trade_date.strftime('%Y%m%d')}.json"
         report_path.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+        SummaryIndex(summary_index_path(cfg)).record_report(
+            "selfcheck", trade_date, report, report_path
+        )
         typer.echo(f"[selfcheck] report_written={report_path}")
 
     if status != "PASS":
@@ -2148,6 +2206,9 @@ def logscan(
         out_path = errors_dir / f"summary_{ymd_compact}.json"
         try:
             out_path.write_text(json.dumps(summary, ensure_ascii=False, indent=2), encoding="utf-8")
+            SummaryIndex(summary_index_path(cfg)).record_report(
+                "errors", target_day, summary, out_path
+            )
         except Exception as exc:  # pragma: no cover - fs issues
             typer.echo(f"[logscan] failed to write summary: {exc}", err=True)
 
@@ -2162,6 +2223,75 @@ def logscan(
         raise typer.Exit(code=1)
 
 
+@app.command()
+def summary_index(
+    config: Optional[str] = typer.Option(None, help="Path to config TOML"),
+) -> None:
+    """Backfill the run/partition summary index from existing run_logs and lake files."""
+    cfg = load_config(Path(config) if config else None)
+    index = SummaryIndex(summary_index_path(cfg))
+    run_logs_roots = {
+        Path(cfg.paths.run_logs).resolve(),
+        (Path(cfg.paths.state) / "run_logs").resolve(),
+    }
+    counts = index.backfill(
+        sorted(run_logs_roots),
+        {"raw": Path(cfg.paths.raw), "clean": Path(cfg.paths.clean)},
+    )
+    typer.echo(
+        f"[summary-index] reports={counts['reports']} partitions={counts['partitions']} "
+        f"path={index.db_path}"
+    )
+
+
+@app.command()
+def manifest(
+    config: Optional[str] = typer.Option(None, help="Path to config TOML"),
+    view: Optional[List[str]] = typer.Option(
+        None, help="View name(s) to process (default: every view under raw/clean)"
+    ),
+    compact_only: bool = typer.Option(
+        False, "--compact", help="Fold existing logs instead of rebuilding from files"
+    ),
+) -> None:
+    """Rebuild (or compact) per-view partition manifests under the raw and clean roots."""
+    cfg = load_config(Path(config) if config else None)
+    for root in (Path(cfg.paths.raw), Path(cfg.paths.clean)):
+        for name in list_partitions(root, "view"):
+            if view and name not in view:
+                continue
+            target = partition_manifest(root / f"view={name}")
+            count = target.compact() if compact_only else target.rebuild()
+            typer.echo(f"[manifest] {target.path} files={count}")
+
+
+@app.command("clean-views")
+def clean_views(
+    date_str: str = typer.Option("today", "--date", help="Trade date in ET or 'today'"),
+    view: List[str] = typer.Option(["intraday", "close"], help="Snapshot view(s) to derive"),
+    symbols: Optional[str] = typer.Option(
+        None, "--symbols", help="Comma separated symbols (defaults to every raw partition)"
+    ),
+    force: bool = typer.Option(False, help="Rebuild even when clean is newer than raw"),
+    config: Optional[str] = typer.Option(None, help="Path to config TOML"),
+) -> None:
+    """Derive clean intraday/close partitions from raw (for snapshot.clean_mode=deferred)."""
+    cfg = load_config(Path(config) if config else None)
+    trade_date = (
+        to_et_date(datetime.now(ZoneInfo("UTC")))
+        if date_str == "today"
+        else date.fromisoformat(date_str)
+    )
+    symbol_list = [s.strip().upper() for s in symbols.split(",") if s.strip()] if symbols else None
+    for name in view:
+        try:
+            paths = materialize_clean_view(cfg, name, trade_date, symbol_list, force=force)
+        except ValueError as exc:
+            typer.echo(f"[clean-views] {exc}", err=True)
+            raise typer.Exit(code=2)
+        typer.echo(f"[clean-views] date={trade_date} view={name} partitions={len(paths)}")
+
+
 @app.command()
 def mcp_server(
     config: Optional[str] = typer.Option(None, help="Path to config TOML"),
@@ -2177,8 +2307,6 @@ def mcp_server(
     logging.basicConfig(level=log_level.upper())
 
     audit_path = Path(audit_db) if audit_db else None
-    from .mcp.server import run_stdio_server
-
     run_stdio_server(
         cfg,
         audit_db=audit_path,
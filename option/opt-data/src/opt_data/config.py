@@ -4,6 +4,8 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional, Any, Dict, List
 import os
+import pickle
+import threading
 
 try:  # Python 3.11+
     import tomllib as toml
@@ -85,12 +87,23 @@ class RateLimitsConfig:
     historical: RateLimitClassConfig
 
 
+@dataclass
+class WriteLayoutConfig:
+    sort_keys: list[str]
+    row_group_size: int  # 0 = pyarrow default
+    dictionary_columns: list[str]
+    statistics_columns: list[str]  # empty = all columns
+    page_index: bool = True
+
+
 @dataclass
 class StorageConfig:
     hot_days: int
     cold_codec: str
     cold_codec_level: int
     hot_codec: str
+    # view/kind name -> layout overriding storage.layout.DEFAULT_WRITE_LAYOUTS
+    layouts: Dict[str, WriteLayoutConfig] | None = None
 
 
 @dataclass
@@ -113,6 +126,7 @@ class LoggingConfig:
 class ObservabilityConfig:
     metrics_db_path: Path
     webhook_url: str | None = None
+    summary_index_path: Path | None = None
 
 
 @dataclass
@@ -123,6 +137,8 @@ class MCPConfig:
     allow_clean: bool
     enabled_tools: list[str]
     audit_db: Path
+    tool_concurrency: int = 4
+    cache_ttl_seconds: float = 30.0
 
 
 @dataclass
@@ -145,6 +161,16 @@ class SnapshotConfig:
     force_frozen_data: bool = False
     fetch_mode: str = "streaming"
     batch_size: int = 50
+    # Order symbols longest-first from state/snapshot_symbol_costs.json
+    cost_ordering: bool = False
+    # > 0: defer/shed unprotected symbols predicted to finish past this many seconds
+    slot_budget_seconds: float = 0.0
+    # > 0: scheduled slots stop this many seconds after their start and commit what they have
+    slot_deadline_seconds: float = 0.0
+    # "eager": write raw and clean partitions per slot; "deferred": raw only, clean
+    # partitions are materialized from raw by rollup, QA and `clean-views`, while the
+    # dashboard and MCP tools clean raw rows in memory on read and never write
+    clean_mode: str = "eager"
 
 
 @dataclass
@@ -179,6 +205,8 @@ class AcquisitionConfig:
     fill_missing_greeks_with_zero: bool
     historical_timeout: float
     throttle_sec: float = 0.35
+    adaptive_what_to_show: bool = True
+    what_to_show_explore_rate: float = 0.1
 
 
 @dataclass
@@ -195,6 +223,8 @@ class QAConfig:
     delayed_ratio_threshold: float
     rollup_fallback_threshold: float
     oi_enrichment_threshold: float
+    # Share of the day's slots allowed to end partial (deadline hit)
+    partial_slot_threshold: float = 0.10
 
 
 @dataclass
@@ -340,6 +370,13 @@ class AppConfig:
                 f"Valid codecs: {valid_codecs}"
             )
 
+        for view, layout in (self.storage.layouts or {}).items():
+            if layout.row_group_size < 0:
+                errors.append(
+                    f"Invalid storage.layout.{view}.row_group_size: {layout.row_group_size} "
+                    "(must be >= 0)"
+                )
+
         # Validate compaction configuration
         if self.compaction.min_file_size_mb <= 0:
             errors.append(
@@ -365,6 +402,7 @@ class AppConfig:
             ("delayed_ratio_threshold", self.qa.delayed_ratio_threshold),
             ("rollup_fallback_threshold", self.qa.rollup_fallback_threshold),
             ("oi_enrichment_threshold", self.qa.oi_enrichment_threshold),
+            ("partial_slot_threshold", self.qa.partial_slot_threshold),
         ]:
             if not (0 <= qa_value <= 1):
                 errors.append(f"Invalid qa.{qa_name}: {qa_value} (must be between 0.0 and 1.0)")
@@ -397,6 +435,22 @@ class AppConfig:
 
         if self.snapshot.batch_size <= 0:
             errors.append(f"Invalid snapshot.batch_size: {self.snapshot.batch_size} (must be > 0)")
+        if self.snapshot.slot_budget_seconds < 0:
+            errors.append(
+                f"Invalid snapshot.slot_budget_seconds: {self.snapshot.slot_budget_seconds} "
+                "(must be >= 0)"
+            )
+        valid_clean_modes = {"eager", "deferred"}
+        if self.snapshot.clean_mode not in valid_clean_modes:
+            errors.append(
+                f"Invalid snapshot.clean_mode: {self.snapshot.clean_mode}. "
+                f"Valid modes: {valid_clean_modes}"
+            )
+        if self.snapshot.slot_deadline_seconds < 0:
+            errors.append(
+                f"Invalid snapshot.slot_deadline_seconds: {self.snapshot.slot_deadline_seconds} "
+                "(must be >= 0)"
+            )
 
         valid_expiries_policy = {"this_friday_next_monthly"}
         if self.streaming.expiries_policy not in valid_expiries_policy:
@@ -479,6 +533,12 @@ class AppConfig:
                 "(must be > 0)"
             )
 
+        if not (0 <= self.acquisition.what_to_show_explore_rate <= 1):
+            errors.append(
+                f"Invalid acquisition.what_to_show_explore_rate: "
+                f"{self.acquisition.what_to_show_explore_rate} (must be between 0.0 and 1.0)"
+            )
+
         # Validate logging level
         valid_log_levels = {"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"}
         if self.logging.level.upper() not in valid_log_levels:
@@ -491,6 +551,10 @@ class AppConfig:
             errors.append(f"Invalid mcp.limit: {self.mcp.limit} (must be > 0)")
         if self.mcp.days <= 0:
             errors.append(f"Invalid mcp.days: {self.mcp.days} (must be > 0)")
+        if self.mcp.tool_concurrency <= 0:
+            errors.append(
+                f"Invalid mcp.tool_concurrency: {self.mcp.tool_concurrency} (must be > 0)"
+            )
 
         return errors
 
@@ -530,13 +594,35 @@ def _load_repo_dotenv() -> None:
     load_dotenv()
 
 
-def load_config(file: Optional[Path] = None) -> AppConfig:
+@dataclass
+class _CachedConfig:
+    mtime_ns: int
+    size: int
+    env_keys: tuple[str, ...]
+    env_values: tuple[str | None, ...]
+    snapshot: bytes
+
+
+_CONFIG_CACHE: Dict[Path, _CachedConfig] = {}
+_CONFIG_CACHE_LOCK = threading.Lock()
+
+
+def _env_values(keys: tuple[str, ...]) -> tuple[str | None, ...]:
+    return tuple(os.environ.get(key) for key in keys)
+
+
+def load_config(file: Optional[Path] = None, *, reload: bool = False) -> AppConfig:
     """Load configuration from a TOML file with environment overrides.
 
     Order of precedence:
     1. File values (TOML)
     2. Environment variables (e.g., IB_HOST, IB_PORT, ...)
     3. Built-in defaults (from template if missing keys)
+
+    Parsed and validated configs are memoized per process by (path, mtime, size) and the
+    values of every environment override consulted while building them; later calls
+    return a fresh copy of the cached config, so callers may still mutate what they get.
+    ``reload=True`` (or ``reload_config``) bypasses the cache.
     """
 
     _load_repo_dotenv()  # load repo .env if present
@@ -544,6 +630,43 @@ def load_config(file: Optional[Path] = None) -> AppConfig:
     cfg_path = (
         _as_path(file) if file else _as_path(os.getenv("OPT_DATA_CONFIG", "config/opt-data.toml"))
     )
+    stat = cfg_path.stat()
+    with _CONFIG_CACHE_LOCK:
+        cached = None if reload else _CONFIG_CACHE.get(cfg_path)
+    if (
+        cached is not None
+        and cached.mtime_ns == stat.st_mtime_ns
+        and cached.size == stat.st_size
+        and cached.env_values == _env_values(cached.env_keys)
+    ):
+        return pickle.loads(cached.snapshot)
+
+    env_keys: set[str] = set()
+    cfg = _build_config(cfg_path, env_keys)
+    keys = tuple(sorted(env_keys))
+    with _CONFIG_CACHE_LOCK:
+        _CONFIG_CACHE[cfg_path] = _CachedConfig(
+            mtime_ns=stat.st_mtime_ns,
+            size=stat.st_size,
+            env_keys=keys,
+            env_values=_env_values(keys),
+            snapshot=pickle.dumps(cfg),
+        )
+    return cfg
+
+
+def reload_config(file: Optional[Path] = None) -> AppConfig:
+    """Re-read the config from disk, replacing the cached copy (for long-running processes)."""
+    return load_config(file, reload=True)
+
+
+def clear_config_cache() -> None:
+    with _CONFIG_CACHE_LOCK:
+        _CONFIG_CACHE.clear()
+
+
+def _build_config(cfg_path: Path, env_keys: set[str]) -> AppConfig:
+    """Parse and validate *cfg_path*, recording the environment overrides consulted."""
     cfg_dir = cfg_path.parent
     base_dir = cfg_dir.parent if cfg_dir.name == "config" else cfg_dir
     with open(cfg_path, "rb") as fh:
@@ -552,6 +675,7 @@ def load_config(file: Optional[Path] = None) -> AppConfig:
     def g(section: str, key: str, default: Any) -> Any:
         # construct env var like SECTION_KEY (dots -> underscores)
         env_key = f"{section}_{key}".upper().replace(".", "_")
+        env_keys.add(env_key)
         val = os.getenv(env_key)
         if val is not None:
             # best-effort casting
@@ -726,6 +850,7 @@ def load_config(file: Optional[Path] = None) -> AppConfig:
         historical=RateLimitClassConfig(
             per_minute=g("rate_limits.historical", "per_minute", 20),
             burst=g("rate_limits.historical", "burst", 10),
+            max_concurrent=_optional_int(g("rate_limits.historical", "max_concurrent", None)),
         ),
     )
 
@@ -734,6 +859,20 @@ def load_config(file: Optional[Path] = None) -> AppConfig:
         cold_codec=g("storage", "cold_codec", "zstd"),
         cold_codec_level=g("storage", "cold_codec_level", 7),
         hot_codec=g("storage", "hot_codec", "snappy"),
+        layouts={
+            str(view): WriteLayoutConfig(
+                sort_keys=_normalize_list(g(f"storage.layout.{view}", "sort_keys", [])),
+                row_group_size=int(g(f"storage.layout.{view}", "row_group_size", 0)),
+                dictionary_columns=_normalize_list(
+                    g(f"storage.layout.{view}", "dictionary_columns", [])
+                ),
+                statistics_columns=_normalize_list(
+                    g(f"storage.layout.{view}", "statistics_columns", [])
+                ),
+                page_index=bool(g(f"storage.layout.{view}", "page_index", True)),
+            )
+            for view in (raw.get("storage", {}).get("layout", {}) or {})
+        },
     )
 
     compaction = CompactionConfig(
@@ -755,6 +894,11 @@ def load_config(file: Optional[Path] = None) -> AppConfig:
             g("observability", "metrics_db_path", "data/metrics.db"), base=base_dir
         ),
         webhook_url=g("observability", "webhook_url", None),
+        summary_index_path=(
+            _as_path(g("observability", "summary_index_path", None), base=base_dir)
+            if g("observability", "summary_index_path", None)
+            else None
+        ),
     )
     mcp = MCPConfig(
         limit=int(g("mcp", "limit", 200)),
@@ -769,6 +913,8 @@ def load_config(file: Optional[Path] = None) -> AppConfig:
             )
         ),
         audit_db=_as_path(g("mcp", "audit_db", "state/run_logs/mcp_audit.db"), base=base_dir),
+        tool_concurrency=int(g("mcp", "tool_concurrency", 4)),
+        cache_ttl_seconds=float(g("mcp", "cache_ttl_seconds", 30.0)),
     )
     cli = CLIConfig(
         default_generic_ticks=g(
@@ -806,6 +952,10 @@ def load_config(file: Optional[Path] = None) -> AppConfig:
         force_frozen_data=bool(g("snapshot", "force_frozen_data", False)),
         fetch_mode=g("snapshot", "fetch_mode", "streaming"),
         batch_size=int(g("snapshot", "batch_size", 50)),
+        cost_ordering=bool(g("snapshot", "cost_ordering", False)),
+        slot_budget_seconds=float(g("snapshot", "slot_budget_seconds", 0.0)),
+        slot_deadline_seconds=float(g("snapshot", "slot_deadline_seconds", 0.0)),
+        clean_mode=str(g("snapshot", "clean_mode", "eager")).lower(),
     )
 
     streaming = StreamingConfig(
@@ -849,6 +999,7 @@ def load_config(file: Optional[Path] = None) -> AppConfig:
         delayed_ratio_threshold=float(g("qa", "delayed_ratio_threshold", 0.10)),
         rollup_fallback_threshold=float(g("qa", "rollup_fallback_threshold", 0.05)),
         oi_enrichment_threshold=float(g("qa", "oi_enrichment_threshold", 0.95)),
+        partial_slot_threshold=float(g("qa", "partial_slot_threshold", 0.10)),
     )
 
     acquisition = AcquisitionConfig(
@@ -863,6 +1014,8 @@ def load_config(file: Optional[Path] = None) -> AppConfig:
         ),
         historical_timeout=float(g("acquisition", "historical_timeout", 30.0)),
         throttle_sec=float(g("acquisition", "throttle_sec", 0.35)),
+        adaptive_what_to_show=bool(g("acquisition", "adaptive_what_to_show", True)),
+        what_to_show_explore_rate=float(g("acquisition", "what_to_show_explore_rate", 0.1)),
     )
 
     rollup = RollupConfig(
@@ -8,7 +8,7 @@ import json
 import altair as alt
 from typing import Any, Dict
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timedelta
 import pytz
 import pyarrow.dataset as ds
 import pyarrow.compute as pc
@@ -24,10 +24,15 @@ except RuntimeError:
 from opt_data.config import load_config, IBClientIdPoolConfig
 from opt_data.universe import load_universe
 from opt_data.util.calendar import to_et_date
+from opt_data.pipeline.clean_views import derive_clean
+from opt_data.pipeline.cleaning import CleaningPipeline
 from opt_data.pipeline.snapshot import SnapshotRunner
 from opt_data.pipeline.rollup import RollupRunner
 from opt_data.pipeline.enrichment import EnrichmentRunner
-from opt_data.pipeline.history import HistoryRunner
+from opt_data.pipeline.history import HistoryRunner, default_history_root
+from opt_data.storage.history import HistoryStore
+from opt_data.storage.lake import lake_dataset, lake_reader, list_parquet_files
+from opt_data.storage.partition_stats import aggregate_stats
 from opt_data.ib.session import IBSession
 
 APP_ROOT = Path(__file__).resolve().parents[3]
@@ -125,12 +130,24 @@ def load_parquet_data(path_str, _filter_expr=None, columns=None, row_limit: int
         if not path.exists():
             return pd.DataFrame()
 
-        # Use pyarrow dataset for robust partitioned loading
-        # This handles schema evolution/mismatches better than pd.read_parquet(dir)
-        dataset = ds.dataset(path, partitioning="hive")
-
-        scanner = dataset.scanner(columns=columns, filter=_filter_expr, use_threads=True)
-        table = scanner.head(row_limit) if row_limit else scanner.to_table()
+        view_dir = path.parent
+        if path.name.startswith("date=") and view_dir.name.startswith("view="):
+            # view=<v>/date=<d>: typed scan over the lake root's cached listings
+            table = lake_reader(view_dir.parent).scan(
+                view_dir.name[len("view=") :],
+                [path.name[len("date=") :]],
+                columns=columns,
+                filter=_filter_expr,
+                limit=row_limit or None,
+            )
+        else:
+            # Use pyarrow dataset for robust partitioned loading
+            # This handles schema evolution/mismatches better than pd.read_parquet(dir)
+            dataset = lake_dataset(path)
+            if dataset is None:
+                return pd.DataFrame()
+            scanner = dataset.scanner(columns=columns, filter=_filter_expr, use_threads=True)
+            table = scanner.head(row_limit) if row_limit else scanner.to_table()
         df = table.to_pandas()
         if row_limit is not None and len(df) > row_limit:
             df = df.head(row_limit)
@@ -140,14 +157,58 @@ def load_parquet_data(path_str, _filter_expr=None, columns=None, row_limit: int
         return pd.DataFrame()
 
 
-def compute_dataset_stats(path_str: str, _filter_expr=None, columns: list[str] | None = None):
-    """Stream dataset to compute counts without loading full tables into pandas."""
+def load_clean_snapshot_data(
+    cfg, path_str, _filter_expr=None, columns=None, row_limit: int | None = 2000
+):
+    """Load clean intraday/close rows from *path_str*.
+
+    In deferred clean mode *path_str* is the raw partition and rows are cleaned in memory,
+    so the dashboard never writes clean data.
+    """
+    if cfg.snapshot.clean_mode != "deferred":
+        return load_parquet_data(
+            path_str, _filter_expr=_filter_expr, columns=columns, row_limit=row_limit
+        )
+    raw_df = load_parquet_data(path_str, _filter_expr=_filter_expr, row_limit=row_limit)
+    if raw_df.empty:
+        return raw_df
+    clean_df = derive_clean(CleaningPipeline.create(cfg), raw_df)
+    if columns:
+        clean_df = clean_df[[c for c in columns if c in clean_df.columns]]
+    return clean_df
+
+
+def _sidecar_stats(path: Path, symbols: list[str] | None = None) -> dict | None:
+    """Aggregate ``_stats.json`` sidecars in the dashboard's stats shape, if all are fresh."""
+    wanted = [str(getattr(sym, "symbol", sym)) for sym in symbols] if symbols else None
+    try:
+        merged = aggregate_stats(path, underlyings=wanted)
+    except Exception:
+        return None
+    if merged is None:
+        return None
+    return {**merged, "underlyings": len(merged["underlyings"])}
+
+
+def compute_dataset_stats(
+    path_str: str,
+    _filter_expr=None,
+    columns: list[str] | None = None,
+    symbols: list[str] | None = None,
+):
+    """Partition counts from stats sidecars, streaming the dataset only when they are stale."""
     path = Path(path_str)
     if not path.exists():
         return None
 
-    dataset = ds.dataset(path, partitioning="hive")
+    sidecar = _sidecar_stats(path, symbols)
+    if sidecar is not None:
+        return sidecar
+
     try:
+        dataset = lake_dataset(path)
+        if dataset is None:
+            return None
         scanner = dataset.scanner(columns=columns, filter=_filter_expr, use_threads=True)
         stats: dict[str, Any] = {
             "rows": scanner.count_rows(),
@@ -207,13 +268,19 @@ def compute_dataset_stats(path_str: str, _filter_expr=None, columns: list[str] |
 
 @st.cache_data(ttl=60, show_spinner=False)
 def compute_fast_stats(path_str: str) -> dict | None:
-    """Read Parquet metadata only - no data scan. Ultra-fast for mobile."""
+    """Read stats sidecars, else Parquet metadata only - no data scan. Ultra-fast for mobile."""
     path = Path(path_str)
     if not path.exists():
         return {"exists": False, "rows": 0, "files": 0}
 
+    sidecar = _sidecar_stats(path)
+    if sidecar is not None:
+        return {"exists": True, **sidecar}
+
     try:
-        dataset = ds.dataset(path, partitioning="hive")
+        dataset = lake_dataset(path)
+        if dataset is None:
+            return {"exists": True, "rows": 0, "files": 0}
         fragments = list(dataset.get_fragments())
         total_rows = 0
         for frag in fragments:
@@ -228,30 +295,54 @@ def compute_fast_stats(path_str: str) -> dict | None:
         return {"exists": True, "rows": 0, "files": 0}
 
 
-def load_history_data(base_path: Path, symbol: str, date_str: str) -> pd.DataFrame:
-    """Load history JSON files for a symbol and date."""
-    target_dir = base_path / symbol / date_str
-    if not target_dir.exists():
-        return pd.DataFrame()
-
-    data = []
-    for f in target_dir.glob("*.json"):
-        try:
-            content = json.loads(f.read_text())
-            # content is a list of bars
-            for bar in content:
-                bar["conid"] = f.stem
-                data.append(bar)
-        except Exception:
-            pass
+@st.cache_data(max_entries=64, show_spinner=False)
+def _read_history_cached(
+    base_path: str,
+    symbol: str,
+    expiry_month: str,
+    conids: tuple[int, ...] | None,
+    start,
+    end,
+    columns: tuple[str, ...] | None,
+    version: tuple,
+) -> pd.DataFrame:
+    # ``version`` is part of the cache key only: a rewritten bucket yields a new entry
+    return HistoryStore(Path(base_path)).read(
+        symbol,
+        buckets=[expiry_month],
+        conids=conids,
+        start=start,
+        end=end,
+        columns=list(columns) if columns else None,
+    )
 
-    if not data:
-        return pd.DataFrame()
 
-    df = pd.DataFrame(data)
-    if "date" in df.columns:
-        df["date"] = pd.to_datetime(df["date"])
-    return df
+def load_history_data(
+    base_path: Path,
+    symbol: str,
+    expiry_month: str,
+    *,
+    conids: list[int] | None = None,
+    start=None,
+    end=None,
+    columns: list[str] | None = None,
+) -> pd.DataFrame:
+    """Load history bars for a symbol/expiry bucket from the parquet history store.
+
+    Conid/date filters and the column list are pushed down to the parquet scan; results
+    are cached per query and invalidated when the bucket's partition file changes.
+    """
+    store = HistoryStore(base_path)
+    return _read_history_cached(
+        str(base_path),
+        symbol,
+        expiry_month,
+        tuple(sorted(int(c) for c in conids)) if conids else None,
+        start,
+        end,
+        tuple(columns) if columns else None,
+        store.version(symbol, [expiry_month]),
+    )
 
 
 def render_history_tab(cfg, universe, *, lightweight_mode: bool = False):
@@ -364,45 +455,71 @@ def render_history_tab(cfg, universe, *, lightweight_mode: bool = False):
     # Source Selection
     data_source = st.radio(
         "Data Source",
-        ["Legacy JSON (Production)", "Weekend Backfill (Experiment)"],
+        ["History Store (Production)", "Weekend Backfill (Experiment)"],
         horizontal=True,
     )
 
-    if data_source == "Legacy JSON (Production)":
-        # Original Logic
-        history_base = Path(cfg.paths.clean) / "ib" / "history"
-
-        if not history_base.exists():
-            st.info("No history data found yet.")
-            return
+    if data_source == "History Store (Production)":
+        history_base = default_history_root(cfg)
+        store = HistoryStore(history_base)
 
-        avail_symbols = [d.name for d in history_base.iterdir() if d.is_dir()]
+        # Symbols/expiry buckets come from the store manifest (no directory listing)
+        avail_symbols = store.symbols()
         if not avail_symbols:
-            st.info("No symbols in history directory.")
+            st.info("No history data found yet.")
             return
 
         v1, v2 = st.columns([1, 3])
 
         with v1:
-            view_symbol = st.selectbox("Select Symbol", sorted(avail_symbols))
+            view_symbol = st.selectbox("Select Symbol", avail_symbols)
 
-            sym_dir = history_base / view_symbol
-            avail_dates = sorted([d.name for d in sym_dir.iterdir() if d.is_dir()], reverse=True)
+            avail_buckets = store.expiry_buckets(view_symbol)
 
-            if not avail_dates:
-                st.warning("No dates found for symbol.")
-                view_date = None
+            if not avail_buckets:
+                st.warning("No expiries found for symbol.")
+                view_bucket = None
             else:
-                view_date = st.selectbox("Select Run Date", avail_dates)
+                view_bucket = st.selectbox("Select Expiry Month", avail_buckets)
 
-        with v2:
-            if view_symbol and view_date:
-                df = load_history_data(history_base, view_symbol, view_date)
+            view_conids = (
+                st.multiselect(
+                    "Contracts (Empty = All)", store.conids(view_symbol, view_bucket), default=[]
+                )
+                if view_bucket
+                else []
+            )
+            lookback_days = st.number_input("Lookback Days (0 = All)", min_value=0, value=0, step=5)
 
-                if df.empty:
-                    st.warning("No data found in files.")
+        with v2:
+            if view_symbol and view_bucket:
+                view_start = (
+                    to_et_date(datetime.now(pytz.utc)) - timedelta(days=int(lookback_days))
+                    if lookback_days
+                    else None
+                )
+                try:
+                    df = load_history_data(
+                        history_base,
+                        view_symbol,
+                        view_bucket,
+                        conids=view_conids or None,
+                        start=view_start,
+                        # Lightweight mode only shows counts; skip the bar payload columns
+                        columns=["conid", "date"] if lightweight_mode else None,
+                    )
+                except Exception as e:
+                    st.error(f"Failed to read history store: {e}")
+                    df = None
+
+                if df is None:
+                    pass  # read error already reported above
+                elif df.empty:
+                    st.warning("No data found in store.")
                 else:
-                    st.caption(f"Loaded {len(df)} records (bars) for {view_symbol} on {view_date}")
+                    st.caption(
+                        f"Loaded {len(df)} records (bars) for {view_symbol} expiring {view_bucket}"
+                    )
 
                     m1, m2, m3 = st.columns(3)
                     m1.metric("Total Bars", len(df))
@@ -578,8 +695,11 @@ def render_operations_tab(*, lightweight_mode: bool = True):
 
     # Paths - CORRECTED to ib/chain
     clean_base = Path(cfg.paths.clean)
-    intraday_path = clean_base / "view=intraday" / f"date={selected_date}"
-    close_path = clean_base / "view=close" / f"date={selected_date}"
+    # Deferred clean mode derives intraday/close from raw on read: counts come from the raw
+    # partitions (cleaning is row-wise) and tables are cleaned in memory, nothing is written
+    snapshot_base = Path(cfg.paths.raw) if cfg.snapshot.clean_mode == "deferred" else clean_base
+    intraday_path = snapshot_base / "view=intraday" / f"date={selected_date}"
+    close_path = snapshot_base / "view=close" / f"date={selected_date}"
     daily_path = clean_base / "view=daily_clean" / f"date={selected_date}"
     enrich_path = clean_base / "view=enrichment" / f"date={selected_date}"
 
@@ -631,9 +751,7 @@ def render_operations_tab(*, lightweight_mode: bool = True):
     else:
         # Desktop mode: original 5-column layout
         intraday_exists = intraday_path.exists()
-        intraday_count = (
-            sum(1 for _ in intraday_path.glob("**/*.parquet")) if intraday_exists else 0
-        )
+        intraday_count = len(list_parquet_files(intraday_path)) if intraday_exists else 0
         close_exists = close_path.exists()
         daily_exists = daily_path.exists()
         enrich_exists = enrich_path.exists()
@@ -948,6 +1066,7 @@ def render_operations_tab(*, lightweight_mode: bool = True):
                 st.session_state[close_stats_key] = compute_dataset_stats(
                     str(close_path),
                     _filter_expr=ds.field("underlying").isin(symbols_arg) if symbols_arg else None,
+                    symbols=symbols_arg,
                     columns=[
                         "underlying",
                         "snapshot_error",
@@ -1011,14 +1130,21 @@ def render_operations_tab(*, lightweight_mode: bool = True):
                     "data_quality_flag",
                 ]
 
-                df_close = load_parquet_data(
-                    str(close_path),
-                    columns=close_cols,
-                    _filter_expr=close_filter,
-                    row_limit=row_limit_default,
-                )
+                try:
+                    df_close = load_clean_snapshot_data(
+                        cfg,
+                        str(close_path),
+                        columns=close_cols,
+                        _filter_expr=close_filter,
+                        row_limit=row_limit_default,
+                    )
+                except Exception as e:
+                    st.error(f"Failed to derive clean close rows: {e}")
+                    df_close = None
 
-                if df_close.empty:
+                if df_close is None:
+                    pass  # read error already reported above
+                elif df_close.empty:
                     st.info(
                         "Close snapshot data exists but returned no rows. "
                         "Check partitions or adjust filters."
@@ -1050,6 +1176,7 @@ def render_operations_tab(*, lightweight_mode: bool = True):
                 st.session_state[rollup_stats_key] = compute_dataset_stats(
                     str(daily_path),
                     _filter_expr=ds.field("underlying").isin(symbols_arg) if symbols_arg else None,
+                    symbols=symbols_arg,
                     columns=[
                         "underlying",
                         "rollup_strategy",
@@ -1148,6 +1275,7 @@ def render_operations_tab(*, lightweight_mode: bool = True):
                 st.session_state[oi_stats_key] = compute_dataset_stats(
                     str(daily_path),
                     _filter_expr=ds.field("underlying").isin(symbols_arg) if symbols_arg else None,
+                    symbols=symbols_arg,
                     columns=[
                         "underlying",
                         "open_interest",
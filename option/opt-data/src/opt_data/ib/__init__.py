@@ -15,7 +15,11 @@ from .history import (
     fetch_option_open_interest,
     fetch_midpoint_daily,
     fetch_option_daily_aggregated,
+    fetch_option_daily_frame,
+    aggregate_daily_bars,
+    aggregate_daily_frame,
     bars_to_dicts,
+    bars_to_frame,
 )
 
 __all__ = [
@@ -33,5 +37,9 @@ __all__ = [
     "fetch_option_open_interest",
     "fetch_midpoint_daily",
     "fetch_option_daily_aggregated",
+    "fetch_option_daily_frame",
+    "aggregate_daily_bars",
+    "aggregate_daily_frame",
     "bars_to_dicts",
+    "bars_to_frame",
 ]
@@ -5,7 +5,6 @@ from pathlib import Path
 from typing import Any, Callable, Dict, List, Iterable, Optional, TYPE_CHECKING
 from collections import defaultdict
 import calendar
-import json
 import logging
 from datetime import date, timedelta
 
@@ -15,6 +14,7 @@ from ..util.expiry import (
     is_quarterly_expiry,
     third_friday,
 )
+from ..util.cache_manager import contract_cache
 from ..util.retry import retry_with_backoff
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -35,6 +35,20 @@ def _qualify_contracts_chunk(ib: Any, contracts: List[Any]) -> List[Any]:
     return ib.qualifyContracts(*contracts)
 
 
+def _qualify_chunk_size(total_contracts: int) -> int:
+    """Adaptive qualifyContracts batch size based on total contract count.
+
+    Smaller batches for small sets, larger for medium, capped for very large.
+    """
+    if total_contracts <= 25:
+        return max(total_contracts, 1)  # Process all at once for small sets
+    if total_contracts <= 100:
+        return 50  # Standard batch size
+    if total_contracts <= 500:
+        return 75  # Larger batches for medium sets
+    return 100  # Cap at 100 for very large sets to avoid timeouts
+
+
 @dataclass
 class ContractInfo:
     conid: int
@@ -52,17 +66,11 @@ def cache_path(root: Path, symbol: str, trade_date: str) -> Path:
 
 
 def load_cache(root: Path, symbol: str, trade_date: str) -> List[Dict[str, Any]]:
-    p = cache_path(root, symbol, trade_date)
-    if p.exists():
-        return json.loads(p.read_text(encoding="utf-8"))
-    return []
+    return contract_cache(root).load(symbol, date.fromisoformat(trade_date)) or []
 
 
 def save_cache(root: Path, symbol: str, trade_date: str, items: List[Dict[str, Any]]) -> Path:
-    p = cache_path(root, symbol, trade_date)
-    p.parent.mkdir(parents=True, exist_ok=True)
-    p.write_text(json.dumps(items), encoding="utf-8")
-    return p
+    return contract_cache(root).save(symbol, date.fromisoformat(trade_date), items)
 
 
 def filter_by_scope(
@@ -333,23 +341,11 @@ def discover_contracts_for_symbol(
     strikes_all = sorted(float(s) for s in secdef.strikes if s is not None)
     if not strikes_all:
         return []
-    cached_strikes: List[float] = []
+    # Reuse the items already loaded above instead of re-reading the cache file
     cached_path = cache_path(cache_root, symbol, cache_key)
-    if cached_path.exists():
-        try:
-            cached_items = json.loads(cached_path.read_text(encoding="utf-8"))
-            cached_strikes = sorted(
-                {
-                    float(item.get("strike", 0.0))
-                    for item in cached_items
-                    if item.get("strike") is not None
-                }
-            )
-        except Exception as exc:  # pragma: no cover - logging only
-            logger.debug(
-                "Failed to read cached strikes for comparison",
-                extra={"path": str(cached_path), "error": str(exc)},
-            )
+    cached_strikes: List[float] = sorted(
+        {float(item.get("strike", 0.0)) for item in cached if item.get("strike") is not None}
+    )
     if logger.isEnabledFor(logging.DEBUG):
         logger.debug(
             "SecDef strikes fetched",
@@ -475,17 +471,8 @@ def discover_contracts_for_symbol(
     # Batch qualify; no per-candidate reqContractDetails
     qualified: List[Any] = []
 
-    # Adaptive batch size based on total contract count
-    # Smaller batches for small sets, larger for medium, capped for very large
     total_contracts = len(options)
-    if total_contracts <= 25:
-        CHUNK = total_contracts  # Process all at once for small sets
-    elif total_contracts <= 100:
-        CHUNK = 50  # Standard batch size
-    elif total_contracts <= 500:
-        CHUNK = 75  # Larger batches for medium sets
-    else:
-        CHUNK = 100  # Cap at 100 for very large sets to avoid timeouts
+    CHUNK = _qualify_chunk_size(total_contracts)
 
     logger.debug(
         f"Qualifying {total_contracts} contracts with batch size {CHUNK}",
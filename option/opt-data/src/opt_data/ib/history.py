@@ -4,6 +4,7 @@ import time
 from typing import Any, Callable, Iterable, Sequence, TYPE_CHECKING
 
 if TYPE_CHECKING:  # pragma: no cover
+    import pandas as pd
     from ib_insync import IB
     from ib_insync.contract import Contract
 
@@ -55,6 +56,118 @@ def fetch_daily(
     return list(bars) if bars else []
 
 
+BAR_FIELDS = ("date", "open", "high", "low", "close", "volume", "barCount", "average")
+DAILY_COLUMNS = ["date", "open", "high", "low", "close", "volume", "barCount", "wap"]
+
+
+def bars_to_frame(bars: Iterable[Any], fields: Sequence[str] = BAR_FIELDS) -> "pd.DataFrame":
+    """Convert IB bars (``BarDataList`` or dicts) into a columnar DataFrame in one pass."""
+    import pandas as pd
+
+    items = bars if isinstance(bars, list) else list(bars)
+    if not items:
+        return pd.DataFrame(columns=list(fields))
+    if isinstance(items[0], dict):
+        return pd.DataFrame.from_records(items)
+    return pd.DataFrame({name: [getattr(b, name, None) for b in items] for name in fields})
+
+
+def aggregate_daily_frame(frame: "pd.DataFrame") -> "pd.DataFrame":
+    """Group intraday bars into daily OHLC bars with vectorized pandas operations.
+
+    Per day: first open, max high, min low, last close, summed non-negative volume and
+    barCount (quote bars report -1/-2), and WAP weighted by volume, else barCount, else 1.
+    """
+    import numpy as np
+    import pandas as pd
+
+    if frame.empty:
+        return pd.DataFrame(columns=DAILY_COLUMNS)
+
+    try:
+        stamps = pd.to_datetime(frame["date"], errors="coerce")
+    except (TypeError, ValueError):  # mixed UTC offsets
+        stamps = pd.to_datetime(frame["date"], errors="coerce", utc=True)
+    day = stamps.dt.strftime("%Y-%m-%d")
+
+    def _numeric(name: str) -> "pd.Series":
+        if name not in frame.columns:
+            return pd.Series(np.nan, index=frame.index, dtype="float64")
+        return pd.to_numeric(frame[name], errors="coerce").astype("float64")
+
+    volume = _numeric("volume").fillna(0.0).clip(lower=0.0)
+    count = _numeric("barCount").fillna(0.0).clip(lower=0.0)
+    wap = _numeric("wap")
+    if "average" in frame.columns:
+        wap = wap.fillna(_numeric("average"))
+    weight = np.where(volume > 0, volume, np.where(count > 0, count, 1.0))
+    has_wap = wap.notna().to_numpy()
+
+    work = pd.DataFrame(
+        {
+            "date": day,
+            "open": _numeric("open"),
+            "high": _numeric("high"),
+            "low": _numeric("low"),
+            "close": _numeric("close"),
+            "volume": volume,
+            "barCount": count,
+            "_wap_num": np.where(has_wap, wap.fillna(0.0).to_numpy() * weight, 0.0),
+            "_wap_den": np.where(has_wap, weight, 0.0),
+        }
+    )
+    work = work[day.notna()]
+    daily = work.groupby("date", sort=True).agg(
+        high=("high", "max"),
+        low=("low", "min"),
+        volume=("volume", "sum"),
+        barCount=("barCount", "sum"),
+        _wap_num=("_wap_num", "sum"),
+        _wap_den=("_wap_den", "sum"),
+    )
+    # Open/close come from the literal first/last bar of the day, even when NaN;
+    # groupby first/last would skip NaN and silently pick a different bar.
+    daily["open"] = work.drop_duplicates("date", keep="first").set_index("date")["open"]
+    daily["close"] = work.drop_duplicates("date", keep="last").set_index("date")["close"]
+    den = daily["_wap_den"]
+    daily["wap"] = (daily["_wap_num"] / den.where(den > 0)).astype(object)
+    daily["wap"] = daily["wap"].where(den > 0, None)
+    daily["barCount"] = daily["barCount"].astype("int64")
+    return daily.reset_index()[DAILY_COLUMNS]
+
+
+def aggregate_daily_bars(bars: Iterable[Any]) -> list[dict[str, Any]]:
+    """Aggregate intraday bars into the daily bar dicts returned by the history helpers."""
+    daily = aggregate_daily_frame(bars_to_frame(bars))
+    if daily.empty:
+        return []
+    return daily.to_dict(orient="records")
+
+
+def fetch_option_daily_frame(
+    ib: "IB",
+    contract: "Contract",
+    *,
+    what_to_show: str = "MIDPOINT",
+    duration: str = "30 D",
+    end_date_time: str = "",
+    use_rth: bool = True,
+    throttle: Throttle | None = None,
+) -> "pd.DataFrame":
+    """Like :func:`fetch_option_daily_aggregated` but returns the daily bars as a DataFrame."""
+    bars = fetch_daily(
+        ib,
+        contract,
+        what_to_show=what_to_show,
+        duration=duration,
+        bar_size="8 hours",
+        end_date_time=end_date_time,
+        use_rth=use_rth,
+        throttle=throttle,
+    )
+    return aggregate_daily_frame(bars_to_frame(bars))
+
+
 def fetch_option_daily_aggregated(
     ib: "IB",
     contract: "Contract",
@@ -71,120 +184,18 @@ def fetch_option_daily_aggregated(
     Workaround for IBKR Error 162 (No data of type EODChart).
     Requests 8-hour bars and aggregates them into single daily bars.
     """
-    bars = fetch_daily(
+    daily = fetch_option_daily_frame(
         ib,
         contract,
         what_to_show=what_to_show,
         duration=duration,
-        bar_size="8 hours",
         end_date_time=end_date_time,
         use_rth=use_rth,
         throttle=throttle,
     )
-
-    if not bars:
+    if daily.empty:
         return []
-
-    def _get_wap(bar: Any) -> float | None:
-        """Best-effort read of weighted average price from BarData."""
-        for attr in ("wap", "average"):
-            val = getattr(bar, attr, None)
-            if val is None:
-                continue
-            try:
-                return float(val)
-            except Exception:
-                continue
-        return None
-
-    def _nonneg(value: Any) -> float:
-        """Coerce volume/barCount to non-negative floats (quote bars use -1/-2)."""
-        try:
-            v = float(value)
-        except Exception:
-            return 0.0
-        return v if v > 0 else 0.0
-
-    daily_bars: list[dict[str, Any]] = []
-    current_day = None
-
-    # Initialize accumulators
-    day_open = 0.0
-    day_high = 0.0
-    day_low = 0.0
-    day_close = 0.0
-    day_volume = 0.0
-    day_count = 0.0
-    day_wap_num = 0.0
-    day_wap_den = 0.0
-
-    for b in bars:
-        # b.date is typically datetime.date or datetime.datetime
-        # Ensure we get a date object
-        b_date = b.date.date() if hasattr(b.date, "date") else b.date
-
-        if b_date != current_day:
-            # Commit previous day
-            if current_day is not None:
-                daily_bars.append(
-                    {
-                        "date": current_day.isoformat(),
-                        "open": day_open,
-                        "high": day_high,
-                        "low": day_low,
-                        "close": day_close,
-                        "volume": day_volume,
-                        "barCount": int(day_count),
-                        "wap": (day_wap_num / day_wap_den) if day_wap_den > 0 else None,
-                    }
-                )
-
-            # Start new day
-            current_day = b_date
-            day_open = b.open
-            day_high = b.high
-            day_low = b.low
-            day_close = b.close
-            day_volume = _nonneg(getattr(b, "volume", 0))
-            day_count = _nonneg(getattr(b, "barCount", 0))
-            day_wap_num = 0.0
-            day_wap_den = 0.0
-            wap = _get_wap(b)
-            if wap is not None:
-                weight = day_volume or day_count or 1.0
-                day_wap_num = wap * weight
-                day_wap_den = weight
-        else:
-            # Aggregate into current day
-            day_high = max(day_high, b.high)
-            day_low = min(day_low, b.low)
-            day_close = b.close  # Close is always the last bar's close
-            bar_volume = _nonneg(getattr(b, "volume", 0))
-            bar_count = _nonneg(getattr(b, "barCount", 0))
-            day_volume += bar_volume
-            day_count += bar_count
-            wap = _get_wap(b)
-            if wap is not None:
-                weight = bar_volume or bar_count or 1.0
-                day_wap_num += wap * weight
-                day_wap_den += weight
-
-    # Commit last day
-    if current_day is not None:
-        daily_bars.append(
-            {
-                "date": current_day.isoformat(),
-                "open": day_open,
-                "high": day_high,
-                "low": day_low,
-                "close": day_close,
-                "volume": day_volume,
-                "barCount": int(day_count),
-                "wap": (day_wap_num / day_wap_den) if day_wap_den > 0 else None,
-            }
-        )
-
-    return daily_bars
+    return daily.to_dict(orient="records")
 
 
 def fetch_option_open_interest(
@@ -251,4 +262,9 @@ __all__ = [
     "fetch_option_open_interest",
     "fetch_midpoint_daily",
     "bars_to_dicts",
+    "bars_to_frame",
+    "aggregate_daily_frame",
+    "aggregate_daily_bars",
+    "fetch_option_daily_frame",
+    "fetch_option_daily_aggregated",
 ]
@@ -3,6 +3,7 @@ from __future__ import annotations
 import asyncio
 import logging
 import math
+import time
 from typing import Any, Callable, Dict, List, Optional, Sequence
 
 from opt_data.util.performance import log_performance
@@ -30,6 +31,7 @@ def collect_option_snapshots(
     batch_size: int = 50,
     metrics: Optional[Any] = None,
     alerts: Optional[Any] = None,
+    deadline: Optional[float] = None,
 ) -> List[Dict[str, Any]]:
     """
     Collect option snapshots concurrently using asyncio.
@@ -48,6 +50,10 @@ def collect_option_snapshots(
         batch_size: Number of contracts per batch (for reqtickers mode)
         metrics: Optional MetricsCollector instance for instrumentation
         alerts: Optional AlertManager instance for notifications
+        deadline: Optional ``time.time()`` timestamp bounding the whole collection. Waits
+            are cut short at the deadline (keeping whatever data arrived), contracts not
+            yet requested get ``deadline`` error rows, and every affected row carries
+            ``deadline_reached=True``.
 
     Returns:
         List of dictionaries containing market data for each contract.
@@ -89,6 +95,7 @@ def collect_option_snapshots(
             concurrency=concurrency,
             metrics=metrics,
             alerts=alerts,
+            deadline=deadline,
         )
     elif mode == "snapshot":
         # Event-driven snapshot mode
@@ -102,6 +109,7 @@ def collect_option_snapshots(
             concurrency=concurrency,
             metrics=metrics,
             alerts=alerts,
+            deadline=deadline,
         )
     elif mode == "reqtickers":
         # Batch reqTickers mode
@@ -115,6 +123,7 @@ def collect_option_snapshots(
             require_greeks=require_greeks,
             metrics=metrics,
             alerts=alerts,
+            deadline=deadline,
         )
 
 
@@ -130,6 +139,7 @@ def _collect_streaming(
     concurrency: int,
     metrics: Optional[Any],
     alerts: Optional[Any],
+    deadline: Optional[float] = None,
 ) -> List[Dict[str, Any]]:
     """Streaming mode: reqMktData(snapshot=False) with polling."""
     try:
@@ -148,6 +158,7 @@ def _collect_streaming(
                 concurrency=concurrency,
                 metrics=metrics,
                 alerts=alerts,
+                deadline=deadline,
             )
         )
     except Exception as e:
@@ -167,6 +178,7 @@ def _collect_snapshot_mode(
     concurrency: int,
     metrics: Optional[Any],
     alerts: Optional[Any],
+    deadline: Optional[float] = None,
 ) -> List[Dict[str, Any]]:
     """Snapshot mode: reqMktData(snapshot=True) with event-driven waiting."""
     try:
@@ -181,6 +193,7 @@ def _collect_snapshot_mode(
                 concurrency=concurrency,
                 metrics=metrics,
                 alerts=alerts,
+                deadline=deadline,
             )
         )
     except Exception as e:
@@ -199,6 +212,7 @@ async def _collect_snapshot_async(
     concurrency: int,
     metrics: Optional[Any],
     alerts: Optional[Any],
+    deadline: Optional[float] = None,
 ) -> List[Dict[str, Any]]:
     """Async implementation using snapshot=True mode."""
     from ib_insync import Option, Ticker  # type: ignore
@@ -244,6 +258,10 @@ async def _collect_snapshot_async(
 
         async with sem:
             try:
+                remaining = _deadline_remaining(deadline)
+                if remaining is not None and remaining <= 0:
+                    return _deadline_row(opt._origin_info)
+
                 # Rate limiting
                 if acquire_token:
                     token_wait_start = loop.time()
@@ -281,32 +299,37 @@ async def _collect_snapshot_async(
 
                 ticker.updateEvent.connect(on_update)
 
+                wait_limit, cut_by_deadline = _wait_limit(timeout, deadline)
                 try:
-                    await asyncio.wait_for(done.wait(), timeout)
+                    await asyncio.wait_for(done.wait(), wait_limit)
                     data_wait_ms = (loop.time() - data_wait_start) * 1000
                     if metrics:
                         tags = {"symbol": opt.symbol, "exchange": opt.exchange, "mode": "snapshot"}
                         metrics.timing("snapshot.data_wait.duration", data_wait_ms, tags)
                 except asyncio.TimeoutError:
-                    logger.warning(f"Timeout for {opt.symbol}")
-                    return _build_error_row(
-                        opt._origin_info, "timeout", f"Data not ready after {timeout}s"
-                    )
+                    if not cut_by_deadline:
+                        logger.warning(f"Timeout for {opt.symbol}")
+                        return _build_error_row(
+                            opt._origin_info, "timeout", f"Data not ready after {timeout}s"
+                        )
                 finally:
                     ticker.updateEvent.disconnect(on_update)
                     ib.cancelMktData(opt)
 
-                # Build result
+                # Build result (after a deadline cut: whatever arrived so far)
                 price_ready = _has_price(ticker)
                 greeks_ready = _has_greeks(ticker)
                 timed_out = not (price_ready and (not require_greeks or greeks_ready))
-                return _build_row(
+                row = _build_row(
                     opt._origin_info,
                     ticker,
                     price_ready=price_ready,
                     greeks_ready=greeks_ready,
                     timed_out=timed_out,
                 )
+                if cut_by_deadline and timed_out:
+                    row["deadline_reached"] = True
+                return row
 
             except Exception as e:
                 logger.exception(
@@ -373,6 +396,27 @@ def _build_error_row(info: Dict[str, Any], error_type: str, error_message: str)
     }
 
 
+def _deadline_remaining(deadline: Optional[float]) -> Optional[float]:
+    """Seconds left until *deadline* (``time.time()`` based); None when unbounded."""
+    if deadline is None:
+        return None
+    return deadline - time.time()
+
+
+def _wait_limit(timeout: float, deadline: Optional[float]) -> tuple[float, bool]:
+    """Per-contract wait clamped to the deadline, and whether the deadline is the bound."""
+    remaining = _deadline_remaining(deadline)
+    if remaining is None or remaining >= timeout:
+        return timeout, False
+    return max(remaining, 0.0), True
+
+
+def _deadline_row(info: Dict[str, Any]) -> Dict[str, Any]:
+    row = _build_error_row(info, "deadline", "Slot deadline reached before request")
+    row["deadline_reached"] = True
+    return row
+
+
 def _collect_reqtickers(
     ib: Any,
     contracts: Sequence[Dict[str, Any]],
@@ -384,6 +428,7 @@ def _collect_reqtickers(
     require_greeks: bool,
     metrics: Optional[Any],
     alerts: Optional[Any],
+    deadline: Optional[float] = None,
 ) -> List[Dict[str, Any]]:
     """Batch reqTickers mode."""
     try:
@@ -398,6 +443,7 @@ def _collect_reqtickers(
                 require_greeks=require_greeks,
                 metrics=metrics,
                 alerts=alerts,
+                deadline=deadline,
             )
         )
     except Exception as e:
@@ -416,6 +462,7 @@ async def _collect_reqtickers_async(
     require_greeks: bool,
     metrics: Optional[Any],
     alerts: Optional[Any],
+    deadline: Optional[float] = None,
 ) -> List[Dict[str, Any]]:
     """Async implementation using reqTickers for batching."""
     from ib_insync import Option  # type: ignore
@@ -460,6 +507,11 @@ async def _collect_reqtickers_async(
         loop = asyncio.get_running_loop()
         batch_start = loop.time()
 
+        remaining = _deadline_remaining(deadline)
+        if remaining is not None and remaining <= 0:
+            results.extend(_deadline_row(opt._origin_info) for opt in batch)
+            continue
+
         if acquire_token:
             try:
                 acquire_token()
@@ -470,7 +522,12 @@ async def _collect_reqtickers_async(
             logger.info(
                 f"Requesting tickers for batch {i // batch_size + 1} ({len(batch)} contracts)..."
             )
-            tickers = await ib.reqTickersAsync(*batch)
+            try:
+                tickers = await asyncio.wait_for(ib.reqTickersAsync(*batch), remaining)
+            except asyncio.TimeoutError:
+                logger.warning(f"Slot deadline reached during batch {i // batch_size + 1}")
+                results.extend(_deadline_row(opt._origin_info) for opt in batch)
+                continue
 
             for ticker in tickers:
                 info = ticker.contract._origin_info
@@ -519,6 +576,7 @@ async def _collect_async(
     concurrency: int,
     metrics: Optional[Any],
     alerts: Optional[Any],
+    deadline: Optional[float] = None,
 ) -> List[Dict[str, Any]]:
     """Async implementation of the snapshot collection logic."""
     from ib_insync import Option  # type: ignore
@@ -604,6 +662,10 @@ async def _collect_async(
 
         async with sem:
             try:
+                remaining = _deadline_remaining(deadline)
+                if remaining is not None and remaining <= 0:
+                    return _deadline_row(opt._origin_info)
+
                 # Rate limiting hook - measure wait time separately
                 if acquire_token:
                     token_wait_start = loop.time()
@@ -637,10 +699,11 @@ async def _collect_async(
                     )
 
                 # Wait for data with timeout - measure data wait time separately
+                wait_limit, cut_by_deadline = _wait_limit(timeout, deadline)
                 try:
                     data_wait_start = loop.time()
 
-                    while (loop.time() - data_wait_start) < timeout:
+                    while (loop.time() - data_wait_start) < wait_limit:
                         price_ready = _has_price(ticker)
                         greeks_ready = _has_greeks(ticker)
 
@@ -693,6 +756,8 @@ async def _collect_async(
                         greeks_ready=greeks_ready,
                         timed_out=timed_out,
                     )
+                    if cut_by_deadline and timed_out:
+                        row["deadline_reached"] = True
                     return row
 
                 except Exception as e:
@@ -2,17 +2,33 @@ from __future__ import annotations
 
 import json
 import logging
+import queue
 import sqlite3
+import threading
 from pathlib import Path
 from typing import Any, Mapping
 
 logger = logging.getLogger(__name__)
 
 
+_STOP = object()
+
+
 class AuditLogger:
-    def __init__(self, db_path: Path) -> None:
+    def __init__(
+        self,
+        db_path: Path,
+        *,
+        batch_size: int = 50,
+        flush_interval: float = 0.5,
+    ) -> None:
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self._queue: queue.Queue[Any] = queue.Queue()
+        self._writer: threading.Thread | None = None
+        self._writer_lock = threading.Lock()
         self._init_db()
 
     def _init_db(self) -> None:
@@ -47,22 +63,75 @@ class AuditLogger:
         status: str,
         error: str | None = None,
     ) -> None:
+        """Queue an audit row; a background writer inserts queued rows in batches."""
         try:
             params_json = json.dumps(params, ensure_ascii=False)
-            with sqlite3.connect(self.db_path) as conn:
-                conn.execute(
-                    """
-                    INSERT INTO mcp_audit_log (
-                        tool_name,
-                        params,
-                        rows_returned,
-                        duration_ms,
-                        status,
-                        error
-                    )
-                    VALUES (?, ?, ?, ?, ?, ?)
-                    """,
-                    (tool_name, params_json, rows_returned, duration_ms, status, error),
-                )
         except Exception as exc:  # pragma: no cover - best-effort audit
-            logger.warning(f"Failed to write MCP audit record: {exc}")
+            logger.warning(f"Failed to encode MCP audit params: {exc}")
+            params_json = None
+        self._ensure_writer()
+        self._queue.put((tool_name, params_json, rows_returned, duration_ms, status, error))
+
+    def flush(self) -> None:
+        """Block until every queued record has been written."""
+        if self._writer is not None:
+            self._queue.join()
+
+    def close(self) -> None:
+        with self._writer_lock:
+            writer = self._writer
+            self._writer = None
+        if writer is not None:
+            self._queue.put(_STOP)
+            writer.join()
+
+    def _ensure_writer(self) -> None:
+        if self._writer is not None:
+            return
+        with self._writer_lock:
+            if self._writer is None:
+                self._writer = threading.Thread(
+                    target=self._drain, name="mcp-audit-writer", daemon=True
+                )
+                self._writer.start()
+
+    def _drain(self) -> None:
+        conn = sqlite3.connect(self.db_path)
+        try:
+            while True:
+                item = self._queue.get()
+                batch = [item]
+                while len(batch) < self.batch_size:
+                    try:
+                        batch.append(self._queue.get(timeout=self.flush_interval))
+                    except queue.Empty:
+                        break
+                    if batch[-1] is _STOP:
+                        break
+                rows = [row for row in batch if row is not _STOP]
+                try:
+                    if rows:
+                        with conn:
+                            conn.executemany(
+                                """
+                                INSERT INTO mcp_audit_log (
+                                    tool_name,
+                                    params,
+                                    rows_returned,
+                                    duration_ms,
+                                    status,
+                                    error
+                                )
+                                VALUES (?, ?, ?, ?, ?, ?)
+                                """,
+                                rows,
+                            )
+                except Exception as exc:  # pragma: no cover - best-effort audit
+                    logger.warning(f"Failed to write MCP audit records: {exc}")
+                finally:
+                    for _ in batch:
+                        self._queue.task_done()
+                if len(rows) != len(batch):
+                    return
+        finally:
+            conn.close()
@@ -5,15 +5,22 @@ import logging
 import sqlite3
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Iterable
+from typing import Any
 from zoneinfo import ZoneInfo
 
-import pandas as pd
-
 from ..config import AppConfig
+from ..observability.summary_index import SummaryIndex, summary_index_path
+from ..storage.lake import lake_reader
 
 logger = logging.getLogger(__name__)
 
+# kind -> (run_logs subdir, filename prefix) for report files
+REPORT_FILES = {
+    "metrics": ("metrics", "metrics_"),
+    "selfcheck": ("selfcheck", "selfcheck_"),
+    "errors": ("errors", "summary_"),
+}
+
 
 class DataAccess:
     def __init__(
@@ -24,6 +31,7 @@ class DataAccess:
         allow_clean: bool = True,
         timezone: str | None = None,
     ) -> None:
+        self.cfg = cfg
         self.raw_root = Path(cfg.paths.raw)
         self.clean_root = Path(cfg.paths.clean)
         self.run_logs = Path(cfg.paths.run_logs)
@@ -31,6 +39,87 @@ class DataAccess:
         self.allow_raw = allow_raw
         self.allow_clean = allow_clean
         self.tz_name = timezone or cfg.timezone.name
+        self.index_path = summary_index_path(cfg)
+        self._index: SummaryIndex | None = None
+        self._cleaner: Any = None
+
+    @property
+    def index(self) -> SummaryIndex | None:
+        """Summary index written by the pipeline; None until the first run creates it."""
+        if self._index is None:
+            self._index = SummaryIndex.open_existing(self.index_path)
+        return self._index
+
+    def freshness_token(self) -> tuple[int, ...]:
+        """Mtimes that change whenever partitions or run reports are written.
+
+        Partition writes update the summary index file; report files land in the
+        run_logs subdirectories (directory mtimes change when files are created).
+        """
+        paths = [self.index_path]
+        paths.extend(self.run_logs / subdir for subdir, _ in REPORT_FILES.values())
+        token: list[int] = []
+        for path in paths:
+            try:
+                token.append(path.stat().st_mtime_ns)
+            except OSError:
+                token.append(0)
+        return tuple(token)
+
+    def report_path(self, kind: str, day: str) -> Path:
+        subdir, prefix = REPORT_FILES[kind]
+        return self.run_logs / subdir / f"{prefix}{day.replace('-', '')}.json"
+
+    def reports_for_dates(self, dates: list[str]) -> dict[tuple[str, str], tuple[Path, dict]]:
+        """Return {(kind, day): (path, payload)} from the index, reading files only for gaps."""
+        found: dict[tuple[str, str], tuple[Path, dict]] = {}
+        index = self.index
+        if index is not None:
+            for key, report in index.reports_for_dates(dates).items():
+                path = Path(report["path"]) if report["path"] else self.report_path(*key)
+                found[key] = (path, report["payload"])
+        for day in dates:
+            for kind in REPORT_FILES:
+                if (kind, day) in found:
+                    continue
+                path = self.report_path(kind, day)
+                payload = self.read_json(path)
+                if payload is not None:
+                    found[(kind, day)] = (path, payload)
+        return found
+
+    def recent_reports(
+        self,
+        kind: str,
+        limit: int,
+        *,
+        exclude_status: str | None = None,
+        before: str | None = None,
+    ) -> list[tuple[Path, dict, str]] | None:
+        """Newest (path, payload, trade_date) reports of *kind* from the index.
+
+        Only reports older than *before* are returned when it is set. Returns None when
+        nothing of that kind is indexed.
+        """
+        index = self.index
+        if index is None or not index.has_reports(kind):
+            return None
+        return [
+            (
+                Path(report["path"]) if report["path"] else Path(),
+                report["payload"],
+                report["trade_date"],
+            )
+            for report in index.recent_reports(
+                kind, limit, exclude_status=exclude_status, before=before
+            )
+        ]
+
+    @staticmethod
+    def run_log_date(path: Path) -> str:
+        """ISO trade date encoded in a ``{kind}_YYYYMMDD.json`` run-log name."""
+        ymd = path.stem.rsplit("_", 1)[-1]
+        return f"{ymd[0:4]}-{ymd[4:6]}-{ymd[6:8]}"
 
     def list_run_log_files(self, subdir: str, pattern: str) -> list[Path]:
         root = self.run_logs / subdir
@@ -74,39 +163,130 @@ class DataAccess:
         symbol: str | None,
         days: int,
     ) -> list[Path]:
-        candidates: list[Path] = []
-        for day in self.recent_dates(days):
-            day_root = root / f"view={view}" / f"date={day}"
-            if not day_root.exists():
+        dates = self.recent_dates(days)
+        index = self.index
+        if index is not None and root.resolve() in {
+            self.raw_root.resolve(),
+            self.clean_root.resolve(),
+        }:
+            source = "clean" if root.resolve() == self.clean_root.resolve() else "raw"
+            indexed = index.partition_files(
+                source=source, view=view, dates=dates, underlying=symbol
+            )
+            if indexed is not None:
+                return self._merge_indexed(root, view, dates, symbol, indexed)
+
+        return lake_reader(root).files(view, dates, [symbol] if symbol else None)
+
+    def derives_clean(self, view: str) -> bool:
+        """Whether clean *view* rows are derived from raw on read (deferred clean mode)."""
+        from ..pipeline.clean_views import DERIVED_VIEWS
+
+        return self.cfg.snapshot.clean_mode == "deferred" and view in DERIVED_VIEWS
+
+    def derive_clean_tables(self, tables: list[Any]) -> list[Any]:
+        """Clean Arrow tables derived in memory from raw snapshot tables; nothing is written."""
+        import pyarrow as pa  # type: ignore
+
+        from ..pipeline.clean_views import derive_clean
+        from ..pipeline.cleaning import CleaningPipeline
+
+        if self._cleaner is None:
+            self._cleaner = CleaningPipeline.create(self.cfg)
+        return [
+            pa.Table.from_pandas(
+                derive_clean(self._cleaner, table.to_pandas()), preserve_index=False
+            )
+            for table in tables
+            if table.num_rows
+        ]
+
+    @staticmethod
+    def _merge_indexed(
+        root: Path,
+        view: str,
+        dates: list[str],
+        symbol: str | None,
+        indexed: dict[tuple[str, str], list[Path]],
+    ) -> list[Path]:
+        """Indexed files, listing the lake only where the index has no rows.
+
+        A symbol query falls back to the lake for that underlying on days the index does
+        not cover it. An all-underlyings query trusts the index for every day it has rows
+        for and lists only the remaining days (written before the index existed), so the
+        lake tree is not walked for days the index already answers.
+        """
+        reader = lake_reader(root)
+        files: list[Path] = []
+        for day in dates:
+            covered = sorted(underlying for (d, underlying) in indexed if d == day)
+            if symbol and symbol.upper() not in covered:
+                files.extend(reader.files(view, [day], [symbol]))
                 continue
-            if symbol:
-                symbol_root = day_root / f"underlying={symbol.upper()}"
-                if symbol_root.exists():
-                    candidates.extend(sorted(symbol_root.rglob("*.parquet")))
-            else:
-                candidates.extend(sorted(day_root.rglob("*.parquet")))
-        return candidates
+            if not covered:
+                files.extend(reader.files(view, [day]))
+                continue
+            for underlying in covered:
+                present = [p for p in indexed[(day, underlying)] if p.exists()]
+                files.extend(present or reader.files(view, [day], [underlying]))
+        return files
 
-    def read_parquet_sample(
+    def read_parquet_page(
         self,
-        files: Iterable[Path],
+        files: list[Path],
         *,
         limit: int,
+        start: tuple[int, int] = (0, 0),
         columns: list[str] | None = None,
-    ) -> list[dict[str, Any]]:
-        rows: list[dict[str, Any]] = []
+    ) -> tuple[list[Any], tuple[int, int] | None]:
+        """Read up to *limit* rows starting at (file index, row offset).
+
+        Only the row groups overlapping the requested window are decoded, so deep pages
+        cost the same as the first one. Returns (Arrow tables, next position or None).
+        """
+        import pyarrow.parquet as pq  # type: ignore
+
+        tables: list[Any] = []
         remaining = limit
-        for file_path in files:
-            if remaining <= 0:
-                break
+        file_idx, row_offset = start
+        while file_idx < len(files) and remaining > 0:
+            file_path = files[file_idx]
             try:
-                df = pd.read_parquet(file_path, columns=columns)
+                parquet = pq.ParquetFile(file_path)
             except Exception as exc:  # pragma: no cover - corrupt or missing parquet
                 logger.warning(f"Failed to read parquet {file_path}: {exc}")
+                file_idx, row_offset = file_idx + 1, 0
                 continue
-            if df.empty:
+            meta = parquet.metadata
+            total = meta.num_rows
+            if row_offset >= total:
+                file_idx, row_offset = file_idx + 1, 0
                 continue
-            sample = df.head(remaining)
-            rows.extend(sample.to_dict(orient="records"))
-            remaining = limit - len(rows)
-        return rows
+
+            stop = min(total, row_offset + remaining)
+            groups: list[int] = []
+            group_start = 0
+            first_group_start = None
+            for idx in range(meta.num_row_groups):
+                group_rows = meta.row_group(idx).num_rows
+                group_end = group_start + group_rows
+                if group_end > row_offset and group_start < stop:
+                    groups.append(idx)
+                    if first_group_start is None:
+                        first_group_start = group_start
+                group_start = group_end
+
+            cols = None
+            if columns is not None:
+                cols = [c for c in columns if c in parquet.schema_arrow.names]
+            table = parquet.read_row_groups(groups, columns=cols)
+            table = table.slice(row_offset - (first_group_start or 0), stop - row_offset)
+            tables.append(table)
+            remaining -= table.num_rows
+            if stop >= total:
+                file_idx, row_offset = file_idx + 1, 0
+            else:
+                row_offset = stop
+
+        next_pos = (file_idx, row_offset) if file_idx < len(files) else None
+        return tables, next_pos
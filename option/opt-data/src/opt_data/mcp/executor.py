@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Hashable
+
+import anyio
+import anyio.to_thread
+
+from .tools import ToolHandler
+
+DEFAULT_TOOL_CONCURRENCY = 4
+DEFAULT_CACHE_TTL_SECONDS = 30.0
+DEFAULT_CACHE_ENTRIES = 256
+
+
+def normalize_args(arguments: dict[str, Any] | None) -> str:
+    """Stable cache key for tool arguments (key order and None-valued keys ignored)."""
+    cleaned = {k: v for k, v in (arguments or {}).items() if v is not None}
+    return json.dumps(cleaned, sort_keys=True, ensure_ascii=False, default=str)
+
+
+@dataclass
+class _CacheEntry:
+    expires_at: float
+    token: Hashable
+    payload: dict[str, Any]
+
+
+class ToolExecutor:
+    """Run tool handlers off the event loop with per-tool limits and a TTL result cache.
+
+    Handlers execute in anyio's worker threads, each tool capped by its own
+    ``CapacityLimiter`` so one slow tool cannot starve the others. Results are cached
+    per (tool, normalized args) for ``cache_ttl`` seconds and dropped early whenever
+    ``freshness`` returns a different token (e.g. partition/index mtimes changed).
+    """
+
+    def __init__(
+        self,
+        handlers: dict[str, ToolHandler],
+        *,
+        concurrency: int = DEFAULT_TOOL_CONCURRENCY,
+        cache_ttl: float = DEFAULT_CACHE_TTL_SECONDS,
+        max_entries: int = DEFAULT_CACHE_ENTRIES,
+        freshness: Callable[[], Hashable] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.handlers = handlers
+        self.concurrency = max(1, concurrency)
+        self.cache_ttl = cache_ttl
+        self.max_entries = max_entries
+        self._freshness = freshness or (lambda: None)
+        self._clock = clock
+        self._limiters: dict[str, anyio.CapacityLimiter] = {}
+        self._cache: OrderedDict[tuple[str, str], _CacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _limiter(self, name: str) -> anyio.CapacityLimiter:
+        limiter = self._limiters.get(name)
+        if limiter is None:
+            limiter = self._limiters[name] = anyio.CapacityLimiter(self.concurrency)
+        return limiter
+
+    def _lookup(self, key: tuple[str, str], token: Hashable) -> dict[str, Any] | None:
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
+            if entry.expires_at <= self._clock() or entry.token != token:
+                del self._cache[key]
+                return None
+            self._cache.move_to_end(key)
+            return entry.payload
+
+    def _store(self, key: tuple[str, str], token: Hashable, payload: dict[str, Any]) -> None:
+        with self._lock:
+            self._cache[key] = _CacheEntry(self._clock() + self.cache_ttl, token, payload)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+    async def call(
+        self, name: str, arguments: dict[str, Any] | None
+    ) -> tuple[dict[str, Any], bool]:
+        """Return ``(payload, cached)`` for a tool call."""
+        if name not in self.handlers:
+            raise ValueError(f"Unknown tool: {name}")
+        args = dict(arguments or {})
+        limiter = self._limiter(name)
+        use_cache = self.cache_ttl > 0
+        key = (name, normalize_args(args))
+        token: Hashable = None
+        if use_cache:
+            token = await anyio.to_thread.run_sync(self._freshness, limiter=limiter)
+            cached = self._lookup(key, token)
+            if cached is not None:
+                self.hits += 1
+                return cached, True
+
+        self.misses += 1
+        payload = await anyio.to_thread.run_sync(self.handlers[name], args, limiter=limiter)
+        if use_cache:
+            self._store(key, token, payload)
+        return payload, False
+
+
+__all__ = ["ToolExecutor", "normalize_args"]
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import anyio
+import anyio.to_thread
 import json
 import logging
 import time
@@ -10,6 +11,7 @@ from typing import Any
 from ..config import AppConfig
 from .audit import AuditLogger
 from .datasource import DataAccess
+from .executor import ToolExecutor
 from .limits import LimitConfig, apply_caps
 from .tools import tool_handlers, tool_specs
 
@@ -28,12 +30,19 @@ def _load_mcp_sdk() -> tuple[Any, Any, Any, Any]:
 
 def _count_rows(payload: Any) -> int:
     if isinstance(payload, dict):
+        if isinstance(payload.get("row_count"), int):
+            return payload["row_count"]
         rows = payload.get("rows")
         if isinstance(rows, list):
             return len(rows)
     return 0
 
 
+def encode_payload(payload: Any) -> str:
+    """Compact JSON for tool responses (no indentation; timestamps as strings)."""
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":"), default=str)
+
+
 def run_stdio_server(
     cfg: AppConfig,
     *,
@@ -54,6 +63,12 @@ def run_stdio_server(
 
     server = Server("opt-data-mcp")
     handlers = tool_handlers(data, limits)
+    executor = ToolExecutor(
+        handlers,
+        concurrency=cfg.mcp.tool_concurrency,
+        cache_ttl=cfg.mcp.cache_ttl_seconds,
+        freshness=data.freshness_token,
+    )
 
     @server.list_tools()
     async def list_tools() -> list[Any]:
@@ -67,11 +82,11 @@ def run_stdio_server(
         start = time.perf_counter()
         status = "ok"
         error: str | None = None
+        payload: Any = None
         try:
-            if name not in handlers:
-                raise ValueError(f"Unknown tool: {name}")
-            payload = handlers[name](arguments or {})
-            text = json.dumps(payload, ensure_ascii=False, indent=2)
+            payload, _cached = await executor.call(name, arguments)
+            # Encoding large payloads is CPU-bound; keep it off the event loop too
+            text = await anyio.to_thread.run_sync(encode_payload, payload)
             return [TextContent(type="text", text=text)]
         except Exception as exc:
             status = "error"
@@ -81,7 +96,7 @@ def run_stdio_server(
         finally:
             duration_ms = (time.perf_counter() - start) * 1000
             try:
-                rows_returned = _count_rows(locals().get("payload"))
+                rows_returned = _count_rows(payload)
                 audit.record(
                     name,
                     arguments or {},
@@ -98,4 +113,7 @@ def run_stdio_server(
             init_options = server.create_initialization_options()
             await server.run(read, write, init_options)
 
-    anyio.run(_run)
+    try:
+        anyio.run(_run)
+    finally:
+        audit.close()
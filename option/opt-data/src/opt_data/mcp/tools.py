@@ -1,6 +1,10 @@
 from __future__ import annotations
 
+import base64
+import hashlib
+import json
 from dataclasses import dataclass
+from pathlib import Path
 from typing import Any, Callable
 
 from .datasource import DataAccess
@@ -16,6 +20,103 @@ class ToolSpec:
 
 ToolHandler = Callable[[dict[str, Any]], dict[str, Any]]
 
+RESPONSE_FORMATS = ("records", "columns", "arrow")
+
+
+def _scope_hash(scope: dict[str, Any]) -> str:
+    text = json.dumps(scope, sort_keys=True, default=str)
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()[:12]
+
+
+def encode_cursor(tool: str, scope: dict[str, Any], position: Any) -> str:
+    """Opaque pagination token bound to the tool and its filter arguments."""
+    body = json.dumps({"t": tool, "s": _scope_hash(scope), "p": position}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(body.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str | None, tool: str, scope: dict[str, Any]) -> Any:
+    if not cursor:
+        return None
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        body = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except Exception as exc:
+        raise ValueError("invalid cursor") from exc
+    if body.get("t") != tool or body.get("s") != _scope_hash(scope):
+        raise ValueError("cursor does not match this tool call")
+    return body.get("p")
+
+
+def _next_cursor(tool: str, scope: dict[str, Any], position: Any, has_more: bool) -> str | None:
+    return encode_cursor(tool, scope, position) if has_more else None
+
+
+def _decode_report_key(cursor: str | None, tool: str) -> str | None:
+    """Trade date of the last report a previous page returned (keyset position).
+
+    Report lists are newest first and grow at the head, so resuming strictly below the
+    last seen trade date neither repeats nor skips rows when a new report is indexed.
+    """
+    key = decode_cursor(cursor, tool, {})
+    if key is not None and not isinstance(key, str):
+        raise ValueError("invalid cursor")
+    return key
+
+
+def _run_log_page(data: DataAccess, subdir: str, pattern: str, before: str | None) -> list[Path]:
+    """Run-log files newest first, limited to trade dates older than *before*."""
+    files = data.list_run_log_files(subdir, pattern)
+    if before is None:
+        return files
+    return [path for path in files if data.run_log_date(path) < before]
+
+
+def _file_position(files: list[Path], position: tuple[int, int]) -> list[Any]:
+    """Cursor position naming the file (and its version) instead of a list index."""
+    path = files[position[0]]
+    return [str(path), path.stat().st_mtime_ns, position[1]]
+
+
+def _resolve_file_position(files: list[Path], position: Any) -> tuple[int, int]:
+    """(file index, row offset) of a cursor position in the current file list.
+
+    The file list is rebuilt on every call, so a cursor whose file disappeared or was
+    rewritten since it was issued is rejected instead of resuming at a shifted row.
+    """
+    try:
+        path, mtime_ns, row = str(position[0]), int(position[1]), int(position[2])
+    except (TypeError, ValueError, IndexError) as exc:
+        raise ValueError("invalid cursor") from exc
+    for idx, candidate in enumerate(files):
+        if str(candidate) == path:
+            try:
+                current = candidate.stat().st_mtime_ns
+            except OSError:
+                break
+            if current != mtime_ns:
+                break
+            return idx, row
+    raise ValueError("stale cursor: the partition changed since it was issued; start over")
+
+
+def _encode_tables(tables: list[Any], fmt: str) -> tuple[dict[str, Any], int]:
+    """Encode Arrow tables as records, column-oriented JSON or base64 Arrow IPC."""
+    import pyarrow as pa  # type: ignore
+
+    row_count = sum(table.num_rows for table in tables)
+    if fmt == "records":
+        return {"rows": [row for table in tables for row in table.to_pylist()]}, row_count
+
+    table = pa.concat_tables(tables, promote_options="default") if tables else pa.table({})
+    if fmt == "columns":
+        return {"columns": table.column_names, "data": table.to_pydict()}, row_count
+
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    encoded = base64.b64encode(sink.getvalue().to_pybytes()).decode("ascii")
+    return {"arrow_ipc_base64": encoded}, row_count
+
 
 def _apply_limit(value: int | None, default: int, maximum: int) -> tuple[int, bool]:
     effective = clamp_int(value, default, maximum)
@@ -77,15 +178,18 @@ def run_status_overview(
 ) -> dict[str, Any]:
     days, days_clamped = _apply_days(days, limits.default_days, limits.max_days)
     items: list[dict[str, Any]] = []
-    for day in data.recent_dates(days):
-        ymd = day.replace("-", "")
-        metrics_path = data.run_logs / "metrics" / f"metrics_{ymd}.json"
-        selfcheck_path = data.run_logs / "selfcheck" / f"selfcheck_{ymd}.json"
-        error_path = data.run_logs / "errors" / f"summary_{ymd}.json"
-
-        metrics_payload = data.read_json(metrics_path)
-        selfcheck_payload = data.read_json(selfcheck_path)
-        error_payload = data.read_json(error_path)
+    dates = data.recent_dates(days)
+    reports = data.reports_for_dates(dates)
+    for day in dates:
+        metrics_path, metrics_payload = reports.get(
+            ("metrics", day), (data.report_path("metrics", day), None)
+        )
+        selfcheck_path, selfcheck_payload = reports.get(
+            ("selfcheck", day), (data.report_path("selfcheck", day), None)
+        )
+        error_path, error_payload = reports.get(
+            ("errors", day), (data.report_path("errors", day), None)
+        )
 
         metrics_status = _normalize_status(
             metrics_payload.get("status") if metrics_payload else None
@@ -166,13 +270,22 @@ def health_overview(
     days, days_clamped = _apply_days(
         days, limits.health_overview_days_default, limits.health_overview_days_max
     )
-    metrics_files = data.list_run_log_files("metrics", "metrics_*.json")
-    selfcheck_files = data.list_run_log_files("selfcheck", "selfcheck_*.json")
-    error_summaries = data.list_run_log_files("errors", "summary_*.json")
+    latest: dict[str, tuple[Path | None, dict[str, Any] | None]] = {}
+    for kind, pattern in (
+        ("metrics", "metrics_*.json"),
+        ("selfcheck", "selfcheck_*.json"),
+        ("errors", "summary_*.json"),
+    ):
+        indexed = data.recent_reports(kind, 1)
+        if indexed is not None:
+            latest[kind] = indexed[0][:2] if indexed else (None, None)
+            continue
+        files = data.list_run_log_files(kind, pattern)
+        latest[kind] = (files[0], data.read_json(files[0])) if files else (None, None)
 
-    metrics_payload = data.read_json(metrics_files[0]) if metrics_files else None
-    selfcheck_payload = data.read_json(selfcheck_files[0]) if selfcheck_files else None
-    error_payload = data.read_json(error_summaries[0]) if error_summaries else None
+    metrics_file, metrics_payload = latest["metrics"]
+    selfcheck_file, selfcheck_payload = latest["selfcheck"]
+    error_file, error_payload = latest["errors"]
 
     recent_metrics = data.recent_metrics_db(limit=20)
 
@@ -185,9 +298,9 @@ def health_overview(
             "metrics_db": str(data.metrics_db),
         },
         "latest": {
-            "metrics_file": str(metrics_files[0]) if metrics_files else None,
-            "selfcheck_file": str(selfcheck_files[0]) if selfcheck_files else None,
-            "error_summary": str(error_summaries[0]) if error_summaries else None,
+            "metrics_file": str(metrics_file) if metrics_file else None,
+            "selfcheck_file": str(selfcheck_file) if selfcheck_file else None,
+            "error_summary": str(error_file) if error_file else None,
         },
         "recent_metrics": recent_metrics,
         "latest_payloads": {
@@ -206,15 +319,27 @@ def health_overview(
 
 
 def list_recent_runs(
-    data: DataAccess, limits: LimitConfig, *, limit: int | None = None
+    data: DataAccess,
+    limits: LimitConfig,
+    *,
+    limit: int | None = None,
+    cursor: str | None = None,
 ) -> dict[str, Any]:
     limit, limit_clamped = _apply_limit(
         limit, limits.list_recent_runs_default, limits.list_recent_runs_max
     )
-    metrics_files = data.list_run_log_files("metrics", "metrics_*.json")[:limit]
+    before = _decode_report_key(cursor, "list_recent_runs")
+    # Fetch one extra entry to know whether another page exists
+    reports = data.recent_reports("metrics", limit + 1, before=before)
+    if reports is None:
+        reports = [
+            (path, data.read_json(path) or {}, data.run_log_date(path))
+            for path in _run_log_page(data, "metrics", "metrics_*.json", before)[: limit + 1]
+        ]
+    has_more = len(reports) > limit
+    reports = reports[:limit]
     runs: list[dict[str, Any]] = []
-    for path in metrics_files:
-        payload = data.read_json(path) or {}
+    for path, payload, _ in reports:
         runs.append(
             {
                 "date": payload.get("trade_date"),
@@ -223,9 +348,11 @@ def list_recent_runs(
                 "metrics": payload.get("metrics"),
             }
         )
+    last_key = reports[-1][2] if reports else None
     return {
         "limit": limit,
         "runs": runs,
+        "next_cursor": _next_cursor("list_recent_runs", {}, last_key, has_more),
         "meta": _build_meta(
             limit=limit,
             days=None,
@@ -242,16 +369,23 @@ def get_partition_issues(
     *,
     days: int | None = None,
     limit: int | None = None,
+    cursor: str | None = None,
 ) -> dict[str, Any]:
     days, days_clamped = _apply_days(days, limits.default_days, limits.max_days)
     limit, limit_clamped = _apply_limit(
         limit, limits.get_partition_issues_default, limits.get_partition_issues_max
     )
 
-    selfcheck_files = data.list_run_log_files("selfcheck", "selfcheck_*.json")
+    before = _decode_report_key(cursor, "get_partition_issues")
+    reports = data.recent_reports("selfcheck", limit + 1, exclude_status="PASS", before=before)
+    if reports is None:
+        reports = (
+            (path, data.read_json(path), data.run_log_date(path))
+            for path in _run_log_page(data, "selfcheck", "selfcheck_*.json", before)
+        )
     issues: list[dict[str, Any]] = []
-    for path in selfcheck_files:
-        report = data.read_json(path)
+    keys: list[str] = []
+    for path, report, key in reports:
         if not report:
             continue
         if report.get("status") == "PASS":
@@ -265,13 +399,18 @@ def get_partition_issues(
                 "qa": report.get("qa"),
             }
         )
-        if len(issues) >= limit:
+        keys.append(key)
+        if len(issues) > limit:
             break
+    has_more = len(issues) > limit
+    issues = issues[:limit]
+    last_key = keys[len(issues) - 1] if issues else None
 
     return {
         "days": days,
         "limit": limit,
         "issues": issues,
+        "next_cursor": _next_cursor("get_partition_issues", {}, last_key, has_more),
         "meta": _build_meta(
             limit=limit,
             days=days,
@@ -291,6 +430,8 @@ def get_chain_sample(
     view: str = "intraday",
     days: int | None = None,
     limit: int | None = None,
+    cursor: str | None = None,
+    response_format: str = "records",
 ) -> dict[str, Any]:
     if source not in {"clean", "raw"}:
         raise ValueError("source must be 'clean' or 'raw'")
@@ -304,9 +445,21 @@ def get_chain_sample(
         limit, limits.get_chain_sample_default, limits.get_chain_sample_max
     )
 
-    root = data.clean_root if source == "clean" else data.raw_root
+    if response_format not in RESPONSE_FORMATS:
+        raise ValueError(f"format must be one of {', '.join(RESPONSE_FORMATS)}")
+
+    scope = {"symbol": symbol.upper(), "source": source, "view": view, "days": days}
+    position = decode_cursor(cursor, "get_chain_sample", scope)
+    # Deferred clean mode: page over the raw files and clean each page in memory, so this
+    # read-only tool never writes clean partitions (cleaning is row-wise)
+    derived = source == "clean" and data.derives_clean(view)
+    root = data.clean_root if source == "clean" and not derived else data.raw_root
     files = data.find_parquet_files(root, view=view, symbol=symbol, days=days)
-    rows = data.read_parquet_sample(files, limit=limit)
+    start = _resolve_file_position(files, position) if position else (0, 0)
+    tables, next_pos = data.read_parquet_page(files, limit=limit, start=start)
+    if derived:
+        tables = data.derive_clean_tables(tables)
+    body, row_count = _encode_tables(tables, response_format)
 
     return {
         "symbol": symbol.upper(),
@@ -314,8 +467,13 @@ def get_chain_sample(
         "view": view,
         "days": days,
         "limit": limit,
+        "format": response_format,
         "files_scanned": len(files),
-        "rows": rows,
+        "row_count": row_count,
+        **body,
+        "next_cursor": encode_cursor("get_chain_sample", scope, _file_position(files, next_pos))
+        if next_pos
+        else None,
         "meta": _build_meta(
             limit=limit,
             days=days,
@@ -351,7 +509,10 @@ def tool_specs() -> list[ToolSpec]:
             description="List recent QA metric runs from run_logs.",
             input_schema={
                 "type": "object",
-                "properties": {"limit": {"type": "integer", "minimum": 1}},
+                "properties": {
+                    "limit": {"type": "integer", "minimum": 1},
+                    "cursor": {"type": "string"},
+                },
                 "required": [],
             },
         ),
@@ -363,13 +524,18 @@ def tool_specs() -> list[ToolSpec]:
                 "properties": {
                     "days": {"type": "integer", "minimum": 1},
                     "limit": {"type": "integer", "minimum": 1},
+                    "cursor": {"type": "string"},
                 },
                 "required": [],
             },
         ),
         ToolSpec(
             name="get_chain_sample",
-            description="Sample option chain rows from Parquet partitions.",
+            description=(
+                "Sample option chain rows from Parquet partitions. Pass next_cursor back as "
+                "cursor to page; format=columns|arrow returns column-oriented JSON or "
+                "base64 Arrow IPC for bulk pulls."
+            ),
             input_schema={
                 "type": "object",
                 "properties": {
@@ -378,6 +544,8 @@ def tool_specs() -> list[ToolSpec]:
                     "view": {"type": "string"},
                     "days": {"type": "integer", "minimum": 1},
                     "limit": {"type": "integer", "minimum": 1},
+                    "cursor": {"type": "string"},
+                    "format": {"type": "string", "enum": list(RESPONSE_FORMATS)},
                 },
                 "required": ["symbol"],
             },
@@ -391,12 +559,15 @@ def tool_handlers(data: DataAccess, limits: LimitConfig) -> dict[str, ToolHandle
         "run_status_overview": lambda args: run_status_overview(
             data, limits, days=args.get("days")
         ),
-        "list_recent_runs": lambda args: list_recent_runs(data, limits, limit=args.get("limit")),
+        "list_recent_runs": lambda args: list_recent_runs(
+            data, limits, limit=args.get("limit"), cursor=args.get("cursor")
+        ),
         "get_partition_issues": lambda args: get_partition_issues(
             data,
             limits,
             days=args.get("days"),
             limit=args.get("limit"),
+            cursor=args.get("cursor"),
         ),
         "get_chain_sample": lambda args: get_chain_sample(
             data,
@@ -406,5 +577,7 @@ def tool_handlers(data: DataAccess, limits: LimitConfig) -> dict[str, ToolHandle
             view=args.get("view", "intraday"),
             days=args.get("days"),
             limit=args.get("limit"),
+            cursor=args.get("cursor"),
+            response_format=args.get("format", "records"),
         ),
     }
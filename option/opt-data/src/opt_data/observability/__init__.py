@@ -4,5 +4,6 @@ Observability module.
 
 from .metrics import MetricsCollector
 from .alerting import AlertManager
+from .summary_index import SummaryIndex, summary_index_path
 
-__all__ = ["MetricsCollector", "AlertManager"]
+__all__ = ["MetricsCollector", "AlertManager", "SummaryIndex", "summary_index_path"]
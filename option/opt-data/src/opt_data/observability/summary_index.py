@@ -0,0 +1,319 @@
+"""
+Summary index of run reports and written partitions using SQLite.
+
+The pipeline upserts a row whenever it writes a partition or a QA/selfcheck/logscan
+report, so read-side tools (MCP, dashboards) answer from indexed lookups instead of
+globbing and parsing run_logs or walking the lake.
+"""
+
+import json
+import logging
+import sqlite3
+from datetime import date
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+SUMMARY_INDEX_FILENAME = "summary_index.db"
+REPORT_KINDS = ("metrics", "selfcheck", "errors")
+# kind -> filename glob under run_logs/<kind>/
+REPORT_GLOBS = {
+    "metrics": "metrics_*.json",
+    "selfcheck": "selfcheck_*.json",
+    "errors": "summary_*.json",
+}
+
+
+def summary_index_path(cfg: Any) -> Path:
+    """Configured summary index path, defaulting to ``{paths.state}/summary_index.db``."""
+    configured = getattr(cfg.observability, "summary_index_path", None)
+    return Path(configured) if configured else Path(cfg.paths.state) / SUMMARY_INDEX_FILENAME
+
+
+def _as_iso(value: Any) -> str:
+    if isinstance(value, date):
+        return value.isoformat()
+    return str(value)
+
+
+class SummaryIndex:
+    """
+    Small SQLite index keyed by (kind, trade_date) for reports and by
+    (source, view, trade_date, underlying, exchange) for partitions.
+    """
+
+    def __init__(self, db_path: Path, *, create: bool = True):
+        self.db_path = Path(db_path)
+        if create:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._init_db()
+
+    @classmethod
+    def open_existing(cls, db_path: Path) -> Optional["SummaryIndex"]:
+        """Return an index for reading, or None when it has not been created yet."""
+        path = Path(db_path)
+        if not path.exists():
+            return None
+        return cls(path, create=False)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def _init_db(self) -> None:
+        try:
+            with self._connect() as conn:
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS run_reports (
+                        kind TEXT NOT NULL,
+                        trade_date TEXT NOT NULL,
+                        status TEXT,
+                        path TEXT,
+                        payload TEXT,
+                        updated_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+                        PRIMARY KEY (kind, trade_date)
+                    )
+                """)
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS partitions (
+                        source TEXT NOT NULL,
+                        view TEXT NOT NULL,
+                        trade_date TEXT NOT NULL,
+                        underlying TEXT NOT NULL,
+                        exchange TEXT NOT NULL,
+                        path TEXT NOT NULL,
+                        rows INTEGER,
+                        updated_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+                        PRIMARY KEY (source, view, trade_date, underlying, exchange)
+                    )
+                """)
+                # Append-style writers (streaming) keep several part files per partition
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS partition_parts (
+                        source TEXT NOT NULL,
+                        view TEXT NOT NULL,
+                        trade_date TEXT NOT NULL,
+                        underlying TEXT NOT NULL,
+                        exchange TEXT NOT NULL,
+                        path TEXT NOT NULL PRIMARY KEY,
+                        rows INTEGER,
+                        updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
+                    )
+                """)
+                conn.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_reports_status "
+                    "ON run_reports(kind, status, trade_date)"
+                )
+        except Exception as e:
+            logger.error(f"Failed to initialize summary index: {e}")
+
+    # ------------------------------------------------------------------ writes
+    def record_report(
+        self,
+        kind: str,
+        trade_date: Any,
+        payload: Dict[str, Any],
+        path: Optional[Path] = None,
+    ) -> None:
+        """Upsert a run report (metrics/selfcheck/errors) for a trade date."""
+        status = payload.get("status")
+        try:
+            with self._connect() as conn:
+                conn.execute(
+                    """
+                    INSERT OR REPLACE INTO run_reports (kind, trade_date, status, path, payload)
+                    VALUES (?, ?, ?, ?, ?)
+                    """,
+                    (
+                        kind,
+                        _as_iso(trade_date),
+                        str(status).upper() if status else None,
+                        str(path) if path else None,
+                        json.dumps(payload, ensure_ascii=False, default=str),
+                    ),
+                )
+        except Exception as e:
+            logger.warning(f"Failed to index {kind} report for {trade_date}: {e}")
+
+    def record_partition(
+        self,
+        *,
+        source: str,
+        view: str,
+        trade_date: Any,
+        underlying: str,
+        exchange: str,
+        path: Path,
+        rows: int,
+        append: bool = False,
+    ) -> None:
+        """Upsert the file written for a partition.
+
+        With *append* the file is added next to the partition's other part files instead
+        of replacing the single indexed file.
+        """
+        table = "partition_parts" if append else "partitions"
+        try:
+            with self._connect() as conn:
+                conn.execute(
+                    f"""
+                    INSERT OR REPLACE INTO {table}
+                        (source, view, trade_date, underlying, exchange, path, rows)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    (
+                        source,
+                        view,
+                        _as_iso(trade_date),
+                        underlying.upper(),
+                        exchange.upper(),
+                        str(path),
+                        int(rows),
+                    ),
+                )
+        except Exception as e:
+            logger.warning(f"Failed to index partition {path}: {e}")
+
+    def backfill(
+        self, run_logs_roots: Iterable[Path], lake_roots: Dict[str, Path]
+    ) -> Dict[str, int]:
+        """Index reports and partitions written before the index existed (one-off scan)."""
+        counts = {"reports": 0, "partitions": 0}
+        for run_logs in run_logs_roots:
+            for kind, pattern in REPORT_GLOBS.items():
+                for path in sorted((Path(run_logs) / kind).glob(pattern)):
+                    try:
+                        payload = json.loads(path.read_text(encoding="utf-8"))
+                    except Exception as e:
+                        logger.warning(f"Skipping unreadable report {path}: {e}")
+                        continue
+                    ymd = path.stem.rsplit("_", 1)[-1]
+                    trade_date = payload.get("trade_date") or payload.get("date")
+                    if not trade_date and len(ymd) == 8:
+                        trade_date = f"{ymd[0:4]}-{ymd[4:6]}-{ymd[6:8]}"
+                    if not trade_date:
+                        continue
+                    self.record_report(kind, trade_date, payload, path)
+                    counts["reports"] += 1
+
+        import pyarrow.parquet as pq  # type: ignore
+
+        for source, root in lake_roots.items():
+            for path in Path(root).glob("view=*/date=*/underlying=*/exchange=*/*.parquet"):
+                exchange_dir = path.parent
+                underlying_dir = exchange_dir.parent
+                date_dir = underlying_dir.parent
+                try:
+                    rows = pq.ParquetFile(path).metadata.num_rows
+                except Exception as e:
+                    logger.warning(f"Skipping unreadable partition {path}: {e}")
+                    continue
+                self.record_partition(
+                    source=source,
+                    view=date_dir.parent.name.split("=", 1)[1],
+                    trade_date=date_dir.name.split("=", 1)[1],
+                    underlying=underlying_dir.name.split("=", 1)[1],
+                    exchange=exchange_dir.name.split("=", 1)[1],
+                    path=path.resolve(),
+                    rows=rows,
+                )
+                counts["partitions"] += 1
+        return counts
+
+    # ------------------------------------------------------------------ reads
+    def _query(self, sql: str, params: Iterable[Any] = ()) -> List[sqlite3.Row]:
+        try:
+            with self._connect() as conn:
+                return conn.execute(sql, tuple(params)).fetchall()
+        except Exception as e:
+            logger.warning(f"Summary index query failed: {e}")
+            return []
+
+    @staticmethod
+    def _report_row(row: sqlite3.Row) -> Dict[str, Any]:
+        return {
+            "kind": row["kind"],
+            "trade_date": row["trade_date"],
+            "status": row["status"],
+            "path": row["path"],
+            "payload": json.loads(row["payload"]) if row["payload"] else {},
+        }
+
+    def reports_for_dates(
+        self, dates: List[str], kinds: Iterable[str] = REPORT_KINDS
+    ) -> Dict[tuple, Dict[str, Any]]:
+        """Return {(kind, trade_date): report} for the requested dates in one query."""
+        kinds = list(kinds)
+        if not dates or not kinds:
+            return {}
+        sql = (
+            "SELECT * FROM run_reports "
+            f"WHERE kind IN ({','.join('?' * len(kinds))}) "
+            f"AND trade_date IN ({','.join('?' * len(dates))})"
+        )
+        rows = self._query(sql, [*kinds, *dates])
+        return {(row["kind"], row["trade_date"]): self._report_row(row) for row in rows}
+
+    def recent_reports(
+        self,
+        kind: str,
+        limit: int,
+        *,
+        exclude_status: Optional[str] = None,
+        before: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """Most recent reports of a kind, newest first, optionally older than *before*."""
+        where = "WHERE kind = ?"
+        params: List[Any] = [kind]
+        if exclude_status is not None:
+            where += " AND COALESCE(status, '') != ?"
+            params.append(exclude_status.upper())
+        if before is not None:
+            where += " AND trade_date < ?"
+            params.append(before)
+        rows = self._query(
+            f"SELECT * FROM run_reports {where} ORDER BY trade_date DESC LIMIT ?",
+            (*params, limit),
+        )
+        return [self._report_row(row) for row in rows]
+
+    def has_reports(self, kind: str) -> bool:
+        return bool(self._query("SELECT 1 FROM run_reports WHERE kind = ? LIMIT 1", (kind,)))
+
+    def partition_files(
+        self,
+        *,
+        source: str,
+        view: str,
+        dates: List[str],
+        underlying: Optional[str] = None,
+    ) -> Optional[Dict[Tuple[str, str], List[Path]]]:
+        """Indexed files for the dates keyed by (trade_date, underlying).
+
+        Returns None when the view is not indexed at all. A date with rows is treated as
+        fully covered; dates (or, for a symbol query, underlyings) missing from the
+        mapping were written before the index existed and callers list the lake for them.
+        """
+        tables = ("partitions", "partition_parts")
+        if not any(
+            self._query(f"SELECT 1 FROM {t} WHERE source = ? AND view = ? LIMIT 1", (source, view))
+            for t in tables
+        ):
+            return None
+        if not dates:
+            return {}
+        where = f"WHERE source = ? AND view = ? AND trade_date IN ({','.join('?' * len(dates))})"
+        params: List[Any] = [source, view, *dates]
+        if underlying:
+            where += " AND underlying = ?"
+            params.append(underlying.upper())
+        sql = " UNION ALL ".join(
+            f"SELECT trade_date, underlying, exchange, path FROM {t} {where}" for t in tables
+        )
+        sql += " ORDER BY trade_date DESC, underlying, exchange, path"
+        found: Dict[Tuple[str, str], List[Path]] = {}
+        for row in self._query(sql, params * len(tables)):
+            found.setdefault((row["trade_date"], row["underlying"]), []).append(Path(row["path"]))
+        return found
@@ -2,6 +2,7 @@ from .backfill import BackfillPlanner, BackfillTask, BackfillRunner
 from .cleaning import CleaningPipeline
 from .actions import CorporateActionsAdjuster
 from .snapshot import SnapshotRunner, SnapshotSlot, SnapshotResult
+from .snapshot_shards import ShardedSnapshotRunner
 from .rollup import RollupRunner, RollupResult
 from .enrichment import EnrichmentRunner, EnrichmentResult
 from .scheduler import ScheduleRunner, ScheduledJob, ScheduleSummary
@@ -16,6 +17,7 @@ __all__ = [
     "SnapshotRunner",
     "SnapshotSlot",
     "SnapshotResult",
+    "ShardedSnapshotRunner",
     "RollupRunner",
     "RollupResult",
     "EnrichmentRunner",
@@ -3,7 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from datetime import date, timedelta
 from pathlib import Path
-from typing import Callable, List, Sequence, Optional, Dict, Any
+from typing import Awaitable, Callable, List, Sequence, Optional, Dict, Any, Tuple
 
 import asyncio
 import logging
@@ -11,10 +11,14 @@ import time
 import pandas as pd
 
 from ..config import AppConfig
-from ..universe import load_universe
+from ..universe import Universe
 from ..util.queue import PersistentQueue
 from ..ib.session import IBSession
-from ..ib.discovery import discover_contracts_for_symbol
+from ..ib.discovery import (
+    _qualify_chunk_size,
+    _qualify_contracts_chunk,
+    discover_contracts_for_symbol,
+)
 from ..ib.snapshot import (
     collect_option_snapshots,
     DEFAULT_GENERIC_TICKS,
@@ -26,9 +30,15 @@ from ..storage.layout import partition_for
 from ..util.calendar import is_trading_day
 from ..util.ratelimit import TokenBucket
 from .cleaning import CleaningPipeline
+from .what_to_show import STATS_FILENAME, WhatToShowStats
 
 logger = logging.getLogger(__name__)
 
+# Historical bar requests kept in flight when rate_limits.historical.max_concurrent is unset
+DEFAULT_HISTORICAL_CONCURRENCY = 4
+# Poll interval of the non-blocking token wait used inside the bar request loop
+ASYNC_ACQUIRE_POLL_SECONDS = 0.1
+
 
 @dataclass
 class BackfillTask:
@@ -44,13 +54,21 @@ class BackfillPlanner:
         name = f"backfill_{start_date.isoformat()}.jsonl"
         return self.cfg.paths.state / name
 
-    def plan(self, start_date: date, symbols: Sequence[str] | None = None) -> PersistentQueue[dict]:
-        universe = load_universe(self.cfg.universe.file)
-        if symbols:
-            wanted = {s.upper() for s in symbols}
-            entries = [u for u in universe if u.symbol in wanted]
-        else:
-            entries = universe
+    def plan(
+        self,
+        start_date: date,
+        symbols: Sequence[str] | None = None,
+        *,
+        since: Universe | None = None,
+    ) -> PersistentQueue[dict]:
+        """Queue one task per selected symbol; with *since*, only symbols added or changed
+        relative to that earlier universe version are planned."""
+        universe = Universe.load(self.cfg.universe.file)
+        entries = universe.select(symbols)
+        if since is not None:
+            delta = universe.diff(since)
+            fresh = {*delta.added, *delta.changed}
+            entries = [entry for entry in entries if entry.symbol in fresh]
 
         tasks: List[dict] = [
             {
@@ -178,6 +196,7 @@ class BackfillRunner:
         )
         self.writer = writer or ParquetWriter(cfg)
         self.cleaner = cleaner or CleaningPipeline.create(cfg)
+        self._what_to_show_stats: Optional[WhatToShowStats] = None
 
         self._limiters: Dict[str, TokenBucket] = {
             "discovery": TokenBucket.create(
@@ -299,7 +318,9 @@ class BackfillRunner:
                             ib,
                             contracts,
                             start_date,
+                            underlying_close=underlying_close,
                             acquire_token=self._make_acquire("historical"),
+                            acquire_token_async=self._make_acquire_async("historical"),
                             progress=progress,
                             stop_requested=stop_requested,
                         )
@@ -460,43 +481,164 @@ class BackfillRunner:
     def _make_acquire(self, name: str) -> Callable[[], None]:
         return lambda: self._acquire(name)
 
+    async def _acquire_async(self, name: str, tokens: int = 1) -> None:
+        # Yield while waiting so ib_insync keeps servicing the requests already in flight
+        limiter = self._limiters[name]
+        while not limiter.try_acquire(tokens):
+            await asyncio.sleep(ASYNC_ACQUIRE_POLL_SECONDS)
+
+    def _make_acquire_async(self, name: str) -> Callable[[], Awaitable[None]]:
+        return lambda: self._acquire_async(name)
+
+    def what_to_show_stats(self) -> Optional[WhatToShowStats]:
+        """Lazily load the persistent what_to_show success table (None when disabled)."""
+        if not self.cfg.acquisition.adaptive_what_to_show:
+            return None
+        if self._what_to_show_stats is None:
+            self._what_to_show_stats = WhatToShowStats.load(
+                self.cfg.paths.state / STATS_FILENAME,
+                explore_rate=self.cfg.acquisition.what_to_show_explore_rate,
+            )
+        return self._what_to_show_stats
+
+    def _historical_what_to_show(self) -> List[str]:
+        raw_wts = self.cfg.acquisition.what_to_show or "TRADES"
+        what_to_shows = [w.strip() for w in raw_wts.split(",") if w.strip()] or ["TRADES"]
+        if "TRADES" not in what_to_shows:
+            # ensure TRADES attempted before fallback to keep behaviour predictable
+            what_to_shows = ["TRADES"] + [w for w in what_to_shows if w != "TRADES"]
+        if "MIDPOINT" not in what_to_shows:
+            what_to_shows.append("MIDPOINT")
+        return what_to_shows
+
     def _fetch_historical_rows(
         self,
         ib: Any,
         contracts: List[Dict[str, Any]],
         trade_date: date,
         *,
+        underlying_close: Optional[float] = None,
         acquire_token: Optional[Callable[[], None]] = None,
+        acquire_token_async: Optional[Callable[[], Awaitable[None]]] = None,
         progress: Optional[Callable[[date, str, str, Dict[str, Any]], None]] = None,
         stop_requested: Optional[Callable[[], bool]] = None,
     ) -> List[Dict[str, Any]]:
-        from ib_insync import Option  # type: ignore
+        """Fetch historical bars for one (symbol, date) worth of contracts.
 
+        Contracts are qualified up front in batches (cached conids skip qualification),
+        then bar requests are pipelined with ``rate_limits.historical.max_concurrent``
+        requests in flight. The whatToShow order per contract comes from
+        ``WhatToShowStats`` when ``acquisition.adaptive_what_to_show`` is enabled.
+
+        Bar requests wait for tokens through *acquire_token_async*; the blocking
+        *acquire_token* is only used for the synchronous qualification step (and as a
+        fallback when no async variant is given).
+        """
         rows: List[Dict[str, Any]] = []
         asof = pd.Timestamp.utcnow().tz_localize(None)
-        duration = self.cfg.acquisition.duration
-        bar_size = self.cfg.acquisition.bar_size
-        raw_wts = self.cfg.acquisition.what_to_show or "TRADES"
-        what_to_shows = [w.strip() for w in raw_wts.split(",") if w.strip()] or ["TRADES"]
-        if "TRADES" not in what_to_shows:
-            # ensure TRADES attempted before fallback to keep behaviour predictable
-            what_to_shows = ["TRADES"] + [w for w in what_to_shows if w != "TRADES"]
-        if "MIDPOINT" not in what_to_shows:
-            what_to_shows.append("MIDPOINT")
-        use_rth = self.cfg.acquisition.use_rth
-        end_dt = f"{trade_date.strftime('%Y%m%d')} 23:59:59"
 
-        for info in contracts:
+        prepared = self._prepare_historical_contracts(
+            ib,
+            contracts,
+            trade_date,
+            acquire_token=acquire_token,
+            progress=progress,
+            stop_requested=stop_requested,
+        )
+        if not prepared:
+            return rows
+
+        concurrency = (
+            self.cfg.rate_limits.historical.max_concurrent or DEFAULT_HISTORICAL_CONCURRENCY
+        )
+        stats = self.what_to_show_stats()
+        bars_acquire = acquire_token_async
+        if bars_acquire is None and acquire_token is not None:
+            sync_acquire = acquire_token
+
+            async def bars_acquire() -> None:
+                sync_acquire()
+
+        try:
+            results = ib.run(
+                self._request_bars_async(
+                    ib,
+                    prepared,
+                    trade_date,
+                    concurrency=max(int(concurrency), 1),
+                    underlying_close=underlying_close,
+                    stats=stats,
+                    acquire_token=bars_acquire,
+                    progress=progress,
+                    stop_requested=stop_requested,
+                )
+            )
+        finally:
+            if stats is not None:
+                try:
+                    stats.save()
+                except OSError as exc:
+                    logger.warning(
+                        "Failed to persist what_to_show stats",
+                        extra={"path": str(stats.path), "error": str(exc)},
+                    )
+
+        for info, bars in results:
+            if not bars:
+                continue
+            for bar in bars:
+                try:
+                    bar_ts = pd.Timestamp(bar.date)
+                except Exception:
+                    bar_ts = pd.Timestamp(trade_date)
+
+                rows.append(
+                    {
+                        **info,
+                        "open": float(getattr(bar, "open", float("nan"))),
+                        "high": float(getattr(bar, "high", float("nan"))),
+                        "low": float(getattr(bar, "low", float("nan"))),
+                        "close": float(getattr(bar, "close", float("nan"))),
+                        "last": float(getattr(bar, "close", float("nan"))),
+                        "volume": int(getattr(bar, "volume", 0) or 0),
+                        "bid": pd.NA,
+                        "ask": pd.NA,
+                        "mid": pd.NA,
+                        "iv": pd.NA,
+                        "delta": pd.NA,
+                        "gamma": pd.NA,
+                        "theta": pd.NA,
+                        "vega": pd.NA,
+                        "open_interest": pd.NA,
+                        "market_data_type": None,
+                        "bar_timestamp": bar_ts,
+                        "asof_ts": asof,
+                    }
+                )
+
+        return rows
+
+    def _prepare_historical_contracts(
+        self,
+        ib: Any,
+        contracts: List[Dict[str, Any]],
+        trade_date: date,
+        *,
+        acquire_token: Optional[Callable[[], None]] = None,
+        progress: Optional[Callable[[date, str, str, Dict[str, Any]], None]] = None,
+        stop_requested: Optional[Callable[[], bool]] = None,
+    ) -> List[Tuple[Dict[str, Any], Any]]:
+        """Build request-ready Option contracts, preserving input order.
+
+        Contracts carrying a valid cached conid are used as-is; the remainder are
+        batch-qualified via ``_qualify_contracts_chunk`` with one token per chunk.
+        """
+        from ib_insync import Option  # type: ignore
+
+        ready: List[Tuple[int, Dict[str, Any], Any]] = []
+        pending: List[Tuple[int, Dict[str, Any], Any]] = []
+        for idx, info in enumerate(contracts):
             try:
-                if stop_requested and stop_requested():
-                    if progress:
-                        progress(
-                            trade_date,
-                            info.get("symbol", ""),
-                            "timeout",
-                            {"stage": "historical_loop"},
-                        )
-                    break
                 option = Option(
                     info.get("symbol"),
                     info.get("expiry", "").replace("-", ""),
@@ -506,43 +648,122 @@ class BackfillRunner:
                     info.get("currency", "USD"),
                     info.get("tradingClass"),
                 )
-                if info.get("conid"):
-                    option.conId = int(info["conid"])
-                option.includeExpired = True
-
-                if acquire_token:
-                    acquire_token()
-                qualified = ib.qualifyContracts(option)
-                if not qualified:
-                    logger.debug(
-                        "Failed to qualify contract",
-                        extra={"symbol": info.get("symbol"), "expiry": info.get("expiry")},
+            except Exception as exc:
+                logger.warning(
+                    "Failed to build option contract",
+                    extra={"symbol": info.get("symbol"), "expiry": info.get("expiry")},
+                    exc_info=exc,
+                )
+                continue
+            option.includeExpired = True
+            conid = _cached_conid(info)
+            if conid:
+                option.conId = conid
+                ready.append((idx, info, option))
+            else:
+                pending.append((idx, info, option))
+
+        if pending:
+            chunk_size = _qualify_chunk_size(len(pending))
+            for start in range(0, len(pending), chunk_size):
+                if stop_requested and stop_requested():
+                    if progress:
+                        progress(
+                            trade_date,
+                            pending[start][1].get("symbol", ""),
+                            "timeout",
+                            {"stage": "historical_qualify"},
+                        )
+                    break
+                chunk = pending[start : start + chunk_size]
+                try:
+                    if acquire_token:
+                        acquire_token()
+                    # qualifyContracts fills conId on the passed objects in place
+                    _qualify_contracts_chunk(ib, [option for _, _, option in chunk])
+                except Exception as exc:  # pragma: no cover - network failure
+                    logger.warning(
+                        "qualifyContracts chunk failed after retries",
+                        extra={"size": len(chunk)},
+                        exc_info=exc,
                     )
                     continue
-                contract = qualified[0]
-
-                bars = None
-                last_error: Optional[str] = None
-                for what_to_show in what_to_shows:
-                    try:
-                        if acquire_token:
-                            acquire_token()
-                        if progress:
-                            progress(
-                                trade_date,
-                                info.get("symbol", ""),
-                                "historical_try",
-                                {
-                                    "expiry": info.get("expiry"),
-                                    "strike": info.get("strike"),
-                                    "right": info.get("right"),
-                                    "what": what_to_show,
-                                },
-                            )
-                        timeout_s = max(self.cfg.acquisition.historical_timeout, 1.0)
+                for idx, info, option in chunk:
+                    conid = int(getattr(option, "conId", 0) or 0)
+                    if not conid:
+                        logger.debug(
+                            "Failed to qualify contract",
+                            extra={"symbol": info.get("symbol"), "expiry": info.get("expiry")},
+                        )
+                        continue
+                    ready.append((idx, {**info, "conid": conid}, option))
+
+        ready.sort(key=lambda item: item[0])
+        return [(info, option) for _, info, option in ready]
+
+    async def _request_bars_async(
+        self,
+        ib: Any,
+        prepared: Sequence[Tuple[Dict[str, Any], Any]],
+        trade_date: date,
+        *,
+        concurrency: int,
+        underlying_close: Optional[float] = None,
+        stats: Optional[WhatToShowStats] = None,
+        acquire_token: Optional[Callable[[], Awaitable[None]]] = None,
+        progress: Optional[Callable[[date, str, str, Dict[str, Any]], None]] = None,
+        stop_requested: Optional[Callable[[], bool]] = None,
+    ) -> List[Tuple[Dict[str, Any], Optional[List[Any]]]]:
+        duration = self.cfg.acquisition.duration
+        bar_size = self.cfg.acquisition.bar_size
+        use_rth = self.cfg.acquisition.use_rth
+        what_to_shows = self._historical_what_to_show()
+        end_dt = f"{trade_date.strftime('%Y%m%d')} 23:59:59"
+        timeout_s = max(self.cfg.acquisition.historical_timeout, 1.0)
+        sem = asyncio.Semaphore(concurrency)
+        stopped = False
+
+        async def fetch_one(
+            info: Dict[str, Any], contract: Any
+        ) -> Tuple[Dict[str, Any], Optional[List[Any]]]:
+            nonlocal stopped
+            async with sem:
+                if stopped or (stop_requested and stop_requested()):
+                    if not stopped and progress:
+                        progress(
+                            trade_date,
+                            info.get("symbol", ""),
+                            "timeout",
+                            {"stage": "historical_loop"},
+                        )
+                    stopped = True
+                    return info, None
+                try:
+                    bars = None
+                    last_error: Optional[str] = None
+                    stats_key: Optional[str] = None
+                    ordered = what_to_shows
+                    if stats is not None:
+                        stats_key = stats.key_for(info, underlying_close, trade_date)
+                        ordered = stats.order(stats_key, what_to_shows)
+                    for what_to_show in ordered:
                         try:
-                            bars = ib.run(
-                                asyncio.wait_for(
+                            if acquire_token:
+                                await acquire_token()
+                            if progress:
+                                progress(
+                                    trade_date,
+                                    info.get("symbol", ""),
+                                    "historical_try",
+                                    {
+                                        "expiry": info.get("expiry"),
+                                        "strike": info.get("strike"),
+                                        "right": info.get("right"),
+                                        "what": what_to_show,
+                                    },
+                                )
+                            try:
+                                bars = await asyncio.wait_for(
                                     ib.reqHistoricalDataAsync(
                                         contract,
                                         endDateTime=end_dt,
@@ -554,77 +775,81 @@ class BackfillRunner:
                                     ),
                                     timeout=timeout_s,
                                 )
-                            )
-                        except asyncio.TimeoutError:
-                            last_error = f"timeout({timeout_s}s)"
-                            if progress:
-                                progress(
-                                    trade_date,
-                                    info.get("symbol", ""),
-                                    "historical_error",
-                                    {
+                            except asyncio.TimeoutError:
+                                last_error = f"timeout({timeout_s}s)"
+                                if stats_key is not None:
+                                    stats.record(stats_key, what_to_show, False)
+                                if progress:
+                                    progress(
+                                        trade_date,
+                                        info.get("symbol", ""),
+                                        "historical_error",
+                                        {
+                                            "expiry": info.get("expiry"),
+                                            "strike": info.get("strike"),
+                                            "right": info.get("right"),
+                                            "what": what_to_show,
+                                            "error": last_error,
+                                        },
+                                    )
+                                logger.warning(
+                                    "Historical data request timeout",
+                                    extra={
+                                        "symbol": info.get("symbol"),
                                         "expiry": info.get("expiry"),
-                                        "strike": info.get("strike"),
-                                        "right": info.get("right"),
                                         "what": what_to_show,
-                                        "error": last_error,
+                                        "timeout": timeout_s,
                                     },
                                 )
+                                continue
+                            if stats_key is not None:
+                                stats.record(stats_key, what_to_show, bool(bars))
+                            if bars:
+                                if progress:
+                                    progress(
+                                        trade_date,
+                                        info.get("symbol", ""),
+                                        "historical_success",
+                                        {
+                                            "expiry": info.get("expiry"),
+                                            "strike": info.get("strike"),
+                                            "right": info.get("right"),
+                                            "what": what_to_show,
+                                            "rows": len(bars),
+                                        },
+                                    )
+                                break
+                            else:
+                                last_error = "no_bars"
+                        except Exception as exc:
+                            last_error = str(exc)
+                            if stats_key is not None:
+                                stats.record(stats_key, what_to_show, False)
                             logger.warning(
-                                "Historical data request timeout",
+                                "Historical data request failed",
                                 extra={
                                     "symbol": info.get("symbol"),
                                     "expiry": info.get("expiry"),
                                     "what": what_to_show,
-                                    "timeout": timeout_s,
                                 },
+                                exc_info=exc,
                             )
-                            continue
-                        if bars:
                             if progress:
                                 progress(
                                     trade_date,
                                     info.get("symbol", ""),
-                                    "historical_success",
+                                    "historical_error",
                                     {
                                         "expiry": info.get("expiry"),
                                         "strike": info.get("strike"),
                                         "right": info.get("right"),
                                         "what": what_to_show,
-                                        "rows": len(bars),
+                                        "error": str(exc),
                                     },
                                 )
-                            break
-                        else:
-                            last_error = "no_bars"
-                    except Exception as exc:
-                        last_error = str(exc)
-                        logger.warning(
-                            "Historical data request failed",
-                            extra={
-                                "symbol": info.get("symbol"),
-                                "expiry": info.get("expiry"),
-                                "what": what_to_show,
-                            },
-                            exc_info=exc,
-                        )
-                        if progress:
-                            progress(
-                                trade_date,
-                                info.get("symbol", ""),
-                                "historical_error",
-                                {
-                                    "expiry": info.get("expiry"),
-                                    "strike": info.get("strike"),
-                                    "right": info.get("right"),
-                                    "what": what_to_show,
-                                    "error": str(exc),
-                                },
-                            )
-                        continue
+                            continue
 
-                if not bars:
-                    if progress:
+                    if not bars and progress:
                         progress(
                             trade_date,
                             info.get("symbol", ""),
@@ -636,43 +861,22 @@ class BackfillRunner:
                                 "last_error": last_error,
                             },
                         )
-                    continue
-
-                for bar in bars:
-                    try:
-                        bar_ts = pd.Timestamp(bar.date)
-                    except Exception:
-                        bar_ts = pd.Timestamp(trade_date)
-
-                    rows.append(
-                        {
-                            **info,
-                            "open": float(getattr(bar, "open", float("nan"))),
-                            "high": float(getattr(bar, "high", float("nan"))),
-                            "low": float(getattr(bar, "low", float("nan"))),
-                            "close": float(getattr(bar, "close", float("nan"))),
-                            "last": float(getattr(bar, "close", float("nan"))),
-                            "volume": int(getattr(bar, "volume", 0) or 0),
-                            "bid": pd.NA,
-                            "ask": pd.NA,
-                            "mid": pd.NA,
-                            "iv": pd.NA,
-                            "delta": pd.NA,
-                            "gamma": pd.NA,
-                            "theta": pd.NA,
-                            "vega": pd.NA,
-                            "open_interest": pd.NA,
-                            "market_data_type": None,
-                            "bar_timestamp": bar_ts,
-                            "asof_ts": asof,
-                        }
+                    return info, (list(bars) if bars else None)
+                except Exception as exc:  # pragma: no cover - network failure
+                    logger.warning(
+                        "Historical data request failed",
+                        extra={"symbol": info.get("symbol"), "expiry": info.get("expiry")},
+                        exc_info=exc,
                     )
-            except Exception as exc:  # pragma: no cover - network failure
-                logger.warning(
-                    "Historical data request failed",
-                    extra={"symbol": info.get("symbol"), "expiry": info.get("expiry")},
-                    exc_info=exc,
-                )
-                continue
+                    return info, None
 
-        return rows
+        return list(await asyncio.gather(*(fetch_one(info, c) for info, c in prepared)))
+
+
+def _cached_conid(info: Dict[str, Any]) -> int:
+    """Return the cached conid when usable for requests without re-qualification."""
+    try:
+        conid = int(info.get("conid") or 0)
+    except (TypeError, ValueError):
+        return 0
+    return conid if conid > 0 else 0
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import logging
+from datetime import date
+from pathlib import Path
+from typing import List, Sequence
+
+import pandas as pd
+
+from ..config import AppConfig
+from ..storage.lake import list_parquet_files, list_partitions
+from ..storage.layout import partition_for
+from ..storage.writer import ParquetWriter
+from .cleaning import CleaningPipeline
+
+logger = logging.getLogger(__name__)
+
+CLEAN_MODES = ("eager", "deferred")
+# Snapshot views whose clean partitions are a pure function of the raw ones
+DERIVED_VIEWS = ("intraday", "close")
+
+
+def derive_clean(cleaner: CleaningPipeline, raw_df: pd.DataFrame) -> pd.DataFrame:
+    """Clean view of deduplicated raw snapshot rows (raw quality flags are kept)."""
+    clean_df, _ = cleaner.process(raw_df.copy())
+    if "data_quality_flag" in raw_df.columns and "data_quality_flag" in clean_df.columns:
+        clean_df["data_quality_flag"] = raw_df["data_quality_flag"]
+    return clean_df
+
+
+def read_clean_partition(
+    cfg: AppConfig,
+    view: str,
+    trade_date: date,
+    symbol: str,
+    exchange: str,
+    *,
+    cleaner: CleaningPipeline | None = None,
+) -> pd.DataFrame:
+    """Clean rows for one partition derived on read from raw (nothing is written)."""
+    part = partition_for(cfg, Path(cfg.paths.raw) / f"view={view}", trade_date, symbol, exchange)
+    files = list_parquet_files(part.path())
+    if not files:
+        return pd.DataFrame()
+    raw_df = pd.concat([pd.read_parquet(f) for f in files], ignore_index=True)
+    return derive_clean(cleaner or CleaningPipeline.create(cfg), raw_df)
+
+
+def materialize_clean_view(
+    cfg: AppConfig,
+    view: str,
+    trade_date: date,
+    symbols: Sequence[str] | None = None,
+    *,
+    force: bool = False,
+    cleaner: CleaningPipeline | None = None,
+    writer: ParquetWriter | None = None,
+) -> List[Path]:
+    """Rebuild ``clean/view=<view>`` partitions of *trade_date* from the raw ones.
+
+    Used when ``snapshot.clean_mode = "deferred"`` keeps snapshots from writing clean
+    partitions. A clean partition is rewritten only when its raw counterpart is newer
+    (or with *force*). Returns the clean files written.
+    """
+    if view not in DERIVED_VIEWS:
+        raise ValueError(f"Clean view {view!r} is not derived from raw; expected {DERIVED_VIEWS}")
+    raw_root = Path(cfg.paths.raw) / f"view={view}"
+    clean_root = Path(cfg.paths.clean) / f"view={view}"
+    date_dir = raw_root / f"date={trade_date.isoformat()}"
+    wanted = {s.upper() for s in symbols} if symbols else None
+    cleaner = cleaner or CleaningPipeline.create(cfg)
+    writer = writer or ParquetWriter(cfg)
+
+    written: List[Path] = []
+    for symbol in sorted(list_partitions(date_dir, "underlying")):
+        if wanted is not None and symbol.upper() not in wanted:
+            continue
+        for exchange in sorted(list_partitions(date_dir / f"underlying={symbol}", "exchange")):
+            raw_part = partition_for(cfg, raw_root, trade_date, symbol, exchange)
+            files = list_parquet_files(raw_part.path())
+            if not files:
+                continue
+            clean_part = partition_for(cfg, clean_root, trade_date, symbol, exchange)
+            target = clean_part.path() / "part-000.parquet"
+            if (
+                not force
+                and target.exists()
+                and target.stat().st_mtime_ns >= max(f.stat().st_mtime_ns for f in files)
+            ):
+                continue
+            try:
+                raw_df = pd.concat([pd.read_parquet(f) for f in files], ignore_index=True)
+            except Exception as exc:
+                logger.warning(
+                    "Failed to read raw partition for clean view",
+                    extra={"view": view, "path": str(raw_part.path()), "error": str(exc)},
+                )
+                continue
+            if raw_df.empty:
+                continue
+            written.append(writer.write_dataframe(derive_clean(cleaner, raw_df), clean_part))
+    return written
+
+
+def ensure_clean_views(
+    cfg: AppConfig,
+    trade_date: date,
+    symbols: Sequence[str] | None = None,
+    views: Sequence[str] = DERIVED_VIEWS,
+) -> List[Path]:
+    """Bring the derived clean views of *trade_date* up to date before they are read.
+
+    Writer-side jobs (QA) call this first so deferred mode shows the same data as eager
+    mode; read-only consumers (dashboard, MCP) clean raw rows with ``derive_clean``
+    instead. With ``clean_mode = "eager"`` it does nothing. Only partitions whose raw side
+    changed are rewritten.
+    """
+    if cfg.snapshot.clean_mode != "deferred":
+        return []
+    written: List[Path] = []
+    for view in views:
+        written.extend(materialize_clean_view(cfg, view, trade_date, symbols))
+    return written
+
+
+__all__ = [
+    "CLEAN_MODES",
+    "DERIVED_VIEWS",
+    "derive_clean",
+    "ensure_clean_views",
+    "materialize_clean_view",
+    "read_clean_partition",
+]
@@ -15,7 +15,9 @@ import time
 
 from ..config import AppConfig
 from ..storage.layout import partition_for
+from ..storage.lake import list_parquet_files
 from ..storage.writer import ParquetWriter
+from ..util.flags import normalize_flags
 from ..util.performance import log_performance
 from .cleaning import CleaningPipeline
 from ..ib.session import IBSession
@@ -128,7 +130,7 @@ class EnrichmentRunner:
         session = self._session_factory()
         error_file = Path(self.cfg.paths.run_logs) / "errors" / f"errors_{trade_date:%Y%m%d}.log"
 
-        part_paths = sorted(target_dir.rglob("part-000.parquet"))
+        part_paths = [p for p in list_parquet_files(target_dir) if p.name == "part-000.parquet"]
         if not part_paths:
             return EnrichmentResult(
                 ingest_id=ingest_id,
@@ -546,7 +548,7 @@ def _needs_open_interest(row: pd.Series, force_overwrite: bool = False) -> bool:
             return False
     except Exception:
         pass
-    flags = _normalize_flags(row.get("data_quality_flag"))
+    flags = normalize_flags(row.get("data_quality_flag"))
     return "missing_oi" in flags or pd.isna(oi)
 
 
@@ -574,7 +576,7 @@ def _extract_tick_oi(ticker: Any, rows: pd.DataFrame) -> float | None:
 
 
 def _flags_after_success(value: Any, was_overwritten: bool = False) -> list[str]:
-    flags = _normalize_flags(value)
+    flags = normalize_flags(value)
     if "missing_oi" in flags:
         flags.remove("missing_oi")
     if "oi_enriched" not in flags:
@@ -584,28 +586,6 @@ def _flags_after_success(value: Any, was_overwritten: bool = False) -> list[str]
     return flags
 
 
-def _normalize_flags(value: Any) -> list[str]:
-    if isinstance(value, list):
-        return [str(v) for v in value if str(v)]
-    if isinstance(value, (tuple, set)):
-        return [str(v) for v in value if str(v)]
-    if value is None or (isinstance(value, float) and pd.isna(value)):
-        return []
-    if isinstance(value, str):
-        text = value.strip()
-        if not text:
-            return []
-        if text.startswith("[") and text.endswith("]"):
-            try:
-                parsed = json.loads(text)
-                if isinstance(parsed, list):
-                    return [str(v) for v in parsed if str(v)]
-            except Exception:
-                pass
-        return [text]
-    return [str(value)]
-
-
 def _read_parquet_optional(path: Path) -> pd.DataFrame | None:
     if not path.exists():
         return None
@@ -1,20 +1,25 @@
 from __future__ import annotations
 
-import json
 import logging
 from datetime import date
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional
 
+import pandas as pd
 
 from ..config import AppConfig
-from ..ib import IBSession, make_throttle, fetch_option_daily_aggregated
+from ..ib import IBSession, make_throttle, fetch_option_daily_frame, bars_to_frame
 from ..ib.discovery import discover_contracts_for_symbol
-from ..universe import load_universe
+from ..storage.history import HistoryStore
+from ..universe import Universe
 
 logger = logging.getLogger(__name__)
 
 
+def default_history_root(cfg: AppConfig) -> Path:
+    return cfg.paths.clean / "view=history"
+
+
 class HistoryRunner:
     def __init__(self, cfg: AppConfig):
         self.cfg = cfg
@@ -42,23 +47,23 @@ class HistoryRunner:
             start_date: Start date for contract discovery/validity
             end_date: End date (not strictly used for history duration, but for cache)
             days: Number of days of history to fetch (e.g. 365)
-            output_dir: Directory to save JSON files
+            output_dir: Root of the partitioned parquet history store
             what_to_show: Data type (MIDPOINT, TRADES, etc.)
             use_rth: Whether to use Regular Trading Hours
             force_refresh: Force refresh contract cache
-            incremental: If True, only fetch missing days based on existing data
+            incremental: If True, only fetch days after each contract's manifest watermark
             bar_size: Bar size to use (default "8 hours")
             progress_callback: Callback(current, total, status, details)
         """
         if not output_dir:
-            output_dir = self.cfg.paths.clean / "ib" / "history"
+            output_dir = default_history_root(self.cfg)
 
         output_dir.mkdir(parents=True, exist_ok=True)
+        store = HistoryStore(output_dir)
 
         # Load universe if symbols not provided
         if not symbols:
-            universe = load_universe(Path(self.cfg.universe.file))
-            symbols = [u.symbol for u in universe]
+            symbols = Universe.load(Path(self.cfg.universe.file)).symbols
 
         # Use today as reference date if not provided
         ref_date = end_date or date.today()
@@ -91,39 +96,18 @@ class HistoryRunner:
                     duration_str = f"{days or 30} D"
 
                     if incremental:
-                        # Check existing data
-                        symbol_dir = output_dir / symbol
-                        if symbol_dir.exists():
-                            # Find max date folder
-                            existing_dates = sorted(
-                                [d.name for d in symbol_dir.iterdir() if d.is_dir()]
-                            )
-                            if existing_dates:
-                                last_date_str = existing_dates[-1]
-                                try:
-                                    last_date = date.fromisoformat(last_date_str)
-                                    # Calculate gap
-                                    gap_days = (ref_date - last_date).days
-                                    if gap_days <= 0:
-                                        logger.info(
-                                            f"Skipping {symbol}: Up to date (last: {last_date})"
-                                        )
-                                        if progress_callback:
-                                            progress_callback(
-                                                i + 1,
-                                                total_symbols,
-                                                f"Skipped {symbol} (Up to date)",
-                                                {},
-                                            )
-                                        continue
-
-                                    # Fetch gap + buffer (e.g. 1 day)
-                                    duration_str = f"{gap_days} D"
-                                    logger.info(
-                                        f"Incremental fetch for {symbol}: {duration_str} (last: {last_date})"
-                                    )
-                                except ValueError:
-                                    pass
+                        # Manifest watermark = earliest last-covered date across known conids
+                        last_date = store.symbol_last_covered(symbol)
+                        if last_date is not None and (ref_date - last_date).days <= 0:
+                            logger.info(f"Skipping {symbol}: Up to date (last: {last_date})")
+                            if progress_callback:
+                                progress_callback(
+                                    i + 1,
+                                    total_symbols,
+                                    f"Skipped {symbol} (Up to date)",
+                                    {},
+                                )
+                            continue
 
                     # 1. Resolve underlying conid
                     from ib_insync import Stock, Index
@@ -194,16 +178,9 @@ class HistoryRunner:
                         logger.warning(f"No contracts found for {symbol}")
                         continue
 
-                    # 2. Fetch history for each contract
-                    # Use ref_date for directory structure, even if incremental
-                    # Ideally we should store by date of data, but here we store by run date/ref date
-                    # If incremental, we might want to append to existing?
-                    # The current structure is history/SYMBOL/DATE/conid.json
-                    # If we run incremental for today, we create a new DATE folder.
-                    # This is fine.
-
-                    current_run_dir = output_dir / symbol / ref_date.isoformat()
-                    current_run_dir.mkdir(parents=True, exist_ok=True)
+                    # 4. Fetch history for each contract; bars are written once per symbol
+                    # into the partitioned parquet store (symbol/expiry_month buckets).
+                    frames: List[pd.DataFrame] = []
 
                     total_contracts = len(contracts)
                     for c_idx, contract_dict in enumerate(contracts):
@@ -226,18 +203,24 @@ class HistoryRunner:
                             contract.conId = int(c.get("conid", 0))
                             contract.includeExpired = True
 
-                            # Use fetch_option_daily_aggregated which handles 8-hour aggregation
-                            # If bar_size is not 8 hours, we might need direct fetch?
-                            # But fetch_option_daily_aggregated is hardcoded for 8 hours logic.
-                            # If user asks for '1 hour', we should use standard fetch?
-                            # For now, assume bar_size="8 hours" uses the aggregator, others use standard (if supported)
+                            contract_duration = duration_str
+                            if incremental:
+                                last_date = store.last_covered(contract.conId)
+                                if last_date is not None:
+                                    gap_days = (ref_date - last_date).days
+                                    if gap_days <= 0:
+                                        continue
+                                    contract_duration = f"{gap_days} D"
+
+                            # "8 hours" goes through the vectorized daily aggregator (EODChart
+                            # workaround); other bar sizes are stored as returned.
 
                             if bar_size == "8 hours":
-                                bars = fetch_option_daily_aggregated(
+                                frame = fetch_option_daily_frame(
                                     ib,
                                     contract,
                                     what_to_show=what_to_show,
-                                    duration=duration_str,
+                                    duration=contract_duration,
                                     use_rth=use_rth,
                                     throttle=self.throttle,
                                 )
@@ -247,37 +230,25 @@ class HistoryRunner:
                                 bars = ib.reqHistoricalData(
                                     contract,
                                     endDateTime=end_dt,
-                                    durationStr=duration_str,
+                                    durationStr=contract_duration,
                                     barSizeSetting=bar_size,
                                     whatToShow=what_to_show,
                                     useRTH=use_rth,
                                     formatDate=1,
                                     keepUpToDate=False,
                                 )
-                                # Convert objects to dicts
-                                if bars:
-                                    bars = [
-                                        {
-                                            "date": b.date.isoformat()
-                                            if hasattr(b.date, "isoformat")
-                                            else str(b.date),
-                                            "open": b.open,
-                                            "high": b.high,
-                                            "low": b.low,
-                                            "close": b.close,
-                                            "volume": b.volume,
-                                            "barCount": b.barCount,
-                                            "average": b.average,
-                                        }
-                                        for b in bars
-                                    ]
-
-                            if bars:
-                                # Save to file
-                                out_file = current_run_dir / f"{contract.conId}.json"
-                                out_file.write_text(json.dumps(bars), encoding="utf-8")
+                                frame = bars_to_frame(bars or [])
+
+                            if not frame.empty:
+                                frame["conid"] = contract.conId
+                                frame["expiry"] = c.get("expiry")
+                                frame["right"] = c.get("right")
+                                frame["strike"] = float(c.get("strike", 0))
+                                frame["what_to_show"] = what_to_show
+                                frame["bar_size"] = bar_size
+                                frames.append(frame)
                                 symbol_stats["contracts"] += 1
-                                symbol_stats["bars"] += len(bars)
+                                symbol_stats["bars"] += len(frame)
 
                             # Update progress periodically
                             if progress_callback and c_idx % 10 == 0:
@@ -293,6 +264,9 @@ class HistoryRunner:
                             # logger.error(f"Failed to fetch history for {symbol} conid={c.get('conid')}: {exc}")
                             symbol_stats["errors"] += 1
 
+                    if frames:
+                        store.write_bars(symbol, pd.concat(frames, ignore_index=True))
+
                     results["symbols"][symbol] = symbol_stats
                     results["processed"] += 1
 
@@ -9,6 +9,11 @@ from typing import Any, Dict, Iterable, List
 import pandas as pd
 
 from ..config import AppConfig
+from ..observability.summary_index import SummaryIndex, summary_index_path
+from ..storage.lake import list_parquet_files
+from ..storage.partition_stats import aggregate_stats
+from ..util.flags import normalize_flags
+from .clean_views import ensure_clean_views
 
 
 TOTAL_SLOTS = 14  # 09:30 through 16:00 inclusive, 30-minute cadence
@@ -47,6 +52,7 @@ class QAMetricsCalculator:
         self.cfg = cfg
 
     def evaluate(self, trade_date: date) -> QAMetricsResult:
+        ensure_clean_views(self.cfg, trade_date, views=("intraday",))
         intraday_dir = Path(self.cfg.paths.clean) / f"view=intraday/date={trade_date.isoformat()}"
         daily_dir = Path(self.cfg.paths.clean) / f"view=daily_clean/date={trade_date.isoformat()}"
 
@@ -102,6 +108,18 @@ class QAMetricsCalculator:
             )
         )
 
+        partial_metric, partial_details = self._metric_partial_slots(trade_date)
+        metrics.append(
+            MetricResult(
+                name="partial_slot_ratio",
+                value=partial_metric,
+                threshold=self.cfg.qa.partial_slot_threshold,
+                comparator="<=",
+                passed=partial_metric <= self.cfg.qa.partial_slot_threshold,
+                details=partial_details,
+            )
+        )
+
         status = "PASS"
         for metric in metrics:
             if not metric.passed:
@@ -123,8 +141,10 @@ class QAMetricsCalculator:
         metrics_dir = Path(self.cfg.paths.state) / "run_logs" / "metrics"
         metrics_dir.mkdir(parents=True, exist_ok=True)
         path = metrics_dir / f"metrics_{result.trade_date.strftime('%Y%m%d')}.json"
-        path.write_text(
-            json.dumps(result.as_dict(), ensure_ascii=False, indent=2), encoding="utf-8"
+        payload = result.as_dict()
+        path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+        SummaryIndex(summary_index_path(self.cfg)).record_report(
+            "metrics", result.trade_date, payload, path
         )
         return path
 
@@ -134,14 +154,20 @@ class QAMetricsCalculator:
 
         coverage: dict[str, set[int]] = {}
         rows = 0
-        for df in _iter_parquet_frames(intraday_dir, columns=["underlying", "slot_30m"]):
-            if df.empty:
-                continue
-            rows += len(df)
-            underlying = str(df.get("underlying", pd.Series([""])).iloc[0]).upper()
-            slots = pd.to_numeric(df["slot_30m"], errors="coerce").dropna().astype(int)
-            if not slots.empty:
-                coverage.setdefault(underlying, set()).update(slots.tolist())
+        sidecars = aggregate_stats(intraday_dir)
+        if sidecars is not None:
+            rows = sidecars["rows"]
+            for symbol, slots_seen in sidecars["slots_by_underlying"].items():
+                coverage[symbol] = set(slots_seen)
+        else:
+            for df in _iter_parquet_frames(intraday_dir, columns=["underlying", "slot_30m"]):
+                if df.empty:
+                    continue
+                rows += len(df)
+                underlying = str(df.get("underlying", pd.Series([""])).iloc[0]).upper()
+                slots = pd.to_numeric(df["slot_30m"], errors="coerce").dropna().astype(int)
+                if not slots.empty:
+                    coverage.setdefault(underlying, set()).update(slots.tolist())
 
         coverage_by_symbol = {sym: len(slots) / TOTAL_SLOTS for sym, slots in coverage.items()}
         minimum = float(min(coverage_by_symbol.values())) if coverage_by_symbol else 0.0
@@ -155,6 +181,12 @@ class QAMetricsCalculator:
         if not intraday_dir.exists():
             return 0.0, {"rows": 0, "delayed_rows": 0}
 
+        sidecars = aggregate_stats(intraday_dir)
+        if sidecars is not None:
+            total_rows, delayed_rows = sidecars["rows"], sidecars["delayed_rows"]
+            ratio = delayed_rows / total_rows if total_rows else 0.0
+            return ratio, {"rows": total_rows, "delayed_rows": delayed_rows}
+
         total_rows = 0
         delayed_rows = 0
         for df in _iter_parquet_frames(
@@ -164,7 +196,7 @@ class QAMetricsCalculator:
                 continue
             total_rows += len(df)
             flags_series = df.get("data_quality_flag", pd.Series([], dtype=object))
-            delayed_mask = flags_series.apply(lambda x: "delayed_fallback" in _normalize_flags(x))
+            delayed_mask = flags_series.apply(lambda x: "delayed_fallback" in normalize_flags(x))
             if "market_data_type" in df.columns:
                 delayed_mask |= df["market_data_type"].astype("Int64").fillna(1) != 1
             delayed_rows += int(delayed_mask.sum())
@@ -172,10 +204,39 @@ class QAMetricsCalculator:
         ratio = delayed_rows / total_rows if total_rows else 0.0
         return ratio, {"rows": total_rows, "delayed_rows": delayed_rows}
 
+    def _metric_partial_slots(self, trade_date: date) -> tuple[float, dict[str, Any]]:
+        # Appended by SnapshotRunner whenever a slot hits its deadline (one line per shard)
+        path = (
+            Path(self.cfg.paths.run_logs)
+            / "snapshot"
+            / f"overruns_{trade_date.strftime('%Y%m%d')}.jsonl"
+        )
+        slots: dict[str, dict[str, Any]] = {}
+        if path.exists():
+            for line in path.read_text(encoding="utf-8").splitlines():
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                label = str(entry.get("slot", ""))
+                agg = slots.setdefault(label, {"skipped": 0, "cut": 0, "overrun_seconds": 0.0})
+                agg["skipped"] += len(entry.get("skipped_symbols") or [])
+                agg["cut"] += len(entry.get("cut_symbols") or [])
+                agg["overrun_seconds"] = max(
+                    agg["overrun_seconds"], float(entry.get("overrun_seconds") or 0.0)
+                )
+        return len(slots) / TOTAL_SLOTS, {"partial_slots": slots, "slots_expected": TOTAL_SLOTS}
+
     def _metric_rollup_fallback(self, daily_dir: Path) -> tuple[float, dict[str, Any]]:
         if not daily_dir.exists():
             return 0.0, {"rows": 0, "fallback_rows": 0}
 
+        sidecars = aggregate_stats(daily_dir)
+        if sidecars is not None:
+            total_rows, fallback_rows = sidecars["rows"], sidecars["fallback_rows"]
+            ratio = fallback_rows / total_rows if total_rows else 0.0
+            return ratio, {"rows": total_rows, "fallback_rows": fallback_rows}
+
         total_rows = 0
         fallback_rows = 0
         for df in _iter_parquet_frames(daily_dir, columns=["rollup_strategy"]):
@@ -196,6 +257,16 @@ class QAMetricsCalculator:
         if not daily_dir.exists():
             return 0.0, {"rows": 0, "enriched_rows": 0, "missing_rows": 0}
 
+        sidecars = aggregate_stats(daily_dir)
+        if sidecars is not None:
+            total_rows = sidecars["rows"]
+            ratio = sidecars["enriched_rows"] / total_rows if total_rows else 0.0
+            return ratio, {
+                "rows": total_rows,
+                "enriched_rows": sidecars["enriched_rows"],
+                "missing_rows": sidecars["missing_oi_rows"],
+            }
+
         total_rows = 0
         enriched_rows = 0
         missing_rows = 0
@@ -204,7 +275,7 @@ class QAMetricsCalculator:
                 continue
             total_rows += len(df)
             flags_series = df.get("data_quality_flag", pd.Series([], dtype=object))
-            flags_list = flags_series.apply(_normalize_flags)
+            flags_list = flags_series.apply(normalize_flags)
             missing_mask = flags_list.apply(lambda flg: "missing_oi" in flg)
             oi_series = pd.to_numeric(df.get("open_interest"), errors="coerce")
             valid_mask = (~oi_series.isna()) & (~missing_mask)
@@ -219,32 +290,10 @@ class QAMetricsCalculator:
         }
 
 
-def _normalize_flags(value: Any) -> list[str]:
-    if isinstance(value, list):
-        return [str(v) for v in value if str(v)]
-    if isinstance(value, (tuple, set)):
-        return [str(v) for v in value if str(v)]
-    if value is None or (isinstance(value, float) and pd.isna(value)):
-        return []
-    if isinstance(value, str):
-        text = value.strip()
-        if not text:
-            return []
-        if text.startswith("[") and text.endswith("]"):
-            try:
-                parsed = json.loads(text)
-                if isinstance(parsed, list):
-                    return [str(v) for v in parsed if str(v)]
-            except Exception:
-                pass
-        return [text]
-    return [str(value)]
-
-
 def _iter_parquet_frames(root: Path, columns: list[str]) -> Iterable[pd.DataFrame]:
     if not root.exists():
         return
-    for path in sorted(root.rglob("*.parquet")):
+    for path in list_parquet_files(root):
         try:
             yield pd.read_parquet(path, columns=columns)
         except Exception:
@@ -255,7 +304,7 @@ def _read_parquet_tree(root: Path) -> pd.DataFrame:
     if not root.exists():
         return pd.DataFrame()
     frames: list[pd.DataFrame] = []
-    for path in sorted(root.rglob("*.parquet")):
+    for path in list_parquet_files(root):
         try:
             frames.append(pd.read_parquet(path))
         except Exception:
@@ -14,12 +14,15 @@ import ast
 
 from ..config import AppConfig
 from ..storage.layout import partition_for
+from ..storage.lake import list_parquet_files
+from ..storage.manifest import partition_manifest
 from ..storage.writer import ParquetWriter
 from ..util.performance import log_performance
 from ..util.memory import optimize_dataframe_dtypes
 from ..quality import OptionMarketDataSchema, detect_anomalies
 from ..quality.report import DailyQualityReport, QualityMetrics
 from .cleaning import CleaningPipeline
+from .clean_views import DERIVED_VIEWS, materialize_clean_view
 from ..observability import MetricsCollector, AlertManager
 import pandera.pandas as pa
 
@@ -92,6 +95,18 @@ class RollupRunner:
 
         wanted = {sym.upper() for sym in symbols} if symbols else None
 
+        if self.cfg.snapshot.clean_mode == "deferred":
+            # Snapshots wrote raw only; bring the clean views up to date before reading
+            for view in DERIVED_VIEWS:
+                materialize_clean_view(
+                    self.cfg,
+                    view,
+                    trade_date,
+                    symbols,
+                    cleaner=self._cleaner,
+                    writer=self._writer,
+                )
+
         close_root = Path(self.cfg.paths.clean) / "view=close" / f"date={trade_date.isoformat()}"
         partition_dirs = self._list_partition_dirs(close_root)
         source_view = "close"
@@ -340,7 +355,11 @@ class RollupRunner:
     def _list_partition_dirs(self, root: Path) -> list[Path]:
         if not root.exists():
             return []
-        return sorted({p.parent for p in root.rglob("*.parquet")})
+        manifest = partition_manifest(root.parent)
+        if manifest.initialized:
+            day = root.name.split("=", 1)[-1]
+            return sorted({p.parent for p in manifest.files([day])})
+        return sorted({p.parent for p in list_parquet_files(root)})
 
     def _partition_values(self, part_dir: Path) -> tuple[str | None, str | None]:
         try:
@@ -357,7 +376,7 @@ class RollupRunner:
     def _read_partition(self, part_dir: Path) -> tuple[pd.DataFrame, list[dict[str, Any]]]:
         frames: list[pd.DataFrame] = []
         errors: list[dict[str, Any]] = []
-        for parquet_path in sorted(part_dir.glob("*.parquet")):
+        for parquet_path in list_parquet_files(part_dir):
             try:
                 frames.append(pd.read_parquet(parquet_path))
             except Exception as exc:
@@ -377,7 +396,7 @@ class RollupRunner:
         frames: list[pd.DataFrame] = []
         errors: list[dict[str, Any]] = []
 
-        for parquet_path in sorted(root.rglob("*.parquet")):
+        for parquet_path in list_parquet_files(root):
             try:
                 frames.append(pd.read_parquet(parquet_path))
             except Exception as exc:
@@ -405,7 +424,7 @@ class RollupRunner:
         frames: list[pd.DataFrame] = []
         errors: list[dict[str, Any]] = []
 
-        for parquet_path in sorted(root.rglob("*.parquet")):
+        for parquet_path in list_parquet_files(root):
             try:
                 frames.append(pd.read_parquet(parquet_path))
             except Exception as exc:
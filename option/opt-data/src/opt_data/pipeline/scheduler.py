@@ -218,10 +218,17 @@ class ScheduleRunner:
             include_rollup=include_rollup,
             include_enrichment=include_enrichment,
         )
+        deadline_seconds = self.cfg.snapshot.slot_deadline_seconds
         job_ids: list[str] = []
         for idx, job in enumerate(jobs):
             job_id = f"{job.kind}-{trade_date.isoformat()}-{idx}"
             if job.kind == "snapshot":
+                # Bound each slot so a late/slow one never delays the next
+                deadline = (
+                    job.run_time + timedelta(seconds=deadline_seconds)
+                    if deadline_seconds > 0
+                    else None
+                )
                 scheduler.add_job(
                     self._run_snapshot_job,
                     trigger="date",
@@ -230,6 +237,7 @@ class ScheduleRunner:
                         "trade_date": trade_date,
                         "payload": job.payload,
                         "progress": snapshot_progress,
+                        "deadline": deadline,
                     },
                     id=job_id,
                     replace_existing=True,
@@ -273,6 +281,7 @@ class ScheduleRunner:
         payload: Dict[str, Any],
         *,
         progress: callable[[str, str, Dict[str, Any]], None] | None = None,
+        deadline: datetime | None = None,
     ) -> None:
         slot_label = str(payload["slot_label"])
         symbols = payload.get("symbols")
@@ -288,6 +297,7 @@ class ScheduleRunner:
             symbols,
             universe_path=universe_path,
             progress=progress,
+            deadline=deadline,
         )
 
     def _run_close_snapshot_rollup_job(
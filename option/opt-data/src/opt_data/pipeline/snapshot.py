@@ -6,7 +6,7 @@ import math
 import time
 import uuid
 import warnings
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import date, datetime, time as dtime, timedelta
 from pathlib import Path
 from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
@@ -19,18 +19,21 @@ from ..ib.discovery import discover_contracts_for_symbol
 from ..ib.session import IBSession
 from ..storage.layout import partition_for
 from ..storage.writer import ParquetWriter
-from ..universe import load_universe
+from ..universe import Universe
 from ..util.ratelimit import TokenBucket
 from ..util.calendar import get_trading_session
 from ..ib.snapshot import collect_option_snapshots
 from .backfill import fetch_underlying_close
 from .cleaning import CleaningPipeline
+from .clean_views import derive_clean
+from .symbol_costs import COSTS_FILENAME, SymbolCostStats
 from ..observability import MetricsCollector, AlertManager
 
 logger = logging.getLogger(__name__)
 
 
 DEFAULT_SNAPSHOT_GRACE_SECONDS = 120
+OVERRUNS_PREFIX = "overruns_"
 
 SCOPE_REQUIRED_FIELDS = {
     "conid": None,
@@ -91,6 +94,14 @@ class SnapshotResult:
     raw_paths: list[Path]
     clean_paths: list[Path]
     errors: list[dict[str, Any]]
+    # Moved behind the rest of the slot by cost-based scheduling (includes shed ones)
+    deferred_symbols: list[str] = field(default_factory=list)
+    # Deferred symbols skipped because the slot budget ran out
+    shed_symbols: list[str] = field(default_factory=list)
+    # The slot deadline passed: some symbols were skipped or cut short
+    partial_slot: bool = False
+    # Symbols not captured because the slot deadline had passed
+    skipped_symbols: list[str] = field(default_factory=list)
 
 
 def _slot_schedule(trade_date: date, tz_name: str, slot_minutes: int = 30) -> list[SnapshotSlot]:
@@ -165,6 +176,7 @@ class SnapshotRunner:
         now_fn: Callable[[], datetime] | None = None,
         snapshot_grace_seconds: int = DEFAULT_SNAPSHOT_GRACE_SECONDS,
         slot_minutes: int = 30,
+        rate_limiters: Dict[str, Any] | None = None,
     ) -> None:
         self.cfg = cfg
         self._session_factory = session_factory or (lambda: _default_session_factory(cfg))
@@ -205,7 +217,7 @@ class SnapshotRunner:
         self._snapshot_cfg = snapshot_cfg
         self._grace_seconds = snapshot_grace_seconds
 
-        self._limiters: dict[str, TokenBucket] = {
+        self._limiters: dict[str, Any] = {
             "discovery": TokenBucket.create(
                 capacity=cfg.rate_limits.discovery.burst,
                 refill_per_minute=cfg.rate_limits.discovery.per_minute,
@@ -215,6 +227,8 @@ class SnapshotRunner:
                 refill_per_minute=cfg.rate_limits.snapshot.per_minute,
             ),
         }
+        # Shared limiters (e.g. one budget across shard processes) replace the local ones
+        self._limiters.update(rate_limiters or {})
 
         # Observability
         self.metrics = MetricsCollector(cfg.observability.metrics_db_path)
@@ -276,16 +290,37 @@ class SnapshotRunner:
         view: str = "intraday",  # Output view: "intraday" or "close"
         force_refresh: bool = False,
         progress: Callable[[str, str, Dict[str, Any]], None] | None = None,
+        ingest_id: str | None = None,
+        deadline: datetime | None = None,
     ) -> SnapshotResult:
+        """Capture *slot* for the selected symbols and write raw/clean partitions.
+
+        With a *deadline*, symbols not started by then are skipped, in-flight market data
+        requests are cancelled when it passes, and whatever was gathered is still written
+        (cut rows flagged ``partial_slot``). The overrun is appended to
+        ``run_logs/snapshot/overruns_<date>.jsonl`` for QA.
+        """
         # Use provided universe_path, or fall back to config default
         effective_path = universe_path or self.cfg.universe.file
-        universe = load_universe(effective_path)
-        wanted = {sym.upper() for sym in symbols} if symbols else None
-        entries = [u for u in universe if wanted is None or u.symbol in wanted]
+        entries = Universe.load(Path(effective_path)).select(symbols)
         if not entries:
             raise ValueError("No symbols available after filtering; check universe configuration")
 
-        ingest_id = uuid.uuid4().hex
+        cost_stats = SymbolCostStats.load(Path(self.cfg.paths.state) / COSTS_FILENAME)
+        budget_seconds = self._snapshot_cfg.slot_budget_seconds if self._snapshot_cfg else 0.0
+        deferred: list[str] = []
+        if self._snapshot_cfg and self._snapshot_cfg.cost_ordering:
+            entries, deferred = cost_stats.schedule(entries, budget_seconds or None)
+        deferred_set = set(deferred)
+        shed: list[str] = []
+        deadline_ts = deadline.timestamp() if deadline is not None else None
+        skipped: list[str] = []
+        cut_symbols: list[str] = []
+
+        def deadline_passed() -> bool:
+            return deadline_ts is not None and time.time() >= deadline_ts
+
+        ingest_id = ingest_id or uuid.uuid4().hex
         errors: list[dict[str, Any]] = []
         raw_files: list[Path] = []
         clean_files: list[Path] = []
@@ -312,6 +347,14 @@ class SnapshotRunner:
                     "slot": slot.label,
                     "view": view,
                     "universe": str(effective_path),
+                    "predicted_seconds": round(
+                        cost_stats.predict(
+                            e.symbol for e in entries if e.symbol not in deferred_set
+                        ),
+                        1,
+                    ),
+                    "deferred": deferred,
+                    "deadline": deadline.isoformat() if deadline is not None else None,
                 },
                 ensure_ascii=False,
             )
@@ -361,15 +404,35 @@ class SnapshotRunner:
 
         session = self._session_factory()
 
+        run_started = time.monotonic()
         with session as sess:
             ib = sess.ensure_connected()
             for entry in entries:
                 symbol = entry.symbol
+                if deadline_passed():
+                    skipped.append(symbol)
+                    record_error(symbol, "deadline", None, {"reason": "slot_deadline"})
+                    emit(symbol, "deadline_skip", {})
+                    continue
+                if symbol in deferred_set:
+                    run_elapsed = time.monotonic() - run_started
+                    expected = cost_stats.expected_seconds(symbol)
+                    if run_elapsed + expected > budget_seconds:
+                        shed.append(symbol)
+                        details = {
+                            "reason": "slot_budget",
+                            "expected_seconds": round(expected, 1),
+                            "elapsed_seconds": round(run_elapsed, 1),
+                        }
+                        record_error(symbol, "shed", None, details)
+                        emit(symbol, "shed", details)
+                        continue
                 started_at = time.monotonic()
                 started_wall = datetime.now(self._tz)
                 result_label = "success"
                 rows_count = 0
                 contracts_count = 0
+                timeouts = 0
                 emit(symbol, "start", {})
                 try:
                     try:
@@ -424,6 +487,13 @@ class SnapshotRunner:
                         result_label = "no_contracts"
                         continue
 
+                    if deadline_passed():
+                        skipped.append(symbol)
+                        record_error(symbol, "deadline", None, {"reason": "slot_deadline"})
+                        emit(symbol, "deadline_skip", {"contracts": len(contracts)})
+                        result_label = "deadline"
+                        continue
+
                     contracts_count = len(contracts)
                     contracts_total += len(contracts)
 
@@ -433,6 +503,7 @@ class SnapshotRunner:
                             contracts,
                             reference_price=reference_price,
                             acquire_token=self._make_acquire("snapshot"),
+                            deadline=deadline_ts,
                         )
                     except Exception as exc:
                         record_error(symbol, "snapshot", exc, {"contracts": len(contracts)})
@@ -457,11 +528,22 @@ class SnapshotRunner:
                     )
                     all_rows.extend(enriched)
                     rows_count = len(enriched)
+                    timeouts = sum(
+                        1 for row in enriched if "snapshot_timeout" in row["data_quality_flag"]
+                    )
+                    if any("partial_slot" in row["data_quality_flag"] for row in enriched):
+                        cut_symbols.append(symbol)
+                        result_label = "partial"
                     emit(symbol, "rows", {"count": rows_count})
-                    result_label = "success"
+                    if result_label != "partial":
+                        result_label = "success"
                 finally:
                     elapsed = round(time.monotonic() - started_at, 3)
                     end_wall = datetime.now(self._tz)
+                    if contracts_count and result_label not in ("partial", "deadline"):
+                        cost_stats.record(
+                            symbol, contracts=contracts_count, seconds=elapsed, timeouts=timeouts
+                        )
                     emit(
                         symbol,
                         "done",
@@ -475,6 +557,35 @@ class SnapshotRunner:
                         },
                     )
 
+        partial_slot = bool(skipped or cut_symbols)
+        if partial_slot and deadline_ts is not None:
+            overrun = {
+                "trade_date": trade_date.isoformat(),
+                "slot": slot.label,
+                "slot_index": slot.index,
+                "ingest_id": ingest_id,
+                "deadline": deadline.isoformat(),
+                "overrun_seconds": round(max(time.time() - deadline_ts, 0.0), 3),
+                "skipped_symbols": skipped,
+                "cut_symbols": cut_symbols,
+            }
+            logger.warning(
+                "Snapshot slot %s hit its deadline: skipped=%s cut=%s",
+                slot.label,
+                len(skipped),
+                len(cut_symbols),
+            )
+            emit("", "partial_slot", {"skipped": len(skipped), "cut": len(cut_symbols)})
+            _write_error_line(
+                log_dir / f"{OVERRUNS_PREFIX}{trade_date.strftime('%Y%m%d')}.jsonl", overrun
+            )
+            self.metrics.count("snapshot.slot.partial", 1, {"slot": slot.label})
+
+        try:
+            cost_stats.save()
+        except OSError as exc:  # pragma: no cover - stats are best-effort
+            logger.warning("Failed to save snapshot cost stats: %s", exc)
+
         if not all_rows:
             return SnapshotResult(
                 ingest_id=ingest_id,
@@ -485,15 +596,15 @@ class SnapshotRunner:
                 raw_paths=[],
                 clean_paths=[],
                 errors=errors,
+                deferred_symbols=deferred,
+                shed_symbols=shed,
+                partial_slot=partial_slot,
+                skipped_symbols=skipped,
             )
 
         raw_df = pd.DataFrame(all_rows)
         raw_df = self._deduplicate(raw_df)
 
-        clean_df, _ = self._cleaner.process(raw_df.copy())
-        if "data_quality_flag" in raw_df.columns and "data_quality_flag" in clean_df.columns:
-            clean_df["data_quality_flag"] = raw_df["data_quality_flag"]
-
         raw_root = Path(self.cfg.paths.raw) / f"view={view}"
         clean_root = Path(self.cfg.paths.clean) / f"view={view}"
 
@@ -510,15 +621,19 @@ class SnapshotRunner:
             )
             raw_files.append(path)
 
-        for (symbol, exchange), group in clean_df.groupby(group_keys):
-            path = self._merge_and_write_partition(
-                root=clean_root,
-                trade_date=trade_date,
-                symbol=symbol,
-                exchange=exchange,
-                new_rows=group,
-            )
-            clean_files.append(path)
+        # Deferred: clean partitions are derived from raw later (see clean_views)
+        clean_mode = self._snapshot_cfg.clean_mode if self._snapshot_cfg else "eager"
+        if clean_mode == "eager":
+            clean_df = derive_clean(self._cleaner, raw_df)
+            for (symbol, exchange), group in clean_df.groupby(group_keys):
+                path = self._merge_and_write_partition(
+                    root=clean_root,
+                    trade_date=trade_date,
+                    symbol=symbol,
+                    exchange=exchange,
+                    new_rows=group,
+                )
+                clean_files.append(path)
 
         return SnapshotResult(
             ingest_id=ingest_id,
@@ -529,6 +644,10 @@ class SnapshotRunner:
             raw_paths=raw_files,
             clean_paths=clean_files,
             errors=errors,
+            deferred_symbols=deferred,
+            shed_symbols=shed,
+            partial_slot=partial_slot,
+            skipped_symbols=skipped,
         )
 
     def _fetch_reference_price(
@@ -622,6 +741,8 @@ class SnapshotRunner:
 
             if row.pop("snapshot_timed_out", False):
                 flags.append("snapshot_timeout")
+            if row.pop("deadline_reached", False):
+                flags.append("partial_slot")
 
             exchange_rank = row.pop("_exchange_rank", 0)
             if exchange_rank:
@@ -729,6 +850,7 @@ class SnapshotRunner:
         *,
         reference_price: float,
         acquire_token: Callable[[], None],
+        deadline: float | None = None,
     ) -> list[dict[str, Any]]:
         preferences = self._preferred_exchanges()
         timeout = self._snapshot_cfg.subscription_timeout if self._snapshot_cfg else 12.0
@@ -748,7 +870,11 @@ class SnapshotRunner:
             market_data_type = 2  # Frozen
             logger.info("Using frozen data (market_data_type=2) for after-hours")
 
+        # Custom fetchers predating slot deadlines only receive the kwarg when one is set
+        deadline_kwargs = {"deadline": deadline} if deadline is not None else {}
         for rank, exchange in enumerate(preferences):
+            if deadline is not None and time.time() >= deadline:
+                break
             subset = self._filter_by_exchange(contracts, exchange)
             if not subset:
                 continue
@@ -770,6 +896,7 @@ class SnapshotRunner:
                 batch_size=self.cfg.snapshot.batch_size,
                 metrics=self.metrics,
                 alerts=self.alerts,
+                **deadline_kwargs,
             )
             if rows:
                 return rows
@@ -0,0 +1,250 @@
+from __future__ import annotations
+
+import copy
+import logging
+import multiprocessing
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Dict, List, Sequence
+
+from ..config import AppConfig
+from ..universe import Universe, shard_of
+from ..util.cache_manager import contract_cache
+from ..util.ratelimit import SharedTokenBucket
+from .snapshot import DEFAULT_SNAPSHOT_GRACE_SECONDS, SnapshotResult, SnapshotRunner, SnapshotSlot
+
+logger = logging.getLogger(__name__)
+
+SHARD_STRATEGIES = ("hash", "contracts")
+
+# Limiters handed to each shard process by the pool initializer
+_SHARD_LIMITERS: Dict[str, SharedTokenBucket] = {}
+
+
+def _init_shard(limiters: Dict[str, SharedTokenBucket]) -> None:
+    _SHARD_LIMITERS.clear()
+    _SHARD_LIMITERS.update(limiters)
+
+
+def shard_config(cfg: AppConfig, shard_index: int, shards: int) -> AppConfig:
+    """Copy of *cfg* for one shard: its own client id and a 1/N share of the line budget."""
+    shard_cfg = copy.deepcopy(cfg)
+    if shard_cfg.ib.client_id_pool is not None:
+        # Let each shard claim a distinct id from the pool via its lock files
+        shard_cfg.ib.client_id = None
+    elif shard_cfg.ib.client_id is not None:
+        shard_cfg.ib.client_id += shard_index
+    total_lines = shard_cfg.rate_limits.snapshot.max_concurrent
+    if total_lines:
+        shard_cfg.rate_limits.snapshot.max_concurrent = max(1, total_lines // max(shards, 1))
+    return shard_cfg
+
+
+def _run_shard(
+    cfg: AppConfig,
+    shard_index: int,
+    shards: int,
+    runner_kwargs: Dict[str, Any],
+    trade_date: date,
+    slot: SnapshotSlot,
+    symbols: List[str],
+    run_kwargs: Dict[str, Any],
+) -> SnapshotResult:
+    runner = SnapshotRunner(
+        shard_config(cfg, shard_index, shards),
+        rate_limiters=dict(_SHARD_LIMITERS),
+        **runner_kwargs,
+    )
+    return runner.run(trade_date, slot, symbols, **run_kwargs)
+
+
+def merge_results(
+    ingest_id: str, slot: SnapshotSlot, results: Sequence[SnapshotResult]
+) -> SnapshotResult:
+    merged = SnapshotResult(
+        ingest_id=ingest_id,
+        slot=slot,
+        symbols_processed=0,
+        contracts_discovered=0,
+        rows_written=0,
+        raw_paths=[],
+        clean_paths=[],
+        errors=[],
+    )
+    for result in results:
+        merged.symbols_processed += result.symbols_processed
+        merged.contracts_discovered += result.contracts_discovered
+        merged.rows_written += result.rows_written
+        merged.raw_paths.extend(result.raw_paths)
+        merged.clean_paths.extend(result.clean_paths)
+        merged.errors.extend(result.errors)
+        merged.deferred_symbols.extend(result.deferred_symbols)
+        merged.shed_symbols.extend(result.shed_symbols)
+        merged.partial_slot = merged.partial_slot or result.partial_slot
+        merged.skipped_symbols.extend(result.skipped_symbols)
+    return merged
+
+
+class ShardedSnapshotRunner:
+    """Run one snapshot slot as N shard processes, each with its own IB connection.
+
+    Symbols are split by a stable symbol hash or, with ``strategy="contracts"``, balanced
+    on the contract counts in the discovery cache. Shards share the discovery/snapshot
+    pacing budget through ``SharedTokenBucket``s and split
+    ``rate_limits.snapshot.max_concurrent`` (market data lines) evenly. Every shard
+    writes the partitions of its own symbols under a common ingest_id, and the
+    per-shard results merge into a single ``SnapshotResult``.
+    """
+
+    def __init__(
+        self,
+        cfg: AppConfig,
+        shards: int,
+        *,
+        strategy: str = "hash",
+        snapshot_grace_seconds: int = DEFAULT_SNAPSHOT_GRACE_SECONDS,
+        slot_minutes: int = 30,
+    ) -> None:
+        if shards < 1:
+            raise ValueError("shards must be >= 1")
+        if strategy not in SHARD_STRATEGIES:
+            raise ValueError(f"Invalid shard strategy: {strategy}")
+        self.cfg = cfg
+        self.shards = shards
+        self.strategy = strategy
+        self._runner_kwargs = {
+            "snapshot_grace_seconds": snapshot_grace_seconds,
+            "slot_minutes": slot_minutes,
+        }
+
+    def _estimated_contracts(self, symbol: str, trade_date: date) -> int:
+        try:
+            cached = contract_cache(Path(self.cfg.paths.contracts_cache)).load(symbol, trade_date)
+        except Exception:
+            cached = None
+        return len(cached) if cached else 0
+
+    def plan(
+        self,
+        trade_date: date,
+        symbols: Sequence[str] | None = None,
+        *,
+        universe_path: Path | None = None,
+    ) -> List[List[str]]:
+        """Symbols per shard (universe order within a shard); some shards may be empty."""
+        universe = Universe.load(Path(universe_path or self.cfg.universe.file))
+        selected = [entry.symbol for entry in universe.select(symbols)]
+        buckets: List[List[str]] = [[] for _ in range(self.shards)]
+        if self.strategy == "hash":
+            for symbol in selected:
+                buckets[shard_of(symbol, self.shards)].append(symbol)
+            return buckets
+
+        # Longest-processing-time first: biggest chains go to the least-loaded shard.
+        # Symbols without a cached chain count as the median known size.
+        costs = {symbol: self._estimated_contracts(symbol, trade_date) for symbol in selected}
+        known = sorted(c for c in costs.values() if c)
+        fallback = known[len(known) // 2] if known else 1
+        loads = [0] * self.shards
+        assigned: Dict[str, int] = {}
+        for symbol in sorted(selected, key=lambda s: costs[s] or fallback, reverse=True):
+            target = loads.index(min(loads))
+            loads[target] += costs[symbol] or fallback
+            assigned[symbol] = target
+        for symbol in selected:
+            buckets[assigned[symbol]].append(symbol)
+        return buckets
+
+    def run(
+        self,
+        trade_date: date,
+        slot: SnapshotSlot,
+        symbols: Sequence[str] | None = None,
+        *,
+        universe_path: Path | None = None,
+        ingest_run_type: str = "intraday",
+        view: str = "intraday",
+        force_refresh: bool = False,
+        deadline: datetime | None = None,
+    ) -> SnapshotResult:
+        plan = [
+            (index, shard_symbols)
+            for index, shard_symbols in enumerate(
+                self.plan(trade_date, symbols, universe_path=universe_path)
+            )
+            if shard_symbols
+        ]
+        if not plan:
+            raise ValueError("No symbols available after filtering; check universe configuration")
+
+        ingest_id = uuid.uuid4().hex
+        run_kwargs = {
+            "universe_path": universe_path,
+            "ingest_run_type": ingest_run_type,
+            "view": view,
+            "force_refresh": force_refresh,
+            "ingest_id": ingest_id,
+            "deadline": deadline,
+        }
+        # spawn: ib_insync/eventkit state does not survive a fork
+        ctx = multiprocessing.get_context("spawn")
+        limiters = {
+            kind: SharedTokenBucket(limit.burst, limit.per_minute, mp_context=ctx)
+            for kind, limit in (
+                ("discovery", self.cfg.rate_limits.discovery),
+                ("snapshot", self.cfg.rate_limits.snapshot),
+            )
+        }
+
+        results: List[SnapshotResult] = []
+        errors: List[Dict[str, Any]] = []
+        with ProcessPoolExecutor(
+            max_workers=len(plan),
+            mp_context=ctx,
+            initializer=_init_shard,
+            initargs=(limiters,),
+        ) as pool:
+            futures = {
+                index: pool.submit(
+                    _run_shard,
+                    self.cfg,
+                    index,
+                    self.shards,
+                    self._runner_kwargs,
+                    trade_date,
+                    slot,
+                    shard_symbols,
+                    run_kwargs,
+                )
+                for index, shard_symbols in plan
+            }
+            for index, shard_symbols in plan:
+                try:
+                    results.append(futures[index].result())
+                except Exception as exc:
+                    logger.error("Snapshot shard %s failed: %s", index, exc)
+                    errors.append(
+                        {
+                            "component": "snapshot",
+                            "symbol": "",
+                            "stage": "shard",
+                            "slot": slot.label,
+                            "shard": index,
+                            "symbols": len(shard_symbols),
+                            "error": str(exc),
+                        }
+                    )
+
+        merged = merge_results(ingest_id, slot, results)
+        merged.errors.extend(errors)
+        return merged
+
+
+__all__ = [
+    "SHARD_STRATEGIES",
+    "ShardedSnapshotRunner",
+    "merge_results",
+    "shard_config",
+]
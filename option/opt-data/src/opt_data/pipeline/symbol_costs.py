@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from ..universe import UniverseEntry
+
+logger = logging.getLogger(__name__)
+
+COSTS_FILENAME = "snapshot_symbol_costs.json"
+# Weight of the newest observation in the moving averages
+EWMA_ALPHA = 0.3
+# Expected seconds for a symbol with no history when nothing else is known
+DEFAULT_SYMBOL_SECONDS = 30.0
+# Universe tag marking symbols that are never deferred or shed
+PROTECTED_TAG = "core"
+# Shards merge into one file: wait this long for the save lock, and treat a lock file
+# older than the stale age as left behind by a crashed process
+SAVE_LOCK_TIMEOUT_SECONDS = 10.0
+SAVE_LOCK_STALE_SECONDS = 60.0
+
+
+@dataclass
+class SymbolCostStats:
+    """Persistent per-symbol snapshot cost: moving averages of contracts, fetch seconds
+    and timeout rate, used to order a slot longest-first and to predict when it ends.
+
+    Symbols without history are costed at the median of the known ones. Ordering weighs
+    the expected seconds by ``1 + timeout_rate``: symbols whose requests often time out
+    have heavier-tailed durations and are started earlier; predictions and budgets use
+    the plain averages.
+    """
+
+    path: Path
+    symbols: Dict[str, Dict[str, float]] = field(default_factory=dict)
+    _touched: Set[str] = field(default_factory=set, repr=False)
+
+    @classmethod
+    def load(cls, path: Path) -> "SymbolCostStats":
+        symbols: Dict[str, Dict[str, float]] = {}
+        if path.exists():
+            try:
+                symbols = json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, ValueError) as exc:
+                logger.warning(
+                    "Failed to read snapshot cost stats; starting fresh",
+                    extra={"path": str(path), "error": str(exc)},
+                )
+        return cls(path=path, symbols=symbols)
+
+    def record(self, symbol: str, *, contracts: int, seconds: float, timeouts: int = 0) -> None:
+        timeout_rate = timeouts / contracts if contracts else 0.0
+        stats = self.symbols.get(symbol)
+        if stats is None:
+            stats = {
+                "contracts": float(contracts),
+                "seconds": seconds,
+                "timeout_rate": timeout_rate,
+                "runs": 0,
+            }
+        else:
+            for key, value in (
+                ("contracts", float(contracts)),
+                ("seconds", seconds),
+                ("timeout_rate", timeout_rate),
+            ):
+                stats[key] = (1 - EWMA_ALPHA) * stats.get(key, value) + EWMA_ALPHA * value
+        stats["runs"] = stats.get("runs", 0) + 1
+        self.symbols[symbol] = stats
+        self._touched.add(symbol)
+
+    def _default_seconds(self) -> float:
+        known = sorted(s["seconds"] for s in self.symbols.values() if s.get("seconds"))
+        return known[len(known) // 2] if known else DEFAULT_SYMBOL_SECONDS
+
+    def expected_seconds(self, symbol: str, default: Optional[float] = None) -> float:
+        stats = self.symbols.get(symbol)
+        if stats and stats.get("seconds"):
+            return float(stats["seconds"])
+        return self._default_seconds() if default is None else default
+
+    def timeout_rate(self, symbol: str) -> float:
+        stats = self.symbols.get(symbol)
+        return float(stats.get("timeout_rate", 0.0)) if stats else 0.0
+
+    def predict(self, symbols: Iterable[str]) -> float:
+        default = self._default_seconds()
+        return sum(self.expected_seconds(symbol, default) for symbol in symbols)
+
+    def schedule(
+        self, entries: Sequence[UniverseEntry], budget_seconds: Optional[float] = None
+    ) -> Tuple[List[UniverseEntry], List[str]]:
+        """Order *entries* longest-first; with a budget, defer what is predicted not to fit.
+
+        Deferral drops unprotected symbols from the end of universe order (lowest
+        priority) until the rest fits, and queues them after everything else, cheapest
+        first. Returns the run order and the deferred symbols.
+        """
+        default = self._default_seconds()
+        cost = {e.symbol: self.expected_seconds(e.symbol, default) for e in entries}
+        ordered = sorted(
+            entries, key=lambda e: -cost[e.symbol] * (1.0 + self.timeout_rate(e.symbol))
+        )
+        total = sum(cost.values())
+        if not budget_seconds or total <= budget_seconds:
+            return ordered, []
+
+        deferred: set[str] = set()
+        for entry in reversed(entries):
+            if total <= budget_seconds:
+                break
+            if PROTECTED_TAG in entry.tags:
+                continue
+            deferred.add(entry.symbol)
+            total -= cost[entry.symbol]
+        kept = [e for e in ordered if e.symbol not in deferred]
+        tail = sorted((e for e in ordered if e.symbol in deferred), key=lambda e: cost[e.symbol])
+        return kept + tail, [e.symbol for e in tail]
+
+    def save(self) -> None:
+        """Merge this run's symbols into the file (other shards may have written since).
+
+        Load, merge and replace run under an exclusive lock file so concurrent shards do
+        not drop each other's updates. When the lock cannot be taken the touched symbols
+        are kept for the next save.
+        """
+        if not self._touched:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        lock_path = self.path.with_name(f".{self.path.name}.lock")
+        if not _acquire_lock(lock_path):
+            logger.warning(
+                "Snapshot cost stats are locked; deferring save",
+                extra={"path": str(self.path), "lock": str(lock_path)},
+            )
+            return
+        try:
+            merged = SymbolCostStats.load(self.path).symbols
+            merged.update({symbol: self.symbols[symbol] for symbol in self._touched})
+            tmp = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+            tmp.write_text(json.dumps(merged, sort_keys=True), encoding="utf-8")
+            os.replace(tmp, self.path)
+            self._touched.clear()
+        finally:
+            _release_lock(lock_path)
+
+
+def _acquire_lock(lock_path: Path) -> bool:
+    deadline = time.monotonic() + SAVE_LOCK_TIMEOUT_SECONDS
+    while True:
+        try:
+            fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            try:
+                if time.time() - lock_path.stat().st_mtime > SAVE_LOCK_STALE_SECONDS:
+                    lock_path.unlink()
+                    continue
+            except FileNotFoundError:
+                continue
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(0.05)
+            continue
+        with os.fdopen(fd, "w", encoding="utf-8") as fh:
+            fh.write(f"{os.getpid()},{int(time.time())}\n")
+        return True
+
+
+def _release_lock(lock_path: Path) -> None:
+    try:
+        lock_path.unlink()
+    except OSError:
+        pass
+
+
+__all__ = ["COSTS_FILENAME", "PROTECTED_TAG", "SymbolCostStats"]
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import random
+from dataclasses import dataclass, field
+from datetime import date
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+STATS_FILENAME = "what_to_show_stats.json"
+# Halve counters once a cell reaches this many attempts so old outcomes fade out
+DECAY_ATTEMPTS = 200
+
+
+def moneyness_bucket(strike: float, underlying_close: Optional[float]) -> str:
+    if not underlying_close or underlying_close <= 0:
+        return "unknown"
+    distance = abs(float(strike) / float(underlying_close) - 1.0)
+    if distance <= 0.02:
+        return "atm"
+    if distance <= 0.10:
+        return "near"
+    if distance <= 0.20:
+        return "mid"
+    return "far"
+
+
+def dte_bucket(expiry: Any, trade_date: date) -> str:
+    text = str(expiry or "").replace("-", "")
+    try:
+        exp = date(int(text[0:4]), int(text[4:6]), int(text[6:8]))
+    except (ValueError, IndexError):
+        return "unknown"
+    dte = (exp - trade_date).days
+    if dte <= 7:
+        return "0-7"
+    if dte <= 30:
+        return "8-30"
+    if dte <= 90:
+        return "31-90"
+    return "91+"
+
+
+@dataclass
+class WhatToShowStats:
+    """Persistent success-rate table for historical ``whatToShow`` choices.
+
+    Cells are keyed by (underlying, moneyness bucket, DTE bucket) and hold per-type
+    attempt/success counters. ``order`` ranks candidate types by smoothed success rate,
+    falling back to the configured order with probability ``explore_rate`` so that
+    rarely-chosen types keep getting sampled.
+    """
+
+    path: Path
+    explore_rate: float = 0.1
+    rng: random.Random = field(default_factory=random.Random)
+    cells: Dict[str, Dict[str, Dict[str, int]]] = field(default_factory=dict)
+
+    @classmethod
+    def load(
+        cls, path: Path, *, explore_rate: float = 0.1, rng: Optional[random.Random] = None
+    ) -> "WhatToShowStats":
+        cells: Dict[str, Dict[str, Dict[str, int]]] = {}
+        if path.exists():
+            try:
+                cells = json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, ValueError) as exc:
+                logger.warning(
+                    "Failed to read what_to_show stats; starting fresh",
+                    extra={"path": str(path), "error": str(exc)},
+                )
+        return cls(path=path, explore_rate=explore_rate, rng=rng or random.Random(), cells=cells)
+
+    @staticmethod
+    def key_for(info: Dict[str, Any], underlying_close: Optional[float], trade_date: date) -> str:
+        symbol = str(info.get("symbol") or "").upper()
+        money = moneyness_bucket(float(info.get("strike", 0.0) or 0.0), underlying_close)
+        return f"{symbol}|{money}|{dte_bucket(info.get('expiry'), trade_date)}"
+
+    def success_rate(self, key: str, what_to_show: str) -> float:
+        counts = self.cells.get(key, {}).get(what_to_show)
+        if not counts:
+            return 0.5
+        # Laplace smoothing keeps unseen/rare types from being ruled out after one miss
+        return (counts.get("success", 0) + 1) / (counts.get("attempts", 0) + 2)
+
+    def order(self, key: str, candidates: Sequence[str]) -> List[str]:
+        base = list(candidates)
+        if key not in self.cells or self.rng.random() < self.explore_rate:
+            return base
+        rank = {what: idx for idx, what in enumerate(base)}
+        return sorted(base, key=lambda what: (-self.success_rate(key, what), rank[what]))
+
+    def record(self, key: str, what_to_show: str, success: bool) -> None:
+        counts = self.cells.setdefault(key, {}).setdefault(
+            what_to_show, {"attempts": 0, "success": 0}
+        )
+        counts["attempts"] += 1
+        if success:
+            counts["success"] += 1
+        if counts["attempts"] >= DECAY_ATTEMPTS:
+            counts["attempts"] //= 2
+            counts["success"] //= 2
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(f".{self.path.name}.tmp")
+        tmp.write_text(json.dumps(self.cells, sort_keys=True), encoding="utf-8")
+        os.replace(tmp, self.path)
+
+
+__all__ = ["WhatToShowStats", "moneyness_bucket", "dte_bucket", "STATS_FILENAME"]
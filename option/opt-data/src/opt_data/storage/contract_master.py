@@ -0,0 +1,283 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+MASTER_DIRNAME = "master"
+MASTER_SUFFIX = ".arrow"
+CONTRACT_FIELDS = [
+    "conid",
+    "symbol",
+    "expiry",
+    "right",
+    "strike",
+    "multiplier",
+    "exchange",
+    "tradingClass",
+    "currency",
+]
+# Schema metadata keys; coverage bounds keep interval queries from answering for days
+# that were never discovered (open rows would otherwise match any later date).
+_META_FIRST = b"first_applied"
+_META_LAST = b"last_applied"
+# Comma-separated ISO dates actually applied; days inside the coverage bounds that are
+# missing here (gaps) have no chain. Absent in masters written before it was tracked.
+_META_DAYS = b"applied_days"
+
+
+def _schema() -> Any:
+    import pyarrow as pa  # type: ignore
+
+    return pa.schema(
+        [
+            ("conid", pa.int64()),
+            ("symbol", pa.string()),
+            ("expiry", pa.string()),
+            ("right", pa.string()),
+            ("strike", pa.float64()),
+            ("multiplier", pa.float64()),
+            ("exchange", pa.string()),
+            ("tradingClass", pa.string()),
+            ("currency", pa.string()),
+            ("valid_from", pa.date32()),
+            ("valid_to", pa.date32()),
+        ]
+    )
+
+
+def _sort_key(item: Dict[str, Any]) -> Tuple[Any, ...]:
+    return (item["expiry"], item["strike"], item["right"], item["exchange"])
+
+
+def _normalize(item: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "conid": int(item["conid"]),
+        "symbol": str(item.get("symbol") or ""),
+        "expiry": str(item.get("expiry") or ""),
+        "right": str(item.get("right") or ""),
+        "strike": float(item.get("strike") or 0.0),
+        "multiplier": float(item.get("multiplier") or 100),
+        "exchange": str(item.get("exchange") or ""),
+        "tradingClass": str(item.get("tradingClass") or ""),
+        "currency": str(item.get("currency") or "USD"),
+    }
+
+
+@dataclass
+class _SymbolIndex:
+    mtime_ns: int
+    first: Optional[date]
+    last: Optional[date]
+    table: Any
+    days: Optional[frozenset] = None
+
+
+@dataclass
+class ContractMaster:
+    """Versioned contract master keyed by conid.
+
+    One Arrow IPC file per underlying (``{root}/{SYMBOL}.arrow``) holds a row per contract
+    version with ``valid_from`` (inclusive) and ``valid_to`` (exclusive, null while open).
+    ``apply`` records only the day-over-day delta: new conids open a row, conids missing
+    from the day's chain are closed. ``chain`` answers "which contracts existed on date D"
+    from a memory-mapped table that is reloaded only when the file changes.
+    """
+
+    root: Path
+    _index: Dict[str, _SymbolIndex] = field(default_factory=dict, repr=False)
+
+    def path_for(self, symbol: str) -> Path:
+        return self.root / f"{symbol.upper()}{MASTER_SUFFIX}"
+
+    # ------------------------------------------------------------------ read
+    def _load(self, symbol: str) -> Optional[_SymbolIndex]:
+        import pyarrow as pa  # type: ignore
+
+        path = self.path_for(symbol)
+        try:
+            mtime_ns = path.stat().st_mtime_ns
+        except FileNotFoundError:
+            self._index.pop(symbol.upper(), None)
+            return None
+        cached = self._index.get(symbol.upper())
+        if cached is not None and cached.mtime_ns == mtime_ns:
+            return cached
+
+        source = pa.memory_map(str(path), "r")
+        table = pa.ipc.open_file(source).read_all()
+        meta = table.schema.metadata or {}
+        first = meta.get(_META_FIRST)
+        last = meta.get(_META_LAST)
+        days = meta.get(_META_DAYS)
+        index = _SymbolIndex(
+            mtime_ns=mtime_ns,
+            first=date.fromisoformat(first.decode()) if first else None,
+            last=date.fromisoformat(last.decode()) if last else None,
+            table=table,
+            days=(
+                frozenset(date.fromisoformat(d) for d in days.decode().split(",") if d)
+                if days is not None
+                else None
+            ),
+        )
+        self._index[symbol.upper()] = index
+        return index
+
+    def coverage(self, symbol: str) -> Optional[Tuple[date, date]]:
+        """Return the (first, last) trade dates applied for *symbol*, if any."""
+        index = self._load(symbol)
+        if index is None or index.first is None or index.last is None:
+            return None
+        return index.first, index.last
+
+    def has_day(self, symbol: str, trade_date: date) -> bool:
+        """Whether a chain for *trade_date* was applied (gap days inside coverage are not)."""
+        index = self._load(symbol)
+        if index is None or index.first is None or index.last is None:
+            return False
+        if not index.first <= trade_date <= index.last:
+            return False
+        return index.days is None or trade_date in index.days
+
+    def chain(self, symbol: str, trade_date: date) -> List[Dict[str, Any]]:
+        """Contracts valid on *trade_date*, ordered like the discovery cache.
+
+        Returns an empty list when *trade_date* falls outside the applied coverage or is a
+        gap day inside it (never applied), rather than the previous day's chain.
+        """
+        import pyarrow as pa  # type: ignore
+        import pyarrow.compute as pc  # type: ignore
+
+        index = self._load(symbol)
+        if index is None or index.first is None or index.last is None:
+            return []
+        if not self.has_day(symbol, trade_date):
+            return []
+
+        table = index.table
+        day = pa.scalar(trade_date, type=pa.date32())
+        mask = pc.and_(
+            pc.less_equal(table["valid_from"], day),
+            pc.or_kleene(pc.is_null(table["valid_to"]), pc.greater(table["valid_to"], day)),
+        )
+        rows = table.filter(mask).select(CONTRACT_FIELDS).to_pylist()
+        rows.sort(key=_sort_key)
+        return rows
+
+    # ------------------------------------------------------------------ write
+    def apply(
+        self, symbol: str, trade_date: date, items: Iterable[Dict[str, Any]]
+    ) -> Dict[str, int]:
+        """Record the day's chain for *symbol* as a delta against the open versions.
+
+        Re-applying the latest trade date replaces that day's delta. Dates earlier than
+        the latest applied date are ignored (the master only moves forward).
+        Returns ``{"added": n, "expired": m}``.
+        """
+        import pyarrow as pa  # type: ignore
+
+        sym = symbol.upper()
+        incoming = {}
+        for item in items:
+            if not item.get("conid"):
+                continue
+            norm = _normalize(item)
+            incoming[norm["conid"]] = norm
+
+        index = self._load(sym)
+        rows: List[Dict[str, Any]] = index.table.to_pylist() if index is not None else []
+        first = index.first if index is not None else None
+        last = index.last if index is not None else None
+        days: set = set()
+        if index is not None and index.days is not None:
+            days = set(index.days)
+        elif first is not None and last is not None:
+            # Master predating applied_days: keep answering every day it used to cover
+            days = {first + timedelta(days=i) for i in range((last - first).days + 1)}
+
+        if last is not None and trade_date < last:
+            logger.debug(
+                "Skipping out-of-order contract master update",
+                extra={"symbol": sym, "trade_date": trade_date.isoformat(), "last": str(last)},
+            )
+            return {"added": 0, "expired": 0}
+        if last is not None and trade_date == last:
+            # Undo the previous delta for this day before re-applying it
+            rows = [row for row in rows if row["valid_from"] != trade_date]
+            for row in rows:
+                if row["valid_to"] == trade_date:
+                    row["valid_to"] = None
+
+        open_conids = {row["conid"] for row in rows if row["valid_to"] is None}
+        expired = 0
+        for row in rows:
+            if row["valid_to"] is None and row["conid"] not in incoming:
+                row["valid_to"] = trade_date
+                expired += 1
+        added = [
+            {**item, "valid_from": trade_date, "valid_to": None}
+            for conid, item in incoming.items()
+            if conid not in open_conids
+        ]
+        rows.extend(added)
+
+        metadata = {
+            _META_FIRST: (min(first, trade_date) if first else trade_date).isoformat().encode(),
+            _META_LAST: trade_date.isoformat().encode(),
+            _META_DAYS: ",".join(d.isoformat() for d in sorted(days | {trade_date})).encode(),
+        }
+        table = pa.Table.from_pylist(rows, schema=_schema().with_metadata(metadata))
+        self._write(sym, table)
+        return {"added": len(added), "expired": expired}
+
+    def _write(self, symbol: str, table: Any) -> None:
+        import pyarrow as pa  # type: ignore
+
+        self.root.mkdir(parents=True, exist_ok=True)
+        path = self.path_for(symbol)
+        tmp = path.with_name(f".{path.name}.tmp")
+        # Uncompressed IPC so readers can memory-map the file without a decode pass
+        with pa.OSFile(str(tmp), "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        os.replace(tmp, path)
+        self._index.pop(symbol, None)
+
+    def import_json_caches(self, cache_root: Path, symbol: Optional[str] = None) -> int:
+        """Seed the master from legacy ``{SYMBOL}_{YYYY-MM-DD}.json`` caches in date order."""
+        pending: List[Tuple[date, str, Path]] = []
+        for path in cache_root.glob("*_*.json"):
+            sym, _, day = path.stem.rpartition("_")
+            if not sym or (symbol and sym != symbol.upper()):
+                continue
+            try:
+                pending.append((date.fromisoformat(day), sym, path))
+            except ValueError:
+                continue
+        applied = 0
+        for trade_date, sym, path in sorted(pending):
+            try:
+                items = json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, ValueError) as exc:
+                logger.warning(
+                    "Skipping unreadable contracts cache",
+                    extra={"path": str(path), "error": str(exc)},
+                )
+                continue
+            self.apply(sym, trade_date, items)
+            applied += 1
+        return applied
+
+
+def default_master_root(cache_root: Path) -> Path:
+    return Path(cache_root) / MASTER_DIRNAME
+
+
+__all__ = ["ContractMaster", "CONTRACT_FIELDS", "default_master_root"]
@@ -0,0 +1,282 @@
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import dataclass, field
+from datetime import date
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+import pandas as pd
+
+from .lake import lake_dataset
+
+MANIFEST_NAME = "_manifest.json"
+PART_NAME = "part-000.parquet"
+# Keep row groups small enough that conid/date statistics prune most of a bucket
+HISTORY_ROW_GROUP_SIZE = 16_384
+HISTORY_KEY_COLUMNS = ["conid", "what_to_show", "bar_size", "date"]
+# Pinned Arrow types per column: an all-None bucket (e.g. ``wap`` on zero-volume days)
+# would otherwise be inferred as ``null`` and clash with ``double`` buckets on read.
+HISTORY_COLUMN_TYPES = {
+    "date": "timestamp[ns]",
+    "open": "float64",
+    "high": "float64",
+    "low": "float64",
+    "close": "float64",
+    "volume": "float64",
+    "barCount": "int64",
+    "wap": "float64",
+    "average": "float64",
+    "conid": "int64",
+    "expiry": "string",
+    "right": "string",
+    "strike": "float64",
+    "what_to_show": "string",
+    "bar_size": "string",
+}
+
+
+def expiry_bucket(expiry: Any) -> str:
+    """Return the YYYY-MM bucket for an expiry given as YYYY-MM-DD or YYYYMMDD."""
+    text = str(expiry or "").strip().replace("-", "")
+    if len(text) >= 6 and text[:6].isdigit():
+        return f"{text[0:4]}-{text[4:6]}"
+    return "unknown"
+
+
+def _normalize_dates(values: pd.Series) -> pd.Series:
+    ts = pd.to_datetime(values, errors="coerce", utc=True)
+    return ts.dt.tz_localize(None)
+
+
+def history_schema(schema: Any) -> Any:
+    """Return *schema* with every known history column pinned to its canonical type."""
+    import pyarrow as pa  # type: ignore
+
+    fields = []
+    for fld in schema:
+        type_name = HISTORY_COLUMN_TYPES.get(fld.name)
+        if type_name is not None:
+            fld = fld.with_type(pa.type_for_alias(type_name))
+        fields.append(fld)
+    return pa.schema(fields)
+
+
+def _atomic_write_text(path: Path, text: str) -> None:
+    tmp = path.with_name(f".{path.name}.tmp")
+    tmp.write_text(text, encoding="utf-8")
+    os.replace(tmp, path)
+
+
+@dataclass
+class HistoryStore:
+    """Partitioned parquet store for option history bars.
+
+    Layout: ``{root}/symbol={SYMBOL}/expiry_month={YYYY-MM}/part-000.parquet`` with rows
+    sorted by (conid, date). ``_manifest.json`` records the last covered bar date per
+    conid so incremental runs can plan without listing or reading partitions.
+    """
+
+    root: Path
+    row_group_size: int = HISTORY_ROW_GROUP_SIZE
+    _manifest: Optional[Dict[str, Dict[str, Any]]] = field(default=None, repr=False)
+
+    @property
+    def manifest_path(self) -> Path:
+        return self.root / MANIFEST_NAME
+
+    def partition_dir(self, symbol: str, bucket: str) -> Path:
+        return self.root / f"symbol={symbol.upper()}" / f"expiry_month={bucket}"
+
+    # ------------------------------------------------------------------ manifest
+    def manifest(self) -> Dict[str, Dict[str, Any]]:
+        if self._manifest is None:
+            try:
+                self._manifest = json.loads(self.manifest_path.read_text(encoding="utf-8"))
+            except FileNotFoundError:
+                self._manifest = {}
+            except (OSError, ValueError):
+                self._manifest = {}
+        return self._manifest
+
+    def _save_manifest(self) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        _atomic_write_text(self.manifest_path, json.dumps(self.manifest(), sort_keys=True))
+
+    def last_covered(self, conid: int) -> Optional[date]:
+        entry = self.manifest().get(str(int(conid)))
+        if not entry or not entry.get("last_date"):
+            return None
+        try:
+            return date.fromisoformat(entry["last_date"])
+        except ValueError:
+            return None
+
+    def symbol_last_covered(self, symbol: str) -> Optional[date]:
+        """Earliest last-covered date across the symbol's conids (None when unknown)."""
+        sym = symbol.upper()
+        dates = [
+            entry.get("last_date")
+            for entry in self.manifest().values()
+            if entry.get("symbol") == sym and entry.get("last_date")
+        ]
+        if not dates:
+            return None
+        return date.fromisoformat(min(dates))
+
+    def symbols(self) -> List[str]:
+        return sorted(
+            {entry["symbol"] for entry in self.manifest().values() if entry.get("symbol")}
+        )
+
+    def expiry_buckets(self, symbol: str) -> List[str]:
+        sym = symbol.upper()
+        return sorted(
+            {
+                entry["expiry_month"]
+                for entry in self.manifest().values()
+                if entry.get("symbol") == sym and entry.get("expiry_month")
+            }
+        )
+
+    def conids(self, symbol: str, bucket: Optional[str] = None) -> List[int]:
+        sym = symbol.upper()
+        return sorted(
+            int(conid)
+            for conid, entry in self.manifest().items()
+            if entry.get("symbol") == sym
+            and (bucket is None or entry.get("expiry_month") == bucket)
+        )
+
+    def version(self, symbol: str, buckets: Optional[Sequence[str]] = None) -> tuple:
+        """Cache token for a symbol's partitions; changes whenever a bucket is rewritten."""
+        symbol_root = self.root / f"symbol={symbol.upper()}"
+        if buckets:
+            paths = [self.partition_dir(symbol, bucket) / PART_NAME for bucket in buckets]
+        else:
+            paths = sorted(symbol_root.glob(f"expiry_month=*/{PART_NAME}"))
+        token = []
+        for path in paths:
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            token.append((path.parent.name, stat.st_mtime_ns, stat.st_size))
+        return tuple(token)
+
+    # ------------------------------------------------------------------ write
+    def write_bars(self, symbol: str, df: pd.DataFrame) -> int:
+        """Merge *df* into the symbol's expiry buckets and update the manifest.
+
+        Expects at least ``conid``, ``expiry`` and ``date`` columns. Returns rows written.
+        """
+        if df is None or df.empty:
+            return 0
+
+        import pyarrow as pa  # type: ignore
+        import pyarrow.parquet as pq  # type: ignore
+
+        sym = symbol.upper()
+        frame = df.drop(columns=["symbol"], errors="ignore").copy()
+        frame["conid"] = frame["conid"].astype("int64")
+        frame["date"] = _normalize_dates(frame["date"])
+        for col in ("what_to_show", "bar_size"):
+            if col not in frame.columns:
+                frame[col] = ""
+        frame["_bucket"] = frame["expiry"].map(expiry_bucket)
+
+        manifest = self.manifest()
+        written = 0
+        for bucket, group in frame.groupby("_bucket", sort=True):
+            group = group.drop(columns=["_bucket"])
+            part_dir = self.partition_dir(sym, str(bucket))
+            part_dir.mkdir(parents=True, exist_ok=True)
+            file_path = part_dir / PART_NAME
+
+            if file_path.exists():
+                # ParquetFile avoids hive partition inference from the bucket path
+                existing = pq.ParquetFile(file_path).read().to_pandas()
+                group = pd.concat([existing, group], ignore_index=True)
+            group = group.drop_duplicates(subset=HISTORY_KEY_COLUMNS, keep="last")
+            group = group.sort_values(["conid", "date"], kind="mergesort").reset_index(drop=True)
+
+            table = pa.Table.from_pandas(group, preserve_index=False)
+            table = table.cast(history_schema(table.schema))
+            tmp_path = part_dir / f".{PART_NAME}.tmp"
+            pq.write_table(
+                table,
+                tmp_path,
+                compression="zstd",
+                row_group_size=self.row_group_size,
+                write_statistics=True,
+            )
+            os.replace(tmp_path, file_path)
+            written += len(group)
+
+            last_dates = group.groupby("conid")["date"].max()
+            for conid, last_ts in last_dates.items():
+                if pd.isna(last_ts):
+                    continue
+                key = str(int(conid))
+                last_iso = last_ts.date().isoformat()
+                prev = manifest.get(key, {}).get("last_date")
+                manifest[key] = {
+                    "symbol": sym,
+                    "expiry_month": str(bucket),
+                    "last_date": max(prev, last_iso) if prev else last_iso,
+                }
+
+        self._save_manifest()
+        return written
+
+    # ------------------------------------------------------------------ read
+    def read(
+        self,
+        symbol: str,
+        *,
+        buckets: Optional[Sequence[str]] = None,
+        conids: Optional[Iterable[int]] = None,
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+        columns: Optional[List[str]] = None,
+    ) -> pd.DataFrame:
+        """Read history bars with partition pruning and row-group predicate pushdown."""
+        import pyarrow.dataset as ds  # type: ignore
+
+        sym = symbol.upper()
+        dataset = lake_dataset(self.root / f"symbol={sym}")
+        if dataset is None:
+            return pd.DataFrame()
+        # Buckets written before the schema was pinned may still carry ``null`` columns
+        schema = history_schema(dataset.schema)
+        if not schema.equals(dataset.schema):
+            dataset = dataset.replace_schema(schema)
+
+        expr = None
+
+        def _and(clause: Any) -> None:
+            nonlocal expr
+            expr = clause if expr is None else expr & clause
+
+        if buckets:
+            _and(ds.field("expiry_month").isin(list(buckets)))
+        if conids is not None:
+            _and(ds.field("conid").isin([int(c) for c in conids]))
+        if start is not None:
+            _and(ds.field("date") >= pd.Timestamp(start))
+        if end is not None:
+            _and(ds.field("date") < pd.Timestamp(end) + pd.Timedelta(days=1))
+
+        cols = None
+        if columns:
+            available = set(dataset.schema.names)
+            cols = [c for c in columns if c in available]
+        table = dataset.to_table(columns=cols, filter=expr)
+        df = table.to_pandas()
+        if not df.empty:
+            df.insert(0, "symbol", sym)
+        return df
+
+
+__all__ = ["HistoryStore", "expiry_bucket", "history_schema", "MANIFEST_NAME"]
@@ -0,0 +1,259 @@
+"""
+Shared reader for the hive-partitioned lake (``view=/date=/underlying=/exchange=``).
+
+Directory listings are cached per directory and reused while the directory's mtime is
+unchanged, so repeated scans stat directories instead of listing them. Datasets built
+from those listings are cached by (files, directory-mtime fingerprint). Dashboards, QA,
+MCP tools, the history store and offline scripts go through this module instead of
+calling ``ds.dataset``/``rglob`` on every request. Only Parquet files are listed; text
+scans such as ``util/logscanner`` over ``run_logs`` walk the filesystem themselves.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+# Directories modified this recently are not cached: on filesystems with coarse mtime
+# resolution a file created in the same tick would otherwise go unnoticed.
+_RACY_SECONDS = 2.0
+DATASET_CACHE_ENTRIES = 64
+
+
+@dataclass(frozen=True)
+class _Listing:
+    mtime_ns: int
+    dirs: Tuple[str, ...]
+    files: Tuple[str, ...]
+
+
+_LISTINGS: Dict[str, _Listing] = {}
+_DATASETS: "OrderedDict[tuple, Any]" = OrderedDict()
+_LOCK = threading.Lock()
+
+
+def _visible(name: str) -> bool:
+    # Same convention as pyarrow: skip hidden/temporary files and sidecars
+    return not name.startswith((".", "_"))
+
+
+def _listing(path: Path) -> Optional[_Listing]:
+    key = str(path)
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except OSError:
+        with _LOCK:
+            _LISTINGS.pop(key, None)
+        return None
+    with _LOCK:
+        cached = _LISTINGS.get(key)
+    if cached is not None and cached.mtime_ns == mtime_ns:
+        return cached
+
+    dirs: List[str] = []
+    files: List[str] = []
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if not _visible(entry.name):
+                    continue
+                if entry.is_dir():
+                    dirs.append(entry.name)
+                elif entry.name.endswith(".parquet"):
+                    files.append(entry.name)
+    except OSError:
+        return None
+    listing = _Listing(mtime_ns, tuple(sorted(dirs)), tuple(sorted(files)))
+    if time.time() - mtime_ns / 1e9 > _RACY_SECONDS:
+        with _LOCK:
+            _LISTINGS[key] = listing
+    return listing
+
+
+def _walk(path: Path, files: List[Path], fingerprint: List[Tuple[str, int]]) -> None:
+    listing = _listing(path)
+    if listing is None:
+        return
+    fingerprint.append((str(path), listing.mtime_ns))
+    files.extend(path / name for name in listing.files)
+    for name in listing.dirs:
+        _walk(path / name, files, fingerprint)
+
+
+def list_parquet_files(path: Path) -> List[Path]:
+    """All visible ``*.parquet`` files below *path*, sorted, using cached listings."""
+    files: List[Path] = []
+    _walk(Path(path), files, [])
+    return sorted(files)
+
+
+def list_partitions(path: Path, key: str) -> List[str]:
+    """Values of ``key=`` subdirectories directly below *path* (e.g. dates of a view)."""
+    listing = _listing(Path(path))
+    if listing is None:
+        return []
+    prefix = f"{key}="
+    return [name[len(prefix) :] for name in listing.dirs if name.startswith(prefix)]
+
+
+def _dataset(files: Sequence[Path], base_dir: Path, fingerprint: tuple) -> Any:
+    import pyarrow.dataset as ds  # type: ignore
+
+    key = (str(base_dir), tuple(str(f) for f in files), fingerprint)
+    with _LOCK:
+        dataset = _DATASETS.get(key)
+        if dataset is not None:
+            _DATASETS.move_to_end(key)
+            return dataset
+    dataset = ds.dataset(
+        [str(f) for f in files],
+        format="parquet",
+        partitioning="hive",
+        partition_base_dir=str(base_dir),
+    )
+    with _LOCK:
+        _DATASETS[key] = dataset
+        while len(_DATASETS) > DATASET_CACHE_ENTRIES:
+            _DATASETS.popitem(last=False)
+    return dataset
+
+
+def lake_dataset(path: Path) -> Optional[Any]:
+    """Hive-partitioned dataset rooted at *path*, or None when it has no Parquet files."""
+    path = Path(path)
+    files: List[Path] = []
+    fingerprint: List[Tuple[str, int]] = []
+    _walk(path, files, fingerprint)
+    if not files:
+        return None
+    return _dataset(sorted(files), path, tuple(fingerprint))
+
+
+def clear_lake_cache() -> None:
+    with _LOCK:
+        _LISTINGS.clear()
+        _DATASETS.clear()
+
+
+@dataclass
+class LakeReader:
+    """Typed access to one lake root (``paths.raw`` or ``paths.clean``)."""
+
+    root: Path
+
+    def view_root(self, view: str) -> Path:
+        return Path(self.root) / f"view={view}"
+
+    def dates(self, view: str) -> List[str]:
+        return sorted(list_partitions(self.view_root(view), "date"))
+
+    def partition_dirs(
+        self,
+        view: str,
+        dates: Optional[Iterable[str]] = None,
+        underlyings: Optional[Iterable[str]] = None,
+    ) -> List[Path]:
+        """``date=*/underlying=*`` directories matching the filters, without listing others."""
+        view_root = self.view_root(view)
+        wanted = {u.upper() for u in underlyings} if underlyings else None
+        days = list(dates) if dates is not None else self.dates(view)
+        dirs: List[Path] = []
+        for day in days:
+            day_root = view_root / f"date={day}"
+            if wanted is not None:
+                dirs.extend(day_root / f"underlying={sym}" for sym in sorted(wanted))
+            else:
+                dirs.extend(
+                    day_root / f"underlying={sym}"
+                    for sym in sorted(list_partitions(day_root, "underlying"))
+                )
+        return dirs
+
+    def _collect(
+        self,
+        view: str,
+        dates: Optional[Iterable[str]],
+        underlyings: Optional[Iterable[str]],
+    ) -> Tuple[List[Path], tuple]:
+        from .manifest import partition_manifest
+
+        manifest = partition_manifest(self.view_root(view))
+        if manifest.initialized:
+            # Committed files only: no directory listing and no half-written parts
+            return manifest.files(dates, underlyings), ("manifest", manifest.version)
+
+        files: List[Path] = []
+        fingerprint: List[Tuple[str, int]] = []
+        for part_dir in self.partition_dirs(view, dates, underlyings):
+            _walk(part_dir, files, fingerprint)
+        return files, tuple(fingerprint)
+
+    def files(
+        self,
+        view: str,
+        dates: Optional[Iterable[str]] = None,
+        underlyings: Optional[Iterable[str]] = None,
+    ) -> List[Path]:
+        files, _ = self._collect(view, dates, underlyings)
+        return files
+
+    def dataset(
+        self,
+        view: str,
+        dates: Optional[Iterable[str]] = None,
+        underlyings: Optional[Iterable[str]] = None,
+    ) -> Optional[Any]:
+        files, fingerprint = self._collect(view, dates, underlyings)
+        if not files:
+            return None
+        return _dataset(files, self.view_root(view), fingerprint)
+
+    def scan(
+        self,
+        view: str,
+        dates: Optional[Iterable[str]] = None,
+        underlyings: Optional[Iterable[str]] = None,
+        columns: Optional[List[str]] = None,
+        filter: Any = None,
+        limit: Optional[int] = None,
+    ) -> Any:
+        """Read matching partitions into an Arrow table (empty table when nothing matches)."""
+        import pyarrow as pa  # type: ignore
+
+        dataset = self.dataset(view, dates, underlyings)
+        if dataset is None:
+            return pa.table({})
+        cols = None
+        if columns is not None:
+            available = set(dataset.schema.names)
+            cols = [c for c in columns if c in available]
+        scanner = dataset.scanner(columns=cols, filter=filter, use_threads=True)
+        return scanner.head(limit) if limit is not None else scanner.to_table()
+
+
+_READERS: Dict[Path, LakeReader] = {}
+
+
+def lake_reader(root: Path) -> LakeReader:
+    """Return the process-wide ``LakeReader`` for a lake root."""
+    key = Path(root).resolve()
+    with _LOCK:
+        reader = _READERS.get(key)
+        if reader is None:
+            reader = _READERS[key] = LakeReader(key)
+        return reader
+
+
+__all__ = [
+    "LakeReader",
+    "clear_lake_cache",
+    "lake_dataset",
+    "lake_reader",
+    "list_parquet_files",
+    "list_partitions",
+]
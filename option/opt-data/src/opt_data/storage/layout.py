@@ -3,8 +3,9 @@ from __future__ import annotations
 from dataclasses import dataclass
 from datetime import date, datetime, timedelta
 from pathlib import Path
+from typing import Any
 
-from ..config import AppConfig
+from ..config import AppConfig, WriteLayoutConfig
 
 
 @dataclass
@@ -38,3 +39,88 @@ def codec_for_date(cfg: AppConfig, trade_date: date, today: date | None = None)
     if cfg.storage.cold_codec.lower() == "zstd":
         return "zstd", {"compression_level": cfg.storage.cold_codec_level}
     return cfg.storage.cold_codec, {}
+
+
+# Readers filter chains by expiry/right/strike (and conid); sorting on those keys keeps
+# row-group min/max statistics tight so scans with such predicates skip most groups.
+_CHAIN_DICTIONARY = [
+    "underlying",
+    "symbol",
+    "exchange",
+    "tradingClass",
+    "currency",
+    "right",
+    "expiry",
+]
+_CHAIN_STATISTICS = ["conid", "expiry", "right", "strike", "underlying", "trade_date"]
+DEFAULT_ROW_GROUP_SIZE = 32_768
+DEFAULT_WRITE_LAYOUTS: dict[str, WriteLayoutConfig] = {
+    "intraday": WriteLayoutConfig(
+        sort_keys=["expiry", "right", "strike", "sample_time"],
+        row_group_size=DEFAULT_ROW_GROUP_SIZE,
+        dictionary_columns=[*_CHAIN_DICTIONARY, "ingest_run_type", "source"],
+        statistics_columns=[*_CHAIN_STATISTICS, "sample_time", "slot_30m"],
+    ),
+    # Streaming option ticks (``kind=options``) are read like the intraday view
+    "options": WriteLayoutConfig(
+        sort_keys=["expiry", "right", "strike", "sample_time"],
+        row_group_size=DEFAULT_ROW_GROUP_SIZE,
+        dictionary_columns=_CHAIN_DICTIONARY,
+        statistics_columns=[*_CHAIN_STATISTICS, "sample_time"],
+    ),
+    "close": WriteLayoutConfig(
+        sort_keys=["expiry", "right", "strike"],
+        row_group_size=DEFAULT_ROW_GROUP_SIZE,
+        dictionary_columns=[*_CHAIN_DICTIONARY, "ingest_run_type", "source"],
+        statistics_columns=[*_CHAIN_STATISTICS, "sample_time"],
+    ),
+    **{
+        view: WriteLayoutConfig(
+            sort_keys=["expiry", "right", "strike"],
+            row_group_size=DEFAULT_ROW_GROUP_SIZE,
+            dictionary_columns=[*_CHAIN_DICTIONARY, "rollup_strategy", "ingest_run_type"],
+            statistics_columns=_CHAIN_STATISTICS,
+        )
+        for view in ("daily_clean", "daily_adjusted", "enrichment")
+    },
+}
+
+
+def write_layout_for(cfg: AppConfig, name: str) -> WriteLayoutConfig | None:
+    """Layout for a view/kind name: ``[storage.layout.<name>]`` first, then the defaults."""
+    storage = getattr(cfg, "storage", None)
+    configured = getattr(storage, "layouts", None) or {}
+    return configured.get(name) or DEFAULT_WRITE_LAYOUTS.get(name)
+
+
+def apply_write_layout(table: Any, layout: WriteLayoutConfig | None) -> tuple[Any, dict]:
+    """Sort *table* for the layout and return ``pq.write_table`` keyword arguments."""
+    if layout is None:
+        return table, {}
+    import pyarrow.parquet as pq  # type: ignore
+
+    names = set(table.column_names)
+    options: dict[str, Any] = {}
+    import pyarrow as pa  # type: ignore
+
+    sort_keys = [
+        key
+        for key in layout.sort_keys
+        if key in names and not pa.types.is_nested(table.schema.field(key).type)
+    ]
+    if sort_keys and table.num_rows > 1:
+        table = table.sort_by([(key, "ascending") for key in sort_keys])
+        options["sorting_columns"] = [
+            pq.SortingColumn(table.schema.get_field_index(key)) for key in sort_keys
+        ]
+    if layout.row_group_size > 0:
+        options["row_group_size"] = layout.row_group_size
+    dictionary = [col for col in layout.dictionary_columns if col in names]
+    if dictionary:
+        options["use_dictionary"] = dictionary
+    statistics = [col for col in layout.statistics_columns if col in names]
+    if statistics:
+        options["write_statistics"] = statistics
+    if layout.page_index:
+        options["write_page_index"] = True
+    return table, options
@@ -0,0 +1,312 @@
+"""
+Append-only partition manifest per view (``{view_root}/_manifest.jsonl``).
+
+Writers commit a file by writing it to a temporary name, renaming it into place and
+then appending one JSON line describing it (path, rows, ``sample_time`` range, schema
+hash, ingest_id). Readers and planners answer "what exists for this date/underlying"
+from the folded log instead of listing directories, and only ever see fully written
+files. A log only becomes authoritative once it holds an ``init`` entry: written when a
+view starts out empty, or by ``rebuild()`` for views that predate the manifest.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from .lake import list_parquet_files, list_partitions
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILENAME = "_manifest.jsonl"
+
+
+def schema_hash(schema: Any) -> str:
+    """Short stable hash of an Arrow schema (field names and types, no metadata)."""
+    text = schema.to_string(show_field_metadata=False, show_schema_metadata=False)
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()[:16]
+
+
+def describe_table(table: Any) -> Dict[str, Any]:
+    """Manifest fields derived from the table being committed."""
+    import pyarrow.compute as pc  # type: ignore
+
+    info: Dict[str, Any] = {
+        "rows": table.num_rows,
+        "schema_hash": schema_hash(table.schema),
+        "min_sample_time": None,
+        "max_sample_time": None,
+        "ingest_id": None,
+    }
+    names = table.column_names
+    if "sample_time" in names and table.num_rows:
+        try:
+            bounds = pc.min_max(table["sample_time"]).as_py()
+            info["min_sample_time"] = _iso(bounds["min"])
+            info["max_sample_time"] = _iso(bounds["max"])
+        except Exception:
+            pass
+    if "ingest_id" in names and table.num_rows:
+        ids = [v for v in pc.unique(table["ingest_id"]).to_pylist() if v is not None]
+        if ids:
+            info["ingest_id"] = ids[0] if len(ids) == 1 else sorted(map(str, ids))
+    return info
+
+
+def _iso(value: Any) -> Optional[str]:
+    if value is None:
+        return None
+    return value.isoformat() if hasattr(value, "isoformat") else str(value)
+
+
+def _partition_keys(rel_path: str) -> Dict[str, str]:
+    keys: Dict[str, str] = {}
+    for part in rel_path.split("/")[:-1]:
+        if "=" in part:
+            key, value = part.split("=", 1)
+            keys[key] = value
+    return keys
+
+
+def write_table_atomic(table: Any, file_path: Path, **options: Any) -> None:
+    """Write a Parquet file under a temporary name and rename it into place."""
+    import pyarrow.parquet as pq  # type: ignore
+
+    tmp = file_path.with_name(f".{file_path.name}.tmp")
+    pq.write_table(table, tmp, **options)
+    os.replace(tmp, file_path)
+
+
+class PartitionManifest:
+    """Folded view of a view root's manifest log, refreshed incrementally from its tail."""
+
+    def __init__(self, view_root: Path):
+        self.view_root = Path(view_root)
+        self.path = self.view_root / MANIFEST_FILENAME
+        self._lock = threading.Lock()
+        self._inode: Optional[int] = None
+        self._offset = 0
+        self._initialized = False
+        self._files: Dict[str, Dict[str, Any]] = {}
+        # date -> {(underlying, exchange): {rel paths}}
+        self._by_date: Dict[str, Dict[Tuple[str, str], Set[str]]] = {}
+
+    # ------------------------------------------------------------------ read
+    def _reset(self) -> None:
+        self._offset = 0
+        self._initialized = False
+        self._files = {}
+        self._by_date = {}
+
+    def _apply(self, entry: Dict[str, Any]) -> None:
+        op = entry.get("op")
+        if op == "init":
+            self._initialized = True
+            return
+        rel = entry.get("path")
+        if not rel:
+            return
+        keys = _partition_keys(rel)
+        slot = (keys.get("underlying", ""), keys.get("exchange", ""))
+        day = keys.get("date", "")
+        if op == "add":
+            self._files[rel] = entry
+            self._by_date.setdefault(day, {}).setdefault(slot, set()).add(rel)
+        elif op == "remove":
+            self._files.pop(rel, None)
+            paths = self._by_date.get(day, {}).get(slot)
+            if paths is not None:
+                paths.discard(rel)
+                if not paths:
+                    del self._by_date[day][slot]
+                if not self._by_date[day]:
+                    del self._by_date[day]
+
+    def refresh(self) -> None:
+        """Apply entries appended since the last read (full reload after compaction)."""
+        with self._lock:
+            try:
+                stat = self.path.stat()
+            except FileNotFoundError:
+                self._inode = None
+                self._reset()
+                return
+            if stat.st_ino != self._inode or stat.st_size < self._offset:
+                self._inode = stat.st_ino
+                self._reset()
+            if stat.st_size == self._offset:
+                return
+            with self.path.open("rb") as fh:
+                fh.seek(self._offset)
+                chunk = fh.read(stat.st_size - self._offset)
+            # Leave a partially appended last line for the next refresh
+            end = chunk.rfind(b"\n") + 1
+            for line in chunk[:end].splitlines():
+                if not line.strip():
+                    continue
+                try:
+                    self._apply(json.loads(line))
+                except ValueError:
+                    logger.warning(f"Skipping corrupt manifest line in {self.path}")
+            self._offset += end
+
+    @property
+    def version(self) -> Tuple[Optional[int], int]:
+        """Changes whenever entries are appended or the log is rewritten."""
+        self.refresh()
+        return self._inode, self._offset
+
+    @property
+    def initialized(self) -> bool:
+        self.refresh()
+        return self._initialized
+
+    def entries(self) -> List[Dict[str, Any]]:
+        self.refresh()
+        return [self._files[rel] for rel in sorted(self._files)]
+
+    def has(
+        self, trade_date: Any, underlying: Optional[str] = None, exchange: Optional[str] = None
+    ) -> bool:
+        """O(1) existence check for a date (optionally an underlying/exchange within it)."""
+        self.refresh()
+        return self._has(_iso(trade_date) or "", underlying, exchange)
+
+    def _has(self, day: str, underlying: Optional[str], exchange: Optional[str]) -> bool:
+        slots = self._by_date.get(day)
+        if not slots:
+            return False
+        if underlying is None and exchange is None:
+            return True
+        return any(
+            (underlying is None or und == underlying.upper())
+            and (exchange is None or exch == exchange.upper())
+            for und, exch in slots
+        )
+
+    def dates(self, underlying: Optional[str] = None, exchange: Optional[str] = None) -> List[str]:
+        self.refresh()
+        return sorted(day for day in list(self._by_date) if self._has(day, underlying, exchange))
+
+    def files(
+        self,
+        dates: Optional[Iterable[Any]] = None,
+        underlyings: Optional[Iterable[str]] = None,
+    ) -> List[Path]:
+        """Committed files for the dates/underlyings, in ``dates`` order then path order."""
+        self.refresh()
+        wanted = {u.upper() for u in underlyings} if underlyings else None
+        days = [_iso(d) or "" for d in dates] if dates is not None else sorted(self._by_date)
+        result: List[Path] = []
+        for day in days:
+            rels = [
+                rel
+                for (und, _), paths in self._by_date.get(day, {}).items()
+                if wanted is None or und in wanted
+                for rel in paths
+            ]
+            result.extend(self.view_root / rel for rel in sorted(rels))
+        return result
+
+    # ------------------------------------------------------------------ write
+    def _append(self, entries: Iterable[Dict[str, Any]]) -> None:
+        self.view_root.mkdir(parents=True, exist_ok=True)
+        data = "".join(json.dumps(e, sort_keys=True, default=str) + "\n" for e in entries)
+        # O_APPEND keeps concurrent single-write appends from interleaving
+        fd = os.open(self.path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        try:
+            os.write(fd, data.encode("utf-8"))
+        finally:
+            os.close(fd)
+
+    def ensure_initialized(self) -> bool:
+        """Start an authoritative log for a view that has no data yet."""
+        if self.path.exists():
+            return self.initialized
+        if list_partitions(self.view_root, "date"):
+            return False
+        self._append([{"op": "init", "committed_at": _now()}])
+        return True
+
+    def commit(self, file_path: Path, table: Any) -> Dict[str, Any]:
+        """Record a file that has been renamed into place under the view root."""
+        rel = Path(file_path).resolve().relative_to(self.view_root.resolve()).as_posix()
+        entry = {"op": "add", "path": rel, "committed_at": _now(), **describe_table(table)}
+        self._append([entry])
+        return entry
+
+    def remove(self, file_path: Path) -> None:
+        rel = Path(file_path).resolve().relative_to(self.view_root.resolve()).as_posix()
+        self._append([{"op": "remove", "path": rel, "committed_at": _now()}])
+
+    def _rewrite(self, entries: List[Dict[str, Any]]) -> None:
+        self.view_root.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(f".{self.path.name}.tmp")
+        with tmp.open("w", encoding="utf-8") as fh:
+            fh.write(json.dumps({"op": "init", "committed_at": _now()}) + "\n")
+            for entry in entries:
+                fh.write(json.dumps(entry, sort_keys=True, default=str) + "\n")
+        os.replace(tmp, self.path)
+
+    def compact(self) -> int:
+        """Rewrite the log with one entry per live file."""
+        entries = self.entries()
+        self._rewrite(entries)
+        return len(entries)
+
+    def rebuild(self) -> int:
+        """Re-derive the log from the files on disk (one-off for pre-manifest views)."""
+        import pyarrow.parquet as pq  # type: ignore
+
+        entries: List[Dict[str, Any]] = []
+        for file_path in list_parquet_files(self.view_root):
+            try:
+                parquet = pq.ParquetFile(file_path)
+                present = set(parquet.schema_arrow.names)
+                table = parquet.read(
+                    columns=[c for c in ("sample_time", "ingest_id") if c in present]
+                )
+            except Exception as exc:
+                logger.warning(f"Skipping unreadable partition {file_path}: {exc}")
+                continue
+            info = describe_table(table)
+            info["rows"] = parquet.metadata.num_rows
+            info["schema_hash"] = schema_hash(parquet.schema_arrow)
+            rel = file_path.relative_to(self.view_root).as_posix()
+            entries.append({"op": "add", "path": rel, "committed_at": _now(), **info})
+        self._rewrite(entries)
+        return len(entries)
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+_MANIFESTS: Dict[Path, PartitionManifest] = {}
+_MANIFESTS_LOCK = threading.Lock()
+
+
+def partition_manifest(view_root: Path) -> PartitionManifest:
+    """Return the process-wide manifest for a view root."""
+    key = Path(view_root).resolve()
+    with _MANIFESTS_LOCK:
+        manifest = _MANIFESTS.get(key)
+        if manifest is None:
+            manifest = _MANIFESTS[key] = PartitionManifest(key)
+        return manifest
+
+
+__all__ = [
+    "MANIFEST_FILENAME",
+    "PartitionManifest",
+    "describe_table",
+    "partition_manifest",
+    "schema_hash",
+    "write_table_atomic",
+]
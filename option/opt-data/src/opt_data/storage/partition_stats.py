@@ -0,0 +1,210 @@
+"""
+Per-partition ``_stats.json`` sidecars written alongside Parquet files.
+
+Writers record the counters status panels and QA need (rows, underlyings, error and
+market data type counts, rollup strategies, OI coverage, slots) at write time, so
+readers aggregate a handful of small JSON files instead of scanning the data.
+A sidecar lists the files it describes; readers treat it as stale when the Parquet
+files in the directory no longer match or are newer than the sidecar.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+import pandas as pd
+
+from ..util.flags import normalize_flags
+from .lake import list_parquet_files
+
+logger = logging.getLogger(__name__)
+
+STATS_FILENAME = "_stats.json"
+STATS_VERSION = 1
+
+
+def _value_counts(series: pd.Series) -> Dict[str, int]:
+    counts = series.dropna().astype(str).value_counts()
+    return {str(key): int(cnt) for key, cnt in counts.items()}
+
+
+def compute_stats(df: pd.DataFrame) -> Dict[str, Any]:
+    """Summarize one written file's rows."""
+    rows = len(df)
+    stats: Dict[str, Any] = {
+        "rows": rows,
+        "underlyings": [],
+        "error_count": 0,
+        "market_data_type_counts": {},
+        "rollup_strategy_counts": {},
+        "data_quality_present": False,
+        "oi_positive": 0,
+        "delayed_rows": 0,
+        "fallback_rows": 0,
+        "enriched_rows": 0,
+        "missing_oi_rows": 0,
+        "slots_by_underlying": {},
+    }
+    if rows == 0:
+        return stats
+
+    if "underlying" in df.columns:
+        stats["underlyings"] = sorted({str(v).upper() for v in df["underlying"].dropna()})
+    if "snapshot_error" in df.columns:
+        stats["error_count"] = int(df["snapshot_error"].fillna(False).astype(bool).sum())
+
+    flags = (
+        df["data_quality_flag"].apply(normalize_flags)
+        if "data_quality_flag" in df.columns
+        else pd.Series([[]] * rows, index=df.index)
+    )
+    stats["data_quality_present"] = "data_quality_flag" in df.columns
+
+    delayed = flags.apply(lambda flg: "delayed_fallback" in flg)
+    if "market_data_type" in df.columns:
+        mdt = pd.to_numeric(df["market_data_type"], errors="coerce")
+        stats["market_data_type_counts"] = _value_counts(mdt.astype("Int64"))
+        delayed |= mdt.fillna(1) != 1
+    stats["delayed_rows"] = int(delayed.sum())
+
+    if "rollup_strategy" in df.columns:
+        strategies = df["rollup_strategy"]
+        stats["rollup_strategy_counts"] = _value_counts(strategies)
+        stats["fallback_rows"] = int((strategies.astype(str).str.lower() != "close").sum())
+
+    if "open_interest" in df.columns:
+        oi = pd.to_numeric(df["open_interest"], errors="coerce")
+        missing = flags.apply(lambda flg: "missing_oi" in flg)
+        stats["oi_positive"] = int((oi > 0).sum())
+        stats["enriched_rows"] = int((oi.notna() & ~missing).sum())
+        stats["missing_oi_rows"] = int(missing.sum())
+
+    if "slot_30m" in df.columns and "underlying" in df.columns:
+        slots = pd.to_numeric(df["slot_30m"], errors="coerce")
+        frame = pd.DataFrame(
+            {"underlying": df["underlying"].astype(str).str.upper(), "slot": slots}
+        )
+        for symbol, group in frame.dropna().groupby("underlying"):
+            stats["slots_by_underlying"][symbol] = sorted({int(s) for s in group["slot"]})
+    return stats
+
+
+def merge_stats(items: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """Combine file- or partition-level stats into one summary."""
+    merged = compute_stats(pd.DataFrame())
+    underlyings: set[str] = set()
+    slots: Dict[str, set[int]] = {}
+    for item in items:
+        for key in (
+            "rows",
+            "error_count",
+            "oi_positive",
+            "delayed_rows",
+            "fallback_rows",
+            "enriched_rows",
+            "missing_oi_rows",
+        ):
+            merged[key] += int(item.get(key, 0))
+        for key in ("market_data_type_counts", "rollup_strategy_counts"):
+            for value, count in item.get(key, {}).items():
+                merged[key][value] = merged[key].get(value, 0) + int(count)
+        merged["data_quality_present"] |= bool(item.get("data_quality_present"))
+        underlyings.update(item.get("underlyings", []))
+        for symbol, values in item.get("slots_by_underlying", {}).items():
+            slots.setdefault(symbol, set()).update(values)
+    merged["underlyings"] = sorted(underlyings)
+    merged["slots_by_underlying"] = {sym: sorted(vals) for sym, vals in sorted(slots.items())}
+    return merged
+
+
+def write_partition_stats(
+    part_dir: Path, file_name: str, df: pd.DataFrame, *, replace: bool = True
+) -> Path:
+    """Record stats for ``file_name`` in ``part_dir/_stats.json``.
+
+    ``replace=True`` drops entries for other files (single-file writers); streaming
+    writers pass ``replace=False`` to append to the existing sidecar.
+    """
+    path = Path(part_dir) / STATS_FILENAME
+    files: Dict[str, Dict[str, Any]] = {}
+    if not replace and path.exists():
+        try:
+            files = json.loads(path.read_text(encoding="utf-8")).get("files", {})
+        except (OSError, ValueError) as exc:
+            logger.warning(f"Discarding unreadable partition stats {path}: {exc}")
+    files[file_name] = compute_stats(df)
+    payload = {"version": STATS_VERSION, "files": files, "totals": merge_stats(files.values())}
+    tmp = path.with_name(f".{path.name}.tmp")
+    tmp.write_text(json.dumps(payload, sort_keys=True), encoding="utf-8")
+    os.replace(tmp, path)
+    return path
+
+
+def read_partition_stats(part_dir: Path) -> Optional[Dict[str, Any]]:
+    """Totals for one partition directory, or None when the sidecar is missing or stale."""
+    part_dir = Path(part_dir)
+    path = part_dir / STATS_FILENAME
+    try:
+        sidecar_mtime = path.stat().st_mtime_ns
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if payload.get("version") != STATS_VERSION:
+        return None
+    parquet = list_parquet_files(part_dir)
+    if {p.name for p in parquet} != set(payload.get("files", {})):
+        return None
+    if any(p.stat().st_mtime_ns > sidecar_mtime for p in parquet):
+        return None
+    return payload.get("totals")
+
+
+def aggregate_stats(
+    root: Path, underlyings: Optional[Iterable[str]] = None
+) -> Optional[Dict[str, Any]]:
+    """Merge sidecars below ``root`` (e.g. a ``date=`` directory).
+
+    Returns None when any partition holding Parquet files lacks a fresh sidecar so
+    callers can fall back to scanning. ``underlyings`` restricts the merge to matching
+    ``underlying=`` partitions.
+    """
+    root = Path(root)
+    if not root.exists():
+        return None
+    wanted = {u.upper() for u in underlyings} if underlyings else None
+    by_dir: Dict[Path, int] = {}
+    for file_path in list_parquet_files(root):
+        by_dir[file_path.parent] = by_dir.get(file_path.parent, 0) + 1
+    totals = []
+    files = 0
+    for part_dir, count in sorted(by_dir.items()):
+        if wanted is not None:
+            symbol = next(
+                (x.split("=", 1)[1] for x in part_dir.parts if x.startswith("underlying=")),
+                None,
+            )
+            if symbol is not None and symbol.upper() not in wanted:
+                continue
+        stats = read_partition_stats(part_dir)
+        if stats is None:
+            return None
+        totals.append(stats)
+        files += count
+    merged = merge_stats(totals)
+    merged["partitions"] = len(totals)
+    merged["files"] = files
+    return merged
+
+
+__all__ = [
+    "STATS_FILENAME",
+    "aggregate_stats",
+    "compute_stats",
+    "merge_stats",
+    "read_partition_stats",
+    "write_partition_stats",
+]
@@ -1,18 +1,27 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import logging
+from dataclasses import dataclass, field
 from pathlib import Path
 import pandas as pd
 
-from .layout import Partition, codec_for_date
+from .layout import Partition, apply_write_layout, codec_for_date, write_layout_for
+from .manifest import partition_manifest, write_table_atomic
+from .partition_stats import write_partition_stats
 from ..config import AppConfig
+from ..observability.summary_index import SummaryIndex, summary_index_path
+
+logger = logging.getLogger(__name__)
 
 
 @dataclass
 class ParquetWriter:
     cfg: AppConfig
+    _index: SummaryIndex | None = field(default=None, init=False, repr=False)
 
     def write_dataframe(self, df: pd.DataFrame, part: Partition) -> Path:
+        manifest = partition_manifest(part.root)
+        manifest.ensure_initialized()
         part_dir = part.path()
         part_dir.mkdir(parents=True, exist_ok=True)
 
@@ -22,8 +31,48 @@ class ParquetWriter:
         file_path = part_dir / "part-000.parquet"
         # Defer pyarrow import until needed to avoid import cost in tests
         import pyarrow as pa  # type: ignore
-        import pyarrow.parquet as pq  # type: ignore
 
         table = pa.Table.from_pandas(df, preserve_index=False)
-        pq.write_table(table, file_path, compression=codec, **options)
+        view = Path(part.root).name.partition("=")[2]
+        table, layout_options = apply_write_layout(table, write_layout_for(self.cfg, view))
+        # Rename into place so readers never observe a partially written part file
+        write_table_atomic(table, file_path, compression=codec, **options, **layout_options)
+        try:
+            write_partition_stats(part_dir, file_path.name, df)
+        except Exception as exc:
+            logger.warning(
+                "Failed to write partition stats",
+                extra={"path": str(part_dir), "error": str(exc)},
+            )
+        try:
+            manifest.commit(file_path, table)
+        except Exception as exc:
+            logger.warning(
+                "Failed to append manifest entry",
+                extra={"path": str(file_path), "error": str(exc)},
+            )
+        self._index_partition(part, file_path, len(df))
         return file_path
+
+    def _index_partition(self, part: Partition, file_path: Path, rows: int) -> None:
+        root = Path(part.root)
+        if not root.name.startswith("view="):
+            return
+        parent = root.parent.resolve()
+        if parent == Path(self.cfg.paths.clean).resolve():
+            source = "clean"
+        elif parent == Path(self.cfg.paths.raw).resolve():
+            source = "raw"
+        else:
+            return
+        if self._index is None:
+            self._index = SummaryIndex(summary_index_path(self.cfg))
+        self._index.record_partition(
+            source=source,
+            view=root.name[len("view=") :],
+            trade_date=part.trade_date,
+            underlying=part.underlying,
+            exchange=part.exchange,
+            path=file_path,
+            rows=rows,
+        )
@@ -20,7 +20,7 @@ from ..streaming.selection import (
     should_rebalance,
     strike_step,
 )
-from ..universe import load_universe
+from ..universe import Universe
 from ..util.calendar import to_et_date
 from .writer import StreamingWriter
 
@@ -141,8 +141,7 @@ class StreamingRunner:
                 for kind, (_, max_rows) in per_kind_config.items()
             }
 
-        universe_entries = load_universe(Path(self.cfg.universe.file))
-        conid_map = {entry.symbol: entry.conid for entry in universe_entries}
+        conid_map = Universe.load(Path(self.cfg.universe.file)).conid_map()
 
         session = self._session_factory()
         with session as sess:
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import logging
+from dataclasses import dataclass, field
 from datetime import date, datetime
 from pathlib import Path
 from typing import Iterable
@@ -8,7 +9,18 @@ from typing import Iterable
 import pandas as pd
 
 from ..config import AppConfig
-from ..storage.layout import codec_for_date, partition_for
+from ..observability.summary_index import SummaryIndex, summary_index_path
+from ..storage.layout import (
+    Partition,
+    apply_write_layout,
+    codec_for_date,
+    partition_for,
+    write_layout_for,
+)
+from ..storage.manifest import partition_manifest, write_table_atomic
+from ..storage.partition_stats import write_partition_stats
+
+logger = logging.getLogger(__name__)
 
 
 @dataclass
@@ -16,6 +28,8 @@ class StreamingWriter:
     cfg: AppConfig
     root: Path
     counter: int = 0
+    source: str = "streaming"
+    _index: SummaryIndex | None = field(default=None, init=False, repr=False)
 
     def write_records(self, kind: str, records: Iterable[dict]) -> int:
         rows = list(records)
@@ -33,6 +47,9 @@ class StreamingWriter:
 
         written = 0
         kind_root = (self.root / f"kind={kind}").resolve()
+        manifest = partition_manifest(kind_root)
+        manifest.ensure_initialized()
+        layout = write_layout_for(self.cfg, kind)
         grouped = df.groupby(["trade_date", "underlying", "exchange"], dropna=False)
         for (trade_date_value, underlying, exchange), group in grouped:
             trade_date_obj = _coerce_date(trade_date_value) or datetime.utcnow().date()
@@ -47,15 +64,44 @@ class StreamingWriter:
             file_path = part_dir / f"part-{ts}-{self.counter:06d}.parquet"
 
             import pyarrow as pa  # type: ignore
-            import pyarrow.parquet as pq  # type: ignore
 
             table = pa.Table.from_pandas(group, preserve_index=False)
-            pq.write_table(table, file_path, compression=codec, **options)
+            table, layout_options = apply_write_layout(table, layout)
+            write_table_atomic(table, file_path, compression=codec, **options, **layout_options)
+            try:
+                write_partition_stats(part_dir, file_path.name, group, replace=False)
+            except Exception as exc:
+                logger.warning(
+                    "Failed to write partition stats",
+                    extra={"path": str(part_dir), "error": str(exc)},
+                )
+            try:
+                manifest.commit(file_path, table)
+            except Exception as exc:
+                logger.warning(
+                    "Failed to append manifest entry",
+                    extra={"path": str(file_path), "error": str(exc)},
+                )
+            self._index_part(kind, part, file_path, len(group))
             written += len(group)
             self.counter += 1
 
         return written
 
+    def _index_part(self, kind: str, part: Partition, file_path: Path, rows: int) -> None:
+        if self._index is None:
+            self._index = SummaryIndex(summary_index_path(self.cfg))
+        self._index.record_partition(
+            source=self.source,
+            view=kind,
+            trade_date=part.trade_date,
+            underlying=part.underlying,
+            exchange=part.exchange,
+            path=file_path,
+            rows=rows,
+            append=True,
+        )
+
 
 def _coerce_date(value: object) -> date | None:
     if isinstance(value, date):
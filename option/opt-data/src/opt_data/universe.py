@@ -1,23 +1,131 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from pathlib import Path
-from typing import List
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 
 import csv
+import threading
+import zlib
 
 
 @dataclass
 class UniverseEntry:
     symbol: str
     conid: int | None = None
+    # Optional ``tags`` column, ";"-separated (e.g. "etf;index")
+    tags: Tuple[str, ...] = ()
 
 
-def load_universe(path: Path) -> List[UniverseEntry]:
-    entries: List[UniverseEntry] = []
-    if not path.exists():
-        return entries
+@dataclass(frozen=True)
+class UniverseDiff:
+    added: Tuple[str, ...]
+    removed: Tuple[str, ...]
+    # Symbols present in both versions whose conid or tags changed
+    changed: Tuple[str, ...]
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.changed)
+
+
+def shard_of(symbol: str, shards: int) -> int:
+    """Stable bucket for *symbol* in ``range(shards)`` (same in every process and run)."""
+    if shards <= 1:
+        return 0
+    return zlib.crc32(symbol.upper().encode("utf-8")) % shards
+
+
+class Universe:
+    """Parsed universe CSV with symbol/conid indexes, in file order (first row per symbol wins).
+
+    Entries are shared with the process-wide cache behind ``Universe.load``; treat them as
+    read-only and use ``load_universe`` when a mutable list of copies is needed.
+    """
+
+    def __init__(self, entries: Iterable[UniverseEntry], path: Optional[Path] = None):
+        self.path = path
+        self._by_symbol: Dict[str, UniverseEntry] = {}
+        for entry in entries:
+            self._by_symbol.setdefault(entry.symbol, entry)
+        self.entries: Tuple[UniverseEntry, ...] = tuple(self._by_symbol.values())
+        self._by_conid: Dict[int, UniverseEntry] = {
+            e.conid: e for e in reversed(self.entries) if e.conid is not None
+        }
+
+    @classmethod
+    def load(cls, path: Path) -> "Universe":
+        """Universe for *path*, re-parsed only when the file's mtime or size changes."""
+        key = Path(path).expanduser().resolve()
+        try:
+            stat = key.stat()
+        except FileNotFoundError:
+            return cls([], key)
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        with _UNIVERSE_CACHE_LOCK:
+            cached = _UNIVERSE_CACHE.get(key)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        universe = cls(_read_entries(key), key)
+        with _UNIVERSE_CACHE_LOCK:
+            _UNIVERSE_CACHE[key] = (stamp, universe)
+        return universe
+
+    def __iter__(self) -> Iterator[UniverseEntry]:
+        return iter(self.entries)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __contains__(self, symbol: object) -> bool:
+        return isinstance(symbol, str) and symbol.upper() in self._by_symbol
+
+    @property
+    def symbols(self) -> List[str]:
+        return [e.symbol for e in self.entries]
 
+    def get(self, symbol: str) -> Optional[UniverseEntry]:
+        return self._by_symbol.get(symbol.upper())
+
+    def by_conid(self, conid: int) -> Optional[UniverseEntry]:
+        return self._by_conid.get(conid)
+
+    def conid_map(self) -> Dict[str, int | None]:
+        return {e.symbol: e.conid for e in self.entries}
+
+    def select(self, symbols: Optional[Sequence[str]] = None) -> List[UniverseEntry]:
+        """Entries for *symbols* (all when empty/None) in universe order; unknowns dropped."""
+        if not symbols:
+            return list(self.entries)
+        wanted = {s.upper() for s in symbols}
+        return [e for e in self.entries if e.symbol in wanted]
+
+    def tagged(self, tag: str) -> List[UniverseEntry]:
+        return [e for e in self.entries if tag in e.tags]
+
+    def shard(self, index: int, shards: int) -> List[UniverseEntry]:
+        """Entries whose ``shard_of`` bucket is *index*; shards partition the universe."""
+        if not 0 <= index < max(shards, 1):
+            raise ValueError(f"Invalid shard index {index} for {shards} shards")
+        return [e for e in self.entries if shard_of(e.symbol, shards) == index]
+
+    def diff(self, previous: "Universe") -> UniverseDiff:
+        """What changed going from *previous* to this universe."""
+        added = tuple(s for s in self._by_symbol if s not in previous._by_symbol)
+        removed = tuple(s for s in previous._by_symbol if s not in self._by_symbol)
+        changed = tuple(
+            s
+            for s, entry in self._by_symbol.items()
+            if s in previous._by_symbol and previous._by_symbol[s] != entry
+        )
+        return UniverseDiff(added=added, removed=removed, changed=changed)
+
+
+_UNIVERSE_CACHE: Dict[Path, Tuple[Tuple[int, int], Universe]] = {}
+_UNIVERSE_CACHE_LOCK = threading.Lock()
+
+
+def _read_entries(path: Path) -> List[UniverseEntry]:
+    entries: List[UniverseEntry] = []
     with path.open("r", newline="", encoding="utf-8") as fh:
         reader = csv.DictReader(row for row in fh if not row.startswith("#"))
         for row in reader:
@@ -26,5 +134,11 @@ def load_universe(path: Path) -> List[UniverseEntry]:
                 continue
             conid_raw = (row.get("conid") or "").strip()
             conid = int(conid_raw) if conid_raw else None
-            entries.append(UniverseEntry(symbol=symbol, conid=conid))
+            tags = tuple(t.strip() for t in (row.get("tags") or "").split(";") if t.strip())
+            entries.append(UniverseEntry(symbol=symbol, conid=conid, tags=tags))
     return entries
+
+
+def load_universe(path: Path) -> List[UniverseEntry]:
+    """Universe entries as a fresh list of copies (safe to mutate); see ``Universe.load``."""
+    return [replace(entry) for entry in Universe.load(Path(path))]
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import json
+from typing import Any
+
+import pandas as pd
+
+
+def normalize_flags(value: Any) -> list[str]:
+    """Return a ``data_quality_flag`` cell as a list of flag strings.
+
+    Accepts lists/tuples/sets, JSON-encoded lists, bare strings, None/NaN and the numpy
+    arrays list columns come back as from Parquet.
+    """
+    if isinstance(value, list):
+        return [str(v) for v in value if str(v)]
+    if isinstance(value, (tuple, set)):
+        return [str(v) for v in value if str(v)]
+    if value is None or (isinstance(value, float) and pd.isna(value)):
+        return []
+    if isinstance(value, str):
+        text = value.strip()
+        if not text:
+            return []
+        if text.startswith("[") and text.endswith("]"):
+            try:
+                parsed = json.loads(text)
+                if isinstance(parsed, list):
+                    return [str(v) for v in parsed if str(v)]
+            except Exception:
+                pass
+        return [text]
+    if hasattr(value, "__iter__"):
+        # List columns read back from Parquet arrive as numpy arrays
+        return [str(v) for v in value if str(v)]
+    return [str(value)]
+
+
+__all__ = ["normalize_flags"]
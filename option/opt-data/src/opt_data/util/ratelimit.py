@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+import multiprocessing
 import time
 from dataclasses import dataclass
-from typing import Callable
+from typing import Any, Callable
 
 
 TimeFn = Callable[[], float]
@@ -45,3 +46,30 @@ class TokenBucket:
             self.tokens -= n
             return True
         return False
+
+
+class SharedTokenBucket:
+    """Token bucket whose state lives in shared memory so several processes draw from one
+    budget. Create it in the parent and hand it to workers at process start-up."""
+
+    def __init__(self, capacity: int, refill_per_minute: int, *, mp_context: Any = None) -> None:
+        ctx = mp_context or multiprocessing.get_context()
+        self.capacity = capacity
+        self.refill_per_minute = refill_per_minute
+        # [tokens, last_ts]
+        self._state = ctx.Array("d", [float(capacity), time.time()])
+
+    def try_acquire(self, n: int = 1) -> bool:
+        with self._state.get_lock():
+            now = time.time()
+            tokens, last_ts = self._state[0], self._state[1]
+            if now > last_ts:
+                tokens = min(
+                    self.capacity, tokens + (now - last_ts) * self.refill_per_minute / 60.0
+                )
+                last_ts = now
+            acquired = tokens >= n
+            if acquired:
+                tokens -= n
+            self._state[0], self._state[1] = tokens, last_ts
+            return acquired
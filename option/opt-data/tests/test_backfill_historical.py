@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import date, datetime
+from types import SimpleNamespace
+from typing import Any, List
+
+from opt_data.pipeline.backfill import BackfillRunner
+
+from helpers import build_config
+
+
+class FakeHistoricalIB:
+    def __init__(self, empty_trades_conids: set[int] | None = None) -> None:
+        self.qualify_calls: List[List[Any]] = []
+        self.history_calls: List[tuple[int, str]] = []
+        self.empty_trades_conids = empty_trades_conids or set()
+        self._next_conid = 9000
+
+    def qualifyContracts(self, *contracts: Any) -> List[Any]:
+        self.qualify_calls.append(list(contracts))
+        for contract in contracts:
+            self._next_conid += 1
+            contract.conId = self._next_conid
+        return list(contracts)
+
+    async def reqHistoricalDataAsync(self, contract: Any, **kwargs: Any) -> List[Any]:
+        what = kwargs["whatToShow"]
+        self.history_calls.append((contract.conId, what))
+        await asyncio.sleep(0)
+        if what == "TRADES" and contract.conId in self.empty_trades_conids:
+            return []
+        return [
+            SimpleNamespace(
+                date=datetime(2025, 10, 6, 16, 0),
+                open=1.0,
+                high=1.5,
+                low=0.9,
+                close=1.2,
+                volume=10,
+            )
+        ]
+
+    def run(self, coro: Any) -> Any:
+        return asyncio.run(coro)
+
+
+def _contract(conid: int | None, strike: float) -> dict:
+    info = {
+        "symbol": "AAPL",
+        "expiry": "2025-11-21",
+        "right": "C",
+        "strike": strike,
+        "exchange": "SMART",
+        "tradingClass": "AAPL",
+        "multiplier": 100,
+    }
+    if conid is not None:
+        info["conid"] = conid
+    return info
+
+
+def test_historical_rows_skip_qualify_for_cached_conids(tmp_path):
+    cfg = build_config(tmp_path)
+    runner = BackfillRunner(cfg, writer=object(), cleaner=object())
+    ib = FakeHistoricalIB()
+
+    contracts = [_contract(1001, 150.0), _contract(None, 155.0), _contract(1003, 160.0)]
+    rows = runner._fetch_historical_rows(ib, contracts, date(2025, 10, 6))
+
+    # Only the contract without a cached conid is qualified, in a single batch.
+    assert len(ib.qualify_calls) == 1
+    assert len(ib.qualify_calls[0]) == 1
+    # One bar request per contract when TRADES succeeds.
+    assert len(ib.history_calls) == 3
+    assert [row["strike"] for row in rows] == [150.0, 155.0, 160.0]
+    assert rows[1]["conid"] == 9001
+    assert rows[0]["close"] == 1.2
+
+
+def test_historical_rows_fallback_to_midpoint(tmp_path):
+    cfg = build_config(tmp_path)
+    runner = BackfillRunner(cfg, writer=object(), cleaner=object())
+    ib = FakeHistoricalIB(empty_trades_conids={1001})
+    events: list[tuple[str, dict]] = []
+
+    rows = runner._fetch_historical_rows(
+        ib,
+        [_contract(1001, 150.0), _contract(1002, 155.0)],
+        date(2025, 10, 6),
+        progress=lambda _d, _s, status, info: events.append((status, info)),
+    )
+
+    assert ib.qualify_calls == []
+    assert (1001, "MIDPOINT") in ib.history_calls
+    assert (1002, "MIDPOINT") not in ib.history_calls
+    assert len(rows) == 2
+    successes = [info["what"] for status, info in events if status == "historical_success"]
+    assert sorted(successes) == ["MIDPOINT", "TRADES"]
+
+
+def test_historical_rows_learn_what_to_show_order(tmp_path):
+    cfg = build_config(tmp_path)
+    cfg.acquisition.what_to_show_explore_rate = 0.0
+    illiquid = {1001, 1002, 1003}
+
+    runner = BackfillRunner(cfg, writer=object(), cleaner=object())
+    first = FakeHistoricalIB(empty_trades_conids=illiquid)
+    contracts = [_contract(conid, 150.0) for conid in sorted(illiquid)]
+    runner._fetch_historical_rows(first, contracts, date(2025, 10, 6), underlying_close=150.0)
+    assert [what for _, what in first.history_calls].count("TRADES") == 3
+    assert (tmp_path / "state/what_to_show_stats.json").exists()
+
+    # A fresh runner reloads the persisted table and leads with MIDPOINT.
+    runner = BackfillRunner(cfg, writer=object(), cleaner=object())
+    second = FakeHistoricalIB(empty_trades_conids=illiquid)
+    rows = runner._fetch_historical_rows(
+        second, contracts, date(2025, 10, 6), underlying_close=150.0
+    )
+    assert [what for _, what in second.history_calls] == ["MIDPOINT"] * 3
+    assert len(rows) == 3
+
+
+def test_historical_token_wait_does_not_block_event_loop(tmp_path, monkeypatch):
+    monkeypatch.setattr("opt_data.pipeline.backfill.ASYNC_ACQUIRE_POLL_SECONDS", 0.01)
+    cfg = build_config(tmp_path)
+    runner = BackfillRunner(cfg, writer=object(), cleaner=object())
+
+    class SlowBucket:
+        def __init__(self) -> None:
+            self.denials = 3
+
+        def try_acquire(self, tokens: int = 1) -> bool:
+            self.denials -= 1
+            return self.denials < 0
+
+    runner._limiters["historical"] = SlowBucket()
+    ticks: list[int] = []
+
+    async def other_request() -> None:
+        for i in range(3):
+            ticks.append(i)
+            await asyncio.sleep(0)
+
+    async def scenario() -> int:
+        acquire = asyncio.ensure_future(runner._make_acquire_async("historical")())
+        await other_request()
+        assert not acquire.done()
+        await acquire
+        return len(ticks)
+
+    assert asyncio.run(scenario()) == 3
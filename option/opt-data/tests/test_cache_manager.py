@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import json
+from datetime import date
+
+from opt_data.util.cache_manager import CacheManager, contract_cache
+
+TRADE_DATE = date(2025, 10, 1)
+
+
+def _items(symbol: str, count: int = 3) -> list[dict]:
+    return [
+        {
+            "conid": 1000 + idx,
+            "symbol": symbol,
+            "expiry": "2025-11-21",
+            "right": "C",
+            "strike": 100.0 + idx,
+            "multiplier": 100.0,
+            "exchange": "SMART",
+            "tradingClass": symbol,
+            "currency": "USD",
+        }
+        for idx in range(count)
+    ]
+
+
+def _write_json(root, symbol: str, items: list[dict]) -> None:
+    root.mkdir(parents=True, exist_ok=True)
+    path = root / f"{symbol}_{TRADE_DATE.isoformat()}.json"
+    path.write_text(json.dumps(items), encoding="utf-8")
+
+
+def test_load_parses_each_file_once(tmp_path):
+    _write_json(tmp_path, "AAPL", _items("AAPL"))
+    manager = CacheManager(tmp_path)
+
+    first = manager.load("aapl", TRADE_DATE)
+    first[0]["strike"] = -1.0  # callers may mutate their copy
+    second = manager.load("AAPL", TRADE_DATE)
+
+    assert second[0]["strike"] == 100.0
+    assert manager.stats.loads == 1
+    assert manager.stats.hits == 1
+    assert manager.stats.misses == 1
+    assert manager.load("MSFT", TRADE_DATE) is None
+
+
+def test_lru_evicts_least_recently_used(tmp_path):
+    for symbol in ("AAPL", "MSFT", "SPY"):
+        _write_json(tmp_path, symbol, _items(symbol, count=20))
+    size = (tmp_path / f"AAPL_{TRADE_DATE.isoformat()}.json").stat().st_size
+    manager = CacheManager(tmp_path, max_bytes=int(size * 2.5))
+
+    manager.load("AAPL", TRADE_DATE)
+    manager.load("MSFT", TRADE_DATE)
+    manager.load("AAPL", TRADE_DATE)  # AAPL becomes most recent
+    manager.load("SPY", TRADE_DATE)  # evicts MSFT
+
+    assert manager.stats.evictions == 1
+    assert manager.stats.entries == 2
+    assert manager.stats.bytes <= manager.max_bytes
+    loads = manager.stats.loads
+    manager.load("AAPL", TRADE_DATE)
+    assert manager.stats.loads == loads
+    manager.load("MSFT", TRADE_DATE)
+    assert manager.stats.loads == loads + 1
+
+
+def test_preload_warms_symbols_in_parallel(tmp_path):
+    for symbol in ("AAPL", "MSFT"):
+        _write_json(tmp_path, symbol, _items(symbol))
+    manager = contract_cache(tmp_path)
+
+    assert manager.preload(["AAPL", "MSFT", "QQQ", "aapl"], TRADE_DATE, max_workers=4) == 2
+    for path in tmp_path.glob("*.json"):
+        path.unlink()
+    # Warm entries are served from memory even after the files disappear.
+    assert len(manager.load("MSFT", TRADE_DATE)) == 3
+    assert contract_cache(tmp_path) is manager
+    assert manager.preload(["AAPL", "MSFT"], TRADE_DATE) == 0
+
+
+def test_save_writes_master_without_discovery_json(tmp_path):
+    manager = CacheManager(tmp_path)
+    path = manager.save("AAPL", TRADE_DATE, _items("AAPL"))
+
+    assert path == manager.master.path_for("AAPL")
+    assert not manager.contract_path("AAPL", TRADE_DATE).exists()
+    assert [c["conid"] for c in manager.master.chain("AAPL", TRADE_DATE)] == [1000, 1001, 1002]
+    assert manager.stats.entries == 1
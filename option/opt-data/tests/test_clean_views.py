@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pandas as pd
+from zoneinfo import ZoneInfo
+
+from opt_data.mcp.datasource import DataAccess
+from opt_data.mcp.limits import LimitConfig
+from opt_data.mcp.tools import get_chain_sample
+from opt_data.pipeline.clean_views import materialize_clean_view, read_clean_partition
+from opt_data.pipeline.qa import QAMetricsCalculator
+from opt_data.pipeline.snapshot import SnapshotRunner
+
+from helpers import build_config
+
+TRADE_DATE = date(2025, 10, 6)
+
+
+class DummySession:
+    def ensure_connected(self) -> Any:
+        return object()
+
+    def __enter__(self) -> "DummySession":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        return None
+
+
+def _run_slot(cfg, label: str, bid: float) -> Any:
+    contracts: List[Dict[str, Any]] = [
+        {
+            "conid": 1000 + i,
+            "symbol": "AAPL",
+            "expiry": "2025-11-21",
+            "right": right,
+            "strike": 150.0,
+            "exchange": "SMART",
+            "tradingClass": "AAPL",
+            "multiplier": 100,
+        }
+        for i, right in enumerate("CP")
+    ]
+    rows = [
+        {**c, "bid": bid, "ask": bid + 0.5, "market_data_type": 1, "open_interest": 10}
+        for c in contracts
+    ]
+    runner = SnapshotRunner(
+        cfg,
+        session_factory=DummySession,
+        contract_fetcher=lambda *_, **__: contracts,
+        snapshot_fetcher=lambda *_, **__: rows,
+        underlying_fetcher=lambda *_, **__: 160.0,
+        now_fn=lambda: datetime(2025, 10, 6, 9, 31, tzinfo=ZoneInfo("America/New_York")),
+    )
+    return runner.run(TRADE_DATE, runner.resolve_slot(TRADE_DATE, label))
+
+
+def _clean_frame(path: Path) -> pd.DataFrame:
+    df = pd.read_parquet(path).sort_values(["conid", "sample_time"]).reset_index(drop=True)
+    df["data_quality_flag"] = df["data_quality_flag"].apply(list)
+    return df
+
+
+def test_deferred_clean_matches_eager(tmp_path):
+    eager_cfg = build_config(tmp_path / "eager")
+    deferred_cfg = build_config(tmp_path / "deferred")
+    deferred_cfg.snapshot.clean_mode = "deferred"
+
+    for label, bid in (("09:30", 1.0), ("10:00", 2.0)):
+        eager = _run_slot(eager_cfg, label, bid)
+        deferred = _run_slot(deferred_cfg, label, bid)
+        assert deferred.clean_paths == []
+        assert len(deferred.raw_paths) == len(eager.raw_paths) == 1
+
+    assert not (Path(deferred_cfg.paths.clean) / "view=intraday").exists()
+    written = materialize_clean_view(deferred_cfg, "intraday", TRADE_DATE)
+    assert len(written) == 1
+
+    expected = _clean_frame(eager.clean_paths[0])
+    derived = _clean_frame(written[0])
+    columns = ["conid", "slot_30m", "mid", "strike_per_100", "moneyness_pct", "data_quality_flag"]
+    pd.testing.assert_frame_equal(derived[columns], expected[columns])
+    assert derived["mid"].tolist() == [1.25, 2.25, 1.25, 2.25]
+
+    # Up to date: nothing rewritten until raw changes or force is given
+    assert materialize_clean_view(deferred_cfg, "intraday", TRADE_DATE) == []
+    assert len(materialize_clean_view(deferred_cfg, "intraday", TRADE_DATE, force=True)) == 1
+
+    on_read = read_clean_partition(deferred_cfg, "intraday", TRADE_DATE, "AAPL", "SMART")
+    assert sorted(on_read["mid"].tolist()) == [1.25, 1.25, 2.25, 2.25]
+
+
+def test_deferred_readers_derive_clean_on_read(tmp_path, monkeypatch):
+    cfg = build_config(tmp_path)
+    cfg.snapshot.clean_mode = "deferred"
+    _run_slot(cfg, "09:30", 1.0)
+    intraday_root = Path(cfg.paths.clean) / "view=intraday"
+    assert not intraday_root.exists()
+
+    qa = QAMetricsCalculator(cfg).evaluate(TRADE_DATE)
+    assert qa.extra["intraday_rows"] == 2
+    assert len(list(intraday_root.rglob("*.parquet"))) == 1
+
+    # MCP cleans raw rows in memory: a later raw slot is visible without running
+    # clean-views, and the clean partition is left untouched
+    _run_slot(cfg, "10:00", 2.0)
+    before = {p: p.stat().st_mtime_ns for p in Path(cfg.paths.clean).rglob("*")}
+    data = DataAccess(cfg)
+    monkeypatch.setattr(data, "recent_dates", lambda _days: [TRADE_DATE.isoformat()])
+    sample = get_chain_sample(data, LimitConfig(), symbol="AAPL", days=1, limit=10)
+    assert sorted(row["mid"] for row in sample["rows"]) == [1.25, 1.25, 2.25, 2.25]
+    assert {p: p.stat().st_mtime_ns for p in Path(cfg.paths.clean).rglob("*")} == before
+
+    paged = get_chain_sample(data, LimitConfig(), symbol="AAPL", days=1, limit=3)
+    rest = get_chain_sample(
+        data, LimitConfig(), symbol="AAPL", days=1, limit=3, cursor=paged["next_cursor"]
+    )
+    assert len(paged["rows"]) + len(rest["rows"]) == 4
+    assert all("mid" in row for row in paged["rows"] + rest["rows"])
@@ -1,7 +1,9 @@
 from pathlib import Path
 import pytest
 
-from opt_data.config import load_config
+import os
+
+from opt_data.config import load_config, reload_config
 
 
 def test_load_config_from_custom_file(tmp_path: Path) -> None:
@@ -170,3 +172,27 @@ def test_config_validation_rejects_invalid_compaction_size(tmp_path: Path) -> No
 
     with pytest.raises(ValueError, match=r"compaction\.max_file_size_mb.*must be.*min"):
         load_config(cfg_file)
+
+
+def test_load_config_is_cached_until_file_or_env_changes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Repeated loads reuse the parsed config but never hand out the same object."""
+    cfg_file = tmp_path / "opt-data.toml"
+    cfg_file.write_text("[ib]\nport = 4001\n", encoding="utf-8")
+    monkeypatch.delenv("IB_CLIENT_ID", raising=False)
+
+    first = load_config(cfg_file)
+    first.ib.port = 9999
+    second = load_config(cfg_file)
+    assert second is not first
+    assert second.ib.port == 4001
+
+    monkeypatch.setenv("IB_CLIENT_ID", "77")
+    assert load_config(cfg_file).ib.client_id == 77
+
+    cfg_file.write_text("[ib]\nport = 4002\n", encoding="utf-8")
+    stat = cfg_file.stat()
+    os.utime(cfg_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert load_config(cfg_file).ib.port == 4002
+    assert reload_config(cfg_file).ib.port == 4002
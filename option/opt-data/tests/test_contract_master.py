@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import json
+from datetime import date
+
+from opt_data.ib.discovery import load_cache, save_cache
+from opt_data.storage.contract_master import ContractMaster
+from opt_data.util.cache_manager import contract_cache
+
+
+def _item(conid: int, strike: float, right: str = "C") -> dict:
+    return {
+        "conid": conid,
+        "symbol": "AAPL",
+        "expiry": "2025-11-21",
+        "right": right,
+        "strike": strike,
+        "multiplier": 100.0,
+        "exchange": "SMART",
+        "tradingClass": "AAPL",
+        "currency": "USD",
+    }
+
+
+def test_contract_master_records_deltas_and_interval_queries(tmp_path):
+    master = ContractMaster(tmp_path / "master")
+    day1 = [_item(1, 150.0), _item(2, 155.0)]
+    day3 = [_item(2, 155.0), _item(3, 160.0)]
+
+    assert master.apply("aapl", date(2025, 10, 1), day1) == {"added": 2, "expired": 0}
+    assert master.apply("AAPL", date(2025, 10, 3), day3) == {"added": 1, "expired": 1}
+    # Out-of-order dates leave the master untouched.
+    assert master.apply("AAPL", date(2025, 10, 2), []) == {"added": 0, "expired": 0}
+
+    reopened = ContractMaster(tmp_path / "master")
+    assert reopened.coverage("AAPL") == (date(2025, 10, 1), date(2025, 10, 3))
+    assert [c["conid"] for c in reopened.chain("AAPL", date(2025, 10, 1))] == [1, 2]
+    # Gap days inside the coverage were never discovered: no chain, not the previous one.
+    assert reopened.chain("AAPL", date(2025, 10, 2)) == []
+    assert not reopened.has_day("AAPL", date(2025, 10, 2))
+    assert [c["conid"] for c in reopened.chain("AAPL", date(2025, 10, 3))] == [2, 3]
+    assert reopened.chain("AAPL", date(2025, 10, 4)) == []
+    assert reopened.chain("MSFT", date(2025, 10, 1)) == []
+
+    # Re-applying the latest day replaces its delta instead of stacking a new one.
+    assert reopened.apply("AAPL", date(2025, 10, 3), day1) == {"added": 0, "expired": 0}
+    assert [c["conid"] for c in reopened.chain("AAPL", date(2025, 10, 3))] == [1, 2]
+
+
+def test_discovery_cache_reads_through_master(tmp_path):
+    items = [_item(2, 155.0), _item(1, 150.0, right="P")]
+    path = save_cache(tmp_path, "AAPL", "2025-10-01", items)
+    # The master is authoritative: no per-day JSON is written alongside it
+    assert path == ContractMaster(tmp_path / "master").path_for("AAPL")
+    assert not (tmp_path / "AAPL_2025-10-01.json").exists()
+
+    contract_cache(tmp_path).clear_memory_cache()
+    loaded = load_cache(tmp_path, "AAPL", "2025-10-01")
+    assert [c["conid"] for c in loaded] == [1, 2]
+    assert loaded[0]["right"] == "P"
+    assert load_cache(tmp_path, "AAPL", "2025-10-02") == []
+
+
+def test_import_json_caches_seeds_master(tmp_path):
+    for day, items in (
+        ("2025-10-02", [_item(2, 155.0)]),
+        ("2025-10-01", [_item(1, 150.0), _item(2, 155.0)]),
+    ):
+        (tmp_path / f"AAPL_{day}.json").write_text(json.dumps(items), encoding="utf-8")
+
+    master = ContractMaster(tmp_path / "master")
+    assert master.import_json_caches(tmp_path) == 2
+    assert [c["conid"] for c in master.chain("AAPL", date(2025, 10, 1))] == [1, 2]
+    assert [c["conid"] for c in master.chain("AAPL", date(2025, 10, 2))] == [2]
+
+
+def test_out_of_order_save_falls_back_to_json(tmp_path):
+    save_cache(tmp_path, "AAPL", "2025-10-03", [_item(1, 150.0)])
+    path = save_cache(tmp_path, "AAPL", "2025-10-01", [_item(2, 155.0)])
+    assert path.name == "AAPL_2025-10-01.json"
+
+    contract_cache(tmp_path).clear_memory_cache()
+    assert [c["conid"] for c in load_cache(tmp_path, "AAPL", "2025-10-01")] == [2]
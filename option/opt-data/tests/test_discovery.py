@@ -234,8 +234,8 @@ def test_discover_contracts_for_symbol_caches(monkeypatch, tmp_path: Path) -> No
     )
 
     assert len(results) == 4  # two strikes x two rights
-    cache_file = cfg.paths.contracts_cache / "AAPL_2024-10-01.json"
-    assert cache_file.exists()
+    master_file = cfg.paths.contracts_cache / "master" / "AAPL.arrow"
+    assert master_file.exists()
 
     # Second call should hit cache (no additional secdef calls)
     ib = session.ensure_connected()
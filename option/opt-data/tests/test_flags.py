@@ -0,0 +1,15 @@
+from __future__ import annotations
+
+import numpy as np
+
+from opt_data.util.flags import normalize_flags
+
+
+def test_normalize_flags_accepts_stored_shapes():
+    assert normalize_flags(["delayed_fallback", ""]) == ["delayed_fallback"]
+    assert normalize_flags('["missing_oi", "oi_enriched"]') == ["missing_oi", "oi_enriched"]
+    assert normalize_flags("delayed_fallback") == ["delayed_fallback"]
+    assert normalize_flags(np.array(["missing_oi"], dtype=object)) == ["missing_oi"]
+    assert normalize_flags(None) == []
+    assert normalize_flags(float("nan")) == []
+    assert normalize_flags("  ") == []
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import math
+from datetime import date, datetime, timezone
+from types import SimpleNamespace
+
+from opt_data.ib.history import aggregate_daily_bars, bars_to_frame
+
+
+def _bar(ts, o, h, low, c, volume=-1, count=-1, average=None):
+    return SimpleNamespace(
+        date=ts, open=o, high=h, low=low, close=c, volume=volume, barCount=count, average=average
+    )
+
+
+def test_aggregate_daily_bars_matches_daily_contract():
+    bars = [
+        _bar(datetime(2025, 10, 6, 13, 30, tzinfo=timezone.utc), 1.0, 1.4, 0.9, 1.2, 10, 2, 1.1),
+        _bar(datetime(2025, 10, 6, 21, 30, tzinfo=timezone.utc), 1.2, 1.6, 1.0, 1.5, 30, 4, 1.5),
+        _bar(datetime(2025, 10, 7, 13, 30, tzinfo=timezone.utc), 2.0, 2.1, 1.9, 2.05),
+    ]
+
+    daily = aggregate_daily_bars(bars)
+
+    assert [d["date"] for d in daily] == ["2025-10-06", "2025-10-07"]
+    first, second = daily
+    assert (first["open"], first["high"], first["low"], first["close"]) == (1.0, 1.6, 0.9, 1.5)
+    assert first["volume"] == 40.0
+    assert first["barCount"] == 6
+    assert abs(first["wap"] - (1.1 * 10 + 1.5 * 30) / 40) < 1e-12
+    # Quote bars report -1 for volume/barCount; those are clamped to zero.
+    assert second["volume"] == 0.0
+    assert second["barCount"] == 0
+    assert second["wap"] is None
+
+
+def test_aggregate_daily_bars_accepts_dates_and_empty_input():
+    assert aggregate_daily_bars([]) == []
+    bars = [_bar(date(2025, 10, 6), 1.0, 1.0, 1.0, 1.0, 5, 1, 1.0)]
+    daily = aggregate_daily_bars(bars)
+    assert daily[0]["date"] == "2025-10-06"
+    assert daily[0]["wap"] == 1.0
+    frame = bars_to_frame(bars)
+    assert list(frame.columns[:5]) == ["date", "open", "high", "low", "close"]
+
+
+def test_aggregate_daily_bars_keeps_nan_edge_bars():
+    nan = float("nan")
+    bars = [
+        _bar(datetime(2025, 10, 6, 13, 30, tzinfo=timezone.utc), nan, 1.4, 0.9, 1.2),
+        _bar(datetime(2025, 10, 6, 17, 30, tzinfo=timezone.utc), 1.1, 1.5, 1.0, 1.3),
+        _bar(datetime(2025, 10, 6, 21, 30, tzinfo=timezone.utc), 1.2, 1.6, 1.0, nan),
+    ]
+
+    (day,) = aggregate_daily_bars(bars)
+
+    # Like the per-bar loop, open/close are taken from the edge bars rather than
+    # the nearest non-NaN value.
+    assert math.isnan(day["open"])
+    assert math.isnan(day["close"])
+    assert (day["high"], day["low"]) == (1.6, 0.9)
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+from datetime import date
+
+import pandas as pd
+import pyarrow.parquet as pq
+
+from opt_data.storage.history import HistoryStore, expiry_bucket
+
+
+def _bars(conid: int, expiry: str, dates: list[str], close: float = 1.0) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "date": dates,
+            "open": close,
+            "high": close,
+            "low": close,
+            "close": close,
+            "volume": 0.0,
+            "barCount": 0,
+            "wap": None,
+            "conid": conid,
+            "expiry": expiry,
+            "right": "C",
+            "strike": 150.0,
+            "what_to_show": "MIDPOINT",
+            "bar_size": "8 hours",
+        }
+    )
+
+
+def test_expiry_bucket_formats():
+    assert expiry_bucket("2025-11-21") == "2025-11"
+    assert expiry_bucket("20251121") == "2025-11"
+    assert expiry_bucket(None) == "unknown"
+
+
+def test_history_store_merges_and_tracks_manifest(tmp_path):
+    store = HistoryStore(tmp_path / "history")
+    frame = pd.concat(
+        [
+            _bars(2, "2025-11-21", ["2025-10-01", "2025-10-02"]),
+            _bars(1, "2025-11-21", ["2025-10-01"]),
+            _bars(3, "2025-12-19", ["2025-10-01"]),
+        ]
+    )
+    store.write_bars("aapl", frame)
+    # Re-run overlaps one day and extends conid 1 by a day.
+    store.write_bars("AAPL", _bars(1, "2025-11-21", ["2025-10-01", "2025-10-03"], close=2.0))
+
+    part = store.partition_dir("AAPL", "2025-11") / "part-000.parquet"
+    table = pq.read_table(part)
+    assert table.column("conid").to_pylist() == [1, 1, 2, 2]
+
+    reopened = HistoryStore(tmp_path / "history")
+    assert reopened.last_covered(1) == date(2025, 10, 3)
+    assert reopened.last_covered(3) == date(2025, 10, 1)
+    assert reopened.symbol_last_covered("AAPL") == date(2025, 10, 1)
+    assert reopened.symbols() == ["AAPL"]
+    assert reopened.expiry_buckets("AAPL") == ["2025-11", "2025-12"]
+
+    df = reopened.read("AAPL", buckets=["2025-11"], conids=[1], start=date(2025, 10, 2))
+    assert len(df) == 1
+    assert df.iloc[0]["close"] == 2.0
+    assert df.iloc[0]["symbol"] == "AAPL"
+
+    assert reopened.read("MSFT").empty
+
+
+def test_history_store_version_changes_on_write(tmp_path):
+    store = HistoryStore(tmp_path / "history")
+    assert store.version("AAPL") == ()
+
+    store.write_bars("AAPL", _bars(1, "2025-11-21", ["2025-10-01"]))
+    store.write_bars("AAPL", _bars(3, "2025-12-19", ["2025-10-01"]))
+    before = store.version("AAPL", ["2025-11"])
+    untouched = store.version("AAPL", ["2025-12"])
+    assert len(store.version("AAPL")) == 2
+
+    store.write_bars("AAPL", _bars(1, "2025-11-21", ["2025-10-02", "2025-10-03"]))
+    assert store.version("AAPL", ["2025-11"]) != before
+    assert store.version("AAPL", ["2025-12"]) == untouched
+
+
+def test_history_store_reads_mixed_null_and_numeric_wap(tmp_path):
+    store = HistoryStore(tmp_path / "history")
+    store.write_bars("SPY", _bars(1, "2025-11-21", ["2025-10-01"]))
+    priced = _bars(2, "2025-12-19", ["2025-10-01"])
+    priced["wap"] = [1.5]
+    store.write_bars("SPY", priced)
+
+    part = store.partition_dir("SPY", "2025-11") / "part-000.parquet"
+    assert str(pq.read_schema(part).field("wap").type) == "double"
+
+    df = store.read("SPY")
+    assert sorted(df["conid"].tolist()) == [1, 2]
+    assert df.set_index("conid")["wap"].isna().tolist() == [True, False]
+
+
+def test_history_store_reads_legacy_null_typed_bucket(tmp_path):
+    import pyarrow as pa
+
+    store = HistoryStore(tmp_path / "history")
+    store.write_bars("SPY", _bars(2, "2025-12-19", ["2025-10-01"]))
+    # A bucket written before the schema was pinned stores an all-None ``wap`` as null
+    legacy_dir = store.partition_dir("SPY", "2025-11")
+    legacy_dir.mkdir(parents=True)
+    legacy = _bars(1, "2025-11-21", ["2025-10-01"])
+    legacy["date"] = pd.to_datetime(legacy["date"])
+    pq.write_table(
+        pa.Table.from_pandas(legacy, preserve_index=False), legacy_dir / "part-000.parquet"
+    )
+
+    df = store.read("SPY")
+    assert sorted(df["conid"].tolist()) == [1, 2]
+    assert df["wap"].isna().all()
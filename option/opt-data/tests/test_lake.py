@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import os
+import time
+
+import pandas as pd
+import pyarrow.dataset as ds
+
+from opt_data.storage import lake
+from opt_data.storage.lake import LakeReader, lake_dataset, list_parquet_files
+
+
+def _write(root, view, day, symbol, name="part-000.parquet", rows=2):
+    part_dir = root / f"view={view}" / f"date={day}" / f"underlying={symbol}" / "exchange=SMART"
+    part_dir.mkdir(parents=True, exist_ok=True)
+    frame = pd.DataFrame({"conid": range(rows), "bid": [1.0] * rows, "symbol": symbol})
+    frame.to_parquet(part_dir / name, index=False)
+    (part_dir / "_stats.json").write_text("{}", encoding="utf-8")
+    return part_dir
+
+
+def _age(path, seconds=60):
+    past = time.time() - seconds
+    for dirpath, _, _ in os.walk(path):
+        os.utime(dirpath, (past, past))
+
+
+def test_scan_prunes_partitions_and_projects(tmp_path):
+    lake.clear_lake_cache()
+    reader = LakeReader(tmp_path)
+    _write(tmp_path, "intraday", "2025-10-06", "AAPL")
+    _write(tmp_path, "intraday", "2025-10-06", "MSFT", rows=3)
+    _write(tmp_path, "intraday", "2025-10-07", "AAPL", rows=4)
+
+    assert reader.dates("intraday") == ["2025-10-06", "2025-10-07"]
+    table = reader.scan("intraday", dates=["2025-10-06"], columns=["conid", "missing"])
+    assert table.num_rows == 5
+    assert table.column_names == ["conid"]
+
+    table = reader.scan("intraday", underlyings=["aapl"], columns=["conid", "underlying"])
+    assert table.num_rows == 6
+    assert set(table.column("underlying").to_pylist()) == {"AAPL"}
+
+    table = reader.scan("intraday", filter=ds.field("conid") >= 2)
+    assert table.num_rows == 3
+    assert reader.scan("close").num_rows == 0
+
+
+def test_listing_cache_sees_new_files(tmp_path):
+    lake.clear_lake_cache()
+    part_dir = _write(tmp_path, "intraday", "2025-10-06", "AAPL")
+    _age(tmp_path)
+
+    assert [p.name for p in list_parquet_files(tmp_path)] == ["part-000.parquet"]
+    first = lake_dataset(tmp_path)
+    assert lake_dataset(tmp_path) is first
+    assert str(part_dir) in lake._LISTINGS
+
+    _write(tmp_path, "intraday", "2025-10-06", "AAPL", name="part-001.parquet")
+    assert len(list_parquet_files(tmp_path)) == 2
+    second = lake_dataset(tmp_path)
+    assert second is not first
+    assert second.count_rows() == 4
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+from datetime import date, datetime
+
+import pandas as pd
+
+from opt_data.storage.lake import LakeReader
+from opt_data.storage.layout import partition_for
+from opt_data.storage.manifest import MANIFEST_FILENAME, PartitionManifest
+from opt_data.storage.writer import ParquetWriter
+
+from helpers import build_config
+
+
+def _frame(symbol: str, rows: int = 2) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "underlying": [symbol] * rows,
+            "conid": list(range(rows)),
+            "sample_time": [datetime(2025, 10, 6, 10, 0 + i) for i in range(rows)],
+            "ingest_id": ["run-1"] * rows,
+        }
+    )
+
+
+def test_writer_commits_manifest_entries(tmp_path):
+    cfg = build_config(tmp_path)
+    view_root = cfg.paths.clean / "view=intraday"
+    writer = ParquetWriter(cfg)
+    trade_date = date(2025, 10, 6)
+    for symbol in ("AAPL", "MSFT"):
+        writer.write_dataframe(
+            _frame(symbol), partition_for(cfg, view_root, trade_date, symbol, "SMART")
+        )
+    writer.write_dataframe(
+        _frame("AAPL", 3), partition_for(cfg, view_root, trade_date, "AAPL", "SMART")
+    )
+
+    manifest = PartitionManifest(view_root)
+    assert manifest.initialized
+    entries = manifest.entries()
+    assert [e["path"] for e in entries] == [
+        "date=2025-10-06/underlying=AAPL/exchange=SMART/part-000.parquet",
+        "date=2025-10-06/underlying=MSFT/exchange=SMART/part-000.parquet",
+    ]
+    assert entries[0]["rows"] == 3
+    assert entries[0]["ingest_id"] == "run-1"
+    assert entries[0]["min_sample_time"].startswith("2025-10-06T10:00")
+    assert entries[0]["schema_hash"] == entries[1]["schema_hash"]
+    assert manifest.has(trade_date, "aapl")
+    assert not manifest.has(trade_date, "TSLA")
+    assert not manifest.has(date(2025, 10, 7))
+    assert manifest.dates(underlying="MSFT") == ["2025-10-06"]
+
+    # Files that were never committed are invisible to manifest-backed readers
+    stray = view_root / "date=2025-10-06/underlying=TSLA/exchange=SMART"
+    stray.mkdir(parents=True)
+    _frame("TSLA").to_parquet(stray / "part-000.parquet", index=False)
+    table = LakeReader(cfg.paths.clean).scan("intraday", columns=["underlying"])
+    assert sorted(set(table.column("underlying").to_pylist())) == ["AAPL", "MSFT"]
+
+    assert manifest.compact() == 2
+    assert len(manifest.path.read_text().splitlines()) == 3
+    assert len(PartitionManifest(view_root).entries()) == 2
+
+
+def test_rebuild_makes_legacy_view_authoritative(tmp_path):
+    view_root = tmp_path / "view=close"
+    part_dir = view_root / "date=2025-10-06/underlying=AAPL/exchange=SMART"
+    part_dir.mkdir(parents=True)
+    _frame("AAPL").to_parquet(part_dir / "part-000.parquet", index=False)
+
+    manifest = PartitionManifest(view_root)
+    assert not manifest.ensure_initialized()
+    assert not manifest.initialized
+
+    assert manifest.rebuild() == 1
+    assert manifest.initialized
+    assert manifest.files(["2025-10-06"]) == [part_dir / "part-000.parquet"]
+
+
+def test_refresh_reads_only_complete_lines(tmp_path):
+    view_root = tmp_path / "view=intraday"
+    manifest = PartitionManifest(view_root)
+    assert manifest.ensure_initialized()
+    path = view_root / MANIFEST_FILENAME
+    with path.open("a", encoding="utf-8") as fh:
+        fh.write(
+            '{"op": "add", "path": "date=2025-10-06/underlying=AAPL/exchange=SMART/a.parquet"}\n'
+        )
+        fh.write('{"op": "add", "path": "date=2025-10-07')
+    assert manifest.dates() == ["2025-10-06"]
+
+    with path.open("a", encoding="utf-8") as fh:
+        fh.write('/underlying=AAPL/exchange=SMART/b.parquet"}\n')
+    assert manifest.dates() == ["2025-10-06", "2025-10-07"]
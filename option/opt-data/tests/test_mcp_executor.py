@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+import anyio
+
+from opt_data.mcp.audit import AuditLogger
+from opt_data.mcp.executor import ToolExecutor, normalize_args
+
+
+def test_normalize_args_ignores_order_and_none() -> None:
+    assert normalize_args({"b": 1, "a": "x", "c": None}) == normalize_args({"a": "x", "b": 1})
+
+
+def test_executor_caches_until_ttl_or_freshness_changes() -> None:
+    calls: list[dict] = []
+    token = {"value": 1}
+    now = {"value": 0.0}
+
+    def handler(args: dict) -> dict:
+        calls.append(args)
+        return {"rows": [args.get("symbol")]}
+
+    executor = ToolExecutor(
+        {"sample": handler},
+        cache_ttl=10.0,
+        freshness=lambda: token["value"],
+        clock=lambda: now["value"],
+    )
+
+    async def scenario() -> list[bool]:
+        flags = []
+        for _ in range(2):
+            _, cached = await executor.call("sample", {"symbol": "AAPL"})
+            flags.append(cached)
+        token["value"] = 2  # new partition written
+        flags.append((await executor.call("sample", {"symbol": "AAPL"}))[1])
+        now["value"] = 11.0  # TTL expired
+        flags.append((await executor.call("sample", {"symbol": "AAPL"}))[1])
+        return flags
+
+    assert anyio.run(scenario) == [False, True, False, False]
+    assert len(calls) == 3
+
+
+def test_executor_runs_handlers_concurrently_off_loop() -> None:
+    active = {"now": 0, "peak": 0}
+    lock = threading.Lock()
+    loop_thread = threading.get_ident()
+    threads: set[int] = set()
+
+    def slow(args: dict) -> dict:
+        threads.add(threading.get_ident())
+        with lock:
+            active["now"] += 1
+            active["peak"] = max(active["peak"], active["now"])
+        time.sleep(0.05)
+        with lock:
+            active["now"] -= 1
+        return {"rows": []}
+
+    executor = ToolExecutor({"slow": slow}, concurrency=2, cache_ttl=0)
+
+    async def scenario() -> None:
+        async with anyio.create_task_group() as tg:
+            for idx in range(4):
+                tg.start_soon(executor.call, "slow", {"idx": idx})
+
+    anyio.run(scenario)
+    assert active["peak"] == 2
+    assert loop_thread not in threads
+
+
+def test_audit_logger_batches_records(tmp_path: Path) -> None:
+    db_path = tmp_path / "audit.db"
+    audit = AuditLogger(db_path, batch_size=10, flush_interval=0.01)
+    for idx in range(25):
+        audit.record("health_overview", {"days": idx}, idx, 1.0, "ok")
+    audit.flush()
+    with sqlite3.connect(db_path) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM mcp_audit_log").fetchone()[0] == 25
+    audit.record("health_overview", {}, 0, 1.0, "error", "boom")
+    audit.close()
+    with sqlite3.connect(db_path) as conn:
+        row = conn.execute("SELECT status, error FROM mcp_audit_log ORDER BY id DESC").fetchone()
+    assert row == ("error", "boom")
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+import os
 import sqlite3
 from pathlib import Path
 from datetime import datetime
@@ -223,3 +224,166 @@ def test_run_status_overview_summarizes_recent_day(tmp_path: Path) -> None:
     assert result["runs"][0]["date"] == today.isoformat()
     assert result["runs"][0]["status"] == "PASS"
     assert result["meta"]["source"] == "run_logs"
+
+
+def test_tools_answer_from_summary_index(tmp_path: Path) -> None:
+    from opt_data.observability.summary_index import SummaryIndex, summary_index_path
+    from opt_data.storage.layout import partition_for
+    from opt_data.storage.writer import ParquetWriter
+
+    cfg_path = _write_config(tmp_path)
+    cfg = load_config(cfg_path)
+    today = datetime.now(ZoneInfo(cfg.timezone.name)).date()
+
+    writer = ParquetWriter(cfg)
+    part = partition_for(cfg, Path(cfg.paths.clean) / "view=intraday", today, "aapl", "smart")
+    writer.write_dataframe(
+        pd.DataFrame([{"underlying": "AAPL", "bid": 1.0 + i, "ask": 1.1 + i} for i in range(5)]),
+        part,
+    )
+
+    index = SummaryIndex(summary_index_path(cfg))
+    index.record_report("metrics", today, {"trade_date": today.isoformat(), "status": "PASS"})
+    index.record_report(
+        "selfcheck",
+        today,
+        {"trade_date": today.isoformat(), "status": "FAIL", "reasons": ["slot_coverage_min"]},
+    )
+    index.record_report("errors", today, {"fatal_total_matches": 2, "warn_total_matches": 0})
+
+    data = DataAccess(cfg)
+    limits = LimitConfig()
+
+    status = run_status_overview(data, limits, days=1)
+    assert status["runs"][0]["status"] == "FAIL"
+    assert "logscan_fatal_hits" in status["runs"][0]["signals"]
+
+    issues = get_partition_issues(data, limits, limit=5)
+    assert [issue["reasons"] for issue in issues["issues"]] == [["slot_coverage_min"]]
+
+    runs = list_recent_runs(data, limits, limit=5)
+    assert runs["runs"][0]["status"] == "PASS"
+
+    sample = get_chain_sample(data, limits, symbol="AAPL", days=1, limit=2)
+    assert sample["files_scanned"] == 1
+    assert [row["bid"] for row in sample["rows"]] == [1.0, 2.0]
+    assert get_chain_sample(data, limits, symbol="MSFT", days=1)["rows"] == []
+
+    # A partition the index does not cover (written before it existed) is still listed
+    msft = partition_for(cfg, Path(cfg.paths.clean) / "view=intraday", today, "msft", "smart")
+    writer.write_dataframe(pd.DataFrame([{"underlying": "MSFT", "bid": 9.0, "ask": 9.1}]), msft)
+    with sqlite3.connect(summary_index_path(cfg)) as conn:
+        conn.execute("DELETE FROM partitions WHERE underlying = 'MSFT'")
+    unindexed = get_chain_sample(data, limits, symbol="MSFT", days=1)
+    assert [row["bid"] for row in unindexed["rows"]] == [9.0]
+    # All-underlyings queries trust the index for days it has rows for and only list
+    # days it has none for
+    clean_root = Path(cfg.paths.clean)
+    assert len(data.find_parquet_files(clean_root, view="intraday", symbol=None, days=1)) == 1
+    with sqlite3.connect(summary_index_path(cfg)) as conn:
+        conn.execute("UPDATE partitions SET trade_date = '2000-01-03'")
+    assert len(data.find_parquet_files(clean_root, view="intraday", symbol=None, days=1)) == 2
+
+
+def test_get_chain_sample_paginates_with_cursor_and_formats(tmp_path: Path) -> None:
+    import base64
+
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    import pytest
+
+    cfg_path = _write_config(tmp_path)
+    cfg = load_config(cfg_path)
+    today = datetime.now(ZoneInfo(cfg.timezone.name)).date().isoformat()
+    day_root = Path(cfg.paths.clean) / "view=intraday" / f"date={today}" / "underlying=AAPL"
+    for exchange, start in (("CBOE", 0), ("SMART", 5)):
+        path = day_root / f"exchange={exchange}" / "part-000.parquet"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        table = pa.table(
+            {"underlying": ["AAPL"] * 5, "strike": [float(start + i) for i in range(5)]}
+        )
+        pq.write_table(table, path, row_group_size=2)
+
+    data = DataAccess(cfg)
+    limits = LimitConfig()
+    strikes: list[float] = []
+    cursor = None
+    pages = 0
+    while True:
+        page = get_chain_sample(data, limits, symbol="AAPL", days=1, limit=3, cursor=cursor)
+        strikes.extend(row["strike"] for row in page["rows"])
+        pages += 1
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+    assert strikes == [float(i) for i in range(10)]
+    assert pages == 4
+
+    columns = get_chain_sample(
+        data, limits, symbol="AAPL", days=1, limit=4, response_format="columns"
+    )
+    assert columns["columns"] == ["underlying", "strike"]
+    assert columns["data"]["strike"] == [0.0, 1.0, 2.0, 3.0]
+    assert columns["row_count"] == 4
+
+    arrow = get_chain_sample(data, limits, symbol="AAPL", days=1, limit=6, response_format="arrow")
+    reader = pa.ipc.open_stream(base64.b64decode(arrow["arrow_ipc_base64"]))
+    assert reader.read_all().column("strike").to_pylist() == [float(i) for i in range(6)]
+
+    with pytest.raises(ValueError):
+        get_chain_sample(data, limits, symbol="MSFT", days=1, cursor=columns["next_cursor"])
+
+    # A partition file rewritten between pages invalidates the cursor
+    first = get_chain_sample(data, limits, symbol="AAPL", days=1, limit=3)
+    rewritten = day_root / "exchange=CBOE" / "part-000.parquet"
+    later = rewritten.stat().st_mtime_ns + 10**9
+    os.utime(rewritten, ns=(later, later))
+    with pytest.raises(ValueError, match="stale cursor"):
+        get_chain_sample(data, limits, symbol="AAPL", days=1, cursor=first["next_cursor"])
+
+
+def test_list_recent_runs_paginates(tmp_path: Path) -> None:
+    cfg_path = _write_config(tmp_path)
+    cfg = load_config(cfg_path)
+    for day in ("20250101", "20250102", "20250103"):
+        _write_run_log(
+            Path(cfg.paths.run_logs) / "metrics" / f"metrics_{day}.json",
+            {"trade_date": f"2025-01-{day[-2:]}", "status": "PASS", "metrics": []},
+        )
+
+    data = DataAccess(cfg)
+    limits = LimitConfig()
+    first = list_recent_runs(data, limits, limit=2)
+    # A report landing between pages must not shift the next page
+    _write_run_log(
+        Path(cfg.paths.run_logs) / "metrics" / "metrics_20250104.json",
+        {"trade_date": "2025-01-04", "status": "PASS", "metrics": []},
+    )
+    second = list_recent_runs(data, limits, limit=2, cursor=first["next_cursor"])
+
+    assert [run["date"] for run in first["runs"]] == ["2025-01-03", "2025-01-02"]
+    assert [run["date"] for run in second["runs"]] == ["2025-01-01"]
+    assert second["next_cursor"] is None
+
+
+def test_partition_issues_keyset_cursor_from_index(tmp_path: Path) -> None:
+    import pytest
+
+    from opt_data.observability.summary_index import SummaryIndex, summary_index_path
+
+    cfg = load_config(_write_config(tmp_path))
+    index = SummaryIndex(summary_index_path(cfg))
+    for day, status in (("2025-01-01", "FAIL"), ("2025-01-02", "PASS"), ("2025-01-03", "FAIL")):
+        index.record_report("selfcheck", day, {"trade_date": day, "status": status})
+
+    data = DataAccess(cfg)
+    limits = LimitConfig()
+    first = get_partition_issues(data, limits, limit=1)
+    index.record_report("selfcheck", "2025-01-04", {"trade_date": "2025-01-04", "status": "FAIL"})
+    second = get_partition_issues(data, limits, limit=1, cursor=first["next_cursor"])
+
+    assert [issue["date"] for issue in first["issues"]] == ["2025-01-03"]
+    assert [issue["date"] for issue in second["issues"]] == ["2025-01-01"]
+    assert second["next_cursor"] is None
+    with pytest.raises(ValueError, match="does not match"):
+        list_recent_runs(data, limits, cursor=first["next_cursor"])
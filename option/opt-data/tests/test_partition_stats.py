@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import json
+import os
+from datetime import date
+
+import pandas as pd
+
+from opt_data.observability.summary_index import SummaryIndex, summary_index_path
+from opt_data.pipeline.qa import QAMetricsCalculator
+from opt_data.storage.layout import partition_for
+from opt_data.storage.partition_stats import (
+    STATS_FILENAME,
+    aggregate_stats,
+    compute_stats,
+    read_partition_stats,
+)
+from opt_data.storage.writer import ParquetWriter
+from opt_data.streaming.writer import StreamingWriter
+
+from helpers import build_config
+
+
+def _daily(symbol: str) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "underlying": [symbol, symbol, symbol],
+            "rollup_strategy": ["close", "close", "last_good"],
+            "open_interest": [10, 0, None],
+            "data_quality_flag": [[], [], ["missing_oi"]],
+            "market_data_type": [1, 1, 3],
+            "snapshot_error": [False, False, True],
+        }
+    )
+
+
+def test_parquet_writer_emits_sidecar_and_aggregates(tmp_path):
+    cfg = build_config(tmp_path)
+    writer = ParquetWriter(cfg)
+    trade_date = date(2025, 10, 6)
+    root = cfg.paths.clean / "view=daily_clean"
+    for symbol in ("AAPL", "MSFT"):
+        writer.write_dataframe(
+            _daily(symbol), partition_for(cfg, root, trade_date, symbol, "SMART")
+        )
+
+    part_dir = partition_for(cfg, root, trade_date, "AAPL", "SMART").path()
+    totals = read_partition_stats(part_dir)
+    assert totals["rows"] == 3
+    assert totals["error_count"] == 1
+    assert totals["oi_positive"] == 1
+    assert totals["fallback_rows"] == 1
+    assert totals["missing_oi_rows"] == 1
+    assert totals["market_data_type_counts"] == {"1": 2, "3": 1}
+
+    date_dir = root / f"date={trade_date.isoformat()}"
+    merged = aggregate_stats(date_dir)
+    assert merged["rows"] == 6
+    assert merged["underlyings"] == ["AAPL", "MSFT"]
+    assert merged["rollup_strategy_counts"] == {"close": 4, "last_good": 2}
+    assert merged["partitions"] == 2
+    assert aggregate_stats(date_dir, underlyings=["msft"])["rows"] == 3
+
+    result = QAMetricsCalculator(cfg).evaluate(trade_date)
+    fallback = next(m for m in result.metrics if m.name == "rollup_fallback_ratio")
+    assert fallback.details == {"rows": 6, "fallback_rows": 2}
+
+
+def test_stale_sidecar_falls_back(tmp_path):
+    cfg = build_config(tmp_path)
+    trade_date = date(2025, 10, 6)
+    part = partition_for(cfg, cfg.paths.clean / "view=close", trade_date, "AAPL", "SMART")
+    ParquetWriter(cfg).write_dataframe(_daily("AAPL"), part)
+    part_dir = part.path()
+
+    # A file written without updating the sidecar invalidates it
+    _daily("AAPL").to_parquet(part_dir / "part-001.parquet", index=False)
+    assert read_partition_stats(part_dir) is None
+    assert aggregate_stats(part_dir.parent.parent) is None
+
+    os.remove(part_dir / "part-001.parquet")
+    stats_path = part_dir / STATS_FILENAME
+    later = (part_dir / "part-000.parquet").stat().st_mtime_ns + 10**9
+    os.utime(part_dir / "part-000.parquet", ns=(later, later))
+    assert read_partition_stats(part_dir) is None
+    assert json.loads(stats_path.read_text())["files"]
+
+
+def test_streaming_writer_appends_sidecar(tmp_path):
+    cfg = build_config(tmp_path)
+    writer = StreamingWriter(cfg, tmp_path / "stream")
+    record = {"trade_date": "2025-10-06", "underlying": "AAPL", "exchange": "SMART", "bid": 1.0}
+    writer.write_records("quotes", [record, record])
+    writer.write_records("quotes", [record])
+
+    part_dir = tmp_path / "stream/kind=quotes/date=2025-10-06/underlying=AAPL/exchange=SMART"
+    totals = read_partition_stats(part_dir)
+    assert totals["rows"] == 3
+    assert totals["underlyings"] == ["AAPL"]
+
+    index = SummaryIndex(summary_index_path(cfg))
+    indexed = index.partition_files(source="streaming", view="quotes", dates=["2025-10-06"])
+    assert sorted(indexed[("2025-10-06", "AAPL")]) == sorted(part_dir.glob("part-*.parquet"))
+
+
+def test_compute_stats_parses_flags_like_qa():
+    import numpy as np
+
+    df = pd.DataFrame(
+        {
+            "data_quality_flag": [
+                np.array(["delayed_fallback"]),
+                '["missing_oi"]',
+                None,
+                ["delayed_fallback", "missing_oi"],
+            ],
+            "open_interest": [1.0, None, 2.0, None],
+        }
+    )
+    stats = compute_stats(df)
+    assert stats["delayed_rows"] == 2
+    assert stats["missing_oi_rows"] == 2
+    assert stats["enriched_rows"] == 2
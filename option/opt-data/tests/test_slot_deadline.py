@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Dict, List
+
+from zoneinfo import ZoneInfo
+
+from opt_data.ib.snapshot import collect_option_snapshots
+from opt_data.pipeline.qa import QAMetricsCalculator, TOTAL_SLOTS
+from opt_data.pipeline.snapshot import SnapshotRunner
+
+from helpers import build_config
+
+TRADE_DATE = date(2025, 10, 6)
+
+
+class SilentIB:
+    """Accepts subscriptions but never delivers any data."""
+
+    def __init__(self) -> None:
+        self.subscribed: list[int] = []
+        self.cancelled: list[int] = []
+
+    def run(self, coro: Any) -> Any:
+        return asyncio.run(coro)
+
+    def reqMktData(self, opt: Any, **_kwargs: Any) -> Any:
+        self.subscribed.append(opt.conId)
+        return SimpleNamespace(bid=None, ask=None, last=None, close=None, modelGreeks=None)
+
+    def cancelMktData(self, opt: Any) -> None:
+        self.cancelled.append(opt.conId)
+
+
+def _contracts(symbol: str, count: int) -> List[Dict[str, Any]]:
+    return [
+        {
+            "conid": 1000 + i,
+            "symbol": symbol,
+            "expiry": "2025-11-21",
+            "right": "C",
+            "strike": 100.0 + i,
+            "exchange": "SMART",
+            "tradingClass": symbol,
+            "multiplier": 100,
+        }
+        for i in range(count)
+    ]
+
+
+def test_streaming_collection_stops_at_deadline():
+    ib = SilentIB()
+    started = time.monotonic()
+    rows = collect_option_snapshots(
+        ib,
+        _contracts("SPY", 3),
+        timeout=30.0,
+        poll_interval=0.01,
+        concurrency=2,
+        deadline=time.time() + 0.2,
+    )
+
+    assert time.monotonic() - started < 5
+    assert all(row["deadline_reached"] for row in rows)
+    # Two were in flight and got cancelled; the third was never requested
+    assert sorted(ib.cancelled) == sorted(ib.subscribed) == [1000, 1001]
+    assert [row["error_type"] for row in rows] == ["timeout", "timeout", "deadline"]
+
+
+def test_runner_commits_partial_slot_and_records_overrun(tmp_path):
+    cfg = build_config(tmp_path)
+    cfg.universe.file.write_text("symbol,conid\nSPY,1\nQQQ,2\n", encoding="utf-8")
+    deadlines: list[float] = []
+
+    def snapshot_rows(_ib, contracts, *, deadline=None, **_kwargs) -> List[Dict[str, Any]]:
+        deadlines.append(deadline)
+        time.sleep(max(deadline - time.time(), 0.0))
+        return [
+            {**c, "bid": 1.0, "ask": 1.2, "market_data_type": 1, "deadline_reached": True}
+            for c in contracts
+        ]
+
+    class DummySession:
+        def ensure_connected(self) -> Any:
+            return object()
+
+        def __enter__(self) -> "DummySession":
+            return self
+
+        def __exit__(self, exc_type, exc, tb) -> None:
+            return None
+
+    runner = SnapshotRunner(
+        cfg,
+        session_factory=DummySession,
+        contract_fetcher=lambda _s, symbol, *_a, **_k: _contracts(symbol, 1),
+        snapshot_fetcher=snapshot_rows,
+        underlying_fetcher=lambda *_, **__: 100.0,
+        now_fn=lambda: datetime(2025, 10, 6, 9, 31, tzinfo=ZoneInfo("America/New_York")),
+    )
+    deadline = datetime.now(ZoneInfo("UTC")) + timedelta(seconds=1)
+    slot = runner.resolve_slot(TRADE_DATE, "09:30")
+    result = runner.run(TRADE_DATE, slot, deadline=deadline)
+
+    assert deadlines == [deadline.timestamp()]
+    assert result.partial_slot
+    assert result.skipped_symbols == ["QQQ"]
+    assert result.rows_written == 1
+    assert [(e["symbol"], e["stage"]) for e in result.errors] == [("QQQ", "deadline")]
+
+    overruns = Path(cfg.paths.run_logs) / "snapshot" / "overruns_20251006.jsonl"
+    entry = json.loads(overruns.read_text(encoding="utf-8"))
+    assert entry["slot"] == "09:30"
+    assert entry["cut_symbols"] == ["SPY"]
+    assert entry["skipped_symbols"] == ["QQQ"]
+
+    qa = QAMetricsCalculator(cfg).evaluate(TRADE_DATE)
+    partial = next(m for m in qa.metrics if m.name == "partial_slot_ratio")
+    assert partial.value == 1 / TOTAL_SLOTS
+    assert partial.passed
+    assert partial.details["partial_slots"]["09:30"]["skipped"] == 1
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+from datetime import date, datetime
+from pathlib import Path
+
+from zoneinfo import ZoneInfo
+
+from opt_data.pipeline.snapshot import SnapshotResult, SnapshotSlot
+from opt_data.pipeline.snapshot_shards import ShardedSnapshotRunner, merge_results, shard_config
+from opt_data.universe import shard_of
+from opt_data.util.cache_manager import contract_cache
+from opt_data.util.ratelimit import SharedTokenBucket
+
+from helpers import build_config
+
+TRADE_DATE = date(2025, 10, 6)
+
+
+def _write_universe(cfg, symbols: list[str]) -> None:
+    path = Path(cfg.universe.file)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("symbol,conid\n" + "".join(f"{s},\n" for s in symbols), encoding="utf-8")
+
+
+def test_hash_plan_partitions_universe(tmp_path):
+    cfg = build_config(tmp_path)
+    symbols = [f"SYM{i}" for i in range(20)]
+    _write_universe(cfg, symbols)
+
+    plan = ShardedSnapshotRunner(cfg, 3).plan(TRADE_DATE)
+    assert sorted(s for shard in plan for s in shard) == sorted(symbols)
+    assert all(shard_of(s, 3) == i for i, shard in enumerate(plan) for s in shard)
+    assert ShardedSnapshotRunner(cfg, 3).plan(TRADE_DATE, ["sym1"]) == [
+        ["SYM1"] if shard_of("SYM1", 3) == i else [] for i in range(3)
+    ]
+
+
+def test_contracts_plan_balances_cached_chain_sizes(tmp_path):
+    cfg = build_config(tmp_path)
+    _write_universe(cfg, ["SPY", "QQQ", "AAPL", "MSFT", "IWM"])
+    cache = contract_cache(Path(cfg.paths.contracts_cache))
+    for symbol, size in {"SPY": 400, "QQQ": 300, "AAPL": 100, "MSFT": 100, "IWM": 200}.items():
+        cache.save(symbol, TRADE_DATE, [{"conid": i, "symbol": symbol} for i in range(size)])
+
+    plan = ShardedSnapshotRunner(cfg, 2, strategy="contracts").plan(TRADE_DATE)
+    assert sorted(map(sorted, plan)) == [["AAPL", "MSFT", "SPY"], ["IWM", "QQQ"]]
+
+
+def test_shard_config_splits_lines_and_client_ids(tmp_path):
+    cfg = build_config(tmp_path)
+    shard_cfg = shard_config(cfg, 2, 4)
+    assert shard_cfg.ib.client_id == cfg.ib.client_id + 2
+    assert shard_cfg.rate_limits.snapshot.max_concurrent == 2
+    assert cfg.rate_limits.snapshot.max_concurrent == 10
+
+
+def test_merge_results_sums_shards():
+    slot = SnapshotSlot(
+        index=0,
+        et=datetime(2025, 10, 6, 9, 30, tzinfo=ZoneInfo("America/New_York")),
+        utc=datetime(2025, 10, 6, 13, 30, tzinfo=ZoneInfo("UTC")),
+    )
+    results = [
+        SnapshotResult("a", slot, 2, 10, 8, [Path("r1")], [Path("c1")], []),
+        SnapshotResult("a", slot, 1, 5, 5, [Path("r2")], [Path("c2")], [{"symbol": "X"}]),
+    ]
+    merged = merge_results("a", slot, results)
+    assert merged.symbols_processed == 3
+    assert merged.contracts_discovered == 15
+    assert merged.rows_written == 13
+    assert merged.raw_paths == [Path("r1"), Path("r2")]
+    assert merged.errors == [{"symbol": "X"}]
+
+
+def test_shared_token_bucket_enforces_burst():
+    bucket = SharedTokenBucket(capacity=2, refill_per_minute=0)
+    assert bucket.try_acquire()
+    assert bucket.try_acquire()
+    assert not bucket.try_acquire()
@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import threading
+from datetime import date, datetime
+from typing import Any, Dict, List
+
+from zoneinfo import ZoneInfo
+
+from opt_data.pipeline.snapshot import SnapshotRunner
+from opt_data.pipeline import symbol_costs
+from opt_data.pipeline.symbol_costs import COSTS_FILENAME, SymbolCostStats
+from opt_data.universe import UniverseEntry
+
+from helpers import build_config
+
+
+class DummySession:
+    def ensure_connected(self) -> Any:
+        return object()
+
+    def __enter__(self) -> "DummySession":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        return None
+
+
+def _seeded_stats(path) -> SymbolCostStats:
+    stats = SymbolCostStats(path=path)
+    for symbol, seconds in {"SPY": 100.0, "AAPL": 10.0, "MSFT": 50.0}.items():
+        stats.record(symbol, contracts=int(seconds) * 4, seconds=seconds)
+    return stats
+
+
+def test_schedule_orders_longest_first_and_defers_unprotected(tmp_path):
+    stats = _seeded_stats(tmp_path / COSTS_FILENAME)
+    entries = [
+        UniverseEntry("AAPL"),
+        UniverseEntry("SPY", tags=("core",)),
+        UniverseEntry("MSFT"),
+        UniverseEntry("NEW"),
+    ]
+
+    ordered, deferred = stats.schedule(entries)
+    # NEW has no history and is costed at the median (50s); ties keep universe order
+    assert [e.symbol for e in ordered] == ["SPY", "MSFT", "NEW", "AAPL"]
+    assert deferred == []
+    assert stats.predict(["SPY", "NEW"]) == 150.0
+
+    ordered, deferred = stats.schedule(entries, budget_seconds=120)
+    assert [e.symbol for e in ordered] == ["SPY", "AAPL", "MSFT", "NEW"]
+    assert deferred == ["MSFT", "NEW"]
+
+
+def test_record_smooths_and_save_merges(tmp_path):
+    path = tmp_path / COSTS_FILENAME
+    first = _seeded_stats(path)
+    first.save()
+
+    other = SymbolCostStats.load(path)
+    other.record("QQQ", contracts=80, seconds=20.0, timeouts=8)
+    first.record("SPY", contracts=400, seconds=200.0)
+    other.save()
+    first.save()
+
+    merged = SymbolCostStats.load(path).symbols
+    assert merged["QQQ"]["timeout_rate"] == 0.1
+    assert merged["SPY"]["seconds"] == 130.0
+    assert merged["SPY"]["runs"] == 2
+
+
+def test_schedule_starts_timeout_prone_symbols_first(tmp_path):
+    stats = SymbolCostStats(path=tmp_path / COSTS_FILENAME)
+    stats.record("AAPL", contracts=100, seconds=30.0)
+    stats.record("TSLA", contracts=100, seconds=30.0, timeouts=20)
+
+    ordered, _ = stats.schedule([UniverseEntry("AAPL"), UniverseEntry("TSLA")])
+    assert [e.symbol for e in ordered] == ["TSLA", "AAPL"]
+    assert stats.predict(["AAPL", "TSLA"]) == 60.0
+
+
+def test_concurrent_saves_keep_every_symbol(tmp_path, monkeypatch):
+    path = tmp_path / COSTS_FILENAME
+
+    def save_one(symbol: str) -> None:
+        stats = SymbolCostStats.load(path)
+        stats.record(symbol, contracts=10, seconds=1.0)
+        stats.save()
+
+    threads = [threading.Thread(target=save_one, args=(f"S{i}",)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert sorted(SymbolCostStats.load(path).symbols) == [f"S{i}" for i in range(8)]
+
+    # A held lock defers the save; the symbols are written by the next one
+    monkeypatch.setattr(symbol_costs, "SAVE_LOCK_TIMEOUT_SECONDS", 0.1)
+    lock_path = tmp_path / f".{COSTS_FILENAME}.lock"
+    lock_path.write_text("other", encoding="utf-8")
+    stats = SymbolCostStats.load(path)
+    stats.record("LATE", contracts=10, seconds=1.0)
+    stats.save()
+    assert "LATE" not in SymbolCostStats.load(path).symbols
+    lock_path.unlink()
+    stats.save()
+    assert "LATE" in SymbolCostStats.load(path).symbols
+
+
+def test_runner_sheds_deferred_symbols_past_budget(tmp_path):
+    cfg = build_config(tmp_path)
+    cfg.universe.file.write_text(
+        "symbol,conid,tags\nAAPL,1,\nSPY,2,core\nMSFT,3,\n", encoding="utf-8"
+    )
+    cfg.snapshot.cost_ordering = True
+    cfg.snapshot.slot_budget_seconds = 40.0
+    _seeded_stats(cfg.paths.state / COSTS_FILENAME).save()
+
+    def contracts_for(_session, symbol, *_args, **_kwargs) -> List[Dict[str, Any]]:
+        return [
+            {
+                "conid": hash(symbol) % 10_000,
+                "symbol": symbol,
+                "expiry": "2025-11-21",
+                "right": "C",
+                "strike": 100.0,
+                "exchange": "SMART",
+                "tradingClass": symbol,
+                "multiplier": 100,
+            }
+        ]
+
+    def snapshot_rows(_ib, contracts, **_kwargs) -> List[Dict[str, Any]]:
+        return [{**c, "bid": 1.0, "ask": 1.2, "market_data_type": 1} for c in contracts]
+
+    runner = SnapshotRunner(
+        cfg,
+        session_factory=DummySession,
+        contract_fetcher=contracts_for,
+        snapshot_fetcher=snapshot_rows,
+        underlying_fetcher=lambda *_, **__: 100.0,
+        now_fn=lambda: datetime(2025, 10, 6, 9, 31, tzinfo=ZoneInfo("America/New_York")),
+    )
+    started: list[str] = []
+    trade_date = date(2025, 10, 6)
+    result = runner.run(
+        trade_date,
+        runner.resolve_slot(trade_date, "09:30"),
+        progress=lambda symbol, status, _: started.append(symbol) if status == "start" else None,
+    )
+
+    assert started == ["SPY", "AAPL"]
+    assert result.deferred_symbols == ["AAPL", "MSFT"]
+    assert result.shed_symbols == ["MSFT"]
+    assert [(e["symbol"], e["stage"]) for e in result.errors] == [("MSFT", "shed")]
+    assert result.rows_written == 2
+    assert SymbolCostStats.load(cfg.paths.state / COSTS_FILENAME).symbols["SPY"]["runs"] == 2
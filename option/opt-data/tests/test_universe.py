@@ -1,6 +1,7 @@
+import os
 from pathlib import Path
 
-from opt_data.universe import load_universe, UniverseEntry
+from opt_data.universe import Universe, UniverseEntry, load_universe, shard_of
 
 
 def test_load_universe_parses_symbols(tmp_path: Path) -> None:
@@ -17,3 +18,44 @@ def test_load_universe_parses_symbols(tmp_path: Path) -> None:
 def test_load_universe_missing_file_returns_empty(tmp_path: Path) -> None:
     file = tmp_path / "missing.csv"
     assert load_universe(file) == []
+
+
+def test_universe_indexes_and_reloads_on_change(tmp_path: Path) -> None:
+    file = tmp_path / "universe.csv"
+    file.write_text(
+        "symbol,conid,tags\nspy,756733,etf;index\nAAPL,265598,\nSPY,1,\n", encoding="utf-8"
+    )
+
+    universe = Universe.load(file)
+    assert universe.symbols == ["SPY", "AAPL"]
+    assert Universe.load(file) is universe
+    assert universe.get("spy").conid == 756733
+    assert universe.by_conid(265598).symbol == "AAPL"
+    assert "aapl" in universe and "MSFT" not in universe
+    assert universe.conid_map() == {"SPY": 756733, "AAPL": 265598}
+    assert [e.symbol for e in universe.select(["aapl", "MSFT"])] == ["AAPL"]
+    assert [e.symbol for e in universe.tagged("etf")] == ["SPY"]
+
+    # load_universe hands out copies, so callers may patch conids without touching the cache
+    entries = load_universe(file)
+    entries[0].conid = 42
+    assert universe.get("SPY").conid == 756733
+
+    file.write_text("symbol,conid\nAAPL,265598\nMSFT,272093\nQQQ,320227571\n", encoding="utf-8")
+    stat = file.stat()
+    os.utime(file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    updated = Universe.load(file)
+    assert updated is not universe
+    delta = updated.diff(universe)
+    assert delta.added == ("MSFT", "QQQ")
+    assert delta.removed == ("SPY",)
+    assert delta.changed == ()
+    assert not updated.diff(updated)
+
+
+def test_universe_shards_partition_symbols() -> None:
+    universe = Universe([UniverseEntry(symbol=f"SYM{i}") for i in range(50)])
+    shards = [universe.shard(i, 4) for i in range(4)]
+    assert sorted(e.symbol for shard in shards for e in shard) == sorted(universe.symbols)
+    assert all(shard_of(e.symbol, 4) == i for i, shard in enumerate(shards) for e in shard)
+    assert shard_of("AAPL", 4) == shard_of("aapl", 4)
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import random
+from datetime import date
+from pathlib import Path
+
+from opt_data.pipeline.what_to_show import WhatToShowStats, dte_bucket, moneyness_bucket
+
+
+def test_buckets():
+    assert moneyness_bucket(100.0, 100.0) == "atm"
+    assert moneyness_bucket(130.0, 100.0) == "far"
+    assert moneyness_bucket(100.0, None) == "unknown"
+    assert dte_bucket("2025-10-10", date(2025, 10, 6)) == "0-7"
+    assert dte_bucket("20260116", date(2025, 10, 6)) == "91+"
+
+
+def test_order_prefers_successful_type_and_persists(tmp_path):
+    path = tmp_path / "stats.json"
+    stats = WhatToShowStats.load(path, explore_rate=0.0)
+    key = "AAPL|far|31-90"
+    assert stats.order(key, ["TRADES", "MIDPOINT"]) == ["TRADES", "MIDPOINT"]
+
+    for _ in range(5):
+        stats.record(key, "TRADES", False)
+        stats.record(key, "MIDPOINT", True)
+    stats.save()
+
+    reloaded = WhatToShowStats.load(path, explore_rate=0.0)
+    assert reloaded.order(key, ["TRADES", "MIDPOINT"]) == ["MIDPOINT", "TRADES"]
+    # Unseen cells keep the configured order.
+    assert reloaded.order("AAPL|atm|0-7", ["TRADES", "MIDPOINT"]) == ["TRADES", "MIDPOINT"]
+
+
+def test_exploration_keeps_configured_order():
+    stats = WhatToShowStats.load(Path("unused.json"), explore_rate=1.0, rng=random.Random(0))
+    key = "SPY|near|8-30"
+    stats.record(key, "TRADES", False)
+    stats.record(key, "MIDPOINT", True)
+    assert stats.order(key, ["TRADES", "MIDPOINT"]) == ["TRADES", "MIDPOINT"]
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from datetime import date, datetime
+
+import pandas as pd
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from opt_data.config import WriteLayoutConfig
+from opt_data.storage.layout import partition_for, write_layout_for
+from opt_data.storage.writer import ParquetWriter
+
+from helpers import build_config
+
+
+def _chain(rows: int) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "underlying": ["AAPL"] * rows,
+            "conid": list(range(rows)),
+            "expiry": [f"2025-11-{21 - (i % 3):02d}" for i in range(rows)],
+            "right": ["P" if i % 2 else "C" for i in range(rows)],
+            "strike": [float(200 - i) for i in range(rows)],
+            "sample_time": [datetime(2025, 10, 6, 10, 0)] * rows,
+        }
+    )
+
+
+def test_writer_sorts_and_splits_row_groups(tmp_path):
+    cfg = build_config(tmp_path)
+    cfg.storage.layouts = {
+        "intraday": WriteLayoutConfig(
+            sort_keys=["expiry", "right", "strike"],
+            row_group_size=10,
+            dictionary_columns=["underlying", "right"],
+            statistics_columns=["expiry", "strike"],
+        )
+    }
+    part = partition_for(cfg, cfg.paths.clean / "view=intraday", date(2025, 10, 6), "AAPL", "SMART")
+    path = ParquetWriter(cfg).write_dataframe(_chain(30), part)
+
+    parquet = pq.ParquetFile(path)
+    assert parquet.metadata.num_rows == 30
+    assert parquet.metadata.num_row_groups == 3
+    sorting = parquet.metadata.row_group(0).sorting_columns
+    names = parquet.schema_arrow.names
+    assert [names[col.column_index] for col in sorting] == ["expiry", "right", "strike"]
+
+    table = parquet.read()
+    keys = list(zip(*(table.column(c).to_pylist() for c in ("expiry", "right", "strike"))))
+    assert keys == sorted(keys)
+    # Each expiry lands in its own row group, so expiry filters skip the others
+    expiry_index = names.index("expiry")
+    for i in range(3):
+        stats = parquet.metadata.row_group(i).column(expiry_index).statistics
+        assert stats.min == stats.max
+    assert parquet.metadata.row_group(0).column(names.index("conid")).statistics is None
+
+    hits = ds.dataset(path).to_table(filter=ds.field("expiry") == "2025-11-20")
+    assert hits.num_rows == 10
+
+
+def test_default_layouts_apply_per_view(tmp_path):
+    cfg = build_config(tmp_path)
+    assert write_layout_for(cfg, "intraday").sort_keys[-1] == "sample_time"
+    assert write_layout_for(cfg, "daily_clean").sort_keys == ["expiry", "right", "strike"]
+    assert write_layout_for(cfg, "unknown") is None
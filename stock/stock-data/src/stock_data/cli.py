@@ -13,14 +13,23 @@ from datetime import date, datetime, time as dtime, timedelta
 from zoneinfo import ZoneInfo
 
 from .config import load_config
-from .pipeline import (
-    CorporateActionsRunner,
-    DailyBarsRunner,
-    FundamentalsRunner,
-    VolatilityRunner,
+from .util.lazy import LazyAttr, lazy_import
+
+# Runners and storage helpers pull in pandas, pyarrow and ib_insync; bind them lazily so
+# ``--help`` and launchd start-ups do not pay that import cost.
+CorporateActionsRunner, DailyBarsRunner, FundamentalsRunner, VolatilityRunner = lazy_import(
+    "stock_data.pipeline",
+    "CorporateActionsRunner",
+    "DailyBarsRunner",
+    "FundamentalsRunner",
+    "VolatilityRunner",
 )
-from .pipeline.fundamentals import DEFAULT_FMP_BASE_URL
-from .universe import load_universe
+DEFAULT_FMP_BASE_URL = LazyAttr("stock_data.pipeline.fundamentals", "DEFAULT_FMP_BASE_URL")
+SeriesStore = LazyAttr("stock_data.storage", "SeriesStore")
+partition_manifest, write_table_atomic = lazy_import(
+    "stock_data.storage.manifest", "partition_manifest", "write_table_atomic"
+)
+load_universe = LazyAttr("stock_data.universe", "load_universe")
 
 
 app = typer.Typer(add_completion=False, help="stock-data CLI entrypoint")
@@ -197,10 +206,11 @@ def volatility(
     poll_interval: float = 0.25,
     throttle_sec: float = 0.7,
     batch_size: int = 50,
+    concurrency: int = typer.Option(8, help="Max IB requests in flight per batch."),
 ) -> None:
     """Fetch daily IV/HV snapshot or backfill history."""
     cfg = _load_cfg(config)
-    runner = VolatilityRunner(cfg, throttle_sec=throttle_sec)
+    runner = VolatilityRunner(cfg, throttle_sec=throttle_sec, concurrency=concurrency)
     symbol_list = [s.strip().upper() for s in symbols.split(",") if s.strip()] or None
 
     mode_norm = mode.strip().lower()
@@ -279,6 +289,11 @@ def cleanup(
 
     price_root = cfg.paths.clean / "view=daily_bars"
     vol_root = cfg.paths.clean / "view=volatility"
+    series = None
+    if cfg.storage.volatility_layout == "series":
+        # Volatility lives in per-symbol series files; they are read, never deleted here
+        vol_root = cfg.paths.clean / "view=volatility_series"
+        series = SeriesStore(cfg, vol_root, granularity=cfg.storage.series_granularity)
     merged_root = cfg.paths.clean / f"view={merged_view}"
 
     log_fh = None
@@ -340,8 +355,31 @@ def cleanup(
                     groups.setdefault(key, []).extend(sorted(exchange_dir.glob("part-*.parquet")))
         return groups, date_dirs
 
+    def _collect_series() -> dict[tuple[str, str, int, int], list[Path]]:
+        groups: dict[tuple[str, str, int, int], list[Path]] = {}
+        for symbol, exchange in series.keys():
+            first, last = series.watermark(symbol, exchange)
+            month = _month_start(first)
+            while month < cutoff and month <= last:
+                key = (symbol, exchange, month.year, month.month)
+                groups[key] = series.files(symbol, exchange, month, month)
+                month = _shift_months(month, 1)
+        return groups
+
+    def _read_volatility(key: tuple[str, str, int, int], files: list[Path]) -> list:
+        if series is None:
+            return [pd.read_parquet(path) for path in files]
+        symbol, exchange, year, month = key
+        start = date(year, month, 1)
+        end = _shift_months(start, 1) - timedelta(days=1)
+        frame = series.read([symbol], exchange, start, end)
+        return [frame] if not frame.empty else []
+
     price_groups, price_dates = _collect_files(price_root)
-    vol_groups, vol_dates = _collect_files(vol_root)
+    if series is None:
+        vol_groups, vol_dates = _collect_files(vol_root)
+    else:
+        vol_groups, vol_dates = _collect_series(), set()
     all_keys = sorted({*price_groups.keys(), *vol_groups.keys()})
     if not all_keys:
         typer.echo("[cleanup] no partitions older than cutoff")
@@ -352,7 +390,6 @@ def cleanup(
 
     import pandas as pd  # type: ignore
     import pyarrow as pa  # type: ignore
-    import pyarrow.parquet as pq  # type: ignore
 
     codec = cfg.storage.cold_codec
     options = {}
@@ -403,8 +440,7 @@ def cleanup(
                 price_frames.append(pd.read_parquet(output_path))
             for path in price_files:
                 price_frames.append(pd.read_parquet(path))
-            for path in vol_files:
-                vol_frames.append(pd.read_parquet(path))
+            vol_frames.extend(_read_volatility(key, vol_files))
             price_df = pd.concat(price_frames, ignore_index=True) if price_frames else pd.DataFrame()
             vol_df = pd.concat(vol_frames, ignore_index=True) if vol_frames else pd.DataFrame()
             if price_df.empty and vol_df.empty:
@@ -471,7 +507,7 @@ def cleanup(
 
             month_dir.mkdir(parents=True, exist_ok=True)
             table = pa.Table.from_pandas(merged, preserve_index=False)
-            pq.write_table(table, output_path, compression=codec, **options)
+            write_table_atomic(table, output_path, compression=codec, **options)
             typer.echo(
                 f"[cleanup] merged {symbol} {exchange} {year}-{month:02d} rows={len(merged)}"
             )
@@ -505,6 +541,10 @@ def cleanup(
             for date_dir in sorted(price_dates | vol_dates):
                 shutil.rmtree(date_dir)
                 typer.echo(f"[cleanup] deleted {date_dir}")
+            for view_root in (price_root, vol_root):
+                manifest = partition_manifest(view_root)
+                if manifest.initialized:
+                    manifest.rebuild()
         _log(
             {
                 "event": "source_cleanup",
@@ -617,10 +657,14 @@ def fundamentals(
     throttle_sec: float = 5.0,
     fmp_api_key: str = "",
     max_symbols: int = 0,
+    requests_per_minute: float = typer.Option(
+        300.0, help="FMP plan request rate; 0 falls back to --throttle-sec pacing."
+    ),
+    max_workers: int = typer.Option(4, help="Concurrent FMP requests."),
 ) -> None:
     """Fetch fundamentals reports and store raw JSON."""
     cfg = _load_cfg(config)
-    _check_fmp_dns(DEFAULT_FMP_BASE_URL)
+    _check_fmp_dns(DEFAULT_FMP_BASE_URL.resolve())
     target_date = _parse_trade_date(trade_date, cfg.timezone.name)
     symbol_list = [s.strip().upper() for s in symbols.split(",") if s.strip()] or None
     types = [t.strip() for t in report_types.split(",") if t.strip()] or None
@@ -628,6 +672,8 @@ def fundamentals(
         cfg,
         throttle_sec=throttle_sec,
         fmp_api_key=fmp_api_key.strip() or None,
+        requests_per_minute=requests_per_minute,
+        max_workers=max_workers,
     )
     result = runner.run(
         trade_date=target_date,
@@ -656,6 +702,46 @@ def corporate_actions(config: str = "config/stock-data.toml") -> None:
         typer.echo(f"errors={len(result.errors)}", err=True)
 
 
+@app.command("manifest")
+def manifest(
+    config: str = "config/stock-data.toml",
+    views: str = typer.Option("daily_bars,volatility", help="Comma-separated views to index."),
+) -> None:
+    """Rebuild per-view partition manifests from the files on disk."""
+    cfg = _load_cfg(config)
+    for view in [v.strip() for v in views.split(",") if v.strip()]:
+        target = partition_manifest(cfg.paths.clean / f"view={view}")
+        typer.echo(f"[manifest] {target.path} files={target.rebuild()}")
+
+
+@app.command("volatility-series")
+def volatility_series(
+    config: str = "config/stock-data.toml",
+    migrate: bool = typer.Option(
+        False, help="Fold existing view=volatility date partitions into the series layout."
+    ),
+) -> None:
+    """Rebuild the volatility series watermarks, optionally migrating date partitions first."""
+    cfg = _load_cfg(config)
+    store = SeriesStore(
+        cfg,
+        cfg.paths.clean / "view=volatility_series",
+        granularity=cfg.storage.series_granularity,
+    )
+    if migrate:
+        import pandas as pd  # type: ignore
+
+        source = cfg.paths.clean / "view=volatility"
+        by_symbol: dict[str, list[Path]] = {}
+        for path in sorted(source.glob("date=*/symbol=*/exchange=*/part-*.parquet")):
+            by_symbol.setdefault(path.parents[1].name, []).append(path)
+        for symbol_dir, files in sorted(by_symbol.items()):
+            frame = pd.concat([pd.read_parquet(path) for path in files], ignore_index=True)
+            store.append(frame)
+            typer.echo(f"[volatility-series] {symbol_dir} files={len(files)} rows={len(frame)}")
+    typer.echo(f"[volatility-series] {store.index_path} symbols={store.rebuild_watermarks()}")
+
+
 def main() -> None:
     app()
 
@@ -65,6 +65,9 @@ class StorageConfig:
     cold_codec: str
     cold_codec_level: int
     hot_codec: str
+    # "date": one file per date/symbol; "series": per-symbol yearly/monthly files
+    volatility_layout: str = "date"
+    series_granularity: str = "year"
 
 
 @dataclass
@@ -212,7 +215,13 @@ def load_config(path: Path) -> AppConfig:
         cold_codec=str(storage_cfg.get("cold_codec", "zstd")),
         cold_codec_level=int(storage_cfg.get("cold_codec_level", 7)),
         hot_codec=str(storage_cfg.get("hot_codec", "snappy")),
+        volatility_layout=str(storage_cfg.get("volatility_layout", "date")).strip().lower(),
+        series_granularity=str(storage_cfg.get("series_granularity", "year")).strip().lower(),
     )
+    if storage.volatility_layout not in {"date", "series"}:
+        raise ValueError(f"Invalid storage.volatility_layout: {storage.volatility_layout}")
+    if storage.series_granularity not in {"year", "month"}:
+        raise ValueError(f"Invalid storage.series_granularity: {storage.series_granularity}")
     mcp = MCPConfig(
         limit=int(mcp_cfg.get("limit", 200)),
         days=int(mcp_cfg.get("days", 3)),
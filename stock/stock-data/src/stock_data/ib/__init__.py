@@ -1,14 +1,24 @@
 from .client_id import ClientIdAllocator
-from .history import HistoricalBars, Throttle, fetch_daily_bars, make_throttle
+from .history import (
+    AsyncPacer,
+    HistoricalBars,
+    Throttle,
+    fetch_daily_bars,
+    fetch_daily_bars_async,
+    make_throttle,
+)
 from .session import IBSession
-from .volatility import fetch_iv_snapshot
+from .volatility import fetch_iv_snapshot, fetch_iv_snapshot_async
 
 __all__ = [
+    "AsyncPacer",
     "ClientIdAllocator",
     "HistoricalBars",
     "Throttle",
     "fetch_daily_bars",
+    "fetch_daily_bars_async",
     "make_throttle",
     "fetch_iv_snapshot",
+    "fetch_iv_snapshot_async",
     "IBSession",
 ]
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import time
 from typing import Any, Callable, Sequence, TYPE_CHECKING
 
@@ -27,6 +28,32 @@ def make_throttle(min_interval_sec: float = 0.35) -> Throttle:
     return wait
 
 
+class AsyncPacer:
+    """Pacing budget for concurrent requests on one IB connection.
+
+    Request starts are spaced at least ``min_interval_sec`` apart (the same budget
+    ``make_throttle`` enforces serially) and at most ``max_inflight`` requests are
+    outstanding, so wall time is bounded by pacing rather than round-trip latency.
+    """
+
+    def __init__(self, min_interval_sec: float = 0.35, max_inflight: int = 8) -> None:
+        self.min_interval_sec = min_interval_sec
+        self._inflight = asyncio.Semaphore(max(int(max_inflight), 1))
+        self._next_start = 0.0
+
+    async def __aenter__(self) -> "AsyncPacer":
+        await self._inflight.acquire()
+        now = time.monotonic()
+        start = max(now, self._next_start)
+        self._next_start = start + self.min_interval_sec
+        if start > now:
+            await asyncio.sleep(start - now)
+        return self
+
+    async def __aexit__(self, *_: Any) -> None:
+        self._inflight.release()
+
+
 def fetch_daily_bars(
     ib: "IB",
     contract: "Contract",
@@ -56,4 +83,46 @@ def fetch_daily_bars(
     return list(bars) if bars else []
 
 
-__all__ = ["HistoricalBars", "Throttle", "make_throttle", "fetch_daily_bars"]
+async def fetch_daily_bars_async(
+    ib: "IB",
+    contract: "Contract",
+    *,
+    what_to_show: str = "TRADES",
+    duration: str = "2 D",
+    bar_size: str = "1 day",
+    end_date_time: str = "",
+    use_rth: bool = True,
+    format_date: int = 2,
+    pacer: AsyncPacer | None = None,
+    timeout: float = 60.0,
+) -> list[Any]:
+    """Async variant of ``fetch_daily_bars`` paced by *pacer* instead of a sleep."""
+
+    async def _request() -> list[Any]:
+        bars = await ib.reqHistoricalDataAsync(
+            contract,
+            endDateTime=end_date_time,
+            durationStr=duration,
+            barSizeSetting=bar_size,
+            whatToShow=what_to_show,
+            useRTH=use_rth,
+            formatDate=format_date,
+            keepUpToDate=False,
+            timeout=timeout,
+        )
+        return list(bars) if bars else []
+
+    if pacer is None:
+        return await _request()
+    async with pacer:
+        return await _request()
+
+
+__all__ = [
+    "AsyncPacer",
+    "HistoricalBars",
+    "Throttle",
+    "make_throttle",
+    "fetch_daily_bars",
+    "fetch_daily_bars_async",
+]
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import math
 import time
 from typing import Any
@@ -38,4 +39,42 @@ def fetch_iv_snapshot(
     return value
 
 
-__all__ = ["fetch_iv_snapshot"]
+def _valid_iv(value: Any) -> bool:
+    return value is not None and not (isinstance(value, float) and math.isnan(value))
+
+
+async def fetch_iv_snapshot_async(
+    ib: Any,
+    contract: Any,
+    *,
+    generic_ticks: str = "106",
+    timeout: float = 12.0,
+) -> float | None:
+    """Await the first tick-106 IV update instead of polling; None on timeout."""
+
+    ticker: Ticker = ib.reqMktData(
+        contract,
+        genericTickList=generic_ticks,
+        snapshot=False,
+        regulatorySnapshot=False,
+        mktDataOptions=[],
+    )
+
+    async def _wait() -> None:
+        while not _valid_iv(getattr(ticker, "impliedVolatility", None)):
+            await ticker.updateEvent
+
+    try:
+        await asyncio.wait_for(_wait(), timeout)
+    except asyncio.TimeoutError:
+        pass
+    finally:
+        try:
+            ib.cancelMktData(contract)
+        except Exception:
+            pass
+    value = getattr(ticker, "impliedVolatility", None)
+    return value if _valid_iv(value) else None
+
+
+__all__ = ["fetch_iv_snapshot", "fetch_iv_snapshot_async"]
@@ -12,7 +12,7 @@ import pandas as pd
 from ..config import AppConfig
 from ..ib import IBSession, fetch_daily_bars, make_throttle
 from ..storage import ParquetWriter, existing_partition_dates, partition_for
-from ..universe import load_universe
+from ..universe import Universe
 
 logger = logging.getLogger(__name__)
 
@@ -163,8 +163,7 @@ class DailyBarsRunner:
         ingest_id = str(uuid.uuid4())
 
         if symbols is None:
-            universe = load_universe(self.cfg.universe.file)
-            symbols = [entry.symbol for entry in universe]
+            symbols = Universe.load(self.cfg.universe.file).symbols
 
         errors: list[dict[str, Any]] = []
         paths: list[str] = []
@@ -293,8 +292,7 @@ class DailyBarsRunner:
         ingest_id = str(uuid.uuid4())
 
         if symbols is None:
-            universe = load_universe(self.cfg.universe.file)
-            symbols = [entry.symbol for entry in universe]
+            symbols = Universe.load(self.cfg.universe.file).symbols
 
         errors: list[dict[str, Any]] = []
         paths: list[str] = []
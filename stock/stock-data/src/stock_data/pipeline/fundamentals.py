@@ -6,21 +6,23 @@ import json
 import logging
 import os
 import random
+import threading
 import time
 import uuid
-from dataclasses import dataclass
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import date, datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any, Iterable, List
 from zoneinfo import ZoneInfo
 
 import pandas as pd
-import requests
 
 from ..config import AppConfig
-from ..ib import make_throttle
-from ..storage import ParquetWriter, partition_for
-from ..universe import load_universe
+from ..storage import FundamentalsStore, ParquetWriter, partition_for
+from ..storage.fundamentals_store import FUNDAMENTALS_DB_FILENAME
+from ..universe import Universe
+from .fmp_http import TokenBucket, make_session
 
 logger = logging.getLogger(__name__)
 
@@ -45,6 +47,7 @@ DEFAULT_INFO_REFRESH_DAYS = 30
 DEFAULT_STATEMENT_REFRESH_DAYS = 85
 DEFAULT_STATEMENT_LIMIT = 20
 DEFAULT_STATEMENT_PERIOD = "quarter"
+DEFAULT_MAX_WORKERS = 4
 
 STATEMENT_REPORT_TYPES = {"financials", "balance_sheet", "cashflow"}
 
@@ -63,6 +66,31 @@ class DailyBudgetExceeded(RuntimeError):
     pass
 
 
+@dataclass
+class _RunContext:
+    """Per-run values shared by the report helpers of ``FundamentalsRunner.run``."""
+
+    ingest_id: str
+    target_date: date
+    exchange: str
+    now_iso: str
+    force_refresh: bool
+    cache_ttl_days: int | None
+    rows_written: int = 0
+    paths: list[str] = field(default_factory=list)
+    errors: list[dict[str, Any]] = field(default_factory=list)
+
+    def result(self, symbols_processed: int) -> FundamentalsResult:
+        return FundamentalsResult(
+            ingest_id=self.ingest_id,
+            trade_date=self.target_date,
+            symbols_processed=symbols_processed,
+            rows_written=self.rows_written,
+            paths=self.paths,
+            errors=self.errors,
+        )
+
+
 def _parse_min_fields(report_type: str, payload: Any) -> dict[str, Any]:
     if report_type != "info" or not isinstance(payload, dict):
         return {"asof_date": None}
@@ -109,13 +137,21 @@ class FundamentalsRunner:
         statement_limit: int = DEFAULT_STATEMENT_LIMIT,
         statement_period: str = DEFAULT_STATEMENT_PERIOD,
         state_path: Path | None = None,
+        store_path: Path | None = None,
+        requests_per_minute: float = 0.0,
+        max_workers: int = DEFAULT_MAX_WORKERS,
     ) -> None:
         self.cfg = cfg
         self._writer = writer or ParquetWriter(cfg)
         self._now_fn = now_fn or (lambda: datetime.now(ZoneInfo(cfg.timezone.name)))
-        self._throttle = make_throttle(throttle_sec)
-        self._cache_dir = cfg.paths.state / "fundamentals_cache"
-        self._cache_dir.mkdir(parents=True, exist_ok=True)
+        # requests_per_minute matches the FMP plan limit; throttle_sec is the legacy pacing
+        self._max_workers = max(int(max_workers), 1)
+        if requests_per_minute > 0:
+            rate = requests_per_minute / 60.0
+        else:
+            rate = 1.0 / throttle_sec if throttle_sec > 0 else 0.0
+        self._rate = TokenBucket(rate, capacity=self._max_workers)
+        self._session = make_session(self._max_workers)
         self._api_key = fmp_api_key or os.getenv("FMP_API_KEY") or DEFAULT_FMP_API_KEY
         self._base_url = fmp_base_url.rstrip("/")
         self._daily_call_limit = max(int(daily_call_limit), 0)
@@ -124,38 +160,29 @@ class FundamentalsRunner:
         self._statement_refresh_days = max(int(statement_refresh_days), 0)
         self._statement_limit = max(int(statement_limit), 0)
         self._statement_period = statement_period
+        # Legacy JSON state/cache locations, imported once into the SQLite store
         self._state_path = state_path or (cfg.paths.state / DEFAULT_FUNDAMENTALS_STATE_FILE)
-        self._state_path.parent.mkdir(parents=True, exist_ok=True)
+        self._cache_dir = cfg.paths.state / "fundamentals_cache"
+        self._store = FundamentalsStore(store_path or (cfg.paths.state / FUNDAMENTALS_DB_FILENAME))
+        self._state_lock = threading.Lock()
+        self._dirty: set[tuple[str, str]] = set()
         self._state = self._load_state()
 
     def _load_state(self) -> dict[str, Any]:
-        default_state: dict[str, Any] = {
-            "version": 1,
-            "last_run_date": None,
-            "daily_calls": 0,
-            "symbols": {},
-        }
-        if not self._state_path.exists():
-            return default_state
-        try:
-            payload = json.loads(self._state_path.read_text(encoding="utf-8"))
-        except Exception:
-            return default_state
-        if not isinstance(payload, dict):
-            return default_state
-        payload.setdefault("version", 1)
-        payload.setdefault("last_run_date", None)
-        payload.setdefault("daily_calls", 0)
-        symbols = payload.get("symbols")
-        if not isinstance(symbols, dict):
-            payload["symbols"] = {}
-        return payload
+        if self._store.is_empty() and (self._state_path.exists() or self._cache_dir.exists()):
+            imported = self._store.import_legacy(self._state_path, self._cache_dir)
+            logger.info(
+                "Imported %s legacy fundamentals cache files into %s", imported, self._store.db_path
+            )
+        return self._store.load_state()
 
     def _save_state(self) -> None:
         try:
-            self._state_path.write_text(json.dumps(self._state), encoding="utf-8")
+            with self._state_lock:
+                dirty, self._dirty = self._dirty, set()
+                self._store.save_state(self._state, dirty)
         except Exception as exc:
-            logger.warning("Failed to write fundamentals state %s: %s", self._state_path, exc)
+            logger.warning("Failed to write fundamentals state %s: %s", self._store.db_path, exc)
 
     def _reset_daily_state(self, target_date: date) -> None:
         date_key = target_date.isoformat()
@@ -171,9 +198,11 @@ class FundamentalsRunner:
         return max(self._daily_call_limit - daily_calls, 0)
 
     def _consume_call(self, label: str = "") -> None:
-        if self._remaining_calls() <= 0:
-            raise DailyBudgetExceeded("Daily call budget reached")
-        self._state["daily_calls"] = int(self._state.get("daily_calls", 0)) + 1
+        # Called from worker threads: check-and-increment must be atomic
+        with self._state_lock:
+            if self._remaining_calls() <= 0:
+                raise DailyBudgetExceeded("Daily call budget reached")
+            self._state["daily_calls"] = int(self._state.get("daily_calls", 0)) + 1
 
     def _calls_for_report_type(self, report_type: str) -> int:
         if report_type == "info":
@@ -214,6 +243,7 @@ class FundamentalsRunner:
     def _update_report_state(self, symbol: str, report_type: str, **updates: Any) -> None:
         report_state = self._report_state(symbol, report_type)
         report_state.update(updates)
+        self._dirty.add((symbol, report_type))
 
     def _latest_payload_meta(self, payload: Any) -> tuple[date | None, str | None, int]:
         if isinstance(payload, list) and payload:
@@ -225,19 +255,12 @@ class FundamentalsRunner:
             return None, None, 1
         return None, None, 0
 
-    def _load_cached_payload(self, cache_path: str | None) -> dict[str, Any] | None:
-        if not cache_path:
-            return None
-        path = Path(cache_path)
-        if not path.exists():
-            return None
-        try:
-            payload = json.loads(path.read_text(encoding="utf-8"))
-        except Exception:
-            return None
-        if not isinstance(payload, dict) or "raw_json" not in payload:
+    def _load_cached_payload(
+        self, symbol: str, report_type: str, cache_date: str | None
+    ) -> dict[str, Any] | None:
+        if not cache_date:
             return None
-        return payload
+        return self._store.get_payload(symbol, report_type, cache_date)
 
     def _should_fetch_report(
         self,
@@ -277,25 +300,65 @@ class FundamentalsRunner:
         max_symbols: int | None = None,
     ) -> FundamentalsResult:
         target_date = trade_date or self._now_fn().date()
-        ingest_id = str(uuid.uuid4())
-        errors: list[dict[str, Any]] = []
+        ctx = _RunContext(
+            ingest_id=str(uuid.uuid4()),
+            target_date=target_date,
+            exchange=exchange,
+            now_iso=datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
+            force_refresh=force_refresh,
+            cache_ttl_days=cache_ttl_days,
+        )
 
         if symbols is None:
-            universe = load_universe(self.cfg.universe.file)
-            symbols = [entry.symbol for entry in universe]
+            symbols = Universe.load(self.cfg.universe.file).symbols
         if max_symbols is not None:
             symbols = symbols[: max(max_symbols, 0)]
         if not self._api_key:
-            errors.append({"error": "missing_api_key", "message": "FMP API key is required"})
-            return FundamentalsResult(
-                ingest_id=ingest_id,
-                trade_date=target_date,
-                symbols_processed=0,
-                rows_written=0,
-                paths=[],
-                errors=errors,
-            )
+            ctx.errors.append({"error": "missing_api_key", "message": "FMP API key is required"})
+            return ctx.result(0)
+
+        types = self._resolve_report_types(report_types, ctx.errors)
+        if not types:
+            return ctx.result(0)
 
+        self._reset_daily_state(target_date)
+        symbols_processed = 0
+        stopped_early = False
+        window = self._max_workers * 4
+        upper_symbols = [symbol.upper() for symbol in symbols]
+        with ThreadPoolExecutor(
+            max_workers=self._max_workers, thread_name_prefix="fmp"
+        ) as executor:
+            for offset in range(0, len(upper_symbols), window):
+                chunk = upper_symbols[offset : offset + window]
+                pending, budget_stop = self._prefetch(
+                    executor,
+                    chunk,
+                    types,
+                    target_date,
+                    force_refresh=force_refresh,
+                    cache_ttl_days=cache_ttl_days,
+                )
+                for symbol in chunk:
+                    stopped_early = self._process_symbol(ctx, symbol, types, pending, budget_stop)
+                    symbols_processed += 1
+                    self._save_state()
+                    if stopped_early:
+                        break
+                for futures in pending.values():
+                    for future in futures:
+                        future.cancel()
+                if stopped_early:
+                    break
+
+        if cache_ttl_days is not None:
+            self._prune_cache(cache_ttl_days)
+        return ctx.result(symbols_processed)
+
+    @staticmethod
+    def _resolve_report_types(
+        report_types: Iterable[str] | None, errors: list[dict[str, Any]]
+    ) -> list[str]:
         raw_types = list(report_types) if report_types else list(DEFAULT_REPORT_TYPES)
         types: list[str] = []
         for report_type in raw_types:
@@ -309,245 +372,235 @@ class FundamentalsRunner:
                         "message": "Report type is not supported by FMP fundamentals",
                     }
                 )
-        if not types:
-            return FundamentalsResult(
-                ingest_id=ingest_id,
-                trade_date=target_date,
-                symbols_processed=0,
-                rows_written=0,
-                paths=[],
-                errors=errors,
-            )
+        return types
 
-        self._reset_daily_state(target_date)
-        paths: list[str] = []
-        rows_written = 0
-        symbols_processed = 0
-        stopped_early = False
-        now_iso = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+    def _process_symbol(
+        self,
+        ctx: _RunContext,
+        symbol: str,
+        types: list[str],
+        pending: dict[tuple[str, str], list[Future]],
+        budget_stop: tuple[str, str] | None,
+    ) -> bool:
+        """Write every due report of one symbol; True when the daily budget ran out."""
+        for report_type in types:
+            should_fetch, skip_reason = self._should_fetch_report(
+                symbol, report_type, ctx.target_date, force_refresh=ctx.force_refresh
+            )
+            if not should_fetch:
+                report = self._reuse_report(ctx, symbol, report_type, skip_reason)
+            elif (symbol, report_type) == budget_stop:
+                self._record_budget_stop(ctx, symbol, report_type)
+                return True
+            else:
+                try:
+                    report = self._obtain_report(ctx, symbol, report_type, pending)
+                except DailyBudgetExceeded:
+                    self._record_budget_stop(ctx, symbol, report_type)
+                    return True
+            if report is not None:
+                payload, raw_json = report
+                self._write_report(ctx, symbol, report_type, payload, raw_json)
+        return False
+
+    def _reuse_report(
+        self, ctx: _RunContext, symbol: str, report_type: str, skip_reason: str
+    ) -> tuple[Any, str] | None:
+        """Payload of a report that is not due, from the last cached copy if still fresh."""
+        report_state = self._report_state(symbol, report_type)
+        cached_state_payload = self._load_cached_payload(
+            symbol, report_type, report_state.get("last_cache_date")
+        )
+        cached_at = None
+        if cached_state_payload is not None and ctx.cache_ttl_days is not None:
+            cached_at = self._parse_datetime(cached_state_payload.get("cached_at"))
+            if cached_at is None:
+                cached_state_payload = None
+            else:
+                age = datetime.now(timezone.utc) - cached_at
+                if age > timedelta(days=ctx.cache_ttl_days):
+                    cached_state_payload = None
+        payload = None
+        raw_json = ""
+        if cached_state_payload is not None:
+            raw_json = cached_state_payload.get("raw_json", "")
+            try:
+                payload = json.loads(raw_json)
+            except json.JSONDecodeError:
+                payload = None
+        if payload in ({}, [], None):
+            self._update_report_state(
+                symbol,
+                report_type,
+                last_attempt_at=ctx.now_iso,
+                status=f"skipped_{skip_reason}",
+            )
+            return None
+        if cached_at is None:
+            cached_at = datetime.now(timezone.utc)
+        self._record_payload_state(
+            ctx,
+            symbol,
+            report_type,
+            payload,
+            status=f"cache_reuse_{skip_reason}",
+            last_fetch_at=cached_at,
+        )
+        return payload, raw_json
 
-        for symbol in symbols:
-            symbol = symbol.upper()
-            for report_type in types:
-                should_fetch, skip_reason = self._should_fetch_report(
+    def _obtain_report(
+        self,
+        ctx: _RunContext,
+        symbol: str,
+        report_type: str,
+        pending: dict[tuple[str, str], list[Future]],
+    ) -> tuple[Any, str] | None:
+        """Payload of a due report from today's cache or the network (None when missing).
+
+        Raises ``DailyBudgetExceeded`` when a serial fetch runs out of daily calls.
+        """
+        cache_payload = self._load_cache(
+            symbol,
+            ctx.target_date,
+            report_type,
+            force_refresh=ctx.force_refresh,
+            cache_ttl_days=ctx.cache_ttl_days,
+        )
+        if cache_payload is not None:
+            logger.info(
+                "fundamentals cache hit symbol=%s report_type=%s date=%s",
+                symbol,
+                report_type,
+                ctx.target_date.isoformat(),
+            )
+            raw_json = cache_payload["raw_json"]
+            try:
+                payload = json.loads(raw_json)
+            except json.JSONDecodeError:
+                payload = None
+            if payload not in ({}, [], None):
+                self._record_payload_state(
+                    ctx,
                     symbol,
                     report_type,
-                    target_date,
-                    force_refresh=force_refresh,
+                    payload,
+                    status="cache_hit",
+                    last_fetch_at=self._parse_datetime(cache_payload.get("cached_at")),
+                    cache_date=ctx.target_date.isoformat(),
                 )
-                if not should_fetch:
-                    report_state = self._report_state(symbol, report_type)
-                    cached_state_payload = self._load_cached_payload(
-                        report_state.get("last_cache_path")
-                    )
-                    cached_at = None
-                    if cached_state_payload is not None and cache_ttl_days is not None:
-                        cached_at = self._parse_datetime(cached_state_payload.get("cached_at"))
-                        if cached_at is None:
-                            cached_state_payload = None
-                        else:
-                            age = datetime.now(timezone.utc) - cached_at
-                            if age > timedelta(days=cache_ttl_days):
-                                cached_state_payload = None
-                    payload = None
-                    raw_json = ""
-                    if cached_state_payload is not None:
-                        raw_json = cached_state_payload.get("raw_json", "")
-                        try:
-                            payload = json.loads(raw_json)
-                        except json.JSONDecodeError:
-                            payload = None
-                    if payload in ({}, [], None):
-                        self._update_report_state(
-                            symbol,
-                            report_type,
-                            last_attempt_at=now_iso,
-                            status=f"skipped_{skip_reason}",
-                        )
-                        continue
-                    status = f"cache_reuse_{skip_reason}"
-                    if cached_at is None:
-                        cached_at = datetime.now(timezone.utc)
-                    last_payload_date, last_period, payload_count = self._latest_payload_meta(
-                        payload
-                    )
-                    self._update_report_state(
-                        symbol,
-                        report_type,
-                        last_attempt_at=now_iso,
-                        last_fetch_at=cached_at.isoformat().replace("+00:00", "Z"),
-                        last_payload_date=last_payload_date.isoformat()
-                        if last_payload_date
-                        else None,
-                        last_period=last_period,
-                        payload_count=payload_count,
-                        status=status,
-                    )
-                else:
-                    calls_needed = self._calls_for_report_type(report_type)
-                    if self._remaining_calls() < calls_needed:
-                        self._update_report_state(
-                            symbol,
-                            report_type,
-                            last_attempt_at=now_iso,
-                            status="skipped_budget",
-                        )
-                        errors.append(
-                            {
-                                "symbol": symbol,
-                                "report_type": report_type,
-                                "error": "daily_budget_exceeded",
-                                "message": "Daily call budget reached",
-                            }
-                        )
-                        stopped_early = True
-                        break
+                return payload, raw_json
 
-                    self._throttle()
-                    cache_payload = self._load_cache(
-                        symbol,
-                        target_date,
-                        report_type,
-                        force_refresh=force_refresh,
-                        cache_ttl_days=cache_ttl_days,
-                    )
-                    payload = None
-                    raw_json = ""
-                    cache_path: Path | None = None
-                    status = "fetched"
-                    last_fetch_at: datetime | None = None
-                    if cache_payload is not None:
-                        logger.info(
-                            "fundamentals cache hit symbol=%s report_type=%s date=%s",
-                            symbol,
-                            report_type,
-                            target_date.isoformat(),
-                        )
-                        raw_json = cache_payload["raw_json"]
-                        try:
-                            payload = json.loads(raw_json)
-                        except json.JSONDecodeError:
-                            payload = None
-                        if payload in ({}, [], None):
-                            payload = None
-                            raw_json = ""
-                            cache_payload = None
-                        else:
-                            status = "cache_hit"
-                            cached_at = self._parse_datetime(cache_payload.get("cached_at"))
-                            if cached_at is not None:
-                                last_fetch_at = cached_at
-                            cache_path = self._cache_path(symbol, target_date, report_type)
-                    if cache_payload is None:
-                        logger.info(
-                            "fundamentals cache miss symbol=%s report_type=%s date=%s",
-                            symbol,
-                            report_type,
-                            target_date.isoformat(),
-                        )
-                        try:
-                            payload = self._fetch_report(symbol, report_type)
-                        except DailyBudgetExceeded:
-                            self._update_report_state(
-                                symbol,
-                                report_type,
-                                last_attempt_at=now_iso,
-                                status="skipped_budget",
-                            )
-                            errors.append(
-                                {
-                                    "symbol": symbol,
-                                    "report_type": report_type,
-                                    "error": "daily_budget_exceeded",
-                                    "message": "Daily call budget reached",
-                                }
-                            )
-                            stopped_early = True
-                            break
-                        if payload is None or payload in ({}, []):
-                            errors.append(
-                                {
-                                    "symbol": symbol,
-                                    "report_type": report_type,
-                                    "error": "missing_report",
-                                    "message": "No payload returned",
-                                }
-                            )
-                            self._update_report_state(
-                                symbol,
-                                report_type,
-                                last_attempt_at=now_iso,
-                                status="missing_report",
-                            )
-                            continue
-
-                        raw_json = json.dumps(payload, ensure_ascii=False)
-                        cache_path = self._save_cache(symbol, target_date, report_type, raw_json)
-                        last_fetch_at = datetime.now(timezone.utc)
-
-                    last_payload_date, last_period, payload_count = self._latest_payload_meta(
-                        payload
-                    )
-                    self._update_report_state(
-                        symbol,
-                        report_type,
-                        last_attempt_at=now_iso,
-                        last_fetch_at=last_fetch_at.isoformat().replace("+00:00", "Z")
-                        if last_fetch_at
-                        else None,
-                        last_payload_date=last_payload_date.isoformat()
-                        if last_payload_date
-                        else None,
-                        last_period=last_period,
-                        payload_count=payload_count,
-                        last_cache_path=str(cache_path) if cache_path else None,
-                        status=status,
-                    )
-
-                parsed = _parse_min_fields(report_type, payload)
-                record = {
-                    "trade_date": target_date,
+        logger.info(
+            "fundamentals cache miss symbol=%s report_type=%s date=%s",
+            symbol,
+            report_type,
+            ctx.target_date.isoformat(),
+        )
+        futures = pending.pop((symbol, report_type), None)
+        if futures is None:
+            payload = self._fetch_report(symbol, report_type)
+        else:
+            payload = self._assemble_report(report_type, [future.result() for future in futures])
+        if payload is None or payload in ({}, []):
+            ctx.errors.append(
+                {
                     "symbol": symbol,
-                    "exchange": exchange,
                     "report_type": report_type,
-                    "asof_date": parsed.get("asof_date"),
-                    "raw_json": raw_json,
-                    "market_cap": parsed.get("market_cap"),
-                    "pe_ttm": parsed.get("pe_ttm"),
-                    "eps_ttm": parsed.get("eps_ttm"),
-                    "sector": parsed.get("sector"),
-                    "industry": parsed.get("industry"),
-                    "source": "FMP",
-                    "asof_ts": datetime.utcnow(),
-                    "ingest_id": ingest_id,
-                    "ingest_run_type": "eod",
-                    "data_quality_flag": [],
+                    "error": "missing_report",
+                    "message": "No payload returned",
                 }
+            )
+            self._update_report_state(
+                symbol, report_type, last_attempt_at=ctx.now_iso, status="missing_report"
+            )
+            return None
 
-                df = pd.DataFrame([record])
-                part = partition_for(
-                    self.cfg,
-                    self.cfg.paths.clean / "view=fundamentals",
-                    target_date,
-                    symbol,
-                    exchange,
-                )
-                path = self._writer.write_dataframe(df, part)
-                rows_written += len(df)
-                paths.append(str(path))
-            symbols_processed += 1
-            self._save_state()
-            if stopped_early:
-                break
+        raw_json = json.dumps(payload, ensure_ascii=False)
+        self._record_payload_state(
+            ctx,
+            symbol,
+            report_type,
+            payload,
+            status="fetched",
+            last_fetch_at=datetime.now(timezone.utc),
+            cache_date=self._save_cache(symbol, ctx.target_date, report_type, raw_json),
+        )
+        return payload, raw_json
 
-        return FundamentalsResult(
-            ingest_id=ingest_id,
-            trade_date=target_date,
-            symbols_processed=symbols_processed,
-            rows_written=rows_written,
-            paths=paths,
-            errors=errors,
+    def _record_payload_state(
+        self,
+        ctx: _RunContext,
+        symbol: str,
+        report_type: str,
+        payload: Any,
+        *,
+        status: str,
+        last_fetch_at: datetime | None,
+        cache_date: str | None = None,
+    ) -> None:
+        last_payload_date, last_period, payload_count = self._latest_payload_meta(payload)
+        updates: dict[str, Any] = {
+            "last_attempt_at": ctx.now_iso,
+            "last_fetch_at": last_fetch_at.isoformat().replace("+00:00", "Z")
+            if last_fetch_at
+            else None,
+            "last_payload_date": last_payload_date.isoformat() if last_payload_date else None,
+            "last_period": last_period,
+            "payload_count": payload_count,
+            "status": status,
+        }
+        # Reused reports keep pointing at the cache entry they were read from
+        if not status.startswith("cache_reuse_"):
+            updates["last_cache_date"] = cache_date
+        self._update_report_state(symbol, report_type, **updates)
+
+    def _record_budget_stop(self, ctx: _RunContext, symbol: str, report_type: str) -> None:
+        self._update_report_state(
+            symbol, report_type, last_attempt_at=ctx.now_iso, status="skipped_budget"
+        )
+        ctx.errors.append(
+            {
+                "symbol": symbol,
+                "report_type": report_type,
+                "error": "daily_budget_exceeded",
+                "message": "Daily call budget reached",
+            }
+        )
+
+    def _write_report(
+        self, ctx: _RunContext, symbol: str, report_type: str, payload: Any, raw_json: str
+    ) -> None:
+        parsed = _parse_min_fields(report_type, payload)
+        record = {
+            "trade_date": ctx.target_date,
+            "symbol": symbol,
+            "exchange": ctx.exchange,
+            "report_type": report_type,
+            "asof_date": parsed.get("asof_date"),
+            "raw_json": raw_json,
+            "market_cap": parsed.get("market_cap"),
+            "pe_ttm": parsed.get("pe_ttm"),
+            "eps_ttm": parsed.get("eps_ttm"),
+            "sector": parsed.get("sector"),
+            "industry": parsed.get("industry"),
+            "source": "FMP",
+            "asof_ts": datetime.utcnow(),
+            "ingest_id": ctx.ingest_id,
+            "ingest_run_type": "eod",
+            "data_quality_flag": [],
+        }
+
+        df = pd.DataFrame([record])
+        part = partition_for(
+            self.cfg,
+            self.cfg.paths.clean / "view=fundamentals",
+            ctx.target_date,
+            symbol,
+            ctx.exchange,
         )
+        path = self._writer.write_dataframe(df, part)
+        ctx.rows_written += len(df)
+        ctx.paths.append(str(path))
 
     def _fetch_with_retry(
         self,
@@ -563,7 +616,8 @@ class FundamentalsRunner:
         for attempt in range(1, max_attempts + 1):
             try:
                 self._consume_call()
-                resp = requests.get(url, params=params, timeout=20)
+                self._rate.acquire()
+                resp = self._session.get(url, params=params, timeout=20)
                 if resp.status_code == 429:
                     raise RuntimeError("FMP rate limit")
                 resp.raise_for_status()
@@ -590,36 +644,18 @@ class FundamentalsRunner:
             logger.warning("FMP fetch failed after retries: %s", last_exc)
         return None
 
-    def _fetch_report(self, symbol: str, report_type: str) -> dict[str, Any] | list[Any] | None:
+    def _report_requests(self, symbol: str, report_type: str) -> list[tuple[str, dict, str]]:
+        """(url, params, label) for each endpoint a report is assembled from."""
         symbol = symbol.upper()
         if report_type == "info":
-            profile = self._fetch_with_retry(
-                f"{self._base_url}/profile",
-                {"apikey": self._api_key, "symbol": symbol},
-                label=f"profile/{symbol}",
-            )
-            metrics = self._fetch_with_retry(
-                f"{self._base_url}/key-metrics-ttm",
-                {"apikey": self._api_key, "symbol": symbol},
-                label=f"key-metrics-ttm/{symbol}",
-            )
-            ratios = self._fetch_with_retry(
-                f"{self._base_url}/ratios-ttm",
-                {"apikey": self._api_key, "symbol": symbol},
-                label=f"ratios-ttm/{symbol}",
-            )
-            if profile is None and metrics is None:
-                return None
-            profile_row = profile[0] if isinstance(profile, list) and profile else {}
-            metrics_row = metrics[0] if isinstance(metrics, list) and metrics else {}
-            ratios_row = ratios[0] if isinstance(ratios, list) and ratios else {}
-            if not profile_row and not metrics_row and not ratios_row:
-                return None
-            return {
-                "profile": profile_row,
-                "metrics_ttm": metrics_row,
-                "ratios_ttm": ratios_row,
-            }
+            return [
+                (
+                    f"{self._base_url}/{endpoint}",
+                    {"apikey": self._api_key, "symbol": symbol},
+                    f"{endpoint}/{symbol}",
+                )
+                for endpoint in ("profile", "key-metrics-ttm", "ratios-ttm")
+            ]
 
         endpoint_map = {
             "financials": "income-statement",
@@ -631,7 +667,7 @@ class FundamentalsRunner:
         }
         endpoint = endpoint_map.get(report_type)
         if not endpoint:
-            return None
+            return []
 
         params = {"apikey": self._api_key, "symbol": symbol}
         if report_type in {"financials", "balance_sheet", "cashflow"}:
@@ -639,18 +675,81 @@ class FundamentalsRunner:
             params["period"] = self._statement_period
         if report_type == "calendar":
             params = {"apikey": self._api_key}
-        payload = self._fetch_with_retry(
-            f"{self._base_url}/{endpoint}",
-            params,
-            label=endpoint,
-        )
-        if payload in (None, [], {}):
+        return [(f"{self._base_url}/{endpoint}", params, endpoint)]
+
+    def _assemble_report(
+        self, report_type: str, payloads: list[Any]
+    ) -> dict[str, Any] | list[Any] | None:
+        if report_type == "info":
+            profile, metrics, ratios = payloads
+            if profile is None and metrics is None:
+                return None
+            profile_row = profile[0] if isinstance(profile, list) and profile else {}
+            metrics_row = metrics[0] if isinstance(metrics, list) and metrics else {}
+            ratios_row = ratios[0] if isinstance(ratios, list) and ratios else {}
+            if not profile_row and not metrics_row and not ratios_row:
+                return None
+            return {
+                "profile": profile_row,
+                "metrics_ttm": metrics_row,
+                "ratios_ttm": ratios_row,
+            }
+        if not payloads or payloads[0] in (None, [], {}):
             return None
-        return payload
+        return payloads[0]
 
-    def _cache_path(self, symbol: str, trade_date: date, report_type: str) -> Path:
-        safe_type = report_type.replace("/", "_")
-        return self._cache_dir / f"{symbol}_{trade_date.isoformat()}_{safe_type}.json"
+    def _fetch_report(self, symbol: str, report_type: str) -> dict[str, Any] | list[Any] | None:
+        payloads = [
+            self._fetch_with_retry(url, params, label=label)
+            for url, params, label in self._report_requests(symbol, report_type)
+        ]
+        return self._assemble_report(report_type, payloads)
+
+    def _submit_report(
+        self, executor: ThreadPoolExecutor, symbol: str, report_type: str
+    ) -> list[Future]:
+        # Endpoints of one report are independent: fetch them in parallel
+        return [
+            executor.submit(self._fetch_with_retry, url, params, label=label)
+            for url, params, label in self._report_requests(symbol, report_type)
+        ]
+
+    def _prefetch(
+        self,
+        executor: ThreadPoolExecutor,
+        symbols: list[str],
+        types: list[str],
+        target_date: date,
+        *,
+        force_refresh: bool,
+        cache_ttl_days: int | None,
+    ) -> tuple[dict[tuple[str, str], list[Future]], tuple[str, str] | None]:
+        """Start network fetches for a window of symbols, reserving the daily budget in order.
+
+        Returns the in-flight requests per (symbol, report_type) and the first pair the
+        budget cannot cover; the sequential pass stops there exactly as a serial run would.
+        """
+        pending: dict[tuple[str, str], list[Future]] = {}
+        available = self._remaining_calls()
+        cached: set[tuple[str, str]] = set()
+        if not force_refresh:
+            max_age = timedelta(days=cache_ttl_days) if cache_ttl_days is not None else None
+            cached = self._store.cached_keys(target_date, max_age)
+        for symbol in symbols:
+            for report_type in types:
+                should_fetch, _ = self._should_fetch_report(
+                    symbol, report_type, target_date, force_refresh=force_refresh
+                )
+                if not should_fetch:
+                    continue
+                calls_needed = self._calls_for_report_type(report_type)
+                if available < calls_needed:
+                    return pending, (symbol, report_type)
+                if (symbol, report_type) in cached:
+                    continue
+                available -= calls_needed
+                pending[(symbol, report_type)] = self._submit_report(executor, symbol, report_type)
+        return pending, None
 
     def _load_cache(
         self,
@@ -663,45 +762,27 @@ class FundamentalsRunner:
     ) -> dict[str, Any] | None:
         if force_refresh:
             return None
-        path = self._cache_path(symbol, trade_date, report_type)
-        if not path.exists():
-            return None
+        max_age = timedelta(days=cache_ttl_days) if cache_ttl_days is not None else None
+        return self._store.get_payload(symbol, report_type, trade_date, max_age)
+
+    def _prune_cache(self, cache_ttl_days: int) -> None:
+        # Payloads past the TTL are never served again (cache hits and reuse both check it)
         try:
-            payload = json.loads(path.read_text(encoding="utf-8"))
-        except Exception:
-            return None
-        if not isinstance(payload, dict) or "raw_json" not in payload:
-            return None
-        if cache_ttl_days is not None:
-            cached_at = payload.get("cached_at")
-            if isinstance(cached_at, str):
-                try:
-                    cached_dt = datetime.fromisoformat(cached_at.replace("Z", "+00:00"))
-                    if cached_dt.tzinfo is None:
-                        cached_dt = cached_dt.replace(tzinfo=timezone.utc)
-                    now = datetime.now(timezone.utc)
-                    if now - cached_dt > timedelta(days=cache_ttl_days):
-                        return None
-                except ValueError:
-                    return None
-        return payload
+            pruned = self._store.prune_payloads(timedelta(days=cache_ttl_days))
+        except Exception as exc:
+            logger.warning("Failed to prune fundamentals cache %s: %s", self._store.db_path, exc)
+            return
+        if pruned:
+            logger.info("Pruned %s expired fundamentals payloads", pruned)
 
     def _save_cache(
         self, symbol: str, trade_date: date, report_type: str, raw_json: str
-    ) -> Path | None:
-        path = self._cache_path(symbol, trade_date, report_type)
-        payload = {
-            "symbol": symbol,
-            "trade_date": trade_date.isoformat(),
-            "report_type": report_type,
-            "raw_json": raw_json,
-            "cached_at": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
-        }
+    ) -> str | None:
         if raw_json in ("", "{}", "[]", "null"):
             return None
         try:
-            path.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
-            return path
+            self._store.put_payload(symbol, report_type, trade_date, raw_json)
+            return trade_date.isoformat()
         except Exception as exc:
-            logger.warning("Failed to write fundamentals cache %s: %s", path, exc)
+            logger.warning("Failed to write fundamentals cache %s/%s: %s", symbol, report_type, exc)
         return None
@@ -1,18 +1,27 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 import uuid
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import date, datetime, timedelta
+from pathlib import Path
 from typing import Any, Iterable, List
 from zoneinfo import ZoneInfo
 
 import pandas as pd
 
 from ..config import AppConfig
-from ..ib import IBSession, fetch_daily_bars, fetch_iv_snapshot, make_throttle
-from ..storage import ParquetWriter, existing_partition_dates, partition_for
-from ..universe import load_universe
+from ..ib import (
+    AsyncPacer,
+    IBSession,
+    fetch_daily_bars,
+    fetch_daily_bars_async,
+    fetch_iv_snapshot_async,
+    make_throttle,
+)
+from ..storage import ParquetWriter, SeriesStore, existing_partition_dates, partition_for
+from ..universe import Universe
 
 logger = logging.getLogger(__name__)
 
@@ -126,6 +135,15 @@ def _chunk_symbols(symbols: List[str], batch_size: int | None) -> Iterable[List[
         yield symbols[idx : idx + batch_size]
 
 
+@dataclass
+class _SymbolFetch:
+    qualified: bool = False
+    iv_value: float | None = None
+    iv_bars: list[Any] = field(default_factory=list)
+    hv_bars: list[Any] = field(default_factory=list)
+    error: str | None = None
+
+
 class VolatilityRunner:
     def __init__(
         self,
@@ -135,6 +153,7 @@ class VolatilityRunner:
         writer: ParquetWriter | None = None,
         now_fn: callable[[], datetime] | None = None,
         throttle_sec: float = 0.7,
+        concurrency: int = 8,
     ) -> None:
         self.cfg = cfg
         self._session_factory = session_factory or (
@@ -149,6 +168,123 @@ class VolatilityRunner:
         self._writer = writer or ParquetWriter(cfg)
         self._now_fn = now_fn or (lambda: datetime.now(ZoneInfo(cfg.timezone.name)))
         self._throttle = make_throttle(throttle_sec)
+        self._throttle_sec = throttle_sec
+        self._concurrency = max(int(concurrency), 1)
+        self._view_root = cfg.paths.clean / "view=volatility"
+        self._series: SeriesStore | None = None
+        if cfg.storage.volatility_layout == "series":
+            self._series = SeriesStore(
+                cfg,
+                cfg.paths.clean / "view=volatility_series",
+                granularity=cfg.storage.series_granularity,
+            )
+
+    def _latest_stored_date(self, symbol: str, exchange: str) -> date | None:
+        if self._series is not None:
+            mark = self._series.watermark(symbol, exchange)
+            return mark[1] if mark else None
+        existing_dates = existing_partition_dates(self._view_root, symbol, exchange)
+        return max(existing_dates) if existing_dates else None
+
+    def _write_records(self, records: List[dict[str, Any]]) -> List[Path]:
+        if not records:
+            return []
+        if self._series is not None:
+            return self._series.append(pd.DataFrame(records))
+        paths = []
+        for record in records:
+            part = partition_for(
+                self.cfg,
+                self._view_root,
+                record["trade_date"],
+                record["symbol"],
+                record["exchange"],
+            )
+            paths.append(self._writer.write_dataframe(pd.DataFrame([record]), part))
+        return paths
+
+    async def _qualify_async(
+        self, ib: Any, symbol: str, exchange: str, currency: str, pacer: AsyncPacer
+    ) -> Any:
+        from ib_insync import Stock  # type: ignore
+
+        # Contract details requests share the pacing budget with historical requests
+        async with pacer:
+            qualified = await ib.qualifyContractsAsync(Stock(symbol, exchange, currency))
+        return qualified[0] if qualified else None
+
+    async def _fetch_snapshot_batch(
+        self,
+        ib: Any,
+        symbols: List[str],
+        *,
+        end_dt: str,
+        exchange: str,
+        currency: str,
+        generic_ticks: str,
+        timeout: float,
+        pacer: AsyncPacer,
+    ) -> List[_SymbolFetch | BaseException]:
+        # Market data lines are a separate IB budget from historical pacing
+        lines = asyncio.Semaphore(self._concurrency)
+
+        async def _iv(contract: Any) -> float | None:
+            async with lines:
+                return await fetch_iv_snapshot_async(
+                    ib, contract, generic_ticks=generic_ticks, timeout=timeout
+                )
+
+        async def _one(symbol: str) -> _SymbolFetch:
+            contract = await self._qualify_async(ib, symbol, exchange, currency, pacer)
+            if contract is None:
+                return _SymbolFetch()
+            iv_value, hv_bars = await asyncio.gather(
+                _iv(contract),
+                fetch_daily_bars_async(
+                    ib,
+                    contract,
+                    what_to_show="HISTORICAL_VOLATILITY",
+                    duration="2 D",
+                    end_date_time=end_dt,
+                    pacer=pacer,
+                ),
+            )
+            return _SymbolFetch(qualified=True, iv_value=iv_value, hv_bars=hv_bars)
+
+        return await asyncio.gather(*(_one(s) for s in symbols), return_exceptions=True)
+
+    async def _fetch_backfill_batch(
+        self,
+        ib: Any,
+        plans: List[tuple[str, date]],
+        *,
+        target_end: date,
+        end_dt: str,
+        exchange: str,
+        currency: str,
+        pacer: AsyncPacer,
+    ) -> List[_SymbolFetch | BaseException]:
+        async def _one(symbol: str, start_date: date) -> _SymbolFetch:
+            contract = await self._qualify_async(ib, symbol, exchange, currency, pacer)
+            if contract is None:
+                return _SymbolFetch()
+            duration_str = f"{(target_end - start_date).days + 1} D"
+            iv_bars, hv_bars = await asyncio.gather(
+                *(
+                    fetch_daily_bars_async(
+                        ib,
+                        contract,
+                        what_to_show=what_to_show,
+                        duration=duration_str,
+                        end_date_time=end_dt,
+                        pacer=pacer,
+                    )
+                    for what_to_show in ("OPTION_IMPLIED_VOLATILITY", "HISTORICAL_VOLATILITY")
+                )
+            )
+            return _SymbolFetch(qualified=True, iv_bars=iv_bars, hv_bars=hv_bars)
+
+        return await asyncio.gather(*(_one(s, d) for s, d in plans), return_exceptions=True)
 
     def run_snapshot(
         self,
@@ -166,8 +302,7 @@ class VolatilityRunner:
         ingest_id = str(uuid.uuid4())
 
         if symbols is None:
-            universe = load_universe(self.cfg.universe.file)
-            symbols = [entry.symbol for entry in universe]
+            symbols = Universe.load(self.cfg.universe.file).symbols
 
         errors: list[dict[str, Any]] = []
         paths: list[str] = []
@@ -176,7 +311,6 @@ class VolatilityRunner:
         session = self._session_factory()
         with session as sess:
             ib = sess.ensure_connected()
-            from ib_insync import Stock  # type: ignore
 
             ref_symbol = symbols[0].strip().upper() if symbols else ""
             effective_date = _resolve_last_trading_date(
@@ -196,21 +330,37 @@ class VolatilityRunner:
                 )
                 target_date = effective_date
 
+            end_dt = _end_dt_for_date(target_date, self.cfg.timezone.name)
+            pacer = AsyncPacer(self._throttle_sec, self._concurrency)
             total = len(symbols)
             processed = 0
             for batch in _chunk_symbols(symbols, batch_size):
-                for symbol in batch:
-                    processed += 1
-                    if processed == 1 or processed % 25 == 0 or processed == total:
-                        logger.info(
-                            "volatility snapshot progress %s/%s symbol=%s",
-                            processed,
-                            total,
-                            symbol,
+                outcomes = ib.run(
+                    self._fetch_snapshot_batch(
+                        ib,
+                        batch,
+                        end_dt=end_dt,
+                        exchange=exchange,
+                        currency=currency,
+                        generic_ticks=generic_ticks,
+                        timeout=timeout,
+                        pacer=pacer,
+                    )
+                )
+                processed += len(batch)
+                logger.info(
+                    "volatility snapshot progress %s/%s symbol=%s",
+                    processed,
+                    total,
+                    batch[-1] if batch else "",
+                )
+                for symbol, outcome in zip(batch, outcomes):
+                    if isinstance(outcome, BaseException):
+                        errors.append(
+                            {"symbol": symbol, "error": "fetch_failed", "message": str(outcome)}
                         )
-                    contract = Stock(symbol, exchange, currency)
-                    qualified = ib.qualifyContracts(contract)
-                    if not qualified:
+                        continue
+                    if not outcome.qualified:
                         errors.append(
                             {
                                 "symbol": symbol,
@@ -220,13 +370,7 @@ class VolatilityRunner:
                         )
                         continue
 
-                    iv_value = fetch_iv_snapshot(
-                        ib,
-                        qualified[0],
-                        generic_ticks=generic_ticks,
-                        timeout=timeout,
-                        poll_interval=poll_interval,
-                    )
+                    iv_value = outcome.iv_value
                     if iv_value is None:
                         errors.append(
                             {
@@ -236,20 +380,7 @@ class VolatilityRunner:
                             }
                         )
 
-                    end_dt = _end_dt_for_date(target_date, self.cfg.timezone.name)
-                    hv_bars = fetch_daily_bars(
-                        ib,
-                        qualified[0],
-                        what_to_show="HISTORICAL_VOLATILITY",
-                        duration="2 D",
-                        bar_size="1 day",
-                        end_date_time=end_dt,
-                        use_rth=True,
-                        format_date=2,
-                        throttle=self._throttle,
-                    )
-                    hv_map = _bars_to_map(hv_bars)
-                    hv_bar = hv_map.get(target_date)
+                    hv_bar = _bars_to_map(outcome.hv_bars).get(target_date)
                     hv_value = getattr(hv_bar, "close", None) if hv_bar else None
                     if hv_value is None:
                         errors.append(
@@ -274,17 +405,8 @@ class VolatilityRunner:
                         "data_quality_flag": [],
                     }
 
-                    df = pd.DataFrame([record])
-                    part = partition_for(
-                        self.cfg,
-                        self.cfg.paths.clean / "view=volatility",
-                        target_date,
-                        symbol,
-                        exchange,
-                    )
-                    path = self._writer.write_dataframe(df, part)
-                    rows_written += len(df)
-                    paths.append(str(path))
+                    paths.extend(str(path) for path in self._write_records([record]))
+                    rows_written += 1
 
         return VolatilityResult(
             ingest_id=ingest_id,
@@ -311,18 +433,15 @@ class VolatilityRunner:
         ingest_id = str(uuid.uuid4())
 
         if symbols is None:
-            universe = load_universe(self.cfg.universe.file)
-            symbols = [entry.symbol for entry in universe]
+            symbols = Universe.load(self.cfg.universe.file).symbols
 
         errors: list[dict[str, Any]] = []
         paths: list[str] = []
         rows_written = 0
 
-        view_root = self.cfg.paths.clean / "view=volatility"
         session = self._session_factory()
         with session as sess:
             ib = sess.ensure_connected()
-            from ib_insync import Stock  # type: ignore
 
             ref_symbol = symbols[0].strip().upper() if symbols else ""
             effective_end = _resolve_last_trading_date(
@@ -343,32 +462,46 @@ class VolatilityRunner:
                 target_end = effective_end
                 window_start = target_end - timedelta(days=max(days - 1, 0))
 
+            end_dt = _end_dt_for_date(target_end, self.cfg.timezone.name)
+            pacer = AsyncPacer(self._throttle_sec, self._concurrency)
             total = len(symbols)
             processed = 0
             for batch in _chunk_symbols(symbols, batch_size):
+                plans: list[tuple[str, date]] = []
                 for symbol in batch:
-                    processed += 1
-                    if processed == 1 or processed % 25 == 0 or processed == total:
-                        logger.info(
-                            "volatility backfill progress %s/%s symbol=%s",
-                            processed,
-                            total,
-                            symbol,
-                        )
-                    existing_dates = existing_partition_dates(view_root, symbol, exchange)
+                    latest = self._latest_stored_date(symbol, exchange)
                     start_date = window_start
-                    if existing_dates:
-                        latest = max(existing_dates)
+                    if latest is not None:
                         if auto_from_latest or latest >= window_start:
                             start_date = latest + timedelta(days=1)
-                    if start_date > target_end:
-                        continue
+                    if start_date <= target_end:
+                        plans.append((symbol, start_date))
 
-                    duration_days = (target_end - start_date).days + 1
-                    duration_str = f"{duration_days} D"
-                    contract = Stock(symbol, exchange, currency)
-                    qualified = ib.qualifyContracts(contract)
-                    if not qualified:
+                outcomes = ib.run(
+                    self._fetch_backfill_batch(
+                        ib,
+                        plans,
+                        target_end=target_end,
+                        end_dt=end_dt,
+                        exchange=exchange,
+                        currency=currency,
+                        pacer=pacer,
+                    )
+                )
+                processed += len(batch)
+                logger.info(
+                    "volatility backfill progress %s/%s symbol=%s",
+                    processed,
+                    total,
+                    batch[-1] if batch else "",
+                )
+                for (symbol, start_date), outcome in zip(plans, outcomes):
+                    if isinstance(outcome, BaseException):
+                        errors.append(
+                            {"symbol": symbol, "error": "fetch_failed", "message": str(outcome)}
+                        )
+                        continue
+                    if not outcome.qualified:
                         errors.append(
                             {
                                 "symbol": symbol,
@@ -378,31 +511,8 @@ class VolatilityRunner:
                         )
                         continue
 
-                    end_dt = _end_dt_for_date(target_end, self.cfg.timezone.name)
-                    iv_bars = fetch_daily_bars(
-                        ib,
-                        qualified[0],
-                        what_to_show="OPTION_IMPLIED_VOLATILITY",
-                        duration=duration_str,
-                        bar_size="1 day",
-                        end_date_time=end_dt,
-                        use_rth=True,
-                        format_date=2,
-                        throttle=self._throttle,
-                    )
-                    hv_bars = fetch_daily_bars(
-                        ib,
-                        qualified[0],
-                        what_to_show="HISTORICAL_VOLATILITY",
-                        duration=duration_str,
-                        bar_size="1 day",
-                        end_date_time=end_dt,
-                        use_rth=True,
-                        format_date=2,
-                        throttle=self._throttle,
-                    )
-                    iv_map = _bars_to_map(iv_bars)
-                    hv_map = _bars_to_map(hv_bars)
+                    iv_map = _bars_to_map(outcome.iv_bars)
+                    hv_map = _bars_to_map(outcome.hv_bars)
                     if not iv_map and not hv_map:
                         errors.append(
                             {
@@ -414,35 +524,29 @@ class VolatilityRunner:
                         continue
 
                     dates = sorted({*iv_map.keys(), *hv_map.keys()})
+                    records = []
                     for bar_date in dates:
                         if bar_date < start_date or bar_date > target_end:
                             continue
                         iv_bar = iv_map.get(bar_date)
                         hv_bar = hv_map.get(bar_date)
-                        record = {
-                            "trade_date": bar_date,
-                            "symbol": symbol,
-                            "exchange": exchange,
-                            "iv_30d": getattr(iv_bar, "close", None) if iv_bar else None,
-                            "hv_30d": getattr(hv_bar, "close", None) if hv_bar else None,
-                            "source": "IBKR",
-                            "asof_ts": datetime.utcnow(),
-                            "ingest_id": ingest_id,
-                            "ingest_run_type": "backfill",
-                            "market_data_type": self.cfg.ib.market_data_type,
-                            "data_quality_flag": [],
-                        }
-                        df = pd.DataFrame([record])
-                        part = partition_for(
-                            self.cfg,
-                            self.cfg.paths.clean / "view=volatility",
-                            bar_date,
-                            symbol,
-                            exchange,
+                        records.append(
+                            {
+                                "trade_date": bar_date,
+                                "symbol": symbol,
+                                "exchange": exchange,
+                                "iv_30d": getattr(iv_bar, "close", None) if iv_bar else None,
+                                "hv_30d": getattr(hv_bar, "close", None) if hv_bar else None,
+                                "source": "IBKR",
+                                "asof_ts": datetime.utcnow(),
+                                "ingest_id": ingest_id,
+                                "ingest_run_type": "backfill",
+                                "market_data_type": self.cfg.ib.market_data_type,
+                                "data_quality_flag": [],
+                            }
                         )
-                        path = self._writer.write_dataframe(df, part)
-                        rows_written += len(df)
-                        paths.append(str(path))
+                    paths.extend(str(path) for path in self._write_records(records))
+                    rows_written += len(records)
 
         return VolatilityResult(
             ingest_id=ingest_id,
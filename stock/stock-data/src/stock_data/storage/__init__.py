@@ -1,5 +1,8 @@
+from .fundamentals_store import FundamentalsStore
 from .layout import Partition, partition_for, codec_for_date
+from .manifest import PartitionManifest, partition_manifest
 from .scan import existing_partition_dates, latest_partition_date
+from .series import SeriesStore
 from .writer import ParquetWriter
 
 __all__ = [
@@ -7,6 +10,10 @@ __all__ = [
     "partition_for",
     "codec_for_date",
     "ParquetWriter",
+    "PartitionManifest",
+    "partition_manifest",
     "existing_partition_dates",
     "latest_partition_date",
+    "SeriesStore",
+    "FundamentalsStore",
 ]
@@ -0,0 +1,251 @@
+from __future__ import annotations
+
+import json
+import logging
+import re
+import sqlite3
+import zlib
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+FUNDAMENTALS_DB_FILENAME = "fundamentals.db"
+
+# Columns of report_state, in the order of the legacy per-report JSON state keys
+STATE_FIELDS = (
+    "last_attempt_at",
+    "last_fetch_at",
+    "last_payload_date",
+    "last_period",
+    "payload_count",
+    "last_cache_date",
+    "status",
+)
+
+
+def _utc_iso(value: datetime | None = None) -> str:
+    # Fixed width so ISO strings compare correctly in SQL
+    value = value or datetime.now(timezone.utc)
+    return value.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+
+class FundamentalsStore:
+    """SQLite store for FMP payloads (zlib-compressed JSON) and per-report fetch state.
+
+    ``payloads`` is keyed by (symbol, report_type, trade_date) and indexed on
+    ``cached_at`` so TTL lookups and pruning are single queries; ``report_state`` holds
+    one row per (symbol, report_type) and is loaded whole when a run starts.
+    """
+
+    def __init__(self, db_path: Path):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._init_db()
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """One transaction on a fresh connection, closed afterwards."""
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def _init_db(self) -> None:
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS payloads (
+                    symbol TEXT NOT NULL,
+                    report_type TEXT NOT NULL,
+                    trade_date TEXT NOT NULL,
+                    cached_at TEXT NOT NULL,
+                    payload BLOB NOT NULL,
+                    PRIMARY KEY (symbol, report_type, trade_date)
+                )
+            """)
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_payloads_cached_at ON payloads (cached_at)"
+            )
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS report_state (
+                    symbol TEXT NOT NULL,
+                    report_type TEXT NOT NULL,
+                    last_attempt_at TEXT,
+                    last_fetch_at TEXT,
+                    last_payload_date TEXT,
+                    last_period TEXT,
+                    payload_count INTEGER,
+                    last_cache_date TEXT,
+                    status TEXT,
+                    PRIMARY KEY (symbol, report_type)
+                )
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS meta (
+                    key TEXT PRIMARY KEY,
+                    value TEXT
+                )
+            """)
+
+    def is_empty(self) -> bool:
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT (SELECT COUNT(*) FROM payloads) + (SELECT COUNT(*) FROM report_state)"
+            ).fetchone()
+        return not row[0]
+
+    # ------------------------------------------------------------------ payloads
+    def put_payload(
+        self,
+        symbol: str,
+        report_type: str,
+        trade_date: date,
+        raw_json: str,
+        cached_at: datetime | None = None,
+    ) -> None:
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO payloads VALUES (?, ?, ?, ?, ?)",
+                (
+                    symbol,
+                    report_type,
+                    trade_date.isoformat(),
+                    _utc_iso(cached_at),
+                    zlib.compress(raw_json.encode("utf-8")),
+                ),
+            )
+
+    def get_payload(
+        self,
+        symbol: str,
+        report_type: str,
+        trade_date: date | str,
+        max_age: timedelta | None = None,
+    ) -> Optional[Dict[str, Any]]:
+        """``{"raw_json", "cached_at"}`` for a cached payload, or None (missing or expired)."""
+        key = trade_date.isoformat() if isinstance(trade_date, date) else str(trade_date)
+        sql = (
+            "SELECT cached_at, payload FROM payloads "
+            "WHERE symbol = ? AND report_type = ? AND trade_date = ?"
+        )
+        params: list[Any] = [symbol, report_type, key]
+        if max_age is not None:
+            sql += " AND cached_at >= ?"
+            params.append(_utc_iso(datetime.now(timezone.utc) - max_age))
+        with self._connect() as conn:
+            row = conn.execute(sql, params).fetchone()
+        if row is None:
+            return None
+        return {
+            "raw_json": zlib.decompress(row["payload"]).decode("utf-8"),
+            "cached_at": row["cached_at"],
+        }
+
+    def cached_keys(
+        self, trade_date: date, max_age: timedelta | None = None
+    ) -> Set[Tuple[str, str]]:
+        """(symbol, report_type) pairs with a payload cached for *trade_date*."""
+        sql = "SELECT symbol, report_type FROM payloads WHERE trade_date = ?"
+        params: list[Any] = [trade_date.isoformat()]
+        if max_age is not None:
+            sql += " AND cached_at >= ?"
+            params.append(_utc_iso(datetime.now(timezone.utc) - max_age))
+        with self._connect() as conn:
+            return {(row[0], row[1]) for row in conn.execute(sql, params)}
+
+    def prune_payloads(self, older_than: timedelta) -> int:
+        cutoff = _utc_iso(datetime.now(timezone.utc) - older_than)
+        with self._connect() as conn:
+            cursor = conn.execute("DELETE FROM payloads WHERE cached_at < ?", (cutoff,))
+            return cursor.rowcount
+
+    # ------------------------------------------------------------------ state
+    def load_state(self) -> Dict[str, Any]:
+        """Fetch state in the legacy JSON shape (``symbols -> report_type -> fields``)."""
+        state: Dict[str, Any] = {
+            "version": 2,
+            "last_run_date": None,
+            "daily_calls": 0,
+            "symbols": {},
+        }
+        with self._connect() as conn:
+            for row in conn.execute("SELECT key, value FROM meta"):
+                if row["key"] == "last_run_date":
+                    state["last_run_date"] = row["value"]
+                elif row["key"] == "daily_calls":
+                    state["daily_calls"] = int(row["value"] or 0)
+            for row in conn.execute("SELECT * FROM report_state"):
+                fields = {k: row[k] for k in STATE_FIELDS if row[k] is not None}
+                state["symbols"].setdefault(row["symbol"], {})[row["report_type"]] = fields
+        return state
+
+    def save_state(
+        self, state: Dict[str, Any], keys: Optional[Iterable[Tuple[str, str]]] = None
+    ) -> None:
+        """Persist counters and the report rows in *keys* (all rows when None) atomically."""
+        symbols = state.get("symbols", {})
+        if keys is None:
+            keys = [(sym, rt) for sym, reports in symbols.items() for rt in reports]
+        rows = []
+        for symbol, report_type in keys:
+            fields = symbols.get(symbol, {}).get(report_type) or {}
+            rows.append((symbol, report_type, *(fields.get(k) for k in STATE_FIELDS)))
+        placeholders = ", ".join("?" for _ in range(2 + len(STATE_FIELDS)))
+        with self._connect() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO meta VALUES (?, ?)",
+                [
+                    ("last_run_date", state.get("last_run_date")),
+                    ("daily_calls", str(int(state.get("daily_calls") or 0))),
+                ],
+            )
+            conn.executemany(f"INSERT OR REPLACE INTO report_state VALUES ({placeholders})", rows)
+
+    # ------------------------------------------------------------------ migration
+    def import_legacy(self, state_path: Path, cache_dir: Path) -> int:
+        """One-off import of ``fundamentals_state.json`` and the per-file JSON cache."""
+        imported = 0
+        if cache_dir.exists():
+            for path in sorted(cache_dir.glob("*.json")):
+                try:
+                    payload = json.loads(path.read_text(encoding="utf-8"))
+                    trade_date = date.fromisoformat(payload["trade_date"])
+                    cached_at = datetime.fromisoformat(
+                        str(payload["cached_at"]).replace("Z", "+00:00")
+                    )
+                    if cached_at.tzinfo is None:
+                        cached_at = cached_at.replace(tzinfo=timezone.utc)
+                    self.put_payload(
+                        payload["symbol"],
+                        payload["report_type"],
+                        trade_date,
+                        payload["raw_json"],
+                        cached_at,
+                    )
+                    imported += 1
+                except Exception as exc:
+                    logger.warning("Skipping legacy fundamentals cache %s: %s", path, exc)
+        if state_path.exists():
+            try:
+                state = json.loads(state_path.read_text(encoding="utf-8"))
+            except Exception as exc:
+                logger.warning("Skipping legacy fundamentals state %s: %s", state_path, exc)
+                return imported
+            for reports in (state.get("symbols") or {}).values():
+                for fields in reports.values():
+                    # Legacy cache files are named {symbol}_{trade_date}_{report_type}.json
+                    cache_path = fields.pop("last_cache_path", None)
+                    match = re.search(r"_(\d{4}-\d{2}-\d{2})_", Path(cache_path or "").stem)
+                    if match:
+                        fields["last_cache_date"] = match.group(1)
+            self.save_state(state)
+        return imported
+
+
+__all__ = ["FUNDAMENTALS_DB_FILENAME", "FundamentalsStore"]
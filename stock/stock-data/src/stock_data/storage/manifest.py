@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILENAME = "_manifest.jsonl"
+
+
+def schema_hash(schema: Any) -> str:
+    text = schema.to_string(show_field_metadata=False, show_schema_metadata=False)
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()[:16]
+
+
+def describe_table(table: Any) -> Dict[str, Any]:
+    import pyarrow.compute as pc  # type: ignore
+
+    info: Dict[str, Any] = {
+        "rows": table.num_rows,
+        "schema_hash": schema_hash(table.schema),
+        "ingest_id": None,
+    }
+    if "ingest_id" in table.column_names and table.num_rows:
+        ids = [v for v in pc.unique(table["ingest_id"]).to_pylist() if v is not None]
+        if ids:
+            info["ingest_id"] = ids[0] if len(ids) == 1 else sorted(map(str, ids))
+    return info
+
+
+def write_table_atomic(table: Any, file_path: Path, **options: Any) -> None:
+    """Write a Parquet file under a temporary name and rename it into place."""
+    import pyarrow.parquet as pq  # type: ignore
+
+    tmp = file_path.with_name(f".{file_path.name}.tmp")
+    pq.write_table(table, tmp, **options)
+    os.replace(tmp, file_path)
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+class PartitionManifest:
+    """Append-only log of committed files for one view (``{view_root}/_manifest.jsonl``).
+
+    Each line is an ``init`` marker or an ``add`` entry (path, rows, schema hash,
+    ingest_id). The log is authoritative only after an ``init`` entry, written when the
+    view starts empty or by ``rebuild()`` for views that predate it.
+    """
+
+    def __init__(self, view_root: Path):
+        self.view_root = Path(view_root)
+        self.path = self.view_root / MANIFEST_FILENAME
+        self._lock = threading.Lock()
+        self._inode: Optional[int] = None
+        self._offset = 0
+        self._initialized = False
+        # (symbol, exchange) -> {date}
+        self._dates: Dict[Tuple[str, str], Set[str]] = {}
+
+    def _reset(self) -> None:
+        self._offset = 0
+        self._initialized = False
+        self._dates = {}
+
+    def _apply(self, entry: Dict[str, Any]) -> None:
+        if entry.get("op") == "init":
+            self._initialized = True
+            return
+        if entry.get("op") != "add" or not entry.get("path"):
+            return
+        keys = dict(part.split("=", 1) for part in entry["path"].split("/")[:-1] if "=" in part)
+        slot = (keys.get("symbol", ""), keys.get("exchange", ""))
+        self._dates.setdefault(slot, set()).add(keys.get("date", ""))
+
+    def refresh(self) -> None:
+        """Apply entries appended since the last read (full reload after a rewrite)."""
+        with self._lock:
+            try:
+                stat = self.path.stat()
+            except FileNotFoundError:
+                self._inode = None
+                self._reset()
+                return
+            if stat.st_ino != self._inode or stat.st_size < self._offset:
+                self._inode = stat.st_ino
+                self._reset()
+            if stat.st_size == self._offset:
+                return
+            with self.path.open("rb") as fh:
+                fh.seek(self._offset)
+                chunk = fh.read(stat.st_size - self._offset)
+            end = chunk.rfind(b"\n") + 1
+            for line in chunk[:end].splitlines():
+                if not line.strip():
+                    continue
+                try:
+                    self._apply(json.loads(line))
+                except ValueError:
+                    logger.warning("Skipping corrupt manifest line in %s", self.path)
+            self._offset += end
+
+    @property
+    def initialized(self) -> bool:
+        self.refresh()
+        return self._initialized
+
+    def dates(self, symbol: str, exchange: str) -> Set[str]:
+        self.refresh()
+        return set(self._dates.get((symbol.upper(), exchange.upper()), set()))
+
+    def _append(self, entries: List[Dict[str, Any]]) -> None:
+        self.view_root.mkdir(parents=True, exist_ok=True)
+        data = "".join(json.dumps(e, sort_keys=True, default=str) + "\n" for e in entries)
+        fd = os.open(self.path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        try:
+            os.write(fd, data.encode("utf-8"))
+        finally:
+            os.close(fd)
+
+    def ensure_initialized(self) -> bool:
+        if self.path.exists():
+            return self.initialized
+        if self.view_root.exists() and any(self.view_root.glob("date=*")):
+            return False
+        self._append([{"op": "init", "committed_at": _now()}])
+        return True
+
+    def commit(self, file_path: Path, table: Any) -> Dict[str, Any]:
+        rel = Path(file_path).resolve().relative_to(self.view_root.resolve()).as_posix()
+        entry = {"op": "add", "path": rel, "committed_at": _now(), **describe_table(table)}
+        self._append([entry])
+        return entry
+
+    def rebuild(self) -> int:
+        """Re-derive the log from the files on disk (one-off for pre-manifest views)."""
+        import pyarrow.parquet as pq  # type: ignore
+
+        lines = [json.dumps({"op": "init", "committed_at": _now()})]
+        for file_path in sorted(self.view_root.glob("date=*/*/*/*.parquet")):
+            try:
+                parquet = pq.ParquetFile(file_path)
+            except Exception as exc:
+                logger.warning("Skipping unreadable partition %s: %s", file_path, exc)
+                continue
+            entry = {
+                "op": "add",
+                "path": file_path.relative_to(self.view_root).as_posix(),
+                "committed_at": _now(),
+                "rows": parquet.metadata.num_rows,
+                "schema_hash": schema_hash(parquet.schema_arrow),
+                "ingest_id": None,
+            }
+            lines.append(json.dumps(entry, sort_keys=True))
+        self.view_root.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(f".{self.path.name}.tmp")
+        tmp.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        os.replace(tmp, self.path)
+        return len(lines) - 1
+
+
+_MANIFESTS: Dict[Path, PartitionManifest] = {}
+_MANIFESTS_LOCK = threading.Lock()
+
+
+def partition_manifest(view_root: Path) -> PartitionManifest:
+    key = Path(view_root).resolve()
+    with _MANIFESTS_LOCK:
+        manifest = _MANIFESTS.get(key)
+        if manifest is None:
+            manifest = _MANIFESTS[key] = PartitionManifest(key)
+        return manifest
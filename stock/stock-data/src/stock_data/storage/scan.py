@@ -3,6 +3,8 @@ from __future__ import annotations
 from datetime import date
 from pathlib import Path
 
+from .manifest import partition_manifest
+
 
 def _parse_date_dir(name: str) -> date | None:
     if not name.startswith("date="):
@@ -17,6 +19,13 @@ def _parse_date_dir(name: str) -> date | None:
 def existing_partition_dates(root: Path, symbol: str, exchange: str) -> set[date]:
     if not root.exists():
         return set()
+    manifest = partition_manifest(root)
+    if manifest.initialized:
+        return {
+            parsed
+            for value in manifest.dates(symbol, exchange)
+            if (parsed := _parse_date_dir(f"date={value}")) is not None
+        }
     pattern = f"date=*/symbol={symbol.upper()}/exchange={exchange.upper()}/part-*.parquet"
     dates: set[date] = set()
     for path in root.glob(pattern):
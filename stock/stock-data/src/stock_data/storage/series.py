@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+from datetime import date
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import pandas as pd
+
+from ..config import AppConfig
+from .layout import codec_for_date
+from .manifest import write_table_atomic
+
+logger = logging.getLogger(__name__)
+
+WATERMARKS_FILENAME = "_watermarks.json"
+SERIES_GRANULARITIES = ("year", "month")
+
+
+def _to_date(value: Any) -> Optional[date]:
+    if value is None:
+        return None
+    if isinstance(value, date):
+        return value
+    try:
+        return date.fromisoformat(str(value)[:10])
+    except ValueError:
+        return None
+
+
+class SeriesStore:
+    """Daily per-symbol series stored as one sorted file per symbol and year (or month).
+
+    Layout: ``{root}/symbol=X/exchange=Y/year=YYYY[/month=MM]/part-000.parquet``, rows
+    sorted by ``trade_date`` and deduplicated on it (last write wins). A small
+    ``_watermarks.json`` index keeps the first/last stored date per symbol so planners
+    never list the tree to decide where to resume.
+    """
+
+    def __init__(self, cfg: AppConfig, root: Path, granularity: str = "year"):
+        if granularity not in SERIES_GRANULARITIES:
+            raise ValueError(f"Invalid series granularity: {granularity}")
+        self.cfg = cfg
+        self.root = Path(root)
+        self.granularity = granularity
+        self.index_path = self.root / WATERMARKS_FILENAME
+        self._lock = threading.Lock()
+        self._watermarks: Optional[Dict[str, Dict[str, Any]]] = None
+
+    # ------------------------------------------------------------------ index
+    @staticmethod
+    def _key(symbol: str, exchange: str) -> str:
+        return f"{symbol.upper()}/{exchange.upper()}"
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        if self._watermarks is None:
+            try:
+                self._watermarks = json.loads(self.index_path.read_text(encoding="utf-8"))
+            except FileNotFoundError:
+                self._watermarks = self._scan_watermarks() if self.root.exists() else {}
+            except ValueError:
+                logger.warning("Corrupt series watermarks %s; rebuilding", self.index_path)
+                self._watermarks = self._scan_watermarks()
+        return self._watermarks
+
+    def _save(self) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp = self.index_path.with_name(f".{self.index_path.name}.tmp")
+        tmp.write_text(json.dumps(self._watermarks or {}, sort_keys=True), encoding="utf-8")
+        os.replace(tmp, self.index_path)
+
+    def _scan_watermarks(self) -> Dict[str, Dict[str, Any]]:
+        import pyarrow.parquet as pq  # type: ignore
+
+        marks: Dict[str, Dict[str, Any]] = {}
+        for path in sorted(self.root.glob("symbol=*/exchange=*/**/part-*.parquet")):
+            rel = path.relative_to(self.root).parts
+            symbol = rel[0].split("=", 1)[1]
+            exchange = rel[1].split("=", 1)[1]
+            try:
+                dates = pq.ParquetFile(path).read(columns=["trade_date"]).column(0).to_pylist()
+            except Exception as exc:
+                logger.warning("Skipping unreadable series file %s: %s", path, exc)
+                continue
+            parsed = [d for d in map(_to_date, dates) if d is not None]
+            if parsed:
+                self._merge_mark(marks, self._key(symbol, exchange), parsed)
+        return marks
+
+    @staticmethod
+    def _merge_mark(marks: Dict[str, Dict[str, Any]], key: str, dates: List[date]) -> None:
+        mark = marks.get(key)
+        first, last = min(dates), max(dates)
+        if mark is not None:
+            first = min(first, date.fromisoformat(mark["first"]))
+            last = max(last, date.fromisoformat(mark["last"]))
+        marks[key] = {"first": first.isoformat(), "last": last.isoformat()}
+
+    def rebuild_watermarks(self) -> int:
+        with self._lock:
+            self._watermarks = self._scan_watermarks()
+            self._save()
+            return len(self._watermarks)
+
+    def watermark(self, symbol: str, exchange: str) -> Optional[Tuple[date, date]]:
+        """(first, last) stored trade date for a symbol, or None when it has no data."""
+        with self._lock:
+            mark = self._load().get(self._key(symbol, exchange))
+        if not mark:
+            return None
+        return date.fromisoformat(mark["first"]), date.fromisoformat(mark["last"])
+
+    def keys(self) -> List[Tuple[str, str]]:
+        """(symbol, exchange) pairs that have stored rows."""
+        with self._lock:
+            marks = self._load()
+        return sorted(tuple(key.split("/", 1)) for key in marks)  # type: ignore[misc]
+
+    # ------------------------------------------------------------------ files
+    def _symbol_dir(self, symbol: str, exchange: str) -> Path:
+        return self.root / f"symbol={symbol.upper()}" / f"exchange={exchange.upper()}"
+
+    def _bucket_dir(self, symbol: str, exchange: str, day: date) -> Path:
+        path = self._symbol_dir(symbol, exchange) / f"year={day.year}"
+        if self.granularity == "month":
+            path = path / f"month={day.month:02d}"
+        return path
+
+    def files(
+        self,
+        symbol: str,
+        exchange: str,
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+    ) -> List[Path]:
+        monthly = self.granularity == "month"
+        pattern = "year=*/month=*/part-*.parquet" if monthly else "year=*/part-*.parquet"
+        out: List[Path] = []
+        for path in sorted(self._symbol_dir(symbol, exchange).glob(pattern)):
+            year = int(path.parts[-3 if monthly else -2].split("=", 1)[1])
+            if (start and year < start.year) or (end and year > end.year):
+                continue
+            out.append(path)
+        return out
+
+    def append(self, df: pd.DataFrame) -> List[Path]:
+        """Merge rows (``trade_date``/``symbol``/``exchange`` required) into their buckets."""
+        if df.empty:
+            return []
+        import pyarrow as pa  # type: ignore
+
+        frame = df.copy()
+        frame["symbol"] = frame["symbol"].astype(str).str.upper()
+        frame["exchange"] = frame["exchange"].astype(str).str.upper()
+        frame["trade_date"] = frame["trade_date"].map(_to_date)
+        frame = frame[frame["trade_date"].notna()]
+
+        written: List[Path] = []
+        with self._lock:
+            marks = self._load()
+            for (symbol, exchange), group in frame.groupby(["symbol", "exchange"], sort=True):
+                buckets = group["trade_date"].map(lambda d: self._bucket_dir(symbol, exchange, d))
+                for bucket_dir, rows in group.groupby(buckets, sort=True):
+                    file_path = bucket_dir / "part-000.parquet"
+                    merged = rows
+                    if file_path.exists():
+                        existing = pd.read_parquet(file_path)
+                        existing["trade_date"] = existing["trade_date"].map(_to_date)
+                        merged = pd.concat([existing, rows], ignore_index=True)
+                    merged = merged.drop_duplicates(subset=["trade_date"], keep="last")
+                    merged = merged.sort_values("trade_date", kind="stable")
+                    bucket_dir.mkdir(parents=True, exist_ok=True)
+                    codec, options = codec_for_date(self.cfg, max(merged["trade_date"]))
+                    table = pa.Table.from_pandas(merged, preserve_index=False)
+                    write_table_atomic(table, file_path, compression=codec, **options)
+                    written.append(file_path)
+                self._merge_mark(marks, self._key(symbol, exchange), list(group["trade_date"]))
+            self._save()
+        return written
+
+    def read(
+        self,
+        symbols: Iterable[str],
+        exchange: str = "SMART",
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+        columns: Optional[List[str]] = None,
+    ) -> pd.DataFrame:
+        """Rows for the symbols between start and end (inclusive), sorted per symbol."""
+        frames = []
+        for symbol in symbols:
+            for path in self.files(symbol, exchange, start, end):
+                frame = pd.read_parquet(path, columns=columns)
+                if "trade_date" in frame.columns:
+                    dates = frame["trade_date"].map(_to_date)
+                    mask = pd.Series(True, index=frame.index)
+                    if start:
+                        mask &= dates >= start
+                    if end:
+                        mask &= dates <= end
+                    frame = frame[mask]
+                frames.append(frame)
+        if not frames:
+            return pd.DataFrame(columns=columns or [])
+        return pd.concat(frames, ignore_index=True)
@@ -1,18 +1,24 @@
 from __future__ import annotations
 
+import logging
 from dataclasses import dataclass
 from pathlib import Path
 import pandas as pd
 
 from .layout import Partition, codec_for_date
+from .manifest import partition_manifest, write_table_atomic
 from ..config import AppConfig
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class ParquetWriter:
     cfg: AppConfig
 
     def write_dataframe(self, df: pd.DataFrame, part: Partition) -> Path:
+        manifest = partition_manifest(part.root)
+        manifest.ensure_initialized()
         part_dir = part.path()
         part_dir.mkdir(parents=True, exist_ok=True)
 
@@ -20,8 +26,11 @@ class ParquetWriter:
 
         file_path = part_dir / "part-000.parquet"
         import pyarrow as pa  # type: ignore
-        import pyarrow.parquet as pq  # type: ignore
 
         table = pa.Table.from_pandas(df, preserve_index=False)
-        pq.write_table(table, file_path, compression=codec, **options)
+        write_table_atomic(table, file_path, compression=codec, **options)
+        try:
+            manifest.commit(file_path, table)
+        except Exception as exc:
+            logger.warning("Failed to append manifest entry for %s: %s", file_path, exc)
         return file_path
@@ -0,0 +1,3 @@
+from .lazy import LazyAttr, lazy_import
+
+__all__ = ["LazyAttr", "lazy_import"]
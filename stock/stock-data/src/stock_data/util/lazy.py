@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import importlib
+from typing import Any, Tuple
+
+
+class LazyAttr:
+    """Stand-in for ``module.name`` that imports the module on first call or attribute access.
+
+    Keeps heavy imports (pandas, pyarrow, ib_insync, ...) off the CLI startup path while the
+    name stays a plain module attribute, so callers and tests can still patch it.
+    """
+
+    __slots__ = ("_module", "_name", "_target")
+
+    def __init__(self, module: str, name: str) -> None:
+        self._module = module
+        self._name = name
+        self._target: Any = None
+
+    def resolve(self) -> Any:
+        if self._target is None:
+            self._target = getattr(importlib.import_module(self._module), self._name)
+        return self._target
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return self.resolve()(*args, **kwargs)
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self.resolve(), attr)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self._target is not None else "pending"
+        return f"<LazyAttr {self._module}.{self._name} ({state})>"
+
+
+def lazy_import(module: str, *names: str) -> Tuple[LazyAttr, ...]:
+    """``from module import a, b`` deferred until each name is first used."""
+    return tuple(LazyAttr(module, name) for name in names)
+
+
+__all__ = ["LazyAttr", "lazy_import"]
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from stock_data.config import AppConfig, load_config
+
+
+def write_config(tmp_path: Path, **storage: str) -> Path:
+    """Minimal stock-data config rooted under *tmp_path*; returns the toml path."""
+    extra = "".join(f'{key} = "{value}"\n' for key, value in storage.items())
+    path = tmp_path / "config" / "stock-data.toml"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(
+        f"""
+[ib]
+host = "127.0.0.1"
+port = 7496
+client_id = 301
+market_data_type = 1
+
+[timezone]
+name = "America/New_York"
+update_time = "17:30"
+
+[paths]
+raw = "data/raw"
+clean = "data/clean"
+state = "state"
+
+[reference]
+corporate_actions = "config/corporate_actions.csv"
+
+[universe]
+file = "config/stock-universe.csv"
+refresh_days = 30
+
+[storage]
+hot_days = 14
+cold_codec = "zstd"
+cold_codec_level = 3
+hot_codec = "snappy"
+{extra}
+[mcp]
+limit = 200
+days = 3
+allow_raw = true
+allow_clean = true
+enabled_tools = "health_overview"
+audit_db = "state/run_logs/mcp_audit.db"
+""",
+        encoding="utf-8",
+    )
+    return path
+
+
+def build_config(tmp_path: Path, **storage: str) -> AppConfig:
+    return load_config(write_config(tmp_path, **storage))
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+
+# Modules that must stay off the CLI startup path (loaded on first use by a command)
+HEAVY_MODULES = ("pandas", "pyarrow", "ib_insync", "requests")
+# ``stock_data.cli`` may cost at most this multiple of its own ``typer`` import. Measured in
+# the same process, the ratio holds on a loaded machine where a wall-clock budget flakes;
+# pulling pandas back onto the startup path pushes it well past the limit.
+IMPORT_BUDGET_RATIO = 6
+
+
+def _importtime(module: str) -> dict[str, int]:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(SRC), env.get("PYTHONPATH")]))
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    cumulative: dict[str, int] = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        _self_us, cum_us, name = line[len("import time:") :].split("|")
+        cumulative[name.strip()] = int(cum_us)
+    return cumulative
+
+
+def test_cli_import_skips_heavy_dependencies():
+    imported = _importtime("stock_data.cli")
+    assert "stock_data.cli" in imported
+    loaded = sorted(name for name in imported if name.split(".")[0] in HEAVY_MODULES)
+    assert not loaded, f"stock_data.cli imports heavy modules at startup: {loaded[:10]}"
+
+
+def test_cli_import_time_budget():
+    imported = _importtime("stock_data.cli")
+    assert imported["stock_data.cli"] < IMPORT_BUDGET_RATIO * imported["typer"]
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from stock_data.pipeline.fundamentals import FundamentalsRunner
+
+from helpers import build_config
+
+TRADE_DATE = date(2025, 10, 6)
+
+
+class _FMPStub(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, so pooled connections are reused
+
+    def do_GET(self) -> None:  # noqa: N802 - http.server naming
+        url = urlparse(self.path)
+        symbol = parse_qs(url.query)["symbol"][0]
+        self.server.requests.append((url.path, symbol, self.client_address[1]))
+        rows = {
+            "/profile": [{"symbol": symbol, "mktCap": 1000.0, "sector": "Technology"}],
+            "/key-metrics-ttm": [{"peRatioTTM": 20.0}],
+            "/ratios-ttm": [{"netIncomePerShareTTM": 5.0}],
+        }.get(url.path, [])
+        body = json.dumps(rows).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *_args) -> None:
+        return None
+
+
+@pytest.fixture
+def fmp_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _FMPStub)
+    server.requests = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _runner(tmp_path, server, **kwargs) -> FundamentalsRunner:
+    return FundamentalsRunner(
+        build_config(tmp_path),
+        fmp_api_key="test",
+        fmp_base_url=f"http://127.0.0.1:{server.server_address[1]}",
+        min_fetch_days=0,
+        info_refresh_days=0,
+        **kwargs,
+    )
+
+
+def test_prefetch_reserves_budget_in_symbol_order(tmp_path, fmp_server):
+    runner = _runner(
+        tmp_path, fmp_server, daily_call_limit=7, max_workers=2, requests_per_minute=6000
+    )
+    runner._reset_daily_state(TRADE_DATE)
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        pending, budget_stop = runner._prefetch(
+            executor,
+            ["AAPL", "MSFT", "NVDA"],
+            ["info"],
+            TRADE_DATE,
+            force_refresh=False,
+            cache_ttl_days=7,
+        )
+        payloads = {key: [f.result() for f in futures] for key, futures in pending.items()}
+
+    # Three calls per info report: the third symbol does not fit a budget of seven
+    assert budget_stop == ("NVDA", "info")
+    assert sorted(payloads) == [("AAPL", "info"), ("MSFT", "info")]
+    assert payloads[("AAPL", "info")][0] == [
+        {"symbol": "AAPL", "mktCap": 1000.0, "sector": "Technology"}
+    ]
+    assert len(fmp_server.requests) == 6
+
+
+def test_run_paces_requests_over_pooled_connections(tmp_path, fmp_server):
+    # 10 requests/s with a burst of two: six calls need at least ~0.4s
+    runner = _runner(
+        tmp_path, fmp_server, daily_call_limit=7, max_workers=2, requests_per_minute=600
+    )
+    started = time.monotonic()
+    result = runner.run(trade_date=TRADE_DATE, symbols=["aapl", "msft", "nvda"])
+    elapsed = time.monotonic() - started
+
+    assert result.rows_written == 2
+    assert result.symbols_processed == 3
+    assert [(e["symbol"], e["error"]) for e in result.errors] == [("NVDA", "daily_budget_exceeded")]
+    assert elapsed >= 0.35
+    assert len(fmp_server.requests) == 6
+    # Keep-alive session: at most one connection per worker
+    assert len({port for _path, _symbol, port in fmp_server.requests}) <= 2
+
+    # Second run the same day is served from the SQLite cache without new requests
+    again = _runner(tmp_path, fmp_server, daily_call_limit=7, max_workers=2)
+    rerun = again.run(trade_date=TRADE_DATE, symbols=["AAPL", "MSFT"])
+    assert rerun.rows_written == 2
+    assert len(fmp_server.requests) == 6
+
+
+def test_run_prunes_expired_payloads(tmp_path, fmp_server):
+    runner = _runner(tmp_path, fmp_server, max_workers=2, requests_per_minute=6000)
+    old = datetime.now(timezone.utc) - timedelta(days=30)
+    runner._store.put_payload("OLD", "info", date(2025, 9, 1), '{"profile": {}}', cached_at=old)
+
+    runner.run(trade_date=TRADE_DATE, symbols=["AAPL"], cache_ttl_days=7)
+
+    assert runner._store.get_payload("OLD", "info", date(2025, 9, 1)) is None
+    assert runner._store.get_payload("AAPL", "info", TRADE_DATE) is not None
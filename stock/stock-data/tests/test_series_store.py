@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import json
+from datetime import date
+
+import pandas as pd
+from typer.testing import CliRunner
+
+from stock_data.cli import app
+from stock_data.storage import SeriesStore, partition_for
+from stock_data.storage.writer import ParquetWriter
+
+from helpers import build_config, write_config
+
+
+def _rows(symbol: str, days: list[date], value: float) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "trade_date": days,
+            "symbol": symbol.lower(),
+            "exchange": "smart",
+            "hv_30d": [value + i for i in range(len(days))],
+        }
+    )
+
+
+def test_series_store_round_trip(tmp_path):
+    cfg = build_config(tmp_path, volatility_layout="series")
+    store = SeriesStore(cfg, tmp_path / "series")
+    store.append(_rows("AAPL", [date(2024, 12, 30), date(2025, 1, 3)], 1.0))
+    # Overlapping append: the later write wins for 2025-01-03
+    written = store.append(_rows("AAPL", [date(2025, 1, 3), date(2025, 1, 2)], 5.0))
+
+    assert [p.relative_to(store.root).as_posix() for p in written] == [
+        "symbol=AAPL/exchange=SMART/year=2025/part-000.parquet"
+    ]
+    assert store.keys() == [("AAPL", "SMART")]
+    assert store.watermark("aapl", "smart") == (date(2024, 12, 30), date(2025, 1, 3))
+    assert len(store.files("AAPL", "SMART", start=date(2025, 1, 1))) == 1
+
+    frame = store.read(["AAPL"], start=date(2025, 1, 1), end=date(2025, 1, 3))
+    assert frame["trade_date"].map(str).tolist() == ["2025-01-02", "2025-01-03"]
+    assert frame["hv_30d"].tolist() == [6.0, 5.0]
+
+    # A fresh store rebuilds the same watermarks from the files alone
+    store.index_path.unlink()
+    reopened = SeriesStore(cfg, tmp_path / "series")
+    assert reopened.watermark("AAPL", "SMART") == (date(2024, 12, 30), date(2025, 1, 3))
+
+
+def test_cleanup_merges_series_volatility(tmp_path):
+    config_path = write_config(tmp_path, volatility_layout="series")
+    cfg = build_config(tmp_path, volatility_layout="series")
+    days = [date(2024, 3, 4), date(2024, 3, 5)]
+    writer = ParquetWriter(cfg)
+    for day in days:
+        price = pd.DataFrame(
+            [{"trade_date": day, "symbol": "AAPL", "exchange": "SMART", "close": 100.0}]
+        )
+        writer.write_dataframe(
+            price, partition_for(cfg, cfg.paths.clean / "view=daily_bars", day, "AAPL", "SMART")
+        )
+    SeriesStore(cfg, cfg.paths.clean / "view=volatility_series").append(_rows("AAPL", days, 0.2))
+
+    log_path = tmp_path / "cleanup.jsonl"
+    result = CliRunner().invoke(
+        app, ["cleanup", "--config", str(config_path), "--log-path", str(log_path)]
+    )
+    assert result.exit_code == 0, result.output
+
+    events = [json.loads(line) for line in log_path.read_text(encoding="utf-8").splitlines()]
+    merged = [e for e in events if e["event"] == "merge_result"]
+    assert [(e["rows"], e["missing_volatility"], e["missing_price"]) for e in merged] == [(2, 0, 0)]
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from datetime import date
+from types import SimpleNamespace
+
+from stock_data.ib import AsyncPacer, fetch_iv_snapshot_async
+from stock_data.pipeline.volatility import VolatilityRunner
+
+from helpers import build_config
+
+INTERVAL = 0.02
+
+
+class _FakeTicker:
+    def __init__(self, iv: float | None) -> None:
+        self._iv = iv
+        self.impliedVolatility = float("nan")
+
+    @property
+    def updateEvent(self):
+        async def _tick() -> None:
+            await asyncio.sleep(0.005)
+            if self._iv is not None:
+                self.impliedVolatility = self._iv
+
+        return _tick()
+
+
+class _FakeIB:
+    """Records when paced requests start and how many are outstanding at once."""
+
+    def __init__(self, iv: float | None = 0.25, latency: float = 0.03) -> None:
+        self.iv = iv
+        self.latency = latency
+        self.starts: list[tuple[str, float]] = []
+        self.inflight = 0
+        self.peak = 0
+        self.cancelled: list[object] = []
+
+    async def _request(self, kind: str) -> None:
+        self.starts.append((kind, time.monotonic()))
+        self.inflight += 1
+        self.peak = max(self.peak, self.inflight)
+        try:
+            await asyncio.sleep(self.latency)
+        finally:
+            self.inflight -= 1
+
+    async def qualifyContractsAsync(self, contract):
+        await self._request("qualify")
+        return [contract]
+
+    async def reqHistoricalDataAsync(self, contract, **kwargs):
+        await self._request(kwargs["whatToShow"])
+        return [SimpleNamespace(date=date(2025, 1, 2), close=0.2)]
+
+    def reqMktData(self, contract, **kwargs):
+        return _FakeTicker(self.iv)
+
+    def cancelMktData(self, contract) -> None:
+        self.cancelled.append(contract)
+
+
+def _min_gap(starts: list[tuple[str, float]]) -> float:
+    stamps = sorted(ts for _, ts in starts)
+    return min(b - a for a, b in zip(stamps, stamps[1:]))
+
+
+async def test_async_pacer_spaces_starts_and_caps_inflight():
+    ib = _FakeIB()
+    pacer = AsyncPacer(INTERVAL, max_inflight=2)
+
+    async def _one() -> None:
+        async with pacer:
+            await ib._request("req")
+
+    await asyncio.gather(*(_one() for _ in range(6)))
+
+    assert len(ib.starts) == 6
+    assert ib.peak == 2
+    assert _min_gap(ib.starts) >= INTERVAL * 0.9
+
+
+async def test_snapshot_batch_paces_qualification(tmp_path):
+    runner = VolatilityRunner(build_config(tmp_path), concurrency=2)
+    ib = _FakeIB()
+    symbols = ["AAPL", "MSFT", "SPY", "QQQ", "IWM"]
+
+    outcomes = await runner._fetch_snapshot_batch(
+        ib,
+        symbols,
+        end_dt="",
+        exchange="SMART",
+        currency="USD",
+        generic_ticks="106",
+        timeout=1.0,
+        pacer=AsyncPacer(INTERVAL, max_inflight=2),
+    )
+
+    assert [o.iv_value for o in outcomes] == [0.25] * len(symbols)
+    assert all(o.qualified and o.hv_bars for o in outcomes)
+    # Qualification and historical requests share one pacing budget
+    assert sum(kind == "qualify" for kind, _ in ib.starts) == len(symbols)
+    assert ib.peak <= 2
+    assert _min_gap(ib.starts) >= INTERVAL * 0.9
+
+
+async def test_fetch_iv_snapshot_async_returns_none_on_timeout():
+    ib = _FakeIB(iv=None)
+    contract = object()
+
+    assert await fetch_iv_snapshot_async(ib, contract, timeout=0.05) is None
+    assert ib.cancelled == [contract]
+
+    ib = _FakeIB(iv=0.3)
+    assert await fetch_iv_snapshot_async(ib, contract, timeout=1.0) == 0.3